@@ -5,8 +5,10 @@ Comments use gta_comment (the table the Lumière dashboard reads).
 Review tracking uses lux_intervention_issue_log (issue 83 = BC review).
 """
 
+import asyncio
+import functools
 import os
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from datetime import datetime, UTC
 
 import pymysql
@@ -18,6 +20,20 @@ from .constants import (
     BC_REVIEW_ISSUE_ID
 )
 from .storage import ReviewStorage
+from .db_async import (
+    AsyncConnectionPool, DEFAULT_MAX_LIFETIME, DEFAULT_POOL_SIZE, DEFAULT_WAIT_TIMEOUT,
+    aiomysql_connector,
+)
+from .query_plan import Plan, Query, run_plan, run_plan_async
+
+T = TypeVar('T')
+
+
+def _raise_failed(*results: Any) -> None:
+    """Re-raise the first failed query of a batch whose reads are all required."""
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
 
 
 class DPADatabaseClient:
@@ -72,6 +88,10 @@ class DPADatabaseClient:
             ''', (user_id, username, first_name, last_name, email, now))
         self._conn.commit()
 
+    def _run(self, plan: Plan[T]) -> T:
+        """Execute a query plan on the shared pymysql connection."""
+        return run_plan(plan, lambda: self._get_connection().cursor())
+
     def close(self):
         if self._conn and self._conn.open:
             self._conn.close()
@@ -92,9 +112,18 @@ class DPADatabaseClient:
 
         Returns events ordered by most recently entering review.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._run(self._list_review_queue_plan(
+            limit, offset, implementing_jurisdictions, date_entered_review_gte,
+        ))
 
+    def _list_review_queue_plan(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        implementing_jurisdictions: Optional[list[str]] = None,
+        date_entered_review_gte: Optional[str] = None
+    ) -> Plan[dict]:
+        """Query plan for list_review_queue()."""
         query = '''
             SELECT DISTINCT
                 e.event_id,
@@ -136,19 +165,21 @@ class DPADatabaseClient:
         query += ' LIMIT %s OFFSET %s'
         params.extend([limit, offset])
 
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-
         # Get total count
         count_query = '''
             SELECT COUNT(DISTINCT e.event_id) as count
             FROM lux_event_log e
             WHERE e.status_id = 2
         '''
-        cursor.execute(count_query)
-        count = cursor.fetchone()['count']
 
-        return {'results': results, 'count': count}
+        # The page and the count are independent reads
+        results, count_row = yield (
+            Query(query, params),
+            Query(count_query, one=True),
+        )
+        _raise_failed(results, count_row)
+
+        return {'results': results, 'count': count_row['count']}
 
     # ========================================================================
     # Get Event Detail
@@ -166,11 +197,22 @@ class DPADatabaseClient:
         implementing jurisdictions, policy areas, development, related
         interventions, sources, and comments.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._run(self._get_event_plan(event_id, include_intervention, include_comments))
+
+    def _get_event_plan(
+        self,
+        event_id: int,
+        include_intervention: bool = True,
+        include_comments: bool = True
+    ) -> Plan[dict]:
+        """Query plan for get_event().
 
+        Everything after the event row is keyed on event_id or intervention_id
+        and goes out as one batch; only the development lookup has to wait
+        for the intervention row.
+        """
         # 1. Event base
-        cursor.execute('''
+        event = yield Query('''
             SELECT
                 e.event_id,
                 e.intervention_id,
@@ -196,18 +238,18 @@ class DPADatabaseClient:
             LEFT JOIN lux_government_body_list gbo ON e.gov_body_id = gbo.gov_body_id
             LEFT JOIN lux_event_status_list esl ON e.status_id = esl.status_id
             WHERE e.event_id = %s
-        ''', (event_id,))
-        event = cursor.fetchone()
+        ''', (event_id,), one=True)
 
         if not event:
             return {'error': f'Event {event_id} not found'}
 
         result = {'event': event}
         intervention_id = event.get('intervention_id')
+        with_intervention = bool(include_intervention and intervention_id)
 
         # 1b. Author (first user to touch the event, per EventSerializer.get_author).
         # Ordered by date_added ASC — matches the DPA Dashboard's notion of "event author".
-        cursor.execute('''
+        queries = {'author': Query('''
             SELECT
                 au.id as user_id,
                 au.username,
@@ -219,182 +261,140 @@ class DPADatabaseClient:
             WHERE esl.event_id = %s
             ORDER BY esl.date_added ASC
             LIMIT 1
-        ''', (event_id,))
-        result['author'] = cursor.fetchone()
-
-        # 2. Intervention details
-        if include_intervention and intervention_id:
-            cursor.execute('''
-                SELECT
-                    i.intervention_id,
-                    i.intervention_title,
-                    i.development_id,
-                    i.policy_area_id,
-                    pa.policy_area_name,
-                    i.intervention_type_id,
-                    it.intervention_type_name,
-                    i.implementation_level_id,
-                    il.implementation_level_name,
-                    i.current_status_id,
-                    cs.current_status_name
-                FROM lux_intervention_log i
-                LEFT JOIN lux_policy_area_list pa ON i.policy_area_id = pa.policy_area_id
-                LEFT JOIN lux_intervention_type_list it ON i.intervention_type_id = it.intervention_type_id
-                LEFT JOIN lux_implementation_level_list il ON i.implementation_level_id = il.implementation_level_id
-                LEFT JOIN lux_current_status_list cs ON i.current_status_id = cs.current_status_id
-                WHERE i.intervention_id = %s
-            ''', (intervention_id,))
-            result['intervention'] = cursor.fetchone() or {}
-
-            # 3. Economic activities
-            cursor.execute('''
-                SELECT ea.economic_activity_id, eal.economic_activity_name
-                FROM lux_intervention_econ_activity ea
-                JOIN lux_economic_activity_list eal ON ea.economic_activity_id = eal.economic_activity_id
-                WHERE ea.intervention_id = %s
-            ''', (intervention_id,))
-            result['economic_activities'] = cursor.fetchall()
-
-            # 4. Implementing jurisdictions
-            cursor.execute('''
-                SELECT j.jurisdiction_id, j.jurisdiction_name, j.iso_code
-                FROM lux_intervention_implementer ii
-                JOIN api_jurisdiction_list j ON ii.jurisdiction_id = j.jurisdiction_id
-                WHERE ii.intervention_id = %s
-            ''', (intervention_id,))
-            result['implementing_jurisdictions'] = cursor.fetchall()
-
-            # 5. Additional policy areas
-            cursor.execute('''
-                SELECT pa.policy_area_id, pa.policy_area_name
-                FROM lux_intervention_policy_area ipa
-                JOIN lux_policy_area_list pa ON ipa.policy_area_id = pa.policy_area_id
-                WHERE ipa.intervention_id = %s
-            ''', (intervention_id,))
-            result['policy_areas'] = cursor.fetchall()
-
-            # 6. Development
-            development_id = result.get('intervention', {}).get('development_id')
-            if development_id:
-                cursor.execute('''
-                    SELECT development_id, development_name
-                    FROM lux_development_log
-                    WHERE development_id = %s
-                ''', (development_id,))
-                result['development'] = cursor.fetchone() or {}
-            else:
-                result['development'] = {}
-
-            # 7. Related interventions
-            cursor.execute('''
-                SELECT
-                    ri.intervention_id_2 as related_intervention_id,
-                    i.intervention_title,
-                    ri.relation_id,
-                    rl.relation_name as relationship_name
-                FROM lux_related_intervention_log ri
-                JOIN lux_intervention_log i ON ri.intervention_id_2 = i.intervention_id
-                LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
-                WHERE ri.intervention_id_1 = %s
-            ''', (intervention_id,))
-            related1 = list(cursor.fetchall())
-
-            cursor.execute('''
-                SELECT
-                    ri.intervention_id_1 as related_intervention_id,
-                    i.intervention_title,
-                    ri.relation_id,
-                    rl.relation_name as relationship_name
-                FROM lux_related_intervention_log ri
-                JOIN lux_intervention_log i ON ri.intervention_id_1 = i.intervention_id
-                LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
-                WHERE ri.intervention_id_2 = %s
-            ''', (intervention_id,))
-            related2 = list(cursor.fetchall())
-
-            result['related_interventions'] = related1 + related2
-
-            # 7b. Intervention issues (thematic tags)
-            cursor.execute('''
-                SELECT il.issue_id, il.issue_name
-                FROM lux_intervention_issue_log iil
-                JOIN lux_issue_list il ON iil.issue_id = il.issue_id
-                WHERE iil.intervention_id = %s
-                ORDER BY il.issue_name
-            ''', (intervention_id,))
-            result['issues'] = cursor.fetchall()
-
-            # 7c. Intervention rationales (stated policy objectives)
-            cursor.execute('''
-                SELECT rl.rationale_id, rl.rationale_name
-                FROM lux_intervention_rationale ir
-                JOIN lux_rationale_list rl ON ir.rationale_id = rl.rationale_id
-                WHERE ir.intervention_id = %s
-                ORDER BY rl.rationale_name
-            ''', (intervention_id,))
-            result['rationales'] = cursor.fetchall()
-
-            # 7d. Agents/firms linked to intervention events (for OP-005)
-            cursor.execute('''
-                SELECT DISTINCT
-                    a.agent_id,
-                    a.agent_type_id,
-                    at2.agent_type_name,
-                    a.relationship_role_id,
-                    rr.role_name,
-                    f.firm_name
-                FROM lux_event_agent ea
-                JOIN lux_agent_log a ON ea.agent_id = a.agent_id
-                LEFT JOIN lux_agent_type_list at2 ON a.agent_type_id = at2.agent_type_id
-                LEFT JOIN lux_relationship_role_list rr ON a.relationship_role_id = rr.role_id
-                LEFT JOIN lux_agent_firm af ON a.agent_id = af.agent_id
-                LEFT JOIN mtz_firm_log f ON af.firm_id = f.firm_id
-                WHERE ea.event_id IN (
-                    SELECT event_id FROM lux_event_log WHERE intervention_id = %s
-                )
-            ''', (intervention_id,))
-            result['agents'] = cursor.fetchall()
-
-            # 7e. Intervention benchmarks (per InterventionBenchmarkThroughSerializer).
-            # Three LEFT JOINs — any of {benchmark, overlap, substance} may be NULL.
-            # Table names from lux/models.py db_table:
-            #   InterventionBenchmarkThrough -> lux_intervention_benchmark_log
-            #   Benchmark                    -> gta_lead_benchmark_log
-            #   BenchmarkOverlap             -> lux_benchmark_overlap_list
-            #   BenchmarkSubstance           -> lux_benchmark_substance_list
-            cursor.execute('''
-                SELECT
-                    ibt.id,
-                    ibt.dpa_existing as is_dpa_existing,
-                    b.benchmark_id,
-                    b.benchmark_name,
-                    bo.overlap_id,
-                    bo.overlap_name,
-                    bs.substance_id,
-                    bs.substance_name
-                FROM lux_intervention_benchmark_log ibt
-                LEFT JOIN gta_lead_benchmark_log b ON ibt.benchmark_id = b.benchmark_id
-                LEFT JOIN lux_benchmark_overlap_list bo ON ibt.overlap_id = bo.overlap_id
-                LEFT JOIN lux_benchmark_substance_list bs ON ibt.substance_id = bs.substance_id
-                WHERE ibt.intervention_id = %s
-                ORDER BY ibt.id
-            ''', (intervention_id,))
-            result['benchmarks'] = cursor.fetchall()
-        else:
-            result['intervention'] = {}
-            result['economic_activities'] = []
-            result['implementing_jurisdictions'] = []
-            result['policy_areas'] = []
-            result['development'] = {}
-            result['related_interventions'] = []
-            result['issues'] = []
-            result['rationales'] = []
-            result['agents'] = []
-            result['benchmarks'] = []
+        ''', (event_id,), one=True)}
+
+        if with_intervention:
+            iid = (intervention_id,)
+            queries.update({
+                # 2. Intervention details
+                'intervention': Query('''
+                    SELECT
+                        i.intervention_id,
+                        i.intervention_title,
+                        i.development_id,
+                        i.policy_area_id,
+                        pa.policy_area_name,
+                        i.intervention_type_id,
+                        it.intervention_type_name,
+                        i.implementation_level_id,
+                        il.implementation_level_name,
+                        i.current_status_id,
+                        cs.current_status_name
+                    FROM lux_intervention_log i
+                    LEFT JOIN lux_policy_area_list pa ON i.policy_area_id = pa.policy_area_id
+                    LEFT JOIN lux_intervention_type_list it ON i.intervention_type_id = it.intervention_type_id
+                    LEFT JOIN lux_implementation_level_list il ON i.implementation_level_id = il.implementation_level_id
+                    LEFT JOIN lux_current_status_list cs ON i.current_status_id = cs.current_status_id
+                    WHERE i.intervention_id = %s
+                ''', iid, one=True),
+                # 3. Economic activities
+                'economic_activities': Query('''
+                    SELECT ea.economic_activity_id, eal.economic_activity_name
+                    FROM lux_intervention_econ_activity ea
+                    JOIN lux_economic_activity_list eal ON ea.economic_activity_id = eal.economic_activity_id
+                    WHERE ea.intervention_id = %s
+                ''', iid),
+                # 4. Implementing jurisdictions
+                'implementing_jurisdictions': Query('''
+                    SELECT j.jurisdiction_id, j.jurisdiction_name, j.iso_code
+                    FROM lux_intervention_implementer ii
+                    JOIN api_jurisdiction_list j ON ii.jurisdiction_id = j.jurisdiction_id
+                    WHERE ii.intervention_id = %s
+                ''', iid),
+                # 5. Additional policy areas
+                'policy_areas': Query('''
+                    SELECT pa.policy_area_id, pa.policy_area_name
+                    FROM lux_intervention_policy_area ipa
+                    JOIN lux_policy_area_list pa ON ipa.policy_area_id = pa.policy_area_id
+                    WHERE ipa.intervention_id = %s
+                ''', iid),
+                # 7. Related interventions
+                'related1': Query('''
+                    SELECT
+                        ri.intervention_id_2 as related_intervention_id,
+                        i.intervention_title,
+                        ri.relation_id,
+                        rl.relation_name as relationship_name
+                    FROM lux_related_intervention_log ri
+                    JOIN lux_intervention_log i ON ri.intervention_id_2 = i.intervention_id
+                    LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
+                    WHERE ri.intervention_id_1 = %s
+                ''', iid),
+                'related2': Query('''
+                    SELECT
+                        ri.intervention_id_1 as related_intervention_id,
+                        i.intervention_title,
+                        ri.relation_id,
+                        rl.relation_name as relationship_name
+                    FROM lux_related_intervention_log ri
+                    JOIN lux_intervention_log i ON ri.intervention_id_1 = i.intervention_id
+                    LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
+                    WHERE ri.intervention_id_2 = %s
+                ''', iid),
+                # 7b. Intervention issues (thematic tags)
+                'issues': Query('''
+                    SELECT il.issue_id, il.issue_name
+                    FROM lux_intervention_issue_log iil
+                    JOIN lux_issue_list il ON iil.issue_id = il.issue_id
+                    WHERE iil.intervention_id = %s
+                    ORDER BY il.issue_name
+                ''', iid),
+                # 7c. Intervention rationales (stated policy objectives)
+                'rationales': Query('''
+                    SELECT rl.rationale_id, rl.rationale_name
+                    FROM lux_intervention_rationale ir
+                    JOIN lux_rationale_list rl ON ir.rationale_id = rl.rationale_id
+                    WHERE ir.intervention_id = %s
+                    ORDER BY rl.rationale_name
+                ''', iid),
+                # 7d. Agents/firms linked to intervention events (for OP-005)
+                'agents': Query('''
+                    SELECT DISTINCT
+                        a.agent_id,
+                        a.agent_type_id,
+                        at2.agent_type_name,
+                        a.relationship_role_id,
+                        rr.role_name,
+                        f.firm_name
+                    FROM lux_event_agent ea
+                    JOIN lux_agent_log a ON ea.agent_id = a.agent_id
+                    LEFT JOIN lux_agent_type_list at2 ON a.agent_type_id = at2.agent_type_id
+                    LEFT JOIN lux_relationship_role_list rr ON a.relationship_role_id = rr.role_id
+                    LEFT JOIN lux_agent_firm af ON a.agent_id = af.agent_id
+                    LEFT JOIN mtz_firm_log f ON af.firm_id = f.firm_id
+                    WHERE ea.event_id IN (
+                        SELECT event_id FROM lux_event_log WHERE intervention_id = %s
+                    )
+                ''', iid),
+                # 7e. Intervention benchmarks (per InterventionBenchmarkThroughSerializer).
+                # Three LEFT JOINs — any of {benchmark, overlap, substance} may be NULL.
+                # Table names from lux/models.py db_table:
+                #   InterventionBenchmarkThrough -> lux_intervention_benchmark_log
+                #   Benchmark                    -> gta_lead_benchmark_log
+                #   BenchmarkOverlap             -> lux_benchmark_overlap_list
+                #   BenchmarkSubstance           -> lux_benchmark_substance_list
+                'benchmarks': Query('''
+                    SELECT
+                        ibt.id,
+                        ibt.dpa_existing as is_dpa_existing,
+                        b.benchmark_id,
+                        b.benchmark_name,
+                        bo.overlap_id,
+                        bo.overlap_name,
+                        bs.substance_id,
+                        bs.substance_name
+                    FROM lux_intervention_benchmark_log ibt
+                    LEFT JOIN gta_lead_benchmark_log b ON ibt.benchmark_id = b.benchmark_id
+                    LEFT JOIN lux_benchmark_overlap_list bo ON ibt.overlap_id = bo.overlap_id
+                    LEFT JOIN lux_benchmark_substance_list bs ON ibt.substance_id = bs.substance_id
+                    WHERE ibt.intervention_id = %s
+                    ORDER BY ibt.id
+                ''', iid),
+            })
 
         # 8. Sources (via lux_event_source → lux_source_log, with file info)
         # display_on_flag: 1 = primary source shown on front page, 0 = background/contextual
-        cursor.execute('''
+        queries['sources'] = Query('''
             SELECT
                 s.source_id,
                 s.source_name,
@@ -414,11 +414,10 @@ class DPADatabaseClient:
             WHERE es.event_id = %s
             ORDER BY es.display_on_flag DESC, s.source_id ASC
         ''', (event_id,))
-        result['sources'] = cursor.fetchall()
 
         # 9. Comments (shared api_comment_log, measure_id = event_id)
         if include_comments:
-            cursor.execute('''
+            queries['comments'] = Query('''
                 SELECT
                     c.id,
                     c.author_id,
@@ -431,9 +430,48 @@ class DPADatabaseClient:
                 WHERE c.measure_id = %s
                 ORDER BY c.creation_time DESC
             ''', (event_id,))
-            result['comments'] = cursor.fetchall()
+
+        fetched = dict(zip(queries, (yield tuple(queries.values()))))
+        _raise_failed(*fetched.values())
+
+        result['author'] = fetched['author']
+        if with_intervention:
+            result['intervention'] = fetched['intervention'] or {}
+            result['economic_activities'] = fetched['economic_activities']
+            result['implementing_jurisdictions'] = fetched['implementing_jurisdictions']
+            result['policy_areas'] = fetched['policy_areas']
+
+            # 6. Development
+            development_id = result.get('intervention', {}).get('development_id')
+            if development_id:
+                development = yield Query('''
+                    SELECT development_id, development_name
+                    FROM lux_development_log
+                    WHERE development_id = %s
+                ''', (development_id,), one=True)
+                result['development'] = development or {}
+            else:
+                result['development'] = {}
+
+            result['related_interventions'] = fetched['related1'] + fetched['related2']
+            result['issues'] = fetched['issues']
+            result['rationales'] = fetched['rationales']
+            result['agents'] = fetched['agents']
+            result['benchmarks'] = fetched['benchmarks']
         else:
-            result['comments'] = []
+            result['intervention'] = {}
+            result['economic_activities'] = []
+            result['implementing_jurisdictions'] = []
+            result['policy_areas'] = []
+            result['development'] = {}
+            result['related_interventions'] = []
+            result['issues'] = []
+            result['rationales'] = []
+            result['agents'] = []
+            result['benchmarks'] = []
+
+        result['sources'] = fetched['sources']
+        result['comments'] = fetched['comments'] if include_comments else []
 
         return result
 
@@ -620,11 +658,16 @@ class DPADatabaseClient:
         from in-review events. This is the mandatory first step before
         reviewing any individual event.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._run(self._get_intervention_context_plan(intervention_id))
+
+    def _get_intervention_context_plan(self, intervention_id: int) -> Plan[dict]:
+        """Query plan for get_intervention_context().
 
+        Once the intervention row is known, every other read is independent
+        and goes out as one batch.
+        """
         # Intervention metadata
-        cursor.execute('''
+        intervention = yield Query('''
             SELECT
                 i.intervention_id,
                 i.intervention_title,
@@ -643,193 +686,175 @@ class DPADatabaseClient:
             LEFT JOIN lux_implementation_level_list il ON i.implementation_level_id = il.implementation_level_id
             LEFT JOIN lux_current_status_list cs ON i.current_status_id = cs.current_status_id
             WHERE i.intervention_id = %s
-        ''', (intervention_id,))
-        intervention = cursor.fetchone()
+        ''', (intervention_id,), one=True)
 
         if not intervention:
             return {'error': f'Intervention {intervention_id} not found'}
 
+        iid = (intervention_id,)
+        queries = {
+            # Implementing jurisdictions
+            'implementers': Query('''
+                SELECT j.jurisdiction_id, j.jurisdiction_name, j.iso_code
+                FROM lux_intervention_implementer ii
+                JOIN api_jurisdiction_list j ON ii.jurisdiction_id = j.jurisdiction_id
+                WHERE ii.intervention_id = %s
+            ''', iid),
+            # Economic activities
+            'econ_activities': Query('''
+                SELECT ea.economic_activity_id, eal.economic_activity_name
+                FROM lux_intervention_econ_activity ea
+                JOIN lux_economic_activity_list eal ON ea.economic_activity_id = eal.economic_activity_id
+                WHERE ea.intervention_id = %s
+            ''', iid),
+            # All events on this intervention, ordered by date
+            'events': Query('''
+                SELECT
+                    e.event_id,
+                    e.event_title,
+                    e.event_description,
+                    e.event_date,
+                    e.event_type_id,
+                    et.event_type_name,
+                    e.action_type_id,
+                    at2.action_type_name,
+                    e.gov_branch_id,
+                    gb.gov_branch_name,
+                    e.gov_body_id,
+                    gbo.gov_body_name,
+                    e.status_id,
+                    esl.status_name,
+                    e.is_case,
+                    e.is_current
+                FROM lux_event_log e
+                LEFT JOIN lux_event_type_list et ON e.event_type_id = et.event_type_id
+                LEFT JOIN lux_action_type_list at2 ON e.action_type_id = at2.action_type_id
+                LEFT JOIN lux_government_branch_list gb ON e.gov_branch_id = gb.gov_branch_id
+                LEFT JOIN lux_government_body_list gbo ON e.gov_body_id = gbo.gov_body_id
+                LEFT JOIN lux_event_status_list esl ON e.status_id = esl.status_id
+                WHERE e.intervention_id = %s
+                ORDER BY e.event_date ASC, e.event_id ASC
+            ''', iid),
+            # Related interventions
+            'related1': Query('''
+                SELECT
+                    ri.intervention_id_2 as related_intervention_id,
+                    i.intervention_title,
+                    ri.relation_id,
+                    rl.relation_name as relationship_name
+                FROM lux_related_intervention_log ri
+                JOIN lux_intervention_log i ON ri.intervention_id_2 = i.intervention_id
+                LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
+                WHERE ri.intervention_id_1 = %s
+            ''', iid),
+            'related2': Query('''
+                SELECT
+                    ri.intervention_id_1 as related_intervention_id,
+                    i.intervention_title,
+                    ri.relation_id,
+                    rl.relation_name as relationship_name
+                FROM lux_related_intervention_log ri
+                JOIN lux_intervention_log i ON ri.intervention_id_1 = i.intervention_id
+                LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
+                WHERE ri.intervention_id_2 = %s
+            ''', iid),
+            # Intervention issues (thematic tags, including BC review marker)
+            'issues': Query('''
+                SELECT il.issue_id, il.issue_name
+                FROM lux_intervention_issue_log iil
+                JOIN lux_issue_list il ON iil.issue_id = il.issue_id
+                WHERE iil.intervention_id = %s
+                ORDER BY il.issue_name
+            ''', iid),
+            # Intervention rationales (stated policy objectives)
+            'rationales': Query('''
+                SELECT rl.rationale_id, rl.rationale_name
+                FROM lux_intervention_rationale ir
+                JOIN lux_rationale_list rl ON ir.rationale_id = rl.rationale_id
+                WHERE ir.intervention_id = %s
+                ORDER BY rl.rationale_name
+            ''', iid),
+            # Agents/firms linked to the intervention's events (OP-005 parity with get_event)
+            'agents': Query('''
+                SELECT DISTINCT
+                    a.agent_id,
+                    a.agent_type_id,
+                    at2.agent_type_name,
+                    a.relationship_role_id,
+                    rr.role_name,
+                    f.firm_name
+                FROM lux_event_agent ea
+                JOIN lux_agent_log a ON ea.agent_id = a.agent_id
+                LEFT JOIN lux_agent_type_list at2 ON a.agent_type_id = at2.agent_type_id
+                LEFT JOIN lux_relationship_role_list rr ON a.relationship_role_id = rr.role_id
+                LEFT JOIN lux_agent_firm af ON a.agent_id = af.agent_id
+                LEFT JOIN mtz_firm_log f ON af.firm_id = f.firm_id
+                WHERE ea.event_id IN (
+                    SELECT event_id FROM lux_event_log WHERE intervention_id = %s
+                )
+            ''', iid),
+            # Intervention benchmarks (per InterventionBenchmarkThroughSerializer)
+            'benchmarks': Query('''
+                SELECT
+                    ibt.id,
+                    ibt.dpa_existing as is_dpa_existing,
+                    b.benchmark_id,
+                    b.benchmark_name,
+                    bo.overlap_id,
+                    bo.overlap_name,
+                    bs.substance_id,
+                    bs.substance_name
+                FROM lux_intervention_benchmark_log ibt
+                LEFT JOIN gta_lead_benchmark_log b ON ibt.benchmark_id = b.benchmark_id
+                LEFT JOIN lux_benchmark_overlap_list bo ON ibt.overlap_id = bo.overlap_id
+                LEFT JOIN lux_benchmark_substance_list bs ON ibt.substance_id = bs.substance_id
+                WHERE ibt.intervention_id = %s
+                ORDER BY ibt.id
+            ''', iid),
+        }
+
         # Development name
-        development = {}
-        dev_id = intervention.get('development_id')
-        if dev_id:
-            cursor.execute(
+        development_id = intervention.get('development_id')
+        if development_id:
+            queries['development'] = Query(
                 'SELECT development_id, development_name FROM lux_development_log WHERE development_id = %s',
-                (dev_id,)
+                (development_id,),
+                one=True,
             )
-            development = cursor.fetchone() or {}
-
-        # Implementing jurisdictions
-        cursor.execute('''
-            SELECT j.jurisdiction_id, j.jurisdiction_name, j.iso_code
-            FROM lux_intervention_implementer ii
-            JOIN api_jurisdiction_list j ON ii.jurisdiction_id = j.jurisdiction_id
-            WHERE ii.intervention_id = %s
-        ''', (intervention_id,))
-        implementers = cursor.fetchall()
-
-        # Economic activities
-        cursor.execute('''
-            SELECT ea.economic_activity_id, eal.economic_activity_name
-            FROM lux_intervention_econ_activity ea
-            JOIN lux_economic_activity_list eal ON ea.economic_activity_id = eal.economic_activity_id
-            WHERE ea.intervention_id = %s
-        ''', (intervention_id,))
-        econ_activities = cursor.fetchall()
-
-        # All events on this intervention, ordered by date
-        cursor.execute('''
+            # Development siblings (all interventions sharing same development_id)
+            queries['dev_siblings'] = Query('''
             SELECT
-                e.event_id,
-                e.event_title,
-                e.event_description,
-                e.event_date,
-                e.event_type_id,
-                et.event_type_name,
-                e.action_type_id,
-                at2.action_type_name,
-                e.gov_branch_id,
-                gb.gov_branch_name,
-                e.gov_body_id,
-                gbo.gov_body_name,
-                e.status_id,
-                esl.status_name,
-                e.is_case,
-                e.is_current
-            FROM lux_event_log e
-            LEFT JOIN lux_event_type_list et ON e.event_type_id = et.event_type_id
-            LEFT JOIN lux_action_type_list at2 ON e.action_type_id = at2.action_type_id
-            LEFT JOIN lux_government_branch_list gb ON e.gov_branch_id = gb.gov_branch_id
-            LEFT JOIN lux_government_body_list gbo ON e.gov_body_id = gbo.gov_body_id
-            LEFT JOIN lux_event_status_list esl ON e.status_id = esl.status_id
-            WHERE e.intervention_id = %s
-            ORDER BY e.event_date ASC, e.event_id ASC
-        ''', (intervention_id,))
-        events = cursor.fetchall()
-
-        # Related interventions
-        cursor.execute('''
-            SELECT
-                ri.intervention_id_2 as related_intervention_id,
-                i.intervention_title,
-                ri.relation_id,
-                rl.relation_name as relationship_name
-            FROM lux_related_intervention_log ri
-            JOIN lux_intervention_log i ON ri.intervention_id_2 = i.intervention_id
-            LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
-            WHERE ri.intervention_id_1 = %s
-        ''', (intervention_id,))
-        related1 = list(cursor.fetchall())
-
-        cursor.execute('''
-            SELECT
-                ri.intervention_id_1 as related_intervention_id,
+                i.intervention_id,
                 i.intervention_title,
-                ri.relation_id,
-                rl.relation_name as relationship_name
-            FROM lux_related_intervention_log ri
-            JOIN lux_intervention_log i ON ri.intervention_id_1 = i.intervention_id
-            LEFT JOIN lux_relationship_list rl ON ri.relation_id = rl.relation_id
-            WHERE ri.intervention_id_2 = %s
-        ''', (intervention_id,))
-        related2 = list(cursor.fetchall())
-
-        # Intervention issues (thematic tags, including BC review marker)
-        cursor.execute('''
-            SELECT il.issue_id, il.issue_name
-            FROM lux_intervention_issue_log iil
-            JOIN lux_issue_list il ON iil.issue_id = il.issue_id
-            WHERE iil.intervention_id = %s
-            ORDER BY il.issue_name
-        ''', (intervention_id,))
-        issues = cursor.fetchall()
-
-        # Intervention rationales (stated policy objectives)
-        cursor.execute('''
-            SELECT rl.rationale_id, rl.rationale_name
-            FROM lux_intervention_rationale ir
-            JOIN lux_rationale_list rl ON ir.rationale_id = rl.rationale_id
-            WHERE ir.intervention_id = %s
-            ORDER BY rl.rationale_name
-        ''', (intervention_id,))
-        rationales = cursor.fetchall()
-
-        # Agents/firms linked to the intervention's events (OP-005 parity with get_event)
-        cursor.execute('''
-            SELECT DISTINCT
-                a.agent_id,
-                a.agent_type_id,
-                at2.agent_type_name,
-                a.relationship_role_id,
-                rr.role_name,
-                f.firm_name
-            FROM lux_event_agent ea
-            JOIN lux_agent_log a ON ea.agent_id = a.agent_id
-            LEFT JOIN lux_agent_type_list at2 ON a.agent_type_id = at2.agent_type_id
-            LEFT JOIN lux_relationship_role_list rr ON a.relationship_role_id = rr.role_id
-            LEFT JOIN lux_agent_firm af ON a.agent_id = af.agent_id
-            LEFT JOIN mtz_firm_log f ON af.firm_id = f.firm_id
-            WHERE ea.event_id IN (
-                SELECT event_id FROM lux_event_log WHERE intervention_id = %s
-            )
-        ''', (intervention_id,))
-        agents = cursor.fetchall()
-
-        # Intervention benchmarks (per InterventionBenchmarkThroughSerializer)
-        cursor.execute('''
-            SELECT
-                ibt.id,
-                ibt.dpa_existing as is_dpa_existing,
-                b.benchmark_id,
-                b.benchmark_name,
-                bo.overlap_id,
-                bo.overlap_name,
-                bs.substance_id,
-                bs.substance_name
-            FROM lux_intervention_benchmark_log ibt
-            LEFT JOIN gta_lead_benchmark_log b ON ibt.benchmark_id = b.benchmark_id
-            LEFT JOIN lux_benchmark_overlap_list bo ON ibt.overlap_id = bo.overlap_id
-            LEFT JOIN lux_benchmark_substance_list bs ON ibt.substance_id = bs.substance_id
-            WHERE ibt.intervention_id = %s
-            ORDER BY ibt.id
-        ''', (intervention_id,))
-        benchmarks = cursor.fetchall()
-
-        # Development siblings (all interventions sharing same development_id)
-        dev_siblings = []
-        development_id = intervention.get('development_id') if intervention else None
-        if development_id:
-            cursor.execute('''
-                SELECT
-                    i.intervention_id,
-                    i.intervention_title,
-                    i.policy_area_id,
-                    pa.policy_area_name,
-                    i.intervention_type_id,
-                    it.intervention_type_name,
-                    i.current_status_id,
-                    cs.current_status_name
-                FROM lux_intervention_log i
-                LEFT JOIN lux_policy_area_list pa ON i.policy_area_id = pa.policy_area_id
-                LEFT JOIN lux_intervention_type_list it ON i.intervention_type_id = it.intervention_type_id
-                LEFT JOIN lux_current_status_list cs ON i.current_status_id = cs.current_status_id
-                WHERE i.development_id = %s AND i.intervention_id != %s
-                ORDER BY i.intervention_id
+                i.policy_area_id,
+                pa.policy_area_name,
+                i.intervention_type_id,
+                it.intervention_type_name,
+                i.current_status_id,
+                cs.current_status_name
+            FROM lux_intervention_log i
+            LEFT JOIN lux_policy_area_list pa ON i.policy_area_id = pa.policy_area_id
+            LEFT JOIN lux_intervention_type_list it ON i.intervention_type_id = it.intervention_type_id
+            LEFT JOIN lux_current_status_list cs ON i.current_status_id = cs.current_status_id
+            WHERE i.development_id = %s AND i.intervention_id != %s
+            ORDER BY i.intervention_id
             ''', (development_id, intervention_id))
-            dev_siblings = cursor.fetchall()
+
+        fetched = dict(zip(queries, (yield tuple(queries.values()))))
+        _raise_failed(*fetched.values())
 
         return {
             'intervention': intervention,
-            'development': development,
-            'implementing_jurisdictions': implementers,
-            'economic_activities': econ_activities,
-            'events': events,
-            'related_interventions': related1 + related2,
-            'development_siblings': dev_siblings,
-            'issues': issues,
-            'rationales': rationales,
-            'agents': agents,
-            'benchmarks': benchmarks,
+            'development': fetched.get('development') or {},
+            'implementing_jurisdictions': fetched['implementers'],
+            'economic_activities': fetched['econ_activities'],
+            'events': fetched['events'],
+            'related_interventions': fetched['related1'] + fetched['related2'],
+            'development_siblings': fetched.get('dev_siblings', []),
+            'issues': fetched['issues'],
+            'rationales': fetched['rationales'],
+            'agents': fetched['agents'],
+            'benchmarks': fetched['benchmarks'],
         }
 
     # ========================================================================
@@ -840,9 +865,10 @@ class DPADatabaseClient:
         self,
         include_checklist: bool = False
     ) -> dict:
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._run(self._list_templates_plan(include_checklist))
 
+    def _list_templates_plan(self, include_checklist: bool = False) -> Plan[dict]:
+        """Query plan for list_templates()."""
         query = '''
             SELECT comment_template_id as id,
                    comment_template_short as template_name,
@@ -855,8 +881,7 @@ class DPADatabaseClient:
             query += " AND is_checklist = 0"
         query += ' ORDER BY comment_template_short'
 
-        cursor.execute(query)
-        results = cursor.fetchall()
+        results = yield Query(query)
 
         return {'results': results}
 
@@ -866,14 +891,15 @@ class DPADatabaseClient:
         Returns the user who set status_id=1 (in progress / created) for each event,
         plus user name from auth_user.
         """
+        return self._run(self._lookup_event_analysts_plan(event_ids))
+
+    def _lookup_event_analysts_plan(self, event_ids: list[int]) -> Plan[dict]:
+        """Query plan for lookup_event_analysts()."""
         if not event_ids:
             return {'analysts': []}
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         placeholders = ', '.join(['%s'] * len(event_ids))
-        cursor.execute(f'''
+        rows = yield Query(f'''
             SELECT esl.event_id, esl.user_id, au.first_name, au.last_name
             FROM lux_event_status_log esl
             LEFT JOIN auth_user au ON esl.user_id = au.id
@@ -881,6 +907,75 @@ class DPADatabaseClient:
             GROUP BY esl.event_id, esl.user_id, au.first_name, au.last_name
             ORDER BY esl.event_id
         ''', event_ids)
-        rows = list(cursor.fetchall())
 
         return {'analysts': rows}
+
+
+def _native(method: Callable[..., T]) -> Callable[..., T]:
+    """Coroutine form of a plan-backed DPADatabaseClient read method."""
+    plan_name = f'_{method.__name__}_plan'
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        plan = getattr(self._sync, plan_name)(*args, **kwargs)
+        return await run_plan_async(plan, self._pool)
+
+    return wrapper
+
+
+class AsyncDPADatabaseClient:
+    """DPADatabaseClient with coroutine methods (GTA_DB_BACKEND=aiomysql).
+
+    Read paths (review queue, event detail, intervention context, templates,
+    analyst lookup) run their query plans natively on an asyncio connection
+    pool, issuing independent statements concurrently. Writes run the pymysql
+    implementation via asyncio.to_thread.
+    """
+
+    def __init__(
+        self,
+        storage: Optional[ReviewStorage] = None,
+        connect: Optional[Callable[[], Any]] = None,
+    ):
+        self._sync = DPADatabaseClient(storage=storage)
+        self.storage = self._sync.storage
+        if connect is None:
+            connect = aiomysql_connector(
+                host=self._sync.host,
+                user=self._sync.user,
+                password=self._sync.password,
+                db=self._sync.database,
+                port=self._sync.port,
+            )
+        self._pool = AsyncConnectionPool(
+            connect,
+            max_size=int(os.getenv('GTA_DB_POOL_SIZE', str(DEFAULT_POOL_SIZE))),
+            max_lifetime=float(os.getenv('GTA_DB_POOL_MAX_LIFETIME', str(DEFAULT_MAX_LIFETIME))),
+            wait_timeout=float(os.getenv('GTA_DB_POOL_TIMEOUT', str(DEFAULT_WAIT_TIMEOUT))),
+        )
+
+    list_review_queue = _native(DPADatabaseClient.list_review_queue)
+    get_event = _native(DPADatabaseClient.get_event)
+    get_intervention_context = _native(DPADatabaseClient.get_intervention_context)
+    list_templates = _native(DPADatabaseClient.list_templates)
+    lookup_event_analysts = _native(DPADatabaseClient.lookup_event_analysts)
+
+    def __getattr__(self, name: str):
+        method = getattr(self._sync, name)
+        if name.startswith('_') or not callable(method):
+            return method
+
+        @functools.wraps(method)
+        async def threaded(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return threaded
+
+    def pool_stats(self) -> dict:
+        """Occupancy and counters of the async read pool."""
+        return self._pool.snapshot()
+
+    def close(self):
+        """Close idle pooled connections and the pymysql connection."""
+        self._pool.close()
+        self._sync.close()
@@ -0,0 +1,217 @@
+"""Native asyncio MySQL backend for dpa_mnt (optional, aiomysql).
+
+With GTA_DB_BACKEND=aiomysql the server talks to MySQL from the event loop
+instead of parking every tool call on an `asyncio.to_thread` worker. Read
+paths run their query plans (see query_plan.py) on this pool, so
+independent statements of one call go out concurrently on separate
+connections. Writes keep using the blocking pymysql connection.
+
+The pool is bounded and LIFO; idle connections are pinged after
+`ping_interval` seconds and recycled after `max_lifetime`. Connections are
+opened in autocommit mode because the pool only serves reads.
+
+Install the driver with `pip install 'dpa-mnt[async]'`.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Tuple
+
+try:
+    import aiomysql
+except ImportError:  # optional dependency
+    aiomysql = None
+
+
+BACKENDS = ('pymysql', 'aiomysql')
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_MAX_LIFETIME = 1800.0  # seconds
+DEFAULT_WAIT_TIMEOUT = 10.0  # seconds
+DEFAULT_PING_INTERVAL = 30.0  # seconds
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the wait timeout."""
+
+
+def aiomysql_connector(**params: Any) -> Callable[[], Awaitable[Any]]:
+    """Return a coroutine factory opening aiomysql DictCursor connections.
+
+    Raises:
+        RuntimeError: If aiomysql is not installed.
+    """
+    if aiomysql is None:
+        raise RuntimeError(
+            "GTA_DB_BACKEND=aiomysql requires the aiomysql package "
+            "(pip install 'dpa-mnt[async]')"
+        )
+
+    async def connect() -> Any:
+        return await aiomysql.connect(
+            cursorclass=aiomysql.DictCursor,
+            autocommit=True,
+            **params,
+        )
+
+    return connect
+
+
+class AsyncConnectionPool:
+    """LIFO pool of async connections produced by the coroutine `connect`.
+
+    Connections need `await ping(reconnect=True)`, `close()`, a `closed`
+    attribute and an async-context-manager `cursor()`, as aiomysql provides.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        max_size: int = DEFAULT_POOL_SIZE,
+        max_lifetime: float = DEFAULT_MAX_LIFETIME,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+    ):
+        if max_size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {max_size}")
+        self._connect = connect
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.wait_timeout = wait_timeout
+        self.ping_interval = ping_interval
+
+        self._slots = asyncio.Semaphore(max_size)
+        # Idle connections as (conn, created_at, returned_at); most recently used last.
+        self._idle: Deque[Tuple[Any, float, float]] = deque()
+        # created_at per checked-out connection, keyed by id(conn)
+        self._in_use: Dict[int, float] = {}
+        self._closed = False
+        self.stats = {
+            "checkouts": 0, "created": 0, "recycled": 0, "pinged": 0,
+            "discarded": 0, "waits": 0, "timeouts": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle + checked out)."""
+        return len(self._idle) + len(self._in_use)
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def _close_quietly(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    async def acquire(self) -> Any:
+        """Check out a healthy connection, waiting up to `wait_timeout` seconds.
+
+        Raises:
+            PoolTimeout: If the pool is exhausted for longer than the wait timeout.
+            RuntimeError: If the pool has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        if self._slots.locked():
+            self.stats["waits"] += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.wait_timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise PoolTimeout(
+                f"No database connection available within {self.wait_timeout:.0f}s "
+                f"(pool size {self.max_size}, all in use)"
+            ) from None
+
+        try:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+            conn = None
+            now = time.monotonic()
+            if self._idle:
+                conn, created_at, returned_at = self._idle.pop()
+                if now - created_at > self.max_lifetime:
+                    self._close_quietly(conn)
+                    self.stats["recycled"] += 1
+                    conn = None
+                elif getattr(conn, "closed", False) or now - returned_at > self.ping_interval:
+                    try:
+                        await conn.ping(reconnect=True)
+                        self.stats["pinged"] += 1
+                    except BaseException:
+                        self._close_quietly(conn)
+                        self.stats["discarded"] += 1
+                        raise
+            if conn is None:
+                conn = await self._connect()
+                created_at = time.monotonic()
+                self.stats["created"] += 1
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._in_use[id(conn)] = created_at
+        self.stats["checkouts"] += 1
+        return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """Return a connection to the pool.
+
+        Args:
+            conn: A connection obtained from acquire().
+            discard: Close the connection instead of reusing it.
+        """
+        created_at = self._in_use.pop(id(conn), None)
+        if created_at is None:
+            return  # not ours, or already released
+
+        if not discard and getattr(conn, "closed", False):
+            discard = True
+        if not discard and time.monotonic() - created_at > self.max_lifetime:
+            discard = True
+            self.stats["recycled"] += 1
+        elif discard:
+            self.stats["discarded"] += 1
+
+        if discard or self._closed:
+            self._close_quietly(conn)
+        else:
+            self._idle.append((conn, created_at, time.monotonic()))
+        self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        """Async context manager form of acquire()/release()."""
+        conn = await self.acquire()
+        try:
+            yield conn
+        except BaseException:
+            self.release(conn, discard=getattr(conn, "closed", False))
+            raise
+        self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections and refuse further checkouts.
+
+        Connections still checked out are closed when they are released.
+        """
+        self._closed = True
+        idle = list(self._idle)
+        self._idle.clear()
+        for conn, _, _ in idle:
+            self._close_quietly(conn)
+
+    def snapshot(self) -> dict:
+        """Current pool occupancy and lifetime counters."""
+        return {
+            "max_size": self.max_size,
+            "open": self.size,
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            **self.stats,
+        }
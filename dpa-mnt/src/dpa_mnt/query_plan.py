@@ -0,0 +1,121 @@
+"""Driver-independent query plans for dpa_mnt read paths.
+
+The read methods of DPADatabaseClient (get_event, the review queue,
+get_intervention_context, ...) are written once as *plans*: generators that
+yield the statements they need and receive the rows back. A plan never touches a
+connection itself, so the same code runs on either backend:
+
+- run_plan() executes it on the blocking pymysql connection (statements
+  in order) — the default backend
+- run_plan_async() executes it on an async connection pool, running the
+  statements of a batch concurrently on separate connections
+
+Plan protocol:
+
+    rows = yield Query(sql, params)            # list of dict rows
+    row = yield Query(sql, params, one=True)   # dict or None
+    results = yield (Query(...), Query(...))   # batch of independent reads
+
+A failing single Query raises inside the plan at the `yield`, so ordinary
+try/except works. A batch never raises: each slot of the returned list holds
+either the query's result or the Exception it raised, and the plan decides
+which failures are tolerable.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Optional, Sequence, TypeVar, Union
+
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class Query:
+    """One read statement in a plan."""
+    sql: str
+    params: Optional[Sequence[Any]] = None
+    one: bool = False  # fetchone() instead of fetchall()
+
+
+Step = Union[Query, Sequence[Query]]
+Plan = Generator[Step, Any, T]
+
+
+def _fetch(cursor: Any, query: Query) -> Any:
+    cursor.execute(query.sql, query.params)
+    if query.one:
+        return cursor.fetchone()
+    return list(cursor.fetchall())
+
+
+def run_plan(plan: Plan[T], cursor_factory: Callable[[], Any]) -> T:
+    """Execute a plan on a blocking DB-API cursor.
+
+    The cursor is created on the first statement, so plans that return early
+    (empty input, dry runs) never check out a connection. Batches run
+    sequentially on the same cursor.
+    """
+    cursor = None
+    send: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            step = plan.throw(error) if error is not None else plan.send(send)
+        except StopIteration as stop:
+            return stop.value
+        send, error = None, None
+        if cursor is None:
+            cursor = cursor_factory()
+        if isinstance(step, Query):
+            try:
+                send = _fetch(cursor, step)
+            except Exception as e:
+                error = e
+        else:
+            send = []
+            for query in step:
+                try:
+                    send.append(_fetch(cursor, query))
+                except Exception as e:
+                    send.append(e)
+
+
+async def _fetch_async(pool: Any, query: Query) -> Any:
+    async with pool.connection() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query.sql, query.params)
+            if query.one:
+                return await cursor.fetchone()
+            return list(await cursor.fetchall())
+
+
+async def _fetch_captured(pool: Any, query: Query) -> Any:
+    try:
+        return await _fetch_async(pool, query)
+    except Exception as e:
+        return e
+
+
+async def run_plan_async(plan: Plan[T], pool: Any) -> T:
+    """Execute a plan on an AsyncConnectionPool.
+
+    Every statement checks out its own connection, so the statements of a
+    batch run concurrently (bounded by the pool size). Reads run in
+    autocommit mode; a plan must not rely on a shared transaction snapshot.
+    """
+    send: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            step = plan.throw(error) if error is not None else plan.send(send)
+        except StopIteration as stop:
+            return stop.value
+        send, error = None, None
+        if isinstance(step, Query):
+            try:
+                send = await _fetch_async(pool, step)
+            except Exception as e:
+                error = e
+        else:
+            send = list(await asyncio.gather(*(_fetch_captured(pool, q) for q in step)))
@@ -5,14 +5,16 @@ Uses direct MySQL access to lux_* tables for DPA Activity Tracker data.
 """
 
 import asyncio
+import inspect
 import os
 import sys
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Union
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 
-from .api import DPADatabaseClient
+from .api import AsyncDPADatabaseClient, DPADatabaseClient
+from .db_async import BACKENDS
 from .source_fetcher import SourceFetcher
 from .constants import (
     SANCHO_USER_ID,
@@ -46,17 +48,32 @@ class _StrictInput(BaseModel):
     )
 
 
-_db_client: Optional[DPADatabaseClient] = None
+_db_client: Optional[Union[DPADatabaseClient, AsyncDPADatabaseClient]] = None
 _source_fetcher: Optional[SourceFetcher] = None
 
 
-def get_db_client() -> DPADatabaseClient:
+def get_db_client() -> Union[DPADatabaseClient, AsyncDPADatabaseClient]:
     global _db_client
     if _db_client is None:
-        _db_client = DPADatabaseClient()
+        backend = os.getenv('GTA_DB_BACKEND', 'pymysql').strip().lower()
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown GTA_DB_BACKEND '{backend}'. Valid: {', '.join(BACKENDS)}"
+            )
+        if backend == 'aiomysql':
+            _db_client = AsyncDPADatabaseClient()
+        else:
+            _db_client = DPADatabaseClient()
     return _db_client
 
 
+async def run_db(method: Callable[..., Any], *args, **kwargs) -> Any:
+    """Await a database client method: coroutines directly, pymysql on a thread."""
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await asyncio.to_thread(method, *args, **kwargs)
+
+
 def get_source_fetcher() -> SourceFetcher:
     global _source_fetcher
     if _source_fetcher is None:
@@ -181,7 +198,7 @@ async def list_review_queue(params: ListReviewQueueInput) -> str:
     Events with status_id=2 (AT: in step 1 review) are shown.
     """
     db_client = get_db_client()
-    data = await asyncio.to_thread(
+    data = await run_db(
         db_client.list_review_queue,
         limit=params.limit,
         offset=params.offset,
@@ -200,7 +217,7 @@ async def get_event(params: GetEventInput) -> str:
     the intervention's benchmarks, issues, rationales, and linked agents.
     """
     db_client = get_db_client()
-    event_data = await asyncio.to_thread(
+    event_data = await run_db(
         db_client.get_event,
         event_id=params.event_id,
         include_intervention=params.include_intervention,
@@ -221,7 +238,7 @@ async def get_intervention_context(params: GetInterventionContextInput) -> str:
     reviewing any individual event.
     """
     db_client = get_db_client()
-    data = await asyncio.to_thread(
+    data = await run_db(
         db_client.get_intervention_context,
         intervention_id=params.intervention_id,
     )
@@ -240,7 +257,7 @@ async def get_source(params: GetSourceInput) -> str:
     db_client = get_db_client()
     source_fetcher = get_source_fetcher()
 
-    event_data = await asyncio.to_thread(
+    event_data = await run_db(
         db_client.get_event,
         event_id=params.event_id,
         include_intervention=False,
@@ -278,7 +295,7 @@ async def add_comment(params: AddCommentInput) -> str:
     Supports issue comments, verification comments, and review complete comments.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(
+    result = await run_db(
         db_client.add_comment,
         event_id=params.event_id,
         comment_text=params.comment_text,
@@ -312,7 +329,7 @@ async def set_status(params: SetStatusInput) -> str:
     enumerated error message.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(
+    result = await run_db(
         db_client.set_status,
         event_id=params.event_id,
         new_status_id=params.new_status_id,
@@ -334,7 +351,7 @@ async def add_review_tag(params: AddReviewTagInput) -> str:
     Call this after every completed review (PASS, CONDITIONAL, or FAIL).
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(
+    result = await run_db(
         db_client.add_review_tag,
         event_id=params.event_id,
     )
@@ -355,7 +372,7 @@ async def add_review_tag(params: AddReviewTagInput) -> str:
 async def list_templates(params: ListTemplatesInput) -> str:
     """List available comment templates for standardised feedback."""
     db_client = get_db_client()
-    data = await asyncio.to_thread(
+    data = await run_db(
         db_client.list_templates,
         include_checklist=params.include_checklist,
     )
@@ -399,7 +416,7 @@ async def lookup_event_analysts(params: LookupEventAnalystsInput) -> str:
     with their name. Useful for Slack notifications after batch reviews.
     """
     db_client = get_db_client()
-    data = await asyncio.to_thread(db_client.lookup_event_analysts, params.event_ids)
+    data = await run_db(db_client.lookup_event_analysts, params.event_ids)
 
     if not data['analysts']:
         return "No analyst records found for the given event IDs."
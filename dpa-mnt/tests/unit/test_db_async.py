@@ -0,0 +1,236 @@
+"""Unit tests for dpa_mnt query plans and the asyncio MySQL backend.
+
+A recorded-query fake answers statements by SQL fragment and tracks how many
+run at once — no live DB or aiomysql needed.
+"""
+
+import asyncio
+
+import pymysql
+import pytest
+
+from dpa_mnt import db_async
+from dpa_mnt.api import AsyncDPADatabaseClient, DPADatabaseClient
+from dpa_mnt.db_async import AsyncConnectionPool, PoolTimeout, aiomysql_connector
+from dpa_mnt.storage import ReviewStorage
+
+
+def respond(sql, params):
+    if 'FROM lux_event_log e' in sql and 'WHERE e.event_id = %s' in sql:
+        return [{'event_id': params[0], 'intervention_id': 30, 'event_title': 'DSA guidance'}]
+    if 'FROM lux_intervention_log i' in sql and 'WHERE i.intervention_id = %s' in sql:
+        return [{'intervention_id': 30, 'intervention_title': 'DSA', 'development_id': 4}]
+    if 'FROM lux_development_log' in sql:
+        return [{'development_id': 4, 'development_name': 'Platform rules'}]
+    if 'WHERE ri.intervention_id_1 = %s' in sql:
+        return [{'related_intervention_id': 31}]
+    if 'WHERE ri.intervention_id_2 = %s' in sql:
+        return [{'related_intervention_id': 29}]
+    if 'WHERE i.development_id = %s' in sql:
+        return [{'intervention_id': 32}]
+    if 'COUNT(DISTINCT e.event_id)' in sql:
+        return [{'count': 3}]
+    if 'FROM lux_event_source es' in sql:
+        return [{'source_id': 1, 'source_url': 'https://eur-lex.europa.eu/x'}]
+    return []
+
+
+class RecordedDB:
+    def __init__(self, responder=respond, delay=0.0):
+        self.responder = responder
+        self.delay = delay
+        self.executed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+class SyncCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        self.db.executed.append((sql, params))
+        self.rows = self.db.responder(sql, params)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class SyncConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return SyncCursor(self.db)
+
+
+class AsyncCursor(SyncCursor):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        self.db.in_flight += 1
+        self.db.max_in_flight = max(self.db.max_in_flight, self.db.in_flight)
+        try:
+            await asyncio.sleep(self.db.delay)
+            SyncCursor.execute(self, sql, params)
+        finally:
+            self.db.in_flight -= 1
+
+    async def fetchall(self):
+        return SyncCursor.fetchall(self)
+
+    async def fetchone(self):
+        return SyncCursor.fetchone(self)
+
+
+class AsyncConnection:
+    def __init__(self, db):
+        self.db = db
+        self.closed = False
+
+    def cursor(self):
+        return AsyncCursor(self.db)
+
+    async def ping(self, reconnect=False):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def async_connect(db):
+    async def connect():
+        return AsyncConnection(db)
+    return connect
+
+
+@pytest.fixture
+def db():
+    return RecordedDB()
+
+
+@pytest.fixture
+def sync_client(tmp_path, db, monkeypatch):
+    client = DPADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client, '_get_connection', lambda: SyncConnection(db))
+    return client
+
+
+@pytest.fixture
+def async_client(tmp_path, db):
+    return AsyncDPADatabaseClient(
+        storage=ReviewStorage(base_path=str(tmp_path)),
+        connect=async_connect(db),
+    )
+
+
+# ============================================================================
+# Backend parity
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_event_matches_sync_backend(sync_client, async_client):
+    expected = sync_client.get_event(101)
+    assert await async_client.get_event(101) == expected
+    assert expected['development'] == {'development_id': 4, 'development_name': 'Platform rules'}
+    assert expected['related_interventions'] == [
+        {'related_intervention_id': 31}, {'related_intervention_id': 29},
+    ]
+    assert expected['sources'][0]['source_id'] == 1
+    assert list(expected) == [
+        'event', 'author', 'intervention', 'economic_activities',
+        'implementing_jurisdictions', 'policy_areas', 'development',
+        'related_interventions', 'issues', 'rationales', 'agents',
+        'benchmarks', 'sources', 'comments',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_event_without_intervention(sync_client, async_client):
+    expected = sync_client.get_event(101, include_intervention=False, include_comments=False)
+    assert await async_client.get_event(101, include_intervention=False, include_comments=False) == expected
+    assert expected['intervention'] == {}
+    assert expected['comments'] == []
+
+
+@pytest.mark.asyncio
+async def test_intervention_context_matches_sync_backend(sync_client, async_client):
+    expected = sync_client.get_intervention_context(30)
+    assert await async_client.get_intervention_context(30) == expected
+    assert expected['development_siblings'] == [{'intervention_id': 32}]
+
+
+@pytest.mark.asyncio
+async def test_review_queue_and_analysts(async_client, db):
+    assert (await async_client.list_review_queue())['count'] == 3
+    assert await async_client.lookup_event_analysts([]) == {'analysts': []}
+    assert len(db.executed) == 2
+
+
+# ============================================================================
+# Concurrency and failures
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_event_batch_runs_concurrently(async_client, db):
+    db.delay = 0.005
+    await async_client.get_event(101)
+    assert db.max_in_flight > 1
+    assert async_client.pool_stats()['in_use'] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_required_read_raises(tmp_path):
+    def responder(sql, params):
+        if 'lux_event_source' in sql:
+            raise pymysql.err.ProgrammingError(1146, "Table doesn't exist")
+        return respond(sql, params)
+
+    client = AsyncDPADatabaseClient(
+        storage=ReviewStorage(base_path=str(tmp_path)),
+        connect=async_connect(RecordedDB(responder)),
+    )
+    with pytest.raises(pymysql.err.ProgrammingError):
+        await client.get_event(101)
+
+
+@pytest.mark.asyncio
+async def test_pool_bounded_and_times_out(db):
+    pool = AsyncConnectionPool(async_connect(db), max_size=1, wait_timeout=0.02)
+    conn = await pool.acquire()
+    with pytest.raises(PoolTimeout):
+        await pool.acquire()
+    pool.release(conn)
+    assert await pool.acquire() is conn
+
+
+@pytest.mark.asyncio
+async def test_writes_delegate_to_pymysql_client(async_client, monkeypatch):
+    monkeypatch.setattr(async_client._sync, 'set_status', lambda **kw: {'success': True, **kw})
+    result = await async_client.set_status(event_id=5, new_status_id=3)
+    assert result == {'success': True, 'event_id': 5, 'new_status_id': 3}
+
+
+@pytest.mark.skipif(db_async.aiomysql is not None, reason='aiomysql installed')
+def test_missing_driver_raises():
+    with pytest.raises(RuntimeError, match='aiomysql'):
+        aiomysql_connector(host='localhost')
+
+
+def test_unknown_backend_rejected(monkeypatch):
+    from dpa_mnt import server
+
+    monkeypatch.setattr(server, '_db_client', None)
+    monkeypatch.setenv('GTA_DB_BACKEND', 'sqlite')
+    with pytest.raises(ValueError, match='GTA_DB_BACKEND'):
+        server.get_db_client()
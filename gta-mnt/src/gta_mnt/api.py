@@ -4,16 +4,27 @@ Refactored to use direct MySQL connections instead of REST API endpoints.
 Also includes BastiatAPIClient for AI-powered HS code guessing.
 """
 
+import asyncio
+import base64
+import csv
+import functools
+import inspect
+import json
 import os
 import re
 import sys
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 from datetime import datetime, UTC
 
 import httpx
 import pymysql
 import pymysql.cursors
 
+from .rag_client import RAGClient, skipped as rag_skipped
+
 
 def _slugify(text: str, max_length: int = 490) -> str:
     """Generate a URL-safe slug from text, matching Django AutoSlugField behaviour."""
@@ -56,6 +67,40 @@ def extract_decree_numbers(title: str) -> list[str]:
     return found
 
 
+def encode_queue_cursor(status_time: Any, state_act_id: int) -> str:
+    """Opaque list_step1_queue cursor for the position after one row.
+
+    The queue is ordered by (status_time DESC, state_act_id DESC); a row
+    without a status log entry (NULL status_time) sorts last.
+    """
+    if status_time is None:
+        stamp = ''
+    elif hasattr(status_time, 'isoformat'):
+        stamp = status_time.isoformat(sep=' ')
+    else:
+        stamp = str(status_time)
+    return base64.urlsafe_b64encode(f'{stamp}|{state_act_id}'.encode()).decode().rstrip('=')
+
+
+def decode_queue_cursor(cursor: str) -> tuple[Optional[str], int]:
+    """(status_time, state_act_id) from encode_queue_cursor().
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_queue_cursor().
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        stamp, state_act_id = raw.rsplit('|', 1)
+        return (stamp or None), int(state_act_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f'Invalid queue cursor: {cursor!r}') from e
+
+
+def decree_key(token: str) -> str:
+    """Case- and whitespace-insensitive form of a decree token, for exact matching."""
+    return ' '.join(token.lower().split())
+
+
 def normalize_url(url: str) -> str:
     """Normalise a URL for verbatim host+path matching.
 
@@ -84,43 +129,67 @@ async def semantic_search_via_rag(
     query: str,
     intervention_ids: Optional[list[int]] = None,
     limit: int = 10,
+    client: Optional[RAGClient] = None,
 ) -> dict:
     """Call the GTA RAG semantic search endpoint.
 
     Mirrors sgept-gta-mcp's semantic_search_interventions but lives here so
     gta-mnt can reach the same vector index without depending on the public MCP.
 
+    Pass a long-lived RAGClient to reuse its connections and cache; without
+    one, a client is built from the environment for this call.
+
     Returns {"results": [], "skipped": True, "reason": "..."} when not
-    configured rather than raising — find_duplicates degrades gracefully.
+    configured, failed or over the latency budget rather than raising —
+    find_duplicates degrades gracefully.
     """
-    base_url = os.environ.get('RAG_BASE_URL')
-    api_key = os.environ.get('RAG_API_KEY')
-    if not base_url or not api_key:
-        return {
-            'results': [],
-            'skipped': True,
-            'reason': 'RAG_BASE_URL or RAG_API_KEY not set; Vector G skipped',
-        }
-    endpoint = f"{base_url.rstrip('/')}/chat/gta/semantic-search"
-    headers = {'X-API-Key': api_key, 'Content-Type': 'application/json'}
-    body: dict = {'query': query, 'limit': limit}
-    if intervention_ids:
-        body['intervention_ids'] = intervention_ids
+    if client is not None:
+        return await client.search(query, intervention_ids, limit)
+    client = RAGClient.from_env()
+    if client is None:
+        return rag_skipped('RAG_BASE_URL or RAG_API_KEY not set; Vector G skipped')
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(endpoint, json=body, headers=headers)
-            response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        return {
-            'results': [],
-            'skipped': True,
-            'reason': f'RAG call failed: {type(e).__name__}: {str(e)[:200]}',
-        }
+        return await client.search(query, intervention_ids, limit)
+    finally:
+        await client.aclose()
 
 
 from .constants import SANCHO_USER_ID, SANCHO_AUTHOR_ID, SANCHO_FRAMEWORK_ID, FRAMEWORK_IDS, LOOKUP_TABLES
+from .hs_guess_cache import HSGuessCache, guess_key
 from .storage import ReviewStorage
+from .db_pool import ConnectionPool, DEFAULT_MAX_LIFETIME, DEFAULT_POOL_SIZE, DEFAULT_WAIT_TIMEOUT
+from .db_async import AsyncConnectionPool, aiomysql_connector
+from .query_plan import Plan, Query, run_plan, run_plan_async
+from .measure_cache import MeasureCache
+from .sql_profiler import SQLProfiler, current_method, profiled_cursor_class
+from .lookup_index import LookupIndex
+from .duplicate_index import DuplicateIndex
+from .read_routing import ANY_WRITE, INTERVENTION, STATE_ACT, ReadRouter
+
+T = TypeVar('T')
+
+# Tariff-line levels stored above HS6, one table each
+_PRODUCT_LEVELS = (8, 10, 12, 14)
+
+# Cached list_step1_queue totals: lifetime (GTA_QUEUE_COUNT_TTL, 0 disables)
+# and the number of distinct filter combinations kept
+DEFAULT_QUEUE_COUNT_TTL = 300.0
+
+# export_queue(): output formats, and rows fetched from the server per write
+EXPORT_FORMATS = ('jsonl', 'csv')
+EXPORT_BATCH_ROWS = 500
+QUEUE_COUNT_MAX_KEYS = 256
+
+# MySQL error codes of a schema without a probed table / column
+_SCHEMA_ERRORS = (1146, 1054)
+
+
+def _is_schema_error(error: Exception) -> bool:
+    """True for a missing table or column, which fails the same way on every call."""
+    return (
+        isinstance(error, (pymysql.err.ProgrammingError, pymysql.err.OperationalError))
+        and bool(error.args) and error.args[0] in _SCHEMA_ERRORS
+    )
 
 
 class BastiatAPIClient:
@@ -128,17 +197,77 @@ class BastiatAPIClient:
 
     Uses semantic understanding to match natural language product descriptions
     to HS codes, unlike gta_mnt_lookup which only does substring matching.
+
+    One instance keeps a pooled HTTP client, so it must be used from a single
+    event loop; guesses are served from an HSGuessCache when one is given.
     """
 
     DEFAULT_BASE_URL = "https://bastiat-api.globaltradealert.org"
+    TIMEOUT = 90.0  # seconds; a guess can take most of a minute
+    DEFAULT_CONCURRENCY = 4
 
-    def __init__(self, api_key: str, base_url: str | None = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str | None = None,
+        cache: Optional[HSGuessCache] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
         self.api_key = api_key
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.headers = {
             "Authorization": f"APIKey {api_key}",
             "Content-Type": "application/json",
         }
+        self.cache = cache
+        self.concurrency = max(1, concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["BastiatAPIClient"]:
+        """Build a client from GTA_API_KEY and GTA_BASTIAT_CONCURRENCY, or None without a key."""
+        api_key = os.getenv("GTA_API_KEY")
+        if not api_key:
+            return None
+        return cls(
+            api_key=api_key,
+            cache=HSGuessCache.from_env(),
+            concurrency=int(os.getenv("GTA_BASTIAT_CONCURRENCY", str(cls.DEFAULT_CONCURRENCY))),
+        )
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.TIMEOUT,
+                limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _request_guess(
+        self,
+        article_text: str,
+        target_hs_levels: list[int] | None,
+        initial_hs_codes: list[str] | None,
+    ) -> dict:
+        payload = {"article_text": article_text}
+        if target_hs_levels:
+            payload["target_hs_levels"] = target_hs_levels
+        if initial_hs_codes:
+            payload["initial_hs_codes"] = initial_hs_codes
+
+        response = await self._http().post(
+            f"{self.base_url}/bastiat/howard/guess-hs-codes/",
+            headers=self.headers,
+            json=payload,
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def guess_hs_codes(
         self,
@@ -155,21 +284,189 @@ class BastiatAPIClient:
 
         Returns:
             API response dict with guessed HS codes.
+
+        Raises:
+            httpx.HTTPError: If the request fails
         """
-        payload = {"article_text": article_text}
-        if target_hs_levels:
-            payload["target_hs_levels"] = target_hs_levels
-        if initial_hs_codes:
-            payload["initial_hs_codes"] = initial_hs_codes
+        key = guess_key(article_text, target_hs_levels, initial_hs_codes)
+        if self.cache is not None:
+            cached = (await asyncio.to_thread(self.cache.get_many, [key])).get(key)
+            if cached is not None:
+                return cached
+        result = await self._request_guess(article_text, target_hs_levels, initial_hs_codes)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put_many, {key: result})
+        return result
+
+    async def guess_hs_codes_bulk(
+        self,
+        article_texts: list[str],
+        target_hs_levels: list[int] | None = None,
+        initial_hs_codes: list[str] | None = None,
+    ) -> dict:
+        """Guess HS codes for many product descriptions at once.
 
-        async with httpx.AsyncClient(timeout=90.0) as client:
-            response = await client.post(
-                f"{self.base_url}/bastiat/howard/guess-hs-codes/",
-                headers=self.headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
+        Descriptions are de-duplicated after normalisation, repeats of earlier
+        requests are served from the cache, and the rest are sent at most
+        `concurrency` at a time over the pooled connections. A failed
+        description is reported in its row and does not fail the others.
+
+        Args:
+            article_texts: Product descriptions, e.g. the lines of a tariff schedule.
+            target_hs_levels: HS digit levels to return, for every description.
+            initial_hs_codes: Hint codes, for every description.
+
+        Returns:
+            Dict with 'results' (one row per input description, in input
+            order: 'index', 'article_text', 'status' of 'ok', 'cached',
+            'duplicate' or 'error', and 'result', 'error' or 'duplicate_of')
+            and counts 'requested', 'unique', 'cached', 'fetched', 'failed'
+        """
+        keys = [guess_key(text, target_hs_levels, initial_hs_codes) for text in article_texts]
+        first: dict = {}
+        for index, key in enumerate(keys):
+            first.setdefault(key, index)
+
+        cached = {}
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get_many, first)
+        pending = [key for key in first if key not in cached]
+
+        slots = asyncio.Semaphore(self.concurrency)
+        errors: dict = {}
+
+        async def fetch(key: tuple) -> Optional[dict]:
+            async with slots:
+                try:
+                    return await self._request_guess(article_texts[first[key]], target_hs_levels, initial_hs_codes)
+                except httpx.HTTPStatusError as e:
+                    errors[key] = f"Bastiat API returned {e.response.status_code}: {e.response.text[:200]}"
+                except httpx.TimeoutException:
+                    errors[key] = f"Bastiat API timed out after {self.TIMEOUT:g}s"
+                except Exception as e:
+                    errors[key] = str(e) or type(e).__name__
+                return None
+
+        fetched = dict(zip(pending, await asyncio.gather(*(fetch(key) for key in pending))))
+        for key in errors:
+            del fetched[key]
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put_many, fetched)
+
+        results = []
+        for index, (text, key) in enumerate(zip(article_texts, keys)):
+            row: dict = {'index': index, 'article_text': text}
+            if first[key] != index:
+                row.update(status='duplicate', duplicate_of=first[key])
+            elif key in errors:
+                row.update(status='error', error=errors[key])
+            else:
+                row.update(status='cached' if key in cached else 'ok')
+            if key not in errors:
+                row['result'] = cached[key] if key in cached else fetched[key]
+            results.append(row)
+
+        return {
+            'results': results,
+            'requested': len(article_texts),
+            'unique': len(first),
+            'cached': len(cached),
+            'fetched': len(fetched),
+            'failed': len(errors),
+        }
+
+
+def _pooled(method: Callable[..., T]) -> Callable[..., T]:
+    """Run a GTADatabaseClient method with its own pooled connection.
+
+    The outermost pooled method is also what the SQL profiler attributes the
+    statements to.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        token = None if current_method.get() else current_method.set(method.__name__)
+        try:
+            with self._connection_scope():
+                return method(self, *args, **kwargs)
+        finally:
+            if token is not None:
+                current_method.reset(token)
+
+    return wrapper
+
+
+# Argument names of the read methods' subjects -> what they identify
+_READ_SUBJECTS = {'state_act_id': STATE_ACT, 'intervention_ids': INTERVENTION}
+
+
+def _read_only(depends_on: Optional[str] = ANY_WRITE) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Send a read-only GTADatabaseClient method to the read replica, when one is configured.
+
+    `depends_on` names the argument holding what the result is about
+    (`state_act_id` or `intervention_ids`): the method stays on the primary
+    while that was written by this process within the pin window. ANY_WRITE
+    keeps it on the primary after any recent write (results that can include
+    any state act); None always allows the replica (reference data).
+    Goes above @_pooled; a method called inside another keeps its connection.
+    """
+
+    def decorate(method: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(method)
+        subject = _READ_SUBJECTS.get(depends_on, depends_on)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            local = self._local
+            if getattr(local, 'depth', 0) or not self._use_replica(subject, depends_on, signature, args, kwargs):
+                return method(self, *args, **kwargs)
+            local.replica = True
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                local.replica = False
+
+        wrapper.read_depends_on = depends_on
+        return wrapper
+
+    return decorate
+
+
+def _invalidates_measure(param: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Drop cached get_measure() results touched by a GTADatabaseClient write.
+
+    `param` names the argument identifying what was written: a state act
+    (`state_act_id` / `measure_id`) or an intervention (`intervention_id`).
+    Runs once the method returns or raises; dry runs write nothing. The
+    write is also pinned to the primary for read-your-writes (read_routing.py).
+    """
+
+    def decorate(method: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                if not bound.arguments.get('dry_run'):
+                    written = bound.arguments[param]
+                    if param == 'intervention_id':
+                        self._pin_write(intervention_ids=[written])
+                    else:
+                        self._pin_write(written)
+                    cache = self._measure_cache
+                    if cache is not None:
+                        if param == 'intervention_id':
+                            cache.invalidate_intervention(written)
+                        else:
+                            cache.invalidate(written)
+
+        return wrapper
+
+    return decorate
 
 
 class GTADatabaseClient:
@@ -193,32 +490,255 @@ class GTADatabaseClient:
         self.password = os.getenv('GTA_DB_PASSWORD_WRITE', os.getenv('GTA_DB_PASSWORD', ''))
 
         self.storage = storage or ReviewStorage()
-        self._conn: Optional[pymysql.Connection] = None
+        # Per-statement timings; None unless GTA_SQL_PROFILE is set
+        self._profiler = SQLProfiler.from_env(str(self.storage.base_path))
+        self._cursor_class = (
+            profiled_cursor_class(self._profiler) if self._profiler is not None else pymysql.cursors.DictCursor
+        )
+        # Unbuffered cursor for export_queue()
+        self._stream_cursor_class = (
+            profiled_cursor_class(self._profiler, pymysql.cursors.SSDictCursor)
+            if self._profiler is not None else pymysql.cursors.SSDictCursor
+        )
+        self._pool = ConnectionPool(
+            self._connect,
+            max_size=int(os.getenv('GTA_DB_POOL_SIZE', str(DEFAULT_POOL_SIZE))),
+            max_lifetime=float(os.getenv('GTA_DB_POOL_MAX_LIFETIME', str(DEFAULT_MAX_LIFETIME))),
+            wait_timeout=float(os.getenv('GTA_DB_POOL_TIMEOUT', str(DEFAULT_WAIT_TIMEOUT))),
+        )
+        # Replica routing for read-only methods; None unless GTA_DB_HOST_READ is set
+        self._router = ReadRouter.from_env()
+        self._read_pool: Optional[ConnectionPool] = None
+        if self._router is not None:
+            self.read_host = os.environ['GTA_DB_HOST_READ']
+            self.read_port = int(os.getenv('GTA_DB_PORT_READ', str(self.port)))
+            self.read_user = os.getenv('GTA_DB_USER_READ', self.user)
+            self.read_password = os.getenv('GTA_DB_PASSWORD_READ', self.password)
+            self._read_pool = ConnectionPool(
+                self._connect_read,
+                max_size=int(os.getenv('GTA_DB_POOL_SIZE', str(DEFAULT_POOL_SIZE))),
+                max_lifetime=float(os.getenv('GTA_DB_POOL_MAX_LIFETIME', str(DEFAULT_MAX_LIFETIME))),
+                wait_timeout=float(os.getenv('GTA_DB_POOL_TIMEOUT', str(DEFAULT_WAIT_TIMEOUT))),
+            )
+        # Per-thread checkout state: each DB method runs on its own to_thread
+        # worker, so a thread-local scope gives every call its own connection.
+        self._local = threading.local()
+        # Assembled get_measure() results; None when GTA_MEASURE_CACHE_TTL=0
+        self._measure_cache = MeasureCache.from_env()
+        # Local search index for lookup(); None when GTA_LOOKUP_INDEX=0
+        self._lookup_index = LookupIndex.from_env()
+        # URL / decree-token index for find_duplicates; None when GTA_DUPLICATE_INDEX=0
+        self._duplicate_index = DuplicateIndex.from_env()
+        # Index loads and rebuilds never run inside a request: job name ->
+        # the daemon thread running it (see _in_background), and a lock per
+        # job so a start-up warm and a request-triggered job do not overlap
+        self._index_jobs: dict[str, threading.Thread] = {}
+        self._index_locks: dict[str, threading.Lock] = {}
+        self._index_jobs_lock = threading.Lock()
+        # list_step1_queue totals: filter key -> (watermark, count, stored_at)
+        self._queue_counts: dict[tuple, tuple[tuple, int, float]] = {}
+        self._queue_count_ttl = float(os.getenv('GTA_QUEUE_COUNT_TTL', str(DEFAULT_QUEUE_COUNT_TTL)))
+
+    def _connect(self) -> pymysql.Connection:
+        """Open a new database connection (used by the pool)."""
+        return pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            port=self.port,
+            cursorclass=self._cursor_class,
+            autocommit=False
+        )
+
+    def _connect_read(self) -> pymysql.Connection:
+        """Open a new read-replica connection (used by the read pool)."""
+        return pymysql.connect(
+            host=self.read_host,
+            user=self.read_user,
+            password=self.read_password,
+            database=self.database,
+            port=self.read_port,
+            cursorclass=self._cursor_class,
+            autocommit=False
+        )
+
+    def _use_replica(self, subject: Optional[str], param: Optional[str], signature, args, kwargs) -> bool:
+        """Whether a read-only method call may run on the replica (see _read_only)."""
+        if self._router is None:
+            return False
+        ids = None
+        if subject in (STATE_ACT, INTERVENTION):
+            bound = signature.bind(self, *args, **kwargs)
+            ids = bound.arguments.get(param)
+        return self._router.use_replica(subject, ids)
+
+    def _pin_write(self, state_act_id: Optional[int] = None, intervention_ids: Iterable[int] = ()) -> None:
+        """Keep reads of what this process just wrote on the primary for the pin window."""
+        if self._router is not None:
+            self._router.pin(state_act_id, intervention_ids)
+
+    @contextmanager
+    def _connection_scope(self) -> Iterator[None]:
+        """Scope within which _get_connection() returns one pooled connection.
+
+        The connection is checked out lazily on first use (dry-run paths never
+        touch the pool) and returned when the outermost scope exits. Nested
+        scopes on the same thread share the connection, so a method that calls
+        another method stays inside one transaction. The outermost scope uses
+        the read pool if a @_read_only method routed it to the replica.
+        """
+        local = self._local
+        depth = getattr(local, 'depth', 0)
+        if depth == 0:
+            local.pool = self._read_pool if getattr(local, 'replica', False) else self._pool
+        local.depth = depth + 1
+        failed = False
+        try:
+            yield
+        except BaseException as e:
+            failed = isinstance(e, (pymysql.err.OperationalError, pymysql.err.InterfaceError))
+            raise
+        finally:
+            local.depth = depth
+            if depth == 0:
+                conn = getattr(local, 'conn', None)
+                local.conn = None
+                if conn is not None:
+                    local.pool.release(conn, discard=failed)
+
+    @contextmanager
+    def connection(self) -> Iterator[pymysql.Connection]:
+        """Check out a pooled connection for ad-hoc queries outside a client method."""
+        with self._connection_scope():
+            yield self._get_connection()
 
     def _get_connection(self) -> pymysql.Connection:
-        """Get or create database connection."""
-        if self._conn is None or not self._conn.open:
-            self._conn = pymysql.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                port=self.port,
-                cursorclass=pymysql.cursors.DictCursor,
-                autocommit=False
+        """Return the connection checked out for the current call."""
+        local = self._local
+        if not getattr(local, 'depth', 0):
+            raise RuntimeError(
+                '_get_connection() called outside a connection scope; '
+                'use `with client.connection() as conn:` or a @_pooled method'
             )
-        return self._conn
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            if local.pool is self._read_pool:
+                try:
+                    conn = self._read_pool.acquire()
+                except pymysql.err.OperationalError as e:
+                    # Replica unreachable: this call reads from the primary instead
+                    print(f"[gta-mnt] WARNING: Read replica unavailable, using the primary: {e}", file=sys.stderr)
+                    self._router.stats["fallbacks"] += 1
+                    local.pool = self._pool
+            if conn is None:
+                conn = local.pool.acquire()
+            local.conn = conn
+        return conn
+
+    def _run(self, plan: Plan[T], concurrent: bool = False) -> T:
+        """Execute a query plan on the current call's pooled connection.
+
+        With `concurrent`, the statements of each batch run in parallel, each
+        extra one on a connection leased from the pool for that statement.
+        Leasing never waits: when the pool is exhausted the statement runs on
+        the call's own connection after the others.
+        """
+        lease = None
+        if concurrent:
+            # Leases are entered in worker threads: bind this call's pool now
+            lease = functools.partial(self._lease_connection, getattr(self._local, 'pool', self._pool))
+        return run_plan(plan, lambda: self._get_connection().cursor(), lease)
+
+    @contextmanager
+    def _lease_connection(self, pool: Optional[ConnectionPool] = None) -> Iterator[Optional[Any]]:
+        """Borrow a cursor on a free connection of `pool` (default: the primary), or None if there is none.
+
+        A connection that cannot be opened counts as none free. One that a
+        statement broke is discarded by the pool when its rollback fails.
+        """
+        pool = pool or self._pool
+        try:
+            conn = pool.acquire(wait=False)
+        except pymysql.err.Error:
+            conn = None
+        if conn is None:
+            yield None
+            return
+        try:
+            yield conn.cursor()
+        finally:
+            pool.release(conn)
+
+    def _index_lock(self, name: str) -> threading.Lock:
+        """Lock held while index job `name` runs, in a request-started thread or a warm."""
+        with self._index_jobs_lock:
+            return self._index_locks.setdefault(name, threading.Lock())
+
+    def _in_background(self, name: str, target: Callable[..., Any], *args: Any) -> None:
+        """Run an index load or rebuild on a daemon thread, unless job `name` is already running.
+
+        Requests that find an index stale or missing call this and carry on
+        with what they have (the current index, or the live LIKE queries).
+        """
+        with self._index_jobs_lock:
+            job = self._index_jobs.get(name)
+            if job is not None and job.is_alive():
+                return
+            job = threading.Thread(target=target, args=args, name=f'gta-mnt-{name}', daemon=True)
+            self._index_jobs[name] = job
+        job.start()
+
+    def pool_stats(self) -> dict:
+        """Connection pool occupancy and counters."""
+        return self._pool.snapshot()
+
+    def read_routing_stats(self) -> Optional[dict]:
+        """Replica pool and routing counters; None when GTA_DB_HOST_READ is unset."""
+        if self._router is None:
+            return None
+        return {'host': self.read_host, **self._router.snapshot(), 'pool': self._read_pool.snapshot()}
+
+    def db_stats(self, top: int = 20, method: Optional[str] = None, reset: bool = False) -> dict:
+        """SQL profile plus the state of the pool, caches and local indexes.
+
+        Args:
+            top: Statement shapes to list, by total time
+            method: Only statements issued by this client method
+            reset: Clear the profile after reading it
+
+        Returns:
+            Dict with 'profile' (None when GTA_SQL_PROFILE is off), 'pool',
+            'measure_cache', 'lookup_index', 'duplicate_index', 'queue_counts'
+            and 'read_routing'
+        """
+        profile = None
+        if self._profiler is not None:
+            profile = self._profiler.summary(top, method)
+            if reset:
+                self._profiler.reset()
+        return {
+            'profile': profile,
+            'pool': self.pool_stats(),
+            'measure_cache': self._measure_cache.snapshot() if self._measure_cache is not None else None,
+            'lookup_index': self._lookup_index.snapshot() if self._lookup_index is not None else None,
+            'duplicate_index': self._duplicate_index.snapshot() if self._duplicate_index is not None else None,
+            'queue_counts': {'cached_totals': len(self._queue_counts), 'ttl': self._queue_count_ttl},
+            'read_routing': self.read_routing_stats(),
+        }
 
     def close(self):
-        """Close the database connection."""
-        if self._conn and self._conn.open:
-            self._conn.close()
-            self._conn = None
+        """Close all idle pooled connections."""
+        self._pool.close()
+        if self._read_pool is not None:
+            self._read_pool.close()
 
     # ========================================================================
     # WS2: List Step 1 Queue
     # ========================================================================
 
+    @_read_only()
+    @_pooled
     def list_step1_queue(
         self,
         status_id: int = 2,
@@ -226,28 +746,104 @@ class GTADatabaseClient:
         offset: int = 0,
         implementing_jurisdictions: Optional[list[str]] = None,
         date_entered_review_gte: Optional[str] = None,
-        exclude_framework_id: Optional[int] = None
+        exclude_framework_id: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> dict:
         """List measures awaiting review by status.
 
         Query uses api_state_act_log with api_state_act_status_log to get accurate
-        status_time ordering (most recent first).
+        status_time ordering (most recent first, ties by state_act_id).
+
+        Pages are read by keyset: pass the previous page's `next_cursor` as
+        `cursor` and the next page starts right after it, at the same cost at
+        any depth. `offset` still works but makes MySQL walk the skipped rows.
+
+        The total is cached per status / framework exclusion / jurisdiction
+        filter and recounted once the status-log, framework or implementing
+        jurisdiction watermark moves (or after GTA_QUEUE_COUNT_TTL seconds).
 
         Args:
             limit: Max measures to return. None = no limit (return all).
-            offset: Pagination offset
-            implementing_jurisdictions: Filter by jurisdiction codes
+            offset: Pagination offset (ignored when `cursor` is given)
+            implementing_jurisdictions: Filter by implementing jurisdiction
+                (ISO codes such as 'USA', or jurisdiction ids)
             date_entered_review_gte: Filter by date entered review (YYYY-MM-DD)
             exclude_framework_id: Exclude measures that have this framework attached
+            cursor: `next_cursor` of the previous page
 
         Returns:
-            Dict with 'results' list and 'count' int
+            Dict with 'results' list, 'count' int and 'next_cursor' (None on
+            the last page)
+
+        Raises:
+            ValueError: If `cursor` is malformed.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._run(self._list_step1_queue_plan(
+            status_id, limit, offset, implementing_jurisdictions,
+            date_entered_review_gte, exclude_framework_id, cursor,
+        ))
 
-        # Build the query using api_state_act_log (the main state act table)
-        query = '''
+    @staticmethod
+    def _jurisdiction_semi_join(jurisdictions: list[str]) -> tuple[str, list]:
+        """EXISTS clause keeping state acts with an intervention implemented in `jurisdictions`.
+
+        Numeric entries are jurisdiction ids, the rest ISO codes. The subquery
+        probes api_intervention_log by state_act_id and stops at the first
+        matching intervention, so it stays an index lookup per state act.
+        """
+        ids = [int(j) for j in jurisdictions if str(j).strip().isdigit()]
+        codes = [str(j).strip().upper() for j in jurisdictions if not str(j).strip().isdigit()]
+        matches, params = [], []
+        if ids:
+            matches.append(f"iij.jurisdiction_id IN ({','.join(['%s'] * len(ids))})")
+            params += ids
+        if codes:
+            matches.append(f"""iij.jurisdiction_id IN (
+                        SELECT j.jurisdiction_id FROM api_jurisdiction_list j
+                        WHERE j.iso_code IN ({','.join(['%s'] * len(codes))}))""")
+            params += codes
+        return f'''EXISTS (
+                SELECT 1 FROM api_intervention_log i
+                JOIN api_intervention_ij iij ON iij.intervention_id = i.intervention_id
+                WHERE i.state_act_id = sa.state_act_id
+                  AND ({' OR '.join(matches)}))''', params
+
+    def _queue_filters(
+        self,
+        status_id: int,
+        implementing_jurisdictions: Optional[list[str]],
+        exclude_framework_id: Optional[int],
+    ) -> tuple[str, list[str], list, list[str]]:
+        """Joins, WHERE conditions and parameters shared by queue pages, counts and exports.
+
+        Also returns the normalised jurisdiction filter (part of the count cache key).
+        """
+        joins = ''
+        params: list = []
+        if exclude_framework_id is not None:
+            joins = '''
+            LEFT JOIN api_state_act_framework saf
+                ON sa.state_act_id = saf.state_act_id AND saf.framework_id = %s
+            '''
+            params.append(exclude_framework_id)
+
+        conditions = ['sa.status_id = %s']
+        params.append(status_id)
+
+        if exclude_framework_id is not None:
+            conditions.append('saf.id IS NULL')
+
+        jurisdictions = sorted({str(j).strip() for j in implementing_jurisdictions or [] if str(j).strip()})
+        if jurisdictions:
+            clause, jurisdiction_params = self._jurisdiction_semi_join(jurisdictions)
+            conditions.append(clause)
+            params += jurisdiction_params
+        return joins, conditions, params, jurisdictions
+
+    @staticmethod
+    def _queue_select(joins: str, conditions: list[str]) -> str:
+        """Queue rows matching `conditions`, most recent status change first."""
+        return f'''
             SELECT DISTINCT
                 sa.state_act_id as id,
                 sa.title,
@@ -259,75 +855,213 @@ class GTADatabaseClient:
             FROM api_state_act_log sa
             LEFT JOIN api_state_act_status_log sl
                 ON sa.state_act_id = sl.state_act_id AND sl.state_act_status_id = sa.status_id
+            {joins}
+            WHERE {' AND '.join(conditions)}
+            ORDER BY sl.status_time DESC, sa.state_act_id DESC
         '''
-        params = []
-
-        if exclude_framework_id is not None:
-            query += '''
-            LEFT JOIN api_state_act_framework saf
-                ON sa.state_act_id = saf.state_act_id AND saf.framework_id = %s
-            '''
-            params.append(exclude_framework_id)
-
-        query += ' WHERE sa.status_id = %s'
-        params.append(status_id)
-
-        if exclude_framework_id is not None:
-            query += ' AND saf.id IS NULL'
 
-        # TODO: Jurisdiction filtering would require joining through interventions
-        # For now, filter by jurisdiction is not supported in list view
-        if implementing_jurisdictions:
-            # Skip jurisdiction filter - would need complex subquery
-            pass
+    def _list_step1_queue_plan(
+        self,
+        status_id: int = 2,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        implementing_jurisdictions: Optional[list[str]] = None,
+        date_entered_review_gte: Optional[str] = None,
+        exclude_framework_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Plan[dict]:
+        """Query plan for list_step1_queue()."""
+        after = decode_queue_cursor(cursor) if cursor else None
+
+        joins, conditions, params, jurisdictions = self._queue_filters(
+            status_id, implementing_jurisdictions, exclude_framework_id,
+        )
+        count_query = f'''
+            SELECT COUNT(DISTINCT sa.state_act_id) as count
+            FROM api_state_act_log sa
+            {joins}
+            WHERE {' AND '.join(conditions)}
+        '''
+        count_params = list(params)
 
+        # Build the query using api_state_act_log (the main state act table)
         if date_entered_review_gte:
-            query += ' AND sl.status_time >= %s'
+            conditions.append('sl.status_time >= %s')
             params.append(date_entered_review_gte)
 
-        query += ' ORDER BY sl.status_time DESC'
+        if after is not None:
+            # Keyset: rows strictly after the cursor in (status_time DESC,
+            # state_act_id DESC) order; NULL status_time rows come last.
+            after_time, after_id = after
+            if after_time is None:
+                conditions.append('(sl.status_time IS NULL AND sa.state_act_id < %s)')
+                params.append(after_id)
+            else:
+                conditions.append(
+                    '(sl.status_time < %s OR (sl.status_time = %s AND sa.state_act_id < %s)'
+                    ' OR sl.status_time IS NULL)'
+                )
+                params += [after_time, after_time, after_id]
+
+        query = self._queue_select(joins, conditions)
 
         if limit is not None:
-            query += ' LIMIT %s OFFSET %s'
-            params.extend([limit, offset])
-        elif offset > 0:
+            query += ' LIMIT %s'
+            params.append(limit)
+            if after is None and offset > 0:
+                query += ' OFFSET %s'
+                params.append(offset)
+        elif after is None and offset > 0:
             query += ' LIMIT 18446744073709551615 OFFSET %s'
             params.append(offset)
 
-        cursor.execute(query, params)
-        results = cursor.fetchall()
+        # The page and the count watermark are independent reads
+        count_key = (status_id, exclude_framework_id, tuple(jurisdictions))
+        results, mark = yield (
+            Query(query, params),
+            Query(self._QUEUE_WATERMARK_SQL, one=True),
+        )
+        if isinstance(results, Exception):
+            raise results
+
+        count = None
+        watermark = None if isinstance(mark, Exception) else tuple((mark or {}).values())
+        cached = self._queue_counts.get(count_key)
+        if (
+            watermark is not None and cached is not None and cached[0] == watermark
+            and time.monotonic() - cached[2] < self._queue_count_ttl
+        ):
+            count = cached[1]
+        if count is None:
+            count_row = yield Query(count_query, count_params, one=True)
+            count = count_row['count']
+            if watermark is not None and self._queue_count_ttl > 0:
+                if len(self._queue_counts) >= QUEUE_COUNT_MAX_KEYS:
+                    self._queue_counts.clear()
+                self._queue_counts[count_key] = (watermark, count, time.monotonic())
+
+        next_cursor = None
+        if limit is not None and len(results) == limit:
+            last = results[-1]
+            next_cursor = encode_queue_cursor(last.get('status_time'), last['id'])
 
-        # Get total count (with same framework exclusion)
-        count_query = '''
-            SELECT COUNT(DISTINCT sa.state_act_id) as count
-            FROM api_state_act_log sa
-        '''
-        count_params = []
-        if exclude_framework_id is not None:
-            count_query += '''
-            LEFT JOIN api_state_act_framework saf
-                ON sa.state_act_id = saf.state_act_id AND saf.framework_id = %s
-            '''
-            count_params.append(exclude_framework_id)
+        return {
+            'results': results,
+            'count': count,
+            'next_cursor': next_cursor,
+        }
+
+    # Moves on every status change, framework assignment and implementing
+    # jurisdiction added (the jurisdiction filter counts through those rows);
+    # read once per queue page to decide whether the cached total is current.
+    _QUEUE_WATERMARK_SQL = '''
+        SELECT
+            (SELECT COALESCE(MAX(id), 0) FROM api_state_act_status_log) AS status_mark,
+            (SELECT COALESCE(MAX(id), 0) FROM api_state_act_framework) AS framework_mark,
+            (SELECT COALESCE(MAX(id), 0) FROM api_intervention_ij) AS ij_mark
+    '''
+
+    @_read_only()
+    @_pooled
+    def export_queue(
+        self,
+        status_id: int = 2,
+        implementing_jurisdictions: Optional[list[str]] = None,
+        date_entered_review_gte: Optional[str] = None,
+        exclude_framework_id: Optional[int] = None,
+        format: str = 'jsonl',
+    ) -> dict:
+        """Stream every measure of a queue into a JSONL or CSV file in review storage.
 
-        count_query += ' WHERE sa.status_id = %s'
-        count_params.append(status_id)
+        The rows list_step1_queue(limit=None) would return, in the same order,
+        read through an unbuffered server-side cursor (SSDictCursor) and
+        written EXPORT_BATCH_ROWS at a time, so memory stays flat however
+        large the queue. The file appears under `_exports/` once complete.
 
-        if exclude_framework_id is not None:
-            count_query += ' AND saf.id IS NULL'
+        Args:
+            status_id: Queue status (2 = Step 1, 19 = Step 2, ...)
+            implementing_jurisdictions: Filter by implementing jurisdiction
+                (ISO codes such as 'USA', or jurisdiction ids)
+            date_entered_review_gte: Filter by date entered review (YYYY-MM-DD)
+            exclude_framework_id: Exclude measures that have this framework attached
+            format: 'jsonl' (one JSON object per line) or 'csv' (header row first)
+
+        Returns:
+            Dict with 'path', 'format', 'rows', 'bytes', 'columns',
+            'newest_status_time' / 'oldest_status_time' (None when no row has
+            one), 'elapsed_ms' and the 'filters' applied
+
+        Raises:
+            ValueError: If `format` is neither 'jsonl' nor 'csv'.
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format {format!r}; use one of {', '.join(EXPORT_FORMATS)}")
+        started = time.perf_counter()
+        joins, conditions, params, jurisdictions = self._queue_filters(
+            status_id, implementing_jurisdictions, exclude_framework_id,
+        )
+        if date_entered_review_gte:
+            conditions.append('sl.status_time >= %s')
+            params.append(date_entered_review_gte)
 
-        cursor.execute(count_query, count_params)
-        count = cursor.fetchone()['count']
+        stamp = datetime.now(UTC).strftime('%Y%m%dT%H%M%S%fZ')
+        path = self.storage.export_path(f'queue-status{status_id}-{stamp}.{format}')
+        partial = path.with_name(f'.{path.name}.partial')
+        rows = 0
+        newest = oldest = None
+        cursor = self._get_connection().cursor(self._stream_cursor_class)
+        try:
+            with open(partial, 'w', encoding='utf-8', newline='') as f:
+                cursor.execute(self._queue_select(joins, conditions), params)
+                columns = [d[0] for d in cursor.description]
+                csv_writer = csv.DictWriter(f, fieldnames=columns) if format == 'csv' else None
+                if csv_writer is not None:
+                    csv_writer.writeheader()
+                while True:
+                    batch = cursor.fetchmany(EXPORT_BATCH_ROWS)
+                    if not batch:
+                        break
+                    if csv_writer is not None:
+                        csv_writer.writerows(batch)
+                    else:
+                        f.writelines(json.dumps(row, default=str, ensure_ascii=False) + '\n' for row in batch)
+                    rows += len(batch)
+                    # Rows come newest first, NULL status times last
+                    times = [row['status_time'] for row in batch if row.get('status_time') is not None]
+                    if times:
+                        newest = newest or times[0]
+                        oldest = times[-1]
+            os.replace(partial, path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        finally:
+            # Drains whatever the server has not sent yet, so the connection is reusable
+            cursor.close()
 
         return {
-            'results': results,
-            'count': count
+            'path': str(path),
+            'format': format,
+            'rows': rows,
+            'bytes': path.stat().st_size,
+            'columns': columns,
+            'newest_status_time': str(newest) if newest is not None else None,
+            'oldest_status_time': str(oldest) if oldest is not None else None,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            'filters': {
+                'status_id': status_id,
+                'implementing_jurisdictions': jurisdictions,
+                'date_entered_review_gte': date_entered_review_gte,
+                'exclude_framework_id': exclude_framework_id,
+            },
         }
 
     # ========================================================================
     # WS3: Get Measure Detail
     # ========================================================================
 
+    @_read_only('state_act_id')
+    @_pooled
     def get_measure(
         self,
         state_act_id: int,
@@ -344,42 +1078,423 @@ class GTADatabaseClient:
         Returns:
             Dict with StateAct details, interventions, comments, sources
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._run(self._get_measure_plan(
+            state_act_id, include_interventions, include_comments,
+        ))
 
-        # Get measure - try multiple table names (gta_measure vs api_state_act_log)
-        measure = None
+    @staticmethod
+    def _intervention_detail_queries(intervention_ids: list[int]) -> list[Query]:
+        """Child-table reads for a set of interventions, in _attach_intervention_details() order.
 
-        # Try 1: gta_measure (documented table name)
-        try:
-            cursor.execute('''
+        One ``IN (...)`` query per table; every query leads with the owning
+        intervention_id so rows can be grouped in memory afterwards.
+        """
+        ids = tuple(intervention_ids)
+        id_in = ','.join(['%s'] * len(ids))
+        queries = [
+            # Canonical description updates and their per-update dates
+            Query(f'''
+                SELECT intervention_id, id, description, description_markdown, status, order_nr,
+                       datetime_created, datetime_modified
+                FROM api_intervention_description_log
+                WHERE intervention_id IN ({id_in}) AND status != 'DELETED'
+                ORDER BY order_nr
+            ''', ids),
+            Query(f'''
+                SELECT d.intervention_id, d.description_id, d.date, d.date_type_id, dt.name AS date_type_name
+                FROM api_intervention_description_date_log d
+                LEFT JOIN api_intervention_date_type_list dt ON d.date_type_id = dt.id
+                WHERE d.intervention_id IN ({id_in})
+                ORDER BY d.description_id, d.date
+            ''', ids),
+            # Affected jurisdictions with type (inferred/targeted/excluded/incidental)
+            Query(f'''
                 SELECT
-                    m.id,
-                    m.title,
-                    m.description,
-                    m.source,
-                    m.source_markdown,
-                    m.is_source_official,
-                    m.status_id,
-                    m.announcement_date,
-                    m.date_created as creation_date,
-                    m.last_modified as last_update,
-                    s.status_name,
-                    m.author_id,
-                    u.username as author_name
-                FROM gta_measure m
-                LEFT JOIN api_state_act_status_list s ON m.status_id = s.status_id
-                LEFT JOIN auth_user u ON m.author_id = u.id
-                WHERE m.id = %s
-            ''', (state_act_id,))
-            measure = cursor.fetchone()
-        except Exception:
-            pass
+                    aj.intervention_id,
+                    j.jurisdiction_id,
+                    j.jurisdiction_name,
+                    j.iso_code,
+                    aj.aj_type as type_id,
+                    jst.jurisdiction_selection_name as type_name
+                FROM api_intervention_aj aj
+                JOIN api_jurisdiction_list j ON aj.jurisdiction_id = j.jurisdiction_id
+                LEFT JOIN api_jurisdiction_selection_type_list jst ON aj.aj_type = jst.jurisdiction_selection_id
+                WHERE aj.intervention_id IN ({id_in})
+            ''', ids),
+            # Distorted markets with type (inferred/targeted/excluded/incidental)
+            Query(f'''
+                SELECT
+                    dm.intervention_id,
+                    j.jurisdiction_id,
+                    j.jurisdiction_name,
+                    j.iso_code,
+                    dm.dm_type as type_id,
+                    jst.jurisdiction_selection_name as type_name
+                FROM api_intervention_dm dm
+                JOIN api_jurisdiction_list j ON dm.jurisdiction_id = j.jurisdiction_id
+                LEFT JOIN api_jurisdiction_selection_type_list jst ON dm.dm_type = jst.jurisdiction_selection_id
+                WHERE dm.intervention_id IN ({id_in})
+            ''', ids),
+            # Firms with role (beneficiary/target/acting agency/etc.)
+            Query(f'''
+                SELECT
+                    fi.intervention_id,
+                    f.firm_id,
+                    f.firm_name,
+                    fi.role_id,
+                    fr.name as role_name
+                FROM api_intervention_firm fi
+                JOIN mtz_firm_log f ON fi.firm_id = f.firm_id
+                LEFT JOIN mtz_firm_role fr ON fi.role_id = fr.id
+                WHERE fi.intervention_id IN ({id_in})
+            ''', ids),
+            # Acting agencies from legacy table (api_acting_agency_log)
+            # Stored separately from api_intervention_firm due to DB migration legacy.
+            Query(f'''
+                SELECT
+                    aa.intervention_id,
+                    aa.agency_id,
+                    aa.agency_name,
+                    aa.agency_name_original
+                FROM api_acting_agency_log aa
+                WHERE aa.intervention_id IN ({id_in})
+            ''', ids),
+            # Levels from api_intervention_level (Fix 4: separate table, not api_intervention_log columns)
+            Query(f'''
+                SELECT
+                    il.intervention_id,
+                    il.prior_level,
+                    il.new_level,
+                    il.tariff_peak,
+                    il.intervention_unit_id as unit_id,
+                    u.name as unit_name,
+                    il.level_type_id,
+                    lt.name as level_type_name
+                FROM api_intervention_level il
+                LEFT JOIN api_unit_list u ON il.intervention_unit_id = u.id
+                LEFT JOIN api_level_type_list lt ON il.level_type_id = lt.id
+                WHERE il.intervention_id IN ({id_in})
+            ''', ids),
+            # Products (HS codes) — HS6 from api_intervention_product, with per-product
+            # tariff fields. Higher-level (HS8/10/12/14) tariff lines come from separate tables below.
+            Query(f'''
+                SELECT
+                    ip.intervention_id,
+                    p.product_id,
+                    p.product_description,
+                    ip.prior_level,
+                    ip.new_level,
+                    ip.unit_id as product_unit_id,
+                    pu.name as product_unit_name,
+                    ip.tariff_peak as is_tariff_peak,
+                    ip.is_tariff_line_official,
+                    ip.is_positively_affected,
+                    ip.is_investigated_only,
+                    ip.date_implemented as product_date_implemented,
+                    ip.date_removed as product_date_removed,
+                    ip.is_in_original,
+                    ip.is_completely_captured
+                FROM api_intervention_product ip
+                JOIN api_product_list p ON ip.product_id = p.product_id
+                LEFT JOIN api_unit_list pu ON ip.unit_id = pu.id
+                WHERE ip.intervention_id IN ({id_in})
+            ''', ids),
+        ]
+        # Higher-level tariff line codes (HS8/10/12/14).
+        # Serializer stores codes > HS6 in separate tables; composite id is
+        # concatenated HS code + jurisdiction id (3-digit zero-padded).
+        for level in _PRODUCT_LEVELS:
+            table = (
+                f'api_intervention_product_level{level}'
+                if level <= 10
+                else f'api_intervention_product_level{level}_log'
+            )
+            queries.append(Query(f'''
+                SELECT
+                    ipl.intervention_id,
+                    ipl.product_level{level}_id as composite_id,
+                    ipl.prior_value,
+                    ipl.new_value,
+                    ipl.date_implemented,
+                    ipl.date_removed,
+                    ipl.unit_id,
+                    u.name as unit_name,
+                    ipl.is_tariff_peak,
+                    ipl.is_tariff_line_official,
+                    ipl.is_positively_affected,
+                    ipl.is_investigated_only
+                FROM {table} ipl
+                LEFT JOIN api_unit_list u ON ipl.unit_id = u.id
+                WHERE ipl.intervention_id IN ({id_in})
+            ''', ids))
+        queries += [
+            # Sectors (CPC). type column: N=Normal, A=Added, D=Deleted.
+            Query(f'''
+                SELECT
+                    isec.intervention_id,
+                    s.sector_id,
+                    s.sector_name,
+                    isec.type as sector_type,
+                    isec.is_investigated_only
+                FROM api_intervention_sector isec
+                JOIN api_sector_list s ON isec.sector_id = s.sector_id
+                WHERE isec.intervention_id IN ({id_in})
+            ''', ids),
+            # Rationale tags
+            Query(f'''
+                SELECT
+                    ir.intervention_id,
+                    r.rationale_id,
+                    r.rationale_name
+                FROM api_intervention_rationale ir
+                JOIN api_rationale_list r ON ir.rationale_id = r.rationale_id
+                WHERE ir.intervention_id IN ({id_in})
+            ''', ids),
+            # Locations (subnational taxonomy). jurisdiction_id is non-nullable per model.
+            Query(f'''
+                SELECT
+                    il.intervention_id,
+                    il.id as location_id,
+                    il.location_name,
+                    il.location_type_id,
+                    lt.location_type_name,
+                    il.jurisdiction_id,
+                    j.iso_code as jurisdiction_iso,
+                    j.jurisdiction_name
+                FROM api_intervention_location il
+                LEFT JOIN api_location_type_list lt ON il.location_type_id = lt.location_type_id
+                LEFT JOIN api_jurisdiction_list j ON il.jurisdiction_id = j.jurisdiction_id
+                WHERE il.intervention_id IN ({id_in})
+            ''', ids),
+            # Themes
+            Query(f'''
+                SELECT intervention_id, theme_id FROM api_intervention_theme WHERE intervention_id IN ({id_in})
+            ''', ids),
+            # Multi-date log (amendments, staged implementation, etc.)
+            Query(f'''
+                SELECT d.intervention_id, d.id, d.date, d.type_id, dt.name as date_type_name
+                FROM api_intervention_date_log d
+                LEFT JOIN api_intervention_date_type_list dt ON d.type_id = dt.id
+                WHERE d.intervention_id IN ({id_in})
+                ORDER BY d.date
+            ''', ids),
+            # Investigation status history (trade-defence lifecycle)
+            Query(f'''
+                SELECT intervention_id, id, investigation_status_id, date
+                FROM api_investigation_status_log
+                WHERE intervention_id IN ({id_in})
+                ORDER BY date
+            ''', ids),
+        ]
+        return queries
 
-        # Try 2: api_state_act_log (alternate table name)
-        if not measure:
-            try:
-                cursor.execute('''
+    @staticmethod
+    def _attach_intervention_details(interventions: list[dict], results: list) -> None:
+        """Fill intervention dicts from the results of _intervention_detail_queries().
+
+        Rows are grouped by their leading intervention_id (dropped from the
+        row, so each intervention sees exactly what a per-id query returned);
+        a failed query is handed to every intervention unchanged.
+        """
+        grouped: list = []
+        for result in results:
+            if isinstance(result, Exception):
+                grouped.append(result)
+                continue
+            by_id: dict = {}
+            for row in result:
+                by_id.setdefault(row.pop('intervention_id'), []).append(row)
+            grouped.append(by_id)
+
+        for intervention in interventions:
+            GTADatabaseClient._attach_intervention_detail(intervention, [
+                g if isinstance(g, Exception) else g.get(intervention['id'], [])
+                for g in grouped
+            ])
+
+    @staticmethod
+    def _attach_intervention_detail(intervention: dict, results: list) -> None:
+        """Fill one intervention dict from its share of _intervention_detail_queries().
+
+        Failed child queries degrade to empty lists (most tables are absent in
+        legacy environments); only the affected-jurisdiction query is required.
+        """
+        iid = intervention['id']
+
+        def rows(result, label: Optional[str] = None) -> list:
+            if isinstance(result, Exception):
+                if label:
+                    print(f"[gta-mnt] WARNING: {label} query failed for intervention {iid}: {result}", file=sys.stderr)
+                return []
+            return result
+
+        (desc_rows, desc_dates, aj, dm, firms, agencies, levels, products,
+         *product_levels, sectors, rationales, locations, themes, dates, investigations) = results
+
+        # Aggregate canonical intervention description from api_intervention_description_log.
+        # Django's Intervention.description @property reads this; api_intervention_log.description
+        # is a legacy shadow column that new submissions do NOT write to.
+        # Each row is one "update" (InterventionDescription), ordered by order_nr.
+        # Per-update dates live in api_intervention_description_date_log.
+        desc_error = next((r for r in (desc_rows, desc_dates) if isinstance(r, Exception)), None)
+        if desc_error is not None and (isinstance(desc_rows, Exception) or desc_rows):
+            print(f"[gta-mnt] WARNING: Description log query failed for intervention {iid}: {desc_error}", file=sys.stderr)
+            intervention['description'] = intervention.get('legacy_description') or ''
+            intervention['description_rows'] = []
+        else:
+            if desc_rows:
+                dates_by_desc: dict = {}
+                for dr in desc_dates:
+                    dates_by_desc.setdefault(dr['description_id'], []).append(dr)
+                for r in desc_rows:
+                    r['dates'] = dates_by_desc.get(r['id'], [])
+            intervention['description_rows'] = desc_rows
+            if desc_rows:
+                intervention['description'] = '\n'.join(r['description'] or '' for r in desc_rows)
+                intervention['description_markdown'] = '\n'.join(r['description_markdown'] or '' for r in desc_rows)
+            else:
+                # Fall back to legacy column (old pre-migration entries)
+                intervention['description'] = intervention.get('legacy_description') or ''
+                intervention['description_markdown'] = ''
+
+        if isinstance(aj, Exception):
+            raise aj
+        intervention['affected_jurisdictions'] = aj
+        intervention['distorted_markets'] = rows(dm, 'DM')
+        intervention['firms'] = list(rows(firms, 'Firms'))
+        for aa in rows(agencies, 'Acting agency'):
+            intervention['firms'].append({
+                'firm_id': aa['agency_id'],
+                'firm_name': aa['agency_name'],
+                'firm_name_original': aa.get('agency_name_original', ''),
+                'role_id': None,
+                'role_name': 'acting agency (legacy)'
+            })
+        intervention['level_rows'] = rows(levels, 'Levels')
+        intervention['products'] = rows(products, 'Products')
+
+        for level, result in zip(_PRODUCT_LEVELS, product_levels):
+            # Tables may be absent in legacy envs — silently empty.
+            level_rows = rows(result)
+            # Decompose composite_id into (hs_code, jurisdiction_id) if possible
+            for r in level_rows:
+                cid = str(r.get('composite_id') or '')
+                if len(cid) > 3:
+                    r['hs_code'] = cid[:-3]
+                    r['jurisdiction_suffix'] = cid[-3:]
+            intervention[f'products_level{level}'] = level_rows
+
+        intervention['sectors'] = rows(sectors, 'Sectors')
+        intervention['rationales'] = rows(rationales, 'Rationales')
+        intervention['locations'] = rows(locations, 'Locations')
+        intervention['themes'] = [r['theme_id'] for r in rows(themes)]
+        intervention['intervention_dates'] = rows(dates)
+        intervention['investigation_history'] = rows(investigations)
+
+    @staticmethod
+    def _measure_version_query(state_act_id: int, include_comments: bool = True) -> Query:
+        """One-row freshness probe for the measure cache.
+
+        Stamps of the tables the loader requires: the state act, its
+        interventions (author edits bump their last_modified) and, when
+        loaded, its comments. Other changes are bounded by the cache TTL.
+        """
+        comments = '''(SELECT CONCAT(COUNT(*), '/', COALESCE(MAX(c.id), 0), '/', COALESCE(MAX(c.updated_at), ''))
+                 FROM api_comment_log c WHERE c.measure_id = sa.state_act_id)''' if include_comments else 'NULL'
+        return Query(f'''
+            SELECT
+                sa.last_modified,
+                sa.status_id,
+                (SELECT CONCAT(COUNT(*), '/', COALESCE(MAX(i.last_modified), ''))
+                 FROM api_intervention_log i WHERE i.state_act_id = sa.state_act_id),
+                {comments}
+            FROM api_state_act_log sa
+            WHERE sa.state_act_id = %s
+        ''', (state_act_id,), one=True)
+
+    def _get_measure_plan(
+        self,
+        state_act_id: int,
+        include_interventions: bool = True,
+        include_comments: bool = True
+    ) -> Plan[dict]:
+        """Query plan for get_measure(), served from the measure cache when fresh."""
+        cache = self._measure_cache
+        if cache is None:
+            return (yield from self._load_measure_plan(
+                state_act_id, include_interventions, include_comments,
+            ))
+
+        key = (state_act_id, include_interventions, include_comments)
+        token = cache.token()
+        version = ()
+        if cache.probe_enabled:
+            try:
+                row = yield self._measure_version_query(state_act_id, include_comments)
+            except Exception as e:
+                if _is_schema_error(e):
+                    # Repeats on every call: stop probing, cache on TTL only
+                    print(f"[gta-mnt] WARNING: Measure cache probe failed, caching on TTL only: {e}", file=sys.stderr)
+                    cache.probe_enabled = False
+                else:
+                    # Transient (lost connection, lock wait, failover): load
+                    # fresh this once and keep probing
+                    print(f"[gta-mnt] WARNING: Measure cache probe failed, loading uncached: {e}", file=sys.stderr)
+                    version = None
+            else:
+                version = tuple(row.values()) if row else None
+
+        if version is not None:
+            cached = cache.get(key, version)
+            if cached is not None:
+                return cached
+
+        measure = yield from self._load_measure_plan(
+            state_act_id, include_interventions, include_comments,
+        )
+        if version is not None and 'error' not in measure:
+            cache.store(key, measure, version, token)
+        return measure
+
+    def _load_measure_plan(
+        self,
+        state_act_id: int,
+        include_interventions: bool = True,
+        include_comments: bool = True
+    ) -> Plan[dict]:
+        """Query plan that assembles a measure from the database."""
+        # Get measure - try multiple table names (gta_measure vs api_state_act_log)
+        measure = None
+
+        # Try 1: gta_measure (documented table name)
+        try:
+            measure = yield Query('''
+                SELECT
+                    m.id,
+                    m.title,
+                    m.description,
+                    m.source,
+                    m.source_markdown,
+                    m.is_source_official,
+                    m.status_id,
+                    m.announcement_date,
+                    m.date_created as creation_date,
+                    m.last_modified as last_update,
+                    s.status_name,
+                    m.author_id,
+                    u.username as author_name
+                FROM gta_measure m
+                LEFT JOIN api_state_act_status_list s ON m.status_id = s.status_id
+                LEFT JOIN auth_user u ON m.author_id = u.id
+                WHERE m.id = %s
+            ''', (state_act_id,), one=True)
+        except Exception:
+            pass
+
+        # Try 2: api_state_act_log (alternate table name)
+        if not measure:
+            try:
+                measure = yield Query('''
                     SELECT
                         sa.state_act_id as id,
                         sa.title,
@@ -399,11 +1514,10 @@ class GTADatabaseClient:
                     LEFT JOIN api_state_act_status_list s ON sa.status_id = s.status_id
                     LEFT JOIN auth_user u ON sa.author_id = u.id
                     WHERE sa.state_act_id = %s
-                ''', (state_act_id,))
-                measure = cursor.fetchone()
+                ''', (state_act_id,), one=True)
             except Exception:
                 # Fallback without source_text column
-                cursor.execute('''
+                measure = yield Query('''
                     SELECT
                         sa.state_act_id as id,
                         sa.title,
@@ -422,26 +1536,27 @@ class GTADatabaseClient:
                     LEFT JOIN api_state_act_status_list s ON sa.status_id = s.status_id
                     LEFT JOIN auth_user u ON sa.author_id = u.id
                     WHERE sa.state_act_id = %s
-                ''', (state_act_id,))
-                measure = cursor.fetchone()
+                ''', (state_act_id,), one=True)
 
         if not measure:
             return {'error': f'Measure {state_act_id} not found'}
 
         # Get implementing jurisdictions (via api_intervention_ij)
-        cursor.execute('''
+        ij_query = Query('''
             SELECT DISTINCT j.jurisdiction_id, j.jurisdiction_name, j.iso_code
             FROM api_intervention_log i
             JOIN api_intervention_ij ij ON i.intervention_id = ij.intervention_id
             JOIN api_jurisdiction_list j ON ij.jurisdiction_id = j.jurisdiction_id
             WHERE i.state_act_id = %s
         ''', (state_act_id,))
-        measure['implementing_jurisdictions'] = cursor.fetchall()
 
         # Optionally fetch interventions from api_intervention_log
-        if include_interventions:
-            # Fetch interventions with implementation level and unit names
-            cursor.execute('''
+        if not include_interventions:
+            measure['implementing_jurisdictions'] = yield ij_query
+        else:
+            # Fetch interventions with implementation level and unit names,
+            # alongside the implementing jurisdictions (independent reads)
+            ij_rows, intervention_rows = yield (ij_query, Query('''
                 SELECT
                     i.intervention_id as id,
                     i.state_act_id as measure_id,
@@ -483,307 +1598,27 @@ class GTADatabaseClient:
                 LEFT JOIN api_mast_chapter_list mc ON i.chapter_id = mc.chapter_id
                 LEFT JOIN api_mast_subchapter_list ms ON i.subchapter_id = ms.subchapter_id
                 WHERE i.state_act_id = %s
-            ''', (state_act_id,))
-            measure['interventions'] = cursor.fetchall()
-
-            # Aggregate canonical intervention description from api_intervention_description_log.
-            # Django's Intervention.description @property reads this; api_intervention_log.description
-            # is a legacy shadow column that new submissions do NOT write to.
-            # Each row is one "update" (InterventionDescription), ordered by order_nr.
-            # Per-update dates live in api_intervention_description_date_log.
-            for intervention in measure['interventions']:
-                try:
-                    cursor.execute('''
-                        SELECT id, description, description_markdown, status, order_nr,
-                               datetime_created, datetime_modified
-                        FROM api_intervention_description_log
-                        WHERE intervention_id = %s AND status != 'DELETED'
-                        ORDER BY order_nr
-                    ''', (intervention['id'],))
-                    rows = cursor.fetchall()
-                    if rows:
-                        cursor.execute('''
-                            SELECT d.description_id, d.date, d.date_type_id, dt.name AS date_type_name
-                            FROM api_intervention_description_date_log d
-                            LEFT JOIN api_intervention_date_type_list dt ON d.date_type_id = dt.id
-                            WHERE d.intervention_id = %s
-                            ORDER BY d.description_id, d.date
-                        ''', (intervention['id'],))
-                        dates_by_desc: dict = {}
-                        for dr in cursor.fetchall():
-                            dates_by_desc.setdefault(dr['description_id'], []).append(dr)
-                        for r in rows:
-                            r['dates'] = dates_by_desc.get(r['id'], [])
-                    intervention['description_rows'] = rows
-                    if rows:
-                        intervention['description'] = '\n'.join(r['description'] or '' for r in rows)
-                        intervention['description_markdown'] = '\n'.join(r['description_markdown'] or '' for r in rows)
-                    else:
-                        # Fall back to legacy column (old pre-migration entries)
-                        intervention['description'] = intervention.get('legacy_description') or ''
-                        intervention['description_markdown'] = ''
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Description log query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['description'] = intervention.get('legacy_description') or ''
-                    intervention['description_rows'] = []
-
-            # Get affected jurisdictions, distorted markets, firms, and levels for each intervention
-            for intervention in measure['interventions']:
-                # Affected jurisdictions with type (inferred/targeted/excluded/incidental)
-                cursor.execute('''
-                    SELECT
-                        j.jurisdiction_id,
-                        j.jurisdiction_name,
-                        j.iso_code,
-                        aj.aj_type as type_id,
-                        jst.jurisdiction_selection_name as type_name
-                    FROM api_intervention_aj aj
-                    JOIN api_jurisdiction_list j ON aj.jurisdiction_id = j.jurisdiction_id
-                    LEFT JOIN api_jurisdiction_selection_type_list jst ON aj.aj_type = jst.jurisdiction_selection_id
-                    WHERE aj.intervention_id = %s
-                ''', (intervention['id'],))
-                intervention['affected_jurisdictions'] = cursor.fetchall()
-
-                # Distorted markets with type (inferred/targeted/excluded/incidental)
-                try:
-                    cursor.execute('''
-                        SELECT
-                            j.jurisdiction_id,
-                            j.jurisdiction_name,
-                            j.iso_code,
-                            dm.dm_type as type_id,
-                            jst.jurisdiction_selection_name as type_name
-                        FROM api_intervention_dm dm
-                        JOIN api_jurisdiction_list j ON dm.jurisdiction_id = j.jurisdiction_id
-                        LEFT JOIN api_jurisdiction_selection_type_list jst ON dm.dm_type = jst.jurisdiction_selection_id
-                        WHERE dm.intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['distorted_markets'] = cursor.fetchall()
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: DM query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['distorted_markets'] = []
-
-                # Firms with role (beneficiary/target/acting agency/etc.)
-                try:
-                    cursor.execute('''
-                        SELECT
-                            f.firm_id,
-                            f.firm_name,
-                            fi.role_id,
-                            fr.name as role_name
-                        FROM api_intervention_firm fi
-                        JOIN mtz_firm_log f ON fi.firm_id = f.firm_id
-                        LEFT JOIN mtz_firm_role fr ON fi.role_id = fr.id
-                        WHERE fi.intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['firms'] = list(cursor.fetchall())
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Firms query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['firms'] = []
-
-                # Acting agencies from legacy table (api_acting_agency_log)
-                # Stored separately from api_intervention_firm due to DB migration legacy.
-                try:
-                    cursor.execute('''
-                        SELECT
-                            aa.agency_id,
-                            aa.agency_name,
-                            aa.agency_name_original
-                        FROM api_acting_agency_log aa
-                        WHERE aa.intervention_id = %s
-                    ''', (intervention['id'],))
-                    acting_agencies = cursor.fetchall()
-                    for aa in acting_agencies:
-                        intervention['firms'].append({
-                            'firm_id': aa['agency_id'],
-                            'firm_name': aa['agency_name'],
-                            'firm_name_original': aa.get('agency_name_original', ''),
-                            'role_id': None,
-                            'role_name': 'acting agency (legacy)'
-                        })
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Acting agency query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-
-                # Levels from api_intervention_level (Fix 4: separate table, not api_intervention_log columns)
-                try:
-                    cursor.execute('''
-                        SELECT
-                            il.prior_level,
-                            il.new_level,
-                            il.tariff_peak,
-                            il.intervention_unit_id as unit_id,
-                            u.name as unit_name,
-                            il.level_type_id,
-                            lt.name as level_type_name
-                        FROM api_intervention_level il
-                        LEFT JOIN api_unit_list u ON il.intervention_unit_id = u.id
-                        LEFT JOIN api_level_type_list lt ON il.level_type_id = lt.id
-                        WHERE il.intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['level_rows'] = cursor.fetchall()
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Levels query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['level_rows'] = []
-
-                # Products (HS codes) — HS6 from api_intervention_product, with per-product
-                # tariff fields. Higher-level (HS8/10/12/14) tariff lines come from separate tables below.
-                try:
-                    cursor.execute('''
-                        SELECT
-                            p.product_id,
-                            p.product_description,
-                            ip.prior_level,
-                            ip.new_level,
-                            ip.unit_id as product_unit_id,
-                            pu.name as product_unit_name,
-                            ip.tariff_peak as is_tariff_peak,
-                            ip.is_tariff_line_official,
-                            ip.is_positively_affected,
-                            ip.is_investigated_only,
-                            ip.date_implemented as product_date_implemented,
-                            ip.date_removed as product_date_removed,
-                            ip.is_in_original,
-                            ip.is_completely_captured
-                        FROM api_intervention_product ip
-                        JOIN api_product_list p ON ip.product_id = p.product_id
-                        LEFT JOIN api_unit_list pu ON ip.unit_id = pu.id
-                        WHERE ip.intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['products'] = cursor.fetchall()
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Products query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['products'] = []
-
-                # Higher-level tariff line codes (HS8/10/12/14).
-                # Serializer stores codes > HS6 in separate tables; composite id is
-                # concatenated HS code + jurisdiction id (3-digit zero-padded).
-                for level in (8, 10, 12, 14):
-                    table = (
-                        f'api_intervention_product_level{level}'
-                        if level <= 10
-                        else f'api_intervention_product_level{level}_log'
-                    )
-                    key = f'products_level{level}'
-                    try:
-                        cursor.execute(f'''
-                            SELECT
-                                ipl.product_level{level}_id as composite_id,
-                                ipl.prior_value,
-                                ipl.new_value,
-                                ipl.date_implemented,
-                                ipl.date_removed,
-                                ipl.unit_id,
-                                u.name as unit_name,
-                                ipl.is_tariff_peak,
-                                ipl.is_tariff_line_official,
-                                ipl.is_positively_affected,
-                                ipl.is_investigated_only
-                            FROM {table} ipl
-                            LEFT JOIN api_unit_list u ON ipl.unit_id = u.id
-                            WHERE ipl.intervention_id = %s
-                        ''', (intervention['id'],))
-                        rows = cursor.fetchall()
-                        # Decompose composite_id into (hs_code, jurisdiction_id) if possible
-                        for r in rows:
-                            cid = str(r.get('composite_id') or '')
-                            if len(cid) > 3:
-                                r['hs_code'] = cid[:-3]
-                                r['jurisdiction_suffix'] = cid[-3:]
-                        intervention[key] = rows
-                    except Exception as e:
-                        # Tables may be absent in legacy envs — silently empty.
-                        intervention[key] = []
-
-                # Sectors (CPC). type column: N=Normal, A=Added, D=Deleted.
-                try:
-                    cursor.execute('''
-                        SELECT
-                            s.sector_id,
-                            s.sector_name,
-                            isec.type as sector_type,
-                            isec.is_investigated_only
-                        FROM api_intervention_sector isec
-                        JOIN api_sector_list s ON isec.sector_id = s.sector_id
-                        WHERE isec.intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['sectors'] = cursor.fetchall()
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Sectors query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['sectors'] = []
-
-                # Rationale tags
-                try:
-                    cursor.execute('''
-                        SELECT
-                            r.rationale_id,
-                            r.rationale_name
-                        FROM api_intervention_rationale ir
-                        JOIN api_rationale_list r ON ir.rationale_id = r.rationale_id
-                        WHERE ir.intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['rationales'] = cursor.fetchall()
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Rationales query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['rationales'] = []
-
-                # Locations (subnational taxonomy). jurisdiction_id is non-nullable per model.
-                try:
-                    cursor.execute('''
-                        SELECT
-                            il.id as location_id,
-                            il.location_name,
-                            il.location_type_id,
-                            lt.location_type_name,
-                            il.jurisdiction_id,
-                            j.iso_code as jurisdiction_iso,
-                            j.jurisdiction_name
-                        FROM api_intervention_location il
-                        LEFT JOIN api_location_type_list lt ON il.location_type_id = lt.location_type_id
-                        LEFT JOIN api_jurisdiction_list j ON il.jurisdiction_id = j.jurisdiction_id
-                        WHERE il.intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['locations'] = cursor.fetchall()
-                except Exception as e:
-                    print(f"[gta-mnt] WARNING: Locations query failed for intervention {intervention['id']}: {e}", file=sys.stderr)
-                    intervention['locations'] = []
-
-                # Themes
-                try:
-                    cursor.execute('''
-                        SELECT theme_id FROM api_intervention_theme WHERE intervention_id = %s
-                    ''', (intervention['id'],))
-                    intervention['themes'] = [r['theme_id'] for r in cursor.fetchall()]
-                except Exception:
-                    intervention['themes'] = []
-
-                # Multi-date log (amendments, staged implementation, etc.)
-                try:
-                    cursor.execute('''
-                        SELECT d.id, d.date, d.type_id, dt.name as date_type_name
-                        FROM api_intervention_date_log d
-                        LEFT JOIN api_intervention_date_type_list dt ON d.type_id = dt.id
-                        WHERE d.intervention_id = %s
-                        ORDER BY d.date
-                    ''', (intervention['id'],))
-                    intervention['intervention_dates'] = cursor.fetchall()
-                except Exception:
-                    intervention['intervention_dates'] = []
-
-                # Investigation status history (trade-defence lifecycle)
-                try:
-                    cursor.execute('''
-                        SELECT id, investigation_status_id, date
-                        FROM api_investigation_status_log
-                        WHERE intervention_id = %s
-                        ORDER BY date
-                    ''', (intervention['id'],))
-                    intervention['investigation_history'] = cursor.fetchall()
-                except Exception:
-                    intervention['investigation_history'] = []
+            ''', (state_act_id,)))
+            for result in (ij_rows, intervention_rows):
+                if isinstance(result, Exception):
+                    raise result
+            measure['implementing_jurisdictions'] = ij_rows
+            measure['interventions'] = intervention_rows
+
+            # One set-based read per child table for all interventions (not one
+            # per intervention), sent as a single batch — concurrently on the
+            # async backend.
+            if measure['interventions']:
+                results = yield self._intervention_detail_queries(
+                    [i['id'] for i in measure['interventions']]
+                )
+                self._attach_intervention_details(measure['interventions'], results)
+            if self._router is not None:
+                self._router.learn(state_act_id, [i['id'] for i in measure['interventions']])
 
         # Fetch motive quotes from gta_stated_motive_log
         try:
-            cursor.execute('''
+            measure['motive_quotes'] = yield Query('''
                 SELECT
                     stated_motive_id,
                     stated_motive_name,
@@ -791,14 +1626,13 @@ class GTADatabaseClient:
                 FROM gta_stated_motive_log
                 WHERE state_act_id = %s
             ''', (state_act_id,))
-            measure['motive_quotes'] = cursor.fetchall()
         except Exception as e:
             print(f"[gta-mnt] WARNING: Motive quotes query failed: {e}", file=sys.stderr)
             measure['motive_quotes'] = []
 
         # Optionally fetch comments
         if include_comments:
-            cursor.execute('''
+            measure['comments'] = yield Query('''
                 SELECT
                     c.id,
                     c.author_id,
@@ -811,7 +1645,6 @@ class GTADatabaseClient:
                 WHERE c.measure_id = %s
                 ORDER BY c.creation_time DESC
             ''', (state_act_id,))
-            measure['comments'] = cursor.fetchall()
 
         # Get source info from linked sources
         # Try multiple table names and schemas since GTA has evolved over time
@@ -823,13 +1656,12 @@ class GTADatabaseClient:
         # api_state_act_log.source / source_markdown columns are NOT the display path.
         state_act_sources = []
         try:
-            cursor.execute('''
+            state_act_sources = yield Query('''
                 SELECT id, source, source_markdown, status, order_nr
                 FROM api_state_act_source_log_new
                 WHERE state_act_id = %s AND status != 'DELETED'
                 ORDER BY order_nr
             ''', (state_act_id,))
-            state_act_sources = cursor.fetchall()
             tables_tried.append(('api_state_act_source_log_new', len(state_act_sources)))
         except Exception as e:
             tables_tried.append(('api_state_act_source_log_new', f'error: {str(e)[:50]}'))
@@ -839,7 +1671,7 @@ class GTADatabaseClient:
         # Distinct from citation text above; these are the raw URLs registered against the SA.
         source_citations = []
         try:
-            cursor.execute('''
+            source_citations = yield Query('''
                 SELECT
                     sl.source_id,
                     sl.source_url
@@ -848,7 +1680,6 @@ class GTADatabaseClient:
                 WHERE sas.state_act_id = %s
                 ORDER BY sas.id ASC
             ''', (state_act_id,))
-            source_citations = cursor.fetchall()
             tables_tried.append(('api_state_act_source+api_source_list', len(source_citations)))
         except Exception as e:
             tables_tried.append(('api_state_act_source+api_source_list', f'error: {str(e)[:50]}'))
@@ -857,7 +1688,7 @@ class GTADatabaseClient:
 
         # Try 1: api_files table (uploaded files with field_id = state_act_id)
         try:
-            cursor.execute('''
+            sources = yield Query('''
                 SELECT
                     af.id as source_id,
                     af.file_url as source_url,
@@ -870,7 +1701,6 @@ class GTADatabaseClient:
                   AND af.is_deleted = 0
                 ORDER BY af.id ASC
             ''', (state_act_id,))
-            sources = cursor.fetchall()
             tables_tried.append(('api_files', len(sources)))
         except Exception as e:
             tables_tried.append(('api_files', f'error: {str(e)[:50]}'))
@@ -884,13 +1714,12 @@ class GTADatabaseClient:
         if not sources:
             try:
                 # First try with state_act_id
-                cursor.execute('''
+                sources = yield Query('''
                     SELECT *
                     FROM gta_state_act_source
                     WHERE state_act_id = %s
                     LIMIT 10
                 ''', (state_act_id,))
-                sources = cursor.fetchall()
                 tables_tried.append(('gta_state_act_source(state_act_id)', len(sources)))
             except Exception as e:
                 tables_tried.append(('gta_state_act_source(state_act_id)', f'error: {str(e)[:50]}'))
@@ -898,13 +1727,12 @@ class GTADatabaseClient:
         # Try 2b: gta_state_act_source with measure_id
         if not sources:
             try:
-                cursor.execute('''
+                sources = yield Query('''
                     SELECT *
                     FROM gta_state_act_source
                     WHERE measure_id = %s
                     LIMIT 10
                 ''', (state_act_id,))
-                sources = cursor.fetchall()
                 tables_tried.append(('gta_state_act_source(measure_id)', len(sources)))
             except Exception as e:
                 tables_tried.append(('gta_state_act_source(measure_id)', f'error: {str(e)[:50]}'))
@@ -912,7 +1740,7 @@ class GTADatabaseClient:
         # Try 3: Look in api_state_act_file for uploaded files
         if not sources:
             try:
-                cursor.execute('''
+                sources = yield Query('''
                     SELECT
                         id as source_id,
                         file_path as source_url,
@@ -923,7 +1751,6 @@ class GTADatabaseClient:
                     WHERE state_act_id = %s
                     ORDER BY id ASC
                 ''', (state_act_id,))
-                sources = cursor.fetchall()
                 tables_tried.append(('api_state_act_file', len(sources)))
             except Exception as e:
                 tables_tried.append(('api_state_act_file', f'error: {str(e)[:50]}'))
@@ -931,7 +1758,7 @@ class GTADatabaseClient:
         # Try 5: gta_source table (might be junction with measure_id)
         if not sources:
             try:
-                cursor.execute('''
+                sources = yield Query('''
                     SELECT
                         id as source_id,
                         url as source_url,
@@ -941,7 +1768,6 @@ class GTADatabaseClient:
                     WHERE measure_id = %s
                     ORDER BY id ASC
                 ''', (state_act_id,))
-                sources = cursor.fetchall()
                 tables_tried.append(('gta_source', len(sources)))
             except Exception as e:
                 tables_tried.append(('gta_source', f'error: {str(e)[:50]}'))
@@ -949,7 +1775,7 @@ class GTADatabaseClient:
         # Try 5: Look for attached documents (some systems use this pattern)
         if not sources:
             try:
-                cursor.execute('''
+                sources = yield Query('''
                     SELECT
                         id as source_id,
                         file_url as source_url,
@@ -959,7 +1785,6 @@ class GTADatabaseClient:
                     WHERE state_act_id = %s
                     ORDER BY id ASC
                 ''', (state_act_id,))
-                sources = cursor.fetchall()
                 tables_tried.append(('gta_attached_document', len(sources)))
             except Exception as e:
                 tables_tried.append(('gta_attached_document', f'error: {str(e)[:50]}'))
@@ -995,7 +1820,7 @@ class GTADatabaseClient:
         # Fetch related state acts from the canonical table api_related_state_act_log
         # (model RelatedStateActLog). Bidirectional — serializer writes both directions.
         try:
-            cursor.execute('''
+            related_rows = yield Query('''
                 SELECT related_state_act_id as id
                 FROM api_related_state_act_log
                 WHERE state_act_id = %s
@@ -1004,18 +1829,17 @@ class GTADatabaseClient:
                 FROM api_related_state_act_log
                 WHERE related_state_act_id = %s
             ''', (state_act_id, state_act_id))
-            related_ids = [r['id'] for r in cursor.fetchall()]
+            related_ids = [r['id'] for r in related_rows]
             related_ids = list(set(related_ids))
 
             related_state_acts = []
             for rel_id in related_ids[:5]:  # cap at 5
-                cursor.execute('''
+                rel_sa = yield Query('''
                     SELECT sa.state_act_id as id, sa.title, sa.date_announced as announcement_date
                     FROM api_state_act_log sa WHERE sa.state_act_id = %s
-                ''', (rel_id,))
-                rel_sa = cursor.fetchone()
+                ''', (rel_id,), one=True)
                 if rel_sa:
-                    cursor.execute('''
+                    rel_sa['interventions'] = yield Query('''
                         SELECT i.intervention_id, i.prior_level, i.new_level,
                                i.unit_id, u.name as unit_name,
                                i.intervention_type_id, t.intervention_type_name as type_name,
@@ -1025,7 +1849,6 @@ class GTADatabaseClient:
                         LEFT JOIN api_intervention_type_list t ON i.intervention_type_id = t.intervention_type_id
                         WHERE i.state_act_id = %s
                     ''', (rel_id,))
-                    rel_sa['interventions'] = cursor.fetchall()
                     related_state_acts.append(rel_sa)
 
             measure['related_state_acts'] = related_state_acts
@@ -1074,6 +1897,8 @@ class GTADatabaseClient:
     # WS6: Set Status
     # ========================================================================
 
+    @_invalidates_measure('state_act_id')
+    @_pooled
     def set_status(
         self,
         state_act_id: int,
@@ -1128,6 +1953,8 @@ class GTADatabaseClient:
     # WS5: Add Comment
     # ========================================================================
 
+    @_invalidates_measure('measure_id')
+    @_pooled
     def add_comment(
         self,
         measure_id: int,
@@ -1184,6 +2011,8 @@ class GTADatabaseClient:
     # WS7: Add Framework
     # ========================================================================
 
+    @_invalidates_measure('state_act_id')
+    @_pooled
     def add_framework(
         self,
         state_act_id: int,
@@ -1254,44 +2083,175 @@ class GTADatabaseClient:
     # Entry Creation: Lookup
     # ========================================================================
 
+    @_read_only()
+    @_pooled
     def lookup(
         self,
         table: str,
         query: str,
-        limit: int = 20
+        limit: int = 20,
+        refresh: bool = False
     ) -> dict:
         """Look up IDs in reference tables by search string.
 
+        Served from the local lookup index (see lookup_index.py): substring
+        matches first, best first, then fuzzy matches. A table the index has
+        not loaded yet is searched with a live LIKE query while it loads in
+        the background; a stale one is served as is while it reloads.
+
         Args:
             table: Short name from LOOKUP_TABLES (e.g. 'jurisdiction', 'product')
-            query: Search string (LIKE match with wildcards)
+            query: Search string
             limit: Max results
+            refresh: Reload the table from the database (in the background;
+                this call searches the live table)
 
         Returns:
             Dict with 'results' list and 'table' name
         """
+        if self._lookup_index is not None and table in LOOKUP_TABLES and self._prepare_lookup_index(table, refresh):
+            table_name, id_col, name_col = LOOKUP_TABLES[table]
+            results = self._lookup_index.search(table, query, limit)
+            return {'results': results, 'table': table_name, 'id_column': id_col, 'name_column': name_col}
+        return self._run(self._lookup_plan(table, query, limit, refresh))
+
+    def _lookup_plan(self, table: str, query: str, limit: int = 20, refresh: bool = False) -> Plan[dict]:
+        """Query plan for lookup() without the index: a live LIKE query."""
         if table not in LOOKUP_TABLES:
             return {
                 'error': f"Unknown table '{table}'. Valid: {', '.join(sorted(LOOKUP_TABLES.keys()))}"
             }
 
         table_name, id_col, name_col = LOOKUP_TABLES[table]
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         search = f'%{query}%'
-        cursor.execute(
+        results = yield Query(
             f'SELECT * FROM {table_name} WHERE {name_col} LIKE %s LIMIT %s',
             (search, limit)
         )
-        results = cursor.fetchall()
-
         return {'results': results, 'table': table_name, 'id_column': id_col, 'name_column': name_col}
 
+    def _prepare_lookup_index(self, table: str, refresh: bool = False) -> bool:
+        """Whether lookup() can search the index for `table` now.
+
+        Table loads and FTS rebuilds (a whole-table fetch) are started on a
+        background thread rather than run in the request. Only the
+        incremental FTS sync (rows above the last synced id, typically the
+        firms created since the last lookup) runs here, so a firm added by
+        add_firm is found by the next lookup.
+        """
+        index = self._lookup_index
+        if refresh:
+            self._in_background(f'lookup-{table}', self._refresh_lookup_table, table, True)
+            return False
+        if index.is_fts(table):
+            since = index.sync_from(table)
+            if since == 0:
+                self._in_background(f'lookup-{table}', self._refresh_lookup_table, table)
+                return False
+            if since is not None:
+                self._run(self._refresh_lookup_plan(table))
+            return True
+        if index.needs_load(table):
+            self._in_background(f'lookup-{table}', self._refresh_lookup_table, table)
+        return index.is_loaded(table)
+
+    def _refresh_lookup_plan(self, table: str, force: bool = False) -> Plan[None]:
+        """Bring the lookup index for one table up to date.
+
+        In-memory tables are reloaded whole once stale. FTS tables fetch only
+        rows above the last synced id (a primary-key range scan); `force`
+        rebuilds them from scratch, picking up renames and deletions.
+        Runs the index work inline: for warm-ups and background jobs.
+        """
+        index = self._lookup_index
+        table_name, id_col, name_col = LOOKUP_TABLES[table]
+        if index.is_fts(table):
+            since = index.sync_from(table, full=force)
+            if since is not None:
+                rows = yield Query(
+                    f'SELECT * FROM {table_name} WHERE {id_col} > %s ORDER BY {id_col}',
+                    (since,)
+                )
+                index.sync(table, rows, id_col, name_col, replace=force)
+        elif force or index.needs_load(table):
+            rows = yield Query(f'SELECT * FROM {table_name}')
+            index.load(table, rows, id_col, name_col)
+
+    @_read_only()
+    @_pooled
+    def warm_lookup_index(self) -> dict:
+        """Load every lookup table into the index (run once at server start).
+
+        Returns:
+            Dict mapping table short name to 'ok' or the error message
+        """
+        status = {}
+        if self._lookup_index is None:
+            return status
+        for table in LOOKUP_TABLES:
+            try:
+                with self._index_lock(f'lookup-{table}'):
+                    self._run(self._refresh_lookup_plan(table))
+                status[table] = 'ok'
+            except Exception as e:
+                print(f"[gta-mnt] WARNING: Lookup index load failed for {table}: {e}", file=sys.stderr)
+                status[table] = str(e)
+        return status
+
+    @_read_only()
+    @_pooled
+    def _refresh_lookup_table(self, table: str, force: bool = False) -> None:
+        """Background job: load, sync or (with `force`) rebuild one lookup table."""
+        try:
+            with self._index_lock(f'lookup-{table}'):
+                self._run(self._refresh_lookup_plan(table, force))
+        except Exception as e:
+            print(f"[gta-mnt] WARNING: Lookup index load failed for {table}: {e}", file=sys.stderr)
+
     # ========================================================================
     # Entry Creation: Create State Act
     # ========================================================================
 
+    @staticmethod
+    def _description_html(description: str) -> str:
+        """Plain-text description to <p>-wrapped HTML (the markdown copy stays plain)."""
+        return ''.join(f'<p>{p.strip()}</p>' for p in description.split('\n\n') if p.strip()) if description else ''
+
+    @classmethod
+    def _state_act_insert(
+        cls,
+        title: str,
+        description: str,
+        citation_text: str,
+        date_announced: str,
+        is_source_official: int,
+        evaluation_id: int,
+        status_id: int,
+        now: datetime,
+    ) -> tuple[str, tuple]:
+        """INSERT statement and params for one api_state_act_log row."""
+        # Convert plain text description to HTML (<p> wrapped) + store markdown copy
+        description_html = cls._description_html(description)
+        description_markdown = description  # Plain text version
+
+        insert_sql = '''
+            INSERT INTO api_state_act_log
+                (title, description, description_markdown, source_markdown, source, date_announced,
+                 is_source_official, status_id, evaluation_id,
+                 author_id, date_created, last_modified,
+                 is_migrated, is_validated_after_migration, submit_to_review_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        '''
+        params = (
+            title, description_html, description_markdown, citation_text, citation_text, date_announced,
+            is_source_official, status_id, evaluation_id,
+            SANCHO_AUTHOR_ID, now.strftime('%Y-%m-%d'), now,
+            1, 1, now.strftime('%Y-%m-%d')
+        )
+
+        return insert_sql, params
+
+    @_pooled
     def create_state_act(
         self,
         title: str,
@@ -1325,24 +2285,9 @@ class GTADatabaseClient:
         now = datetime.now(UTC)
         status_id = 1  # In progress — never create in publishable or review state
         citation_text = source_citation or source_url
-
-        # Convert plain text description to HTML (<p> wrapped) + store markdown copy
-        description_html = ''.join(f'<p>{p.strip()}</p>' for p in description.split('\n\n') if p.strip()) if description else ''
-        description_markdown = description  # Plain text version
-
-        insert_sql = '''
-            INSERT INTO api_state_act_log
-                (title, description, description_markdown, source_markdown, source, date_announced,
-                 is_source_official, status_id, evaluation_id,
-                 author_id, date_created, last_modified,
-                 is_migrated, is_validated_after_migration, submit_to_review_date)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        '''
-        params = (
-            title, description_html, description_markdown, citation_text, citation_text, date_announced,
-            is_source_official, status_id, evaluation_id,
-            SANCHO_AUTHOR_ID, now.strftime('%Y-%m-%d'), now,
-            1, 1, now.strftime('%Y-%m-%d')
+        insert_sql, params = self._state_act_insert(
+            title, description, citation_text, date_announced,
+            is_source_official, evaluation_id, status_id, now,
         )
 
         if dry_run:
@@ -1405,6 +2350,9 @@ class GTADatabaseClient:
             ''', ('NEW', citation_text, citation_text, now, now, 1, state_act_id))
 
             conn.commit()
+            self._pin_write(state_act_id)
+            if self._duplicate_index is not None:
+                self._duplicate_index.expire()
 
             return {
                 'success': True,
@@ -1422,6 +2370,62 @@ class GTADatabaseClient:
     # Entry Creation: Create Intervention
     # ========================================================================
 
+    @classmethod
+    def _intervention_insert(
+        cls,
+        state_act_id: Optional[int],
+        description: str,
+        intervention_type_id: int,
+        chapter_id: int,
+        subchapter_id: int,
+        gta_evaluation_id: int,
+        affected_flow_id: int,
+        eligible_firm_id: int,
+        implementation_level_id: int,
+        intervention_area_id: int,
+        date_implemented: str,
+        date_announced: str,
+        title: str,
+        announced_as_temporary: int = 0,
+        is_horizontal: int = 0,
+        aj_type: int = 1,
+        dm_type: int = 1,
+        *,
+        now: datetime,
+    ) -> tuple[str, tuple]:
+        """INSERT statement and params for one api_intervention_log row."""
+        description_html = cls._description_html(description)
+        description_markdown = description  # Plain text version
+
+        insert_sql = '''
+            INSERT INTO api_intervention_log
+                (state_act_id, title, description, description_markdown_collected,
+                 intervention_type_id,
+                 chapter_id, subchapter_id, gta_evaluation_id,
+                 affected_flow_id, eligible_firm_id, implementation_level_id,
+                 intervention_area_id, date_implemented, date_announced,
+                 announced_as_temporary, is_horizontal, aj_type, dm_type,
+                 status_id,
+                 is_in_counts, is_in_coverage, is_in_inspector,
+                 date_created, last_modified)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        '''
+        params = (
+            state_act_id, title, description_html, description_markdown,
+            intervention_type_id,
+            chapter_id, subchapter_id, gta_evaluation_id,
+            affected_flow_id, eligible_firm_id, implementation_level_id,
+            intervention_area_id, date_implemented, date_announced,
+            announced_as_temporary, is_horizontal, aj_type, dm_type,
+            1,  # status_id=1 (In progress), matching state act status
+            0, 0, 0,
+            now.strftime('%Y-%m-%d'), now
+        )
+
+        return insert_sql, params
+
+    @_invalidates_measure('state_act_id')
+    @_pooled
     def create_intervention(
         self,
         state_act_id: int,
@@ -1481,34 +2485,15 @@ class GTADatabaseClient:
             sa = cursor.fetchone()
             title = sa['title'] if sa else 'Untitled'
 
-        # Convert plain text description to HTML (<p> wrapped) + store markdown copy
-        description_html = ''.join(f'<p>{p.strip()}</p>' for p in description.split('\n\n') if p.strip()) if description else ''
-        description_markdown = description  # Plain text version
-
-        insert_sql = '''
-            INSERT INTO api_intervention_log
-                (state_act_id, title, description, description_markdown_collected,
-                 intervention_type_id,
-                 chapter_id, subchapter_id, gta_evaluation_id,
-                 affected_flow_id, eligible_firm_id, implementation_level_id,
-                 intervention_area_id, date_implemented, date_announced,
-                 announced_as_temporary, is_horizontal, aj_type, dm_type,
-                 status_id,
-                 is_in_counts, is_in_coverage, is_in_inspector,
-                 date_created, last_modified)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        '''
-        params = (
-            state_act_id, title, description_html, description_markdown,
-            intervention_type_id,
+        insert_sql, params = self._intervention_insert(
+            state_act_id, description, intervention_type_id,
             chapter_id, subchapter_id, gta_evaluation_id,
             affected_flow_id, eligible_firm_id, implementation_level_id,
-            intervention_area_id, date_implemented, date_announced,
-            announced_as_temporary, is_horizontal, aj_type, dm_type,
-            1,  # status_id=1 (In progress), matching state act status
-            0, 0, 0,
-            now.strftime('%Y-%m-%d'), now
+            intervention_area_id, date_implemented, date_announced, title,
+            announced_as_temporary, is_horizontal, aj_type, dm_type, now=now,
         )
+        description_html = self._description_html(description)
+        description_markdown = description  # Plain text version
 
         if dry_run:
             return {
@@ -1550,6 +2535,7 @@ class GTADatabaseClient:
             ''', ('NEW', description_html, description_markdown, now, now, 1, intervention_id))
 
             conn.commit()
+            self._pin_write(state_act_id, [intervention_id])
 
             return {
                 'success': True,
@@ -1566,6 +2552,8 @@ class GTADatabaseClient:
     # Entry Creation: Add Implementing Jurisdiction
     # ========================================================================
 
+    @_invalidates_measure('intervention_id')
+    @_pooled
     def add_ij(
         self,
         intervention_id: int,
@@ -1618,8 +2606,8 @@ class GTADatabaseClient:
     # Entry Creation: Add Product
     # ========================================================================
 
-    def add_product(
-        self,
+    @staticmethod
+    def _product_row(
         intervention_id: int,
         product_id: int,
         prior_level: Optional[str] = None,
@@ -1628,29 +2616,8 @@ class GTADatabaseClient:
         date_implemented: Optional[str] = None,
         date_removed: Optional[str] = None,
         is_investigated_only: bool = False,
-        dry_run: bool = False
-    ) -> dict:
-        """Add affected product (HS6) to an intervention.
-
-        For higher-granularity tariff lines (HS8/10/12/14) the source actually
-        publishes, use add_product_level instead — the gta-api back-end then
-        aggregates the finer rows up to HS6.
-
-        Args:
-            intervention_id: FK to api_intervention_log
-            product_id: FK to api_product_list (look up from HS code via gta_mnt_lookup)
-            prior_level: Optional prior tariff/level value for this product
-            new_level: Optional new tariff/level value for this product
-            unit_id: Optional FK to api_unit_list (e.g. percentage, specific rate)
-            date_implemented: Optional per-product implementation date (YYYY-MM-DD)
-            date_removed: Optional per-product removal date (YYYY-MM-DD)
-            is_investigated_only: True for trade-defence cases where this product
-                is under investigation only; False for ordinary affected products
-            dry_run: If True, return SQL without executing
-
-        Returns:
-            Dict with success status
-        """
+    ) -> tuple[list[str], list]:
+        """Column and value lists for one api_intervention_product INSERT."""
         # Base column list. is_investigated_only and type are NOT NULL with no
         # DB-level DEFAULT (Django ORM defaults don't apply to raw SQL), so they
         # must appear in every INSERT. type is hardcoded 'N': 'A'/'A_MIN'/'A_MAX'
@@ -1676,6 +2643,47 @@ class GTADatabaseClient:
         if date_removed is not None:
             columns.append('date_removed')
             values.append(date_removed)
+        return columns, values
+
+    @_invalidates_measure('intervention_id')
+    @_pooled
+    def add_product(
+        self,
+        intervention_id: int,
+        product_id: int,
+        prior_level: Optional[str] = None,
+        new_level: Optional[str] = None,
+        unit_id: Optional[int] = None,
+        date_implemented: Optional[str] = None,
+        date_removed: Optional[str] = None,
+        is_investigated_only: bool = False,
+        dry_run: bool = False
+    ) -> dict:
+        """Add affected product (HS6) to an intervention.
+
+        For higher-granularity tariff lines (HS8/10/12/14) the source actually
+        publishes, use add_product_level instead — the gta-api back-end then
+        aggregates the finer rows up to HS6.
+
+        Args:
+            intervention_id: FK to api_intervention_log
+            product_id: FK to api_product_list (look up from HS code via gta_mnt_lookup)
+            prior_level: Optional prior tariff/level value for this product
+            new_level: Optional new tariff/level value for this product
+            unit_id: Optional FK to api_unit_list (e.g. percentage, specific rate)
+            date_implemented: Optional per-product implementation date (YYYY-MM-DD)
+            date_removed: Optional per-product removal date (YYYY-MM-DD)
+            is_investigated_only: True for trade-defence cases where this product
+                is under investigation only; False for ordinary affected products
+            dry_run: If True, return SQL without executing
+
+        Returns:
+            Dict with success status
+        """
+        columns, values = self._product_row(
+            intervention_id, product_id, prior_level, new_level, unit_id,
+            date_implemented, date_removed, is_investigated_only,
+        )
 
         placeholders = ', '.join(['%s'] * len(values))
         insert_sql = f'''
@@ -1719,12 +2727,13 @@ class GTADatabaseClient:
         docstring for the implication)."""
         return ''.join(ch for ch in str(raw) if ch.isdigit())
 
-    def add_product_level(
-        self,
+    @classmethod
+    def _product_level_row(
+        cls,
         intervention_id: int,
-        level: int,                       # 8, 10, 12, or 14
-        hs_code: str,                     # may include punctuation; cleaned internally
-        jurisdiction_id: int,             # tariff line jurisdiction (FK api_jurisdiction_list)
+        level: int,
+        hs_code: str,
+        jurisdiction_id: int,
         prior_value: Optional[str] = None,
         new_value: Optional[str] = None,
         unit_id: Optional[int] = None,
@@ -1735,75 +2744,25 @@ class GTADatabaseClient:
         is_positively_affected: bool = False,
         is_tariff_line_official: bool = True,
         is_tariff_peak: Optional[int] = None,
-        # Level 8/10 only (the richer schema):
-        action_id: Optional[int] = None,           # REQUIRED for level 8/10 — FK api_action_log
-        applicability_reason_id: int = 1,          # default: 1 = "explicit in scope"
-        verification_status_id: int = 1,           # default: 1 = "HS code is in official source (HS 2022)"
+        action_id: Optional[int] = None,
+        applicability_reason_id: int = 1,
+        verification_status_id: int = 1,
         is_completely_captured: bool = False,
-        dry_run: bool = False,
     ) -> dict:
-        """Add a tariff-line row at HS8/10/12/14 to an intervention.
+        """Validate one tariff-line row and build its INSERT for add_product_level().
 
-        Analysts insert at the ORIGINAL SOURCE's HS granularity — if the source
-        publishes 10-digit codes, call with level=10; if the source publishes
-        8-digit codes, call with level=8. The gta-api back-end then aggregates
-        the finer rows upward (HS14 ⊂ HS12 ⊂ HS10 ⊂ HS8 ⊂ HS6) and produces
-        the 'A'/'A_MIN'/'A_MAX' type markers on the coarser tables when
-        children disagree on the rate. Always inserts with type='N'; the other
-        enum values are algorithm-only.
-
-        Target tables:
-            level=8  → api_intervention_product_level8       (22 cols)
-            level=10 → api_intervention_product_level10      (22 cols)
-            level=12 → api_intervention_product_level12_log  (14 cols)
-            level=14 → api_intervention_product_level14_log  (14 cols)
-
-        HS code cleaning: caller can pass any of '0102.10.20', '0102-10-20',
-        '0102 10 20', or '01021020' — all are normalized to digits-only. The
-        cleaned string must have exactly `level` digits or the call errors.
-
-        Leading-zero HS codes (e.g. '0102.10.20' — Live Bovine, chapter 01):
-        the cleaned 8-char string '01021020' is preserved during validation,
-        but the master `api_product_level{N}_list` table stores HS codes as
-        INTEGERS — leading zeros are dropped at the DB level by the existing
-        upstream system. The lookup still works because both sides drop the
-        leading zero consistently. If a caller cares about preserving the
-        leading zero in the surfaced detail, that has to be reconstructed
-        from the HS6 parent's product_id via api_product_list.
-
-        Args:
-            intervention_id: FK to api_intervention_log
-            level: 8, 10, 12, or 14
-            hs_code: source-stated HS code (any common formatting); will be cleaned
-            jurisdiction_id: FK to api_jurisdiction_list — the tariff schedule's jurisdiction
-            prior_value, new_value: tariff value strings (e.g. '5.0', '25.0')
-            unit_id: FK to api_unit_list (look up via gta_mnt_lookup table='unit')
-            date_implemented, date_removed: YYYY-MM-DD
-            is_investigated_only: True for trade-defence cases under investigation only
-            is_in_original: True if this code appeared in the source as written (default True)
-            is_positively_affected: True if measure is favourable to the product (default False)
-            is_tariff_line_official: True if from an official tariff schedule (default True)
-            is_tariff_peak: optional tariff-peak flag (0/1)
-            action_id: FK to api_action_log (REQUIRED for level 8/10; ignored for 12/14)
-            applicability_reason_id: 1='explicit in scope' (default), 2='explicit out of scope',
-                3='implicit in scope'. Level 8/10 only; ignored for 12/14.
-            verification_status_id: 1='HS code is in official source (HS 2022)' (default),
-                2='HS 2017 or earlier', 3='Not official'. Level 8/10 only; ignored for 12/14.
-            is_completely_captured: aggregation hint (default False). Level 8/10 only.
-            dry_run: If True, return SQL without executing
-
-        Returns:
-            Dict with success status; on success includes the resolved product_level{N}_id
-            composite value (`master_id`) for traceability.
+        Returns {'error': ...} when the row is invalid locally; otherwise the
+        target/master tables, the column and value lists, and the resolved
+        master_id / cleaned HS code. The master-list FK check is left to the
+        caller, since the bulk path runs it set-based.
         """
         if level not in (8, 10, 12, 14):
-            return {'success': False, 'error': f"level must be 8, 10, 12, or 14; got {level}"}
+            return {'error': f"level must be 8, 10, 12, or 14; got {level}"}
 
         # Clean the HS code: strip punctuation/whitespace, validate length matches level
-        cleaned = self._clean_hs_code(hs_code)
+        cleaned = cls._clean_hs_code(hs_code)
         if len(cleaned) != level:
             return {
-                'success': False,
                 'error': f"hs_code '{hs_code}' cleaned to '{cleaned}' ({len(cleaned)} digits); "
                          f"expected exactly {level} digits for HS{level}",
             }
@@ -1840,7 +2799,6 @@ class GTADatabaseClient:
         if level in (8, 10):
             if action_id is None:
                 return {
-                    'success': False,
                     'error': f"action_id is required for level {level} (FK to api_action_log). "
                              f"Use gta_mnt_lookup table='action' if you have one; common values "
                              f"include 1 (U.S. HTS Tariff Schedule)",
@@ -1891,6 +2849,113 @@ class GTADatabaseClient:
         if is_tariff_peak is not None:
             columns.append('is_tariff_peak'); values.append(is_tariff_peak)
 
+        return {
+            'target_table': target_table,
+            'master_table': master_table,
+            'pl_col': master_pl_col,
+            'columns': columns,
+            'values': values,
+            'hs_int': hs_int,
+            'master_id': master_id,
+            'cleaned': cleaned,
+        }
+
+    @_invalidates_measure('intervention_id')
+    @_pooled
+    def add_product_level(
+        self,
+        intervention_id: int,
+        level: int,                       # 8, 10, 12, or 14
+        hs_code: str,                     # may include punctuation; cleaned internally
+        jurisdiction_id: int,             # tariff line jurisdiction (FK api_jurisdiction_list)
+        prior_value: Optional[str] = None,
+        new_value: Optional[str] = None,
+        unit_id: Optional[int] = None,
+        date_implemented: Optional[str] = None,
+        date_removed: Optional[str] = None,
+        is_investigated_only: bool = False,
+        is_in_original: bool = True,
+        is_positively_affected: bool = False,
+        is_tariff_line_official: bool = True,
+        is_tariff_peak: Optional[int] = None,
+        # Level 8/10 only (the richer schema):
+        action_id: Optional[int] = None,           # REQUIRED for level 8/10 — FK api_action_log
+        applicability_reason_id: int = 1,          # default: 1 = "explicit in scope"
+        verification_status_id: int = 1,           # default: 1 = "HS code is in official source (HS 2022)"
+        is_completely_captured: bool = False,
+        dry_run: bool = False,
+    ) -> dict:
+        """Add a tariff-line row at HS8/10/12/14 to an intervention.
+
+        Analysts insert at the ORIGINAL SOURCE's HS granularity — if the source
+        publishes 10-digit codes, call with level=10; if the source publishes
+        8-digit codes, call with level=8. The gta-api back-end then aggregates
+        the finer rows upward (HS14 ⊂ HS12 ⊂ HS10 ⊂ HS8 ⊂ HS6) and produces
+        the 'A'/'A_MIN'/'A_MAX' type markers on the coarser tables when
+        children disagree on the rate. Always inserts with type='N'; the other
+        enum values are algorithm-only.
+
+        Target tables:
+            level=8  → api_intervention_product_level8       (22 cols)
+            level=10 → api_intervention_product_level10      (22 cols)
+            level=12 → api_intervention_product_level12_log  (14 cols)
+            level=14 → api_intervention_product_level14_log  (14 cols)
+
+        HS code cleaning: caller can pass any of '0102.10.20', '0102-10-20',
+        '0102 10 20', or '01021020' — all are normalized to digits-only. The
+        cleaned string must have exactly `level` digits or the call errors.
+
+        Leading-zero HS codes (e.g. '0102.10.20' — Live Bovine, chapter 01):
+        the cleaned 8-char string '01021020' is preserved during validation,
+        but the master `api_product_level{N}_list` table stores HS codes as
+        INTEGERS — leading zeros are dropped at the DB level by the existing
+        upstream system. The lookup still works because both sides drop the
+        leading zero consistently. If a caller cares about preserving the
+        leading zero in the surfaced detail, that has to be reconstructed
+        from the HS6 parent's product_id via api_product_list.
+
+        Args:
+            intervention_id: FK to api_intervention_log
+            level: 8, 10, 12, or 14
+            hs_code: source-stated HS code (any common formatting); will be cleaned
+            jurisdiction_id: FK to api_jurisdiction_list — the tariff schedule's jurisdiction
+            prior_value, new_value: tariff value strings (e.g. '5.0', '25.0')
+            unit_id: FK to api_unit_list (look up via gta_mnt_lookup table='unit')
+            date_implemented, date_removed: YYYY-MM-DD
+            is_investigated_only: True for trade-defence cases under investigation only
+            is_in_original: True if this code appeared in the source as written (default True)
+            is_positively_affected: True if measure is favourable to the product (default False)
+            is_tariff_line_official: True if from an official tariff schedule (default True)
+            is_tariff_peak: optional tariff-peak flag (0/1)
+            action_id: FK to api_action_log (REQUIRED for level 8/10; ignored for 12/14)
+            applicability_reason_id: 1='explicit in scope' (default), 2='explicit out of scope',
+                3='implicit in scope'. Level 8/10 only; ignored for 12/14.
+            verification_status_id: 1='HS code is in official source (HS 2022)' (default),
+                2='HS 2017 or earlier', 3='Not official'. Level 8/10 only; ignored for 12/14.
+            is_completely_captured: aggregation hint (default False). Level 8/10 only.
+            dry_run: If True, return SQL without executing
+
+        Returns:
+            Dict with success status; on success includes the resolved product_level{N}_id
+            composite value (`master_id`) for traceability.
+        """
+        row = self._product_level_row(
+            intervention_id, level, hs_code, jurisdiction_id,
+            prior_value=prior_value, new_value=new_value, unit_id=unit_id,
+            date_implemented=date_implemented, date_removed=date_removed,
+            is_investigated_only=is_investigated_only, is_in_original=is_in_original,
+            is_positively_affected=is_positively_affected,
+            is_tariff_line_official=is_tariff_line_official, is_tariff_peak=is_tariff_peak,
+            action_id=action_id, applicability_reason_id=applicability_reason_id,
+            verification_status_id=verification_status_id,
+            is_completely_captured=is_completely_captured,
+        )
+        if 'error' in row:
+            return {'success': False, 'error': row['error']}
+        target_table, master_table, master_pl_col = row['target_table'], row['master_table'], row['pl_col']
+        columns, values = row['columns'], row['values']
+        hs_int, master_id, cleaned = row['hs_int'], row['master_id'], row['cleaned']
+
         placeholders = ', '.join(['%s'] * len(values))
         insert_sql = f'''
             INSERT INTO {target_table}
@@ -1938,65 +3003,351 @@ class GTADatabaseClient:
             conn.rollback()
             return {'success': False, 'error': str(e)}
 
-    # ========================================================================
-    # Entry Creation: Add Sector
-    # ========================================================================
+    # ========================================================================
+    # Entry Creation: Add Sector
+    # ========================================================================
+
+    @_invalidates_measure('intervention_id')
+    @_pooled
+    def add_sector(
+        self,
+        intervention_id: int,
+        sector_id: int,
+        sector_type: str = 'N',
+        is_investigated_only: bool = False,
+        dry_run: bool = False
+    ) -> dict:
+        """Add affected sector to an intervention.
+
+        Args:
+            intervention_id: FK to api_intervention_log
+            sector_id: FK to api_sector_list
+            sector_type: 'N' (normal), 'A' (additional), 'D' (deleted)
+            is_investigated_only: True for trade-defence cases (anti-dumping,
+                anti-subsidy, safeguard) where the sector is under investigation
+                only; False for normal affected-sector tags
+            dry_run: If True, return SQL without executing
+
+        Returns:
+            Dict with success status
+        """
+        insert_sql = '''
+            INSERT INTO api_intervention_sector
+                (intervention_id, sector_id, type, is_investigated_only)
+            VALUES (%s, %s, %s, %s)
+        '''
+        params = (intervention_id, sector_id, sector_type, 1 if is_investigated_only else 0)
+
+        if dry_run:
+            return {'dry_run': True, 'sql': insert_sql.strip(), 'params': [str(p) for p in params]}
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('SELECT sector_id FROM api_sector_list WHERE sector_id = %s', (sector_id,))
+            if not cursor.fetchone():
+                return {'success': False, 'error': f'Sector {sector_id} not found'}
+
+            cursor.execute(insert_sql, params)
+            conn.commit()
+            return {
+                'success': True,
+                'id': cursor.lastrowid,
+                'message': f'Sector {sector_id} added to intervention {intervention_id}'
+            }
+        except Exception as e:
+            conn.rollback()
+            return {'success': False, 'error': str(e)}
+
+    # ========================================================================
+    # Entry Creation: Bulk Adds (products, product levels, sectors, IJs)
+    # ========================================================================
+    #
+    # An HS-heavy intervention carries hundreds of tariff lines; adding them
+    # one call at a time costs two or three round trips and a commit per row.
+    # The bulk variants take one intervention and a list of rows, validate
+    # every FK with one set-based query per master table, and insert the
+    # valid rows with executemany (pymysql rewrites it into multi-row VALUES)
+    # inside a single transaction. Rows that fail validation are reported
+    # and skipped; a DB error during the insert rolls back the whole batch.
+    #
+    # Results carry one entry per input row, in input order:
+    #   {'index': i, 'status': 'inserted' | 'invalid' | 'failed' | 'dry_run', ...}
+    # Auto-increment ids are not returned — a multi-row INSERT only reports
+    # the first one, and consecutive ids are not guaranteed.
+
+    @staticmethod
+    def _bulk_prepare(items: list, build: Callable[[dict], dict]) -> list[dict]:
+        """Run `build` on every item; rows it rejects are marked invalid."""
+        rows = []
+        for index, item in enumerate(items):
+            try:
+                row = build(dict(item))
+            except (TypeError, ValueError) as e:
+                row = {'error': str(e)}
+            row['index'] = index
+            if 'error' in row:
+                row['status'] = 'invalid'
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _bulk_statements(rows: list[dict]) -> list[tuple[str, list[tuple]]]:
+        """Group valid rows by (table, column list) into one INSERT each."""
+        groups: dict[tuple, list[tuple]] = {}
+        for row in rows:
+            if 'status' in row:
+                continue
+            key = (row['table'], tuple(row['columns']))
+            groups.setdefault(key, []).append(tuple(row['values']))
+        statements = []
+        for (table, columns), params in groups.items():
+            placeholders = ', '.join(['%s'] * len(columns))
+            sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            statements.append((sql, params))
+        return statements
+
+    @staticmethod
+    def _bulk_result(rows: list[dict], label: str, intervention_id: int, **extra) -> dict:
+        """Per-row results plus counts, in input order."""
+        results = []
+        for row in rows:
+            entry = {'index': row['index'], 'status': row.get('status', 'inserted')}
+            for key in ('key', 'master_id', 'cleaned_hs_code', 'error'):
+                if key in row:
+                    entry[key] = row[key]
+            results.append(entry)
+        counts = {
+            status: sum(1 for r in results if r['status'] == status)
+            for status in ('inserted', 'invalid', 'failed')
+        }
+        return {
+            'success': counts['invalid'] == 0 and counts['failed'] == 0,
+            **counts,
+            'results': results,
+            'message': f"{counts['inserted']} of {len(results)} {label} added to "
+                       f"intervention {intervention_id}",
+            **extra,
+        }
+
+    # kind -> (master table, key column, label) for the single-column FK checks
+    _BULK_FKS = {
+        'ij': ('api_jurisdiction_list', 'jurisdiction_id', 'Jurisdiction'),
+        'product': ('api_product_list', 'product_id', 'Product'),
+        'sector': ('api_sector_list', 'sector_id', 'Sector'),
+        'rationale': ('api_rationale_list', 'rationale_id', 'Rationale'),
+    }
+
+    @classmethod
+    def _bulk_row(cls, kind: str, intervention_id: Optional[int], item: dict) -> dict:
+        """Build one child-table INSERT row of `kind` from single-add keyword arguments.
+
+        Every child INSERT leads with intervention_id, so rows built before the
+        intervention exists (entry bundles) get it patched into values[0].
+        """
+        if kind == 'product':
+            columns, values = cls._product_row(intervention_id, **item)
+            return {'table': 'api_intervention_product', 'columns': columns, 'values': values,
+                    'key': item['product_id']}
+
+        if kind == 'product_level':
+            row = cls._product_level_row(intervention_id, **item)
+            if 'error' in row:
+                return row
+            return {
+                'table': row['target_table'], 'master_table': row['master_table'],
+                'pl_col': row['pl_col'], 'columns': row['columns'], 'values': row['values'],
+                'level': item['level'], 'hs_int': row['hs_int'], 'jurisdiction_id': item['jurisdiction_id'],
+                'master_id': row['master_id'], 'cleaned_hs_code': row['cleaned'],
+            }
+
+        def sector(sector_id: int, sector_type: str = 'N', is_investigated_only: bool = False):
+            return {'table': 'api_intervention_sector',
+                    'columns': ['intervention_id', 'sector_id', 'type', 'is_investigated_only'],
+                    'values': [intervention_id, sector_id, sector_type, 1 if is_investigated_only else 0],
+                    'key': sector_id}
+
+        def ij(jurisdiction_id: int):
+            return {'table': 'api_intervention_ij', 'columns': ['intervention_id', 'jurisdiction_id'],
+                    'values': [intervention_id, jurisdiction_id], 'key': jurisdiction_id}
+
+        def rationale(rationale_id: int):
+            return {'table': 'api_intervention_rationale', 'columns': ['intervention_id', 'rationale_id'],
+                    'values': [intervention_id, rationale_id], 'key': rationale_id}
+
+        def level(prior_level: Optional[str] = None, new_level: Optional[str] = None,
+                  unit_id: Optional[int] = None, level_type_id: Optional[int] = None,
+                  tariff_peak: Optional[int] = None):
+            return {'table': 'api_intervention_level',
+                    'columns': ['intervention_id', 'prior_level', 'new_level', 'intervention_unit_id',
+                                'level_type_id', 'tariff_peak'],
+                    'values': [intervention_id, prior_level, new_level, unit_id, level_type_id, tariff_peak]}
+
+        builders = {'sector': sector, 'ij': ij, 'rationale': rationale, 'level': level}
+        return builders[kind](**item)
+
+    @classmethod
+    def _mark_missing(cls, cursor, kind: str, rows: list[dict]) -> None:
+        """Mark rows whose FK targets do not exist as invalid, one query per master table.
+
+        Single-column FKs use `key IN (...)`; tariff lines check their
+        (HS code, jurisdiction) pairs with a row-constructor `IN` per level.
+        """
+        pending = [r for r in rows if 'status' not in r]
+        if not pending:
+            return
+
+        if kind in cls._BULK_FKS:
+            table, column, what = cls._BULK_FKS[kind]
+            ids = sorted({r['key'] for r in pending})
+            cursor.execute(
+                f"SELECT {column} FROM {table} WHERE {column} IN ({', '.join(['%s'] * len(ids))})",
+                tuple(ids),
+            )
+            found = {r[column] for r in cursor.fetchall()}
+            for r in pending:
+                if r['key'] not in found:
+                    r.update(status='invalid', error=f"{what} {r['key']} not found")
+            return
+
+        if kind == 'product_level':
+            by_master: dict[tuple, list[dict]] = {}
+            for r in pending:
+                by_master.setdefault((r['master_table'], r['pl_col'], r['level']), []).append(r)
+            for (master_table, pl_col, level), group in by_master.items():
+                pairs = sorted({(r['hs_int'], r['jurisdiction_id']) for r in group})
+                cursor.execute(
+                    f"SELECT {pl_col} AS hs, jurisdiction_id FROM {master_table} "
+                    f"WHERE ({pl_col}, jurisdiction_id) IN ({', '.join(['(%s, %s)'] * len(pairs))})",
+                    tuple(v for pair in pairs for v in pair),
+                )
+                found = {(r['hs'], r['jurisdiction_id']) for r in cursor.fetchall()}
+                for r in group:
+                    if (r['hs_int'], r['jurisdiction_id']) not in found:
+                        r.update(status='invalid', error=(
+                            f"HS{level} code {r['cleaned_hs_code']} not found in {master_table} "
+                            f"for jurisdiction {r['jurisdiction_id']}"
+                        ))
+
+    def _bulk_insert(self, intervention_id: int, kind: str, items: list, label: str, dry_run: bool) -> dict:
+        """Validate FKs, then insert all valid rows of `kind` in one transaction."""
+        rows = self._bulk_prepare(items, functools.partial(self._bulk_row, kind, intervention_id))
+
+        if dry_run:
+            statements = self._bulk_statements(rows)
+            for row in rows:
+                row.setdefault('status', 'dry_run')
+            result = self._bulk_result(rows, label, intervention_id)
+            pending = sum(len(params) for _, params in statements)
+            result.update(
+                dry_run=True,
+                message=f"{pending} of {len(rows)} {label} would be added to "
+                        f"intervention {intervention_id} (FKs not checked)",
+                statements=[
+                    {'sql': sql, 'params': [[str(p) for p in values] for values in params]}
+                    for sql, params in statements
+                ],
+            )
+            return result
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute('SELECT intervention_id FROM api_intervention_log WHERE intervention_id = %s', (intervention_id,))
+            if not cursor.fetchone():
+                return {'success': False, 'error': f'Intervention {intervention_id} not found'}
+
+            self._mark_missing(cursor, kind, rows)
+            for sql, params in self._bulk_statements(rows):
+                cursor.executemany(sql, params)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            for row in rows:
+                if 'status' not in row:
+                    row.update(status='failed', error=str(e))
+        return self._bulk_result(rows, label, intervention_id)
+
+    @_invalidates_measure('intervention_id')
+    @_pooled
+    def add_products_bulk(self, intervention_id: int, products: list[dict], dry_run: bool = False) -> dict:
+        """Add many HS6 products to an intervention in one transaction.
+
+        Args:
+            intervention_id: FK to api_intervention_log
+            products: rows with add_product() keyword arguments — product_id
+                (required), prior_level, new_level, unit_id, date_implemented,
+                date_removed, is_investigated_only
+            dry_run: If True, validate locally and return the SQL without executing
+
+        Returns:
+            Dict with inserted/invalid/failed counts and per-row results
+        """
+        return self._bulk_insert(intervention_id, 'product', products, 'products', dry_run)
+
+    @_invalidates_measure('intervention_id')
+    @_pooled
+    def add_product_levels_bulk(self, intervention_id: int, lines: list[dict], dry_run: bool = False) -> dict:
+        """Add many HS8/10/12/14 tariff lines to an intervention in one transaction.
 
-    def add_sector(
-        self,
-        intervention_id: int,
-        sector_id: int,
-        sector_type: str = 'N',
-        is_investigated_only: bool = False,
-        dry_run: bool = False
-    ) -> dict:
-        """Add affected sector to an intervention.
+        Each row is cleaned and checked exactly like add_product_level(); the
+        (HS code, jurisdiction) master-list check runs once per level as a
+        row-constructor `IN` query.
 
         Args:
             intervention_id: FK to api_intervention_log
-            sector_id: FK to api_sector_list
-            sector_type: 'N' (normal), 'A' (additional), 'D' (deleted)
-            is_investigated_only: True for trade-defence cases (anti-dumping,
-                anti-subsidy, safeguard) where the sector is under investigation
-                only; False for normal affected-sector tags
-            dry_run: If True, return SQL without executing
+            lines: rows with add_product_level() keyword arguments — level,
+                hs_code and jurisdiction_id are required; action_id is required
+                for level 8/10
+            dry_run: If True, validate locally and return the SQL without executing
 
         Returns:
-            Dict with success status
+            Dict with inserted/invalid/failed counts and per-row results; each
+            result carries the resolved master_id and cleaned_hs_code
         """
-        insert_sql = '''
-            INSERT INTO api_intervention_sector
-                (intervention_id, sector_id, type, is_investigated_only)
-            VALUES (%s, %s, %s, %s)
-        '''
-        params = (intervention_id, sector_id, sector_type, 1 if is_investigated_only else 0)
+        return self._bulk_insert(intervention_id, 'product_level', lines, 'tariff lines', dry_run)
 
-        if dry_run:
-            return {'dry_run': True, 'sql': insert_sql.strip(), 'params': [str(p) for p in params]}
+    @_invalidates_measure('intervention_id')
+    @_pooled
+    def add_sectors_bulk(self, intervention_id: int, sectors: list[dict], dry_run: bool = False) -> dict:
+        """Add many affected sectors to an intervention in one transaction.
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        Args:
+            intervention_id: FK to api_intervention_log
+            sectors: rows with add_sector() keyword arguments — sector_id
+                (required), sector_type, is_investigated_only
+            dry_run: If True, validate locally and return the SQL without executing
 
-        try:
-            cursor.execute('SELECT sector_id FROM api_sector_list WHERE sector_id = %s', (sector_id,))
-            if not cursor.fetchone():
-                return {'success': False, 'error': f'Sector {sector_id} not found'}
+        Returns:
+            Dict with inserted/invalid/failed counts and per-row results
+        """
+        return self._bulk_insert(intervention_id, 'sector', sectors, 'sectors', dry_run)
 
-            cursor.execute(insert_sql, params)
-            conn.commit()
-            return {
-                'success': True,
-                'id': cursor.lastrowid,
-                'message': f'Sector {sector_id} added to intervention {intervention_id}'
-            }
-        except Exception as e:
-            conn.rollback()
-            return {'success': False, 'error': str(e)}
+    @_invalidates_measure('intervention_id')
+    @_pooled
+    def add_ijs_bulk(self, intervention_id: int, jurisdiction_ids: list[int], dry_run: bool = False) -> dict:
+        """Add many implementing jurisdictions to an intervention in one transaction.
+
+        Args:
+            intervention_id: FK to api_intervention_log
+            jurisdiction_ids: FKs to api_jurisdiction_list
+            dry_run: If True, return the SQL without executing
+
+        Returns:
+            Dict with inserted/invalid/failed counts and per-row results
+        """
+        return self._bulk_insert(
+            intervention_id, 'ij', [{'jurisdiction_id': j} for j in jurisdiction_ids],
+            'jurisdictions', dry_run,
+        )
 
     # ========================================================================
     # Entry Creation: Add Rationale
     # ========================================================================
 
+    @_invalidates_measure('intervention_id')
+    @_pooled
     def add_rationale(
         self,
         intervention_id: int,
@@ -2045,6 +3396,8 @@ class GTADatabaseClient:
     # Entry Creation: Add Firm
     # ========================================================================
 
+    @_invalidates_measure('intervention_id')
+    @_pooled
     def add_firm(
         self,
         intervention_id: int,
@@ -2109,6 +3462,8 @@ class GTADatabaseClient:
                 ''', (firm_name, firm_name, intervention_id))
 
             conn.commit()
+            if existing is None and self._lookup_index is not None:
+                self._lookup_index.expire('firm')
             return {
                 'success': True,
                 'firm_id': firm_id,
@@ -2123,6 +3478,8 @@ class GTADatabaseClient:
     # Entry Creation: Add Source
     # ========================================================================
 
+    @_invalidates_measure('state_act_id')
+    @_pooled
     def add_source(
         self,
         state_act_id: int,
@@ -2207,6 +3564,8 @@ class GTADatabaseClient:
             ''', ('NEW', citation_text, citation_text, now, now, next_order, state_act_id))
 
             conn.commit()
+            if self._duplicate_index is not None:
+                self._duplicate_index.expire('url')
             return {
                 'success': True,
                 'source_id': source_id,
@@ -2221,6 +3580,8 @@ class GTADatabaseClient:
     # Entry Creation: Queue Recalculation
     # ========================================================================
 
+    @_invalidates_measure('intervention_id')
+    @_pooled
     def queue_recalculation(
         self,
         intervention_id: int,
@@ -2278,6 +3639,8 @@ class GTADatabaseClient:
     # Entry Creation: Add Intervention Level
     # ========================================================================
 
+    @_invalidates_measure('intervention_id')
+    @_pooled
     def add_level(
         self,
         intervention_id: int,
@@ -2331,6 +3694,8 @@ class GTADatabaseClient:
     # Motive Quotes
     # ========================================================================
 
+    @_invalidates_measure('state_act_id')
+    @_pooled
     def add_motive_quote(
         self,
         state_act_id: int,
@@ -2374,10 +3739,341 @@ class GTADatabaseClient:
             conn.rollback()
             return {'success': False, 'error': str(e)}
 
+    # ========================================================================
+    # Entry Creation: Entry Bundle
+    # ========================================================================
+    #
+    # Authoring a measure through the single-row tools is a chain of a dozen
+    # or more calls, each its own round trip and commit; a failure halfway
+    # leaves a partial state act behind. create_entry_bundle() takes the
+    # whole graph at once, validates every row (locally, then one FK query
+    # per master table across all interventions), and writes everything in
+    # one transaction — either the full graph exists afterwards or nothing.
+    #
+    # Parent rows whose ids are needed (state act, interventions, new
+    # sources, new firms) are inserted one statement each; every leaf table
+    # is written with a single executemany.
+
+    # Bundle intervention keys holding child rows -> _bulk_row() kind
+    _BUNDLE_CHILDREN = {
+        'implementing_jurisdictions': 'ij',
+        'products': 'product',
+        'product_levels': 'product_level',
+        'sectors': 'sector',
+        'rationales': 'rationale',
+        'levels': 'level',
+    }
+
+    @_pooled
+    def create_entry_bundle(
+        self,
+        state_act: dict,
+        interventions: Optional[list[dict]] = None,
+        sources: Optional[list[dict]] = None,
+        motive_quotes: Optional[list[dict]] = None,
+        dry_run: bool = False,
+    ) -> dict:
+        """Create a state act with its sources, motive quotes and interventions in one transaction.
+
+        Args:
+            state_act: create_state_act() keyword arguments (title, description,
+                source_url, is_source_official, date_announced, evaluation_id,
+                source_citation)
+            interventions: create_intervention() keyword arguments without
+                state_act_id (title defaults to the state act title), plus
+                optional child lists:
+                  implementing_jurisdictions: [jurisdiction_id, ...]
+                  products: [add_product() rows]
+                  product_levels: [add_product_level() rows]
+                  sectors: [add_sector() rows]
+                  rationales: [rationale_id, ...]
+                  firms: [{firm_name, role_id, jurisdiction_id}]
+                  levels: [add_level() rows]
+                  queue_recalculation: bool; defaults to True when aj_type or
+                      dm_type is 1 (inferred)
+            sources: additional add_source() rows ({source_url, source_citation})
+            motive_quotes: add_motive_quote() rows ({motive_quote, source_url})
+            dry_run: If True, validate locally and return the row counts without executing
+
+        Returns:
+            Dict with success status, the generated state_act_id, source_ids
+            and per-intervention ids, and row counts per table. On validation
+            failure nothing is written and `errors` lists every bad row by path.
+        """
+        now = datetime.now(UTC)
+        status_id = 1  # In progress — never create in publishable or review state
+        errors: list[str] = []
+
+        # ---- Build and validate every row before touching the DB ----
+        def state_act_row(title: str, description: str, source_url: str, is_source_official: int,
+                          date_announced: str, evaluation_id: int, source_citation: Optional[str] = None):
+            citation = source_citation or source_url
+            sql, params = self._state_act_insert(
+                title, description, citation, date_announced,
+                is_source_official, evaluation_id, status_id, now,
+            )
+            return {'sql': sql, 'params': params, 'title': title, 'sources': [(source_url, citation)]}
+
+        def source_row(source_url: str, source_citation: Optional[str] = None):
+            return (source_url, source_citation or source_url)
+
+        def quote_row(motive_quote: str, source_url: Optional[str] = None):
+            return [motive_quote, source_url]
+
+        def firm_row(firm_name: str, role_id: int, jurisdiction_id: Optional[int] = None):
+            return {'firm_name': firm_name, 'role_id': role_id, 'jurisdiction_id': jurisdiction_id}
+
+        try:
+            sa = state_act_row(**state_act)
+        except TypeError as e:
+            return {'success': False, 'errors': [f'state_act: {e}'], 'message': 'Entry bundle is invalid; nothing was written'}
+
+        # Same URL twice links once, like add_source()
+        seen_urls = {sa['sources'][0][0].casefold()}
+        for n, item in enumerate(sources or []):
+            try:
+                url, citation = source_row(**item)
+            except TypeError as e:
+                errors.append(f'sources[{n}]: {e}')
+                continue
+            if url.casefold() not in seen_urls:
+                seen_urls.add(url.casefold())
+                sa['sources'].append((url, citation))
+
+        quotes = []
+        for n, item in enumerate(motive_quotes or []):
+            try:
+                quotes.append(quote_row(**item))
+            except TypeError as e:
+                errors.append(f'motive_quotes[{n}]: {e}')
+
+        plans = []
+        rows_by_kind: dict[str, list[dict]] = {kind: [] for kind in self._BUNDLE_CHILDREN.values()}
+        for i, spec in enumerate(interventions or []):
+            spec = dict(spec)
+            path = f'interventions[{i}]'
+            plan = {'children': [], 'firms': []}
+            for key, kind in self._BUNDLE_CHILDREN.items():
+                items = spec.pop(key, None) or []
+                if kind in ('ij', 'rationale'):
+                    column = 'jurisdiction_id' if kind == 'ij' else 'rationale_id'
+                    items = [{column: item} for item in items]
+                rows = self._bulk_prepare(items, functools.partial(self._bulk_row, kind, None))
+                for row in rows:
+                    row['path'] = f"{path}.{key}[{row['index']}]"
+                rows_by_kind[kind].extend(rows)
+                plan['children'].extend(rows)
+            for n, item in enumerate(spec.pop('firms', None) or []):
+                try:
+                    plan['firms'].append(firm_row(**item))
+                except TypeError as e:
+                    errors.append(f'{path}.firms[{n}]: {e}')
+            recalc = spec.pop('queue_recalculation', None)
+            plan['recalc'] = recalc if recalc is not None else 1 in (spec.get('aj_type', 1), spec.get('dm_type', 1))
+            spec['title'] = spec.get('title') or sa['title']
+            try:
+                plan['sql'], plan['params'] = self._intervention_insert(None, now=now, **spec)
+            except TypeError as e:
+                errors.append(f'{path}: {e}')
+                continue
+            plan['title'] = spec['title']
+            plan['description'] = spec['description']
+            plans.append(plan)
+
+        def row_errors():
+            return [
+                f"{row['path']}: {row['error']}"
+                for rows in rows_by_kind.values() for row in rows if row.get('status') == 'invalid'
+            ]
+
+        errors.extend(row_errors())
+        child_rows = [row for plan in plans for row in plan['children'] if 'status' not in row]
+        counts = {
+            'api_state_act_log': 1,
+            'api_state_act_source': len(sa['sources']),
+            'gta_stated_motive_log': len(quotes),
+            'api_intervention_log': len(plans),
+            'api_intervention_firm': sum(len(plan['firms']) for plan in plans),
+            'api_recalculation_log': sum(1 for plan in plans if plan['recalc']),
+        }
+        for row in child_rows:
+            counts[row['table']] = counts.get(row['table'], 0) + 1
+        counts = {table: n for table, n in counts.items() if n}
+
+        if dry_run:
+            return {
+                'dry_run': True,
+                'success': not errors,
+                'errors': errors,
+                'rows': counts,
+                'message': (f"Entry bundle is valid: {sum(counts.values())} rows across {len(counts)} "
+                            f"tables would be written (FKs not checked)" if not errors else
+                            f"Entry bundle has {len(errors)} invalid rows"),
+            }
+        if errors:
+            return {'success': False, 'errors': errors, 'message': 'Entry bundle is invalid; nothing was written'}
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            # ---- Batch FK checks and lookups: one query per master table ----
+            for kind, rows in rows_by_kind.items():
+                self._mark_missing(cursor, kind, rows)
+            errors = row_errors()
+            if errors:
+                return {'success': False, 'errors': errors, 'message': 'Entry bundle is invalid; nothing was written'}
+
+            # The name/URL columns compare case-insensitively, so key the maps the same way
+            urls = [url for url, _ in sa['sources']]
+            cursor.execute(
+                f"SELECT source_id, source_url FROM api_source_list "
+                f"WHERE source_url IN ({', '.join(['%s'] * len(urls))}) ORDER BY source_id",
+                tuple(urls),
+            )
+            source_ids: dict[str, int] = {}
+            for r in cursor.fetchall():
+                source_ids.setdefault(r['source_url'].casefold(), r['source_id'])
+
+            firm_ids: dict[str, int] = {}
+            names = sorted({f['firm_name'] for plan in plans for f in plan['firms']})
+            if names:
+                cursor.execute(
+                    f"SELECT firm_id, firm_name FROM mtz_firm_log "
+                    f"WHERE firm_name IN ({', '.join(['%s'] * len(names))}) ORDER BY firm_id",
+                    tuple(names),
+                )
+                for r in cursor.fetchall():
+                    firm_ids.setdefault(r['firm_name'].casefold(), r['firm_id'])
+
+            # ---- State act, sources, motive quotes ----
+            cursor.execute(sa['sql'], sa['params'])
+            state_act_id = cursor.lastrowid
+            cursor.execute(
+                'UPDATE api_state_act_log SET slug = %s WHERE state_act_id = %s',
+                (f"{state_act_id}-{_slugify(sa['title'])}", state_act_id)
+            )
+            cursor.execute('''
+                INSERT INTO api_state_act_status_log
+                    (state_act_id, state_act_status_id, status_time)
+                VALUES (%s, %s, %s)
+            ''', (state_act_id, status_id, now))
+
+            new_sources = 0
+            for url, _ in sa['sources']:
+                if url.casefold() not in source_ids:
+                    cursor.execute('''
+                        INSERT INTO api_source_list (source_url, is_collected, is_file, is_404)
+                        VALUES (%s, 0, 0, 0)
+                    ''', (url,))
+                    source_ids[url.casefold()] = cursor.lastrowid
+                    new_sources += 1
+            cursor.executemany(
+                'INSERT INTO api_state_act_source (source_id, state_act_id) VALUES (%s, %s)',
+                [(source_ids[url.casefold()], state_act_id) for url, _ in sa['sources']],
+            )
+            cursor.executemany(
+                'INSERT INTO api_state_act_source_log_new '
+                '(status, source, source_markdown, datetime_created, datetime_modified, order_nr, state_act_id) '
+                'VALUES (%s, %s, %s, %s, %s, %s, %s)',
+                [('NEW', citation, citation, now, now, order_nr, state_act_id)
+                 for order_nr, (_, citation) in enumerate(sa['sources'], 1)],
+            )
+            if quotes:
+                cursor.executemany(
+                    'INSERT INTO gta_stated_motive_log (stated_motive_name, state_act_id, stated_motive_url) '
+                    'VALUES (%s, %s, %s)',
+                    [(quote, state_act_id, url) for quote, url in quotes],
+                )
+
+            # ---- Interventions and their child rows ----
+            created = []
+            new_firms = 0
+            for plan in plans:
+                cursor.execute(plan['sql'], (state_act_id,) + tuple(plan['params'][1:]))
+                intervention_id = cursor.lastrowid
+                for row in plan['children']:
+                    row['values'][0] = intervention_id
+                for firm in plan['firms']:
+                    key = firm['firm_name'].casefold()
+                    if key not in firm_ids:
+                        cursor.execute('''
+                            INSERT INTO mtz_firm_log
+                                (firm_name, jurisdiction_id, priority,
+                                 status_id, hs_status_id, cpc_status_id)
+                            VALUES (%s, %s, 0, 1, 1, 1)
+                        ''', (firm['firm_name'], firm['jurisdiction_id']))
+                        firm_ids[key] = cursor.lastrowid
+                        new_firms += 1
+                    firm['firm_id'] = firm_ids[key]
+                created.append({
+                    'intervention_id': intervention_id,
+                    'firm_ids': [firm['firm_id'] for firm in plan['firms']],
+                    'queued_recalculation': plan['recalc'],
+                })
+
+            if plans:
+                cursor.executemany(
+                    'UPDATE api_intervention_log SET slug = %s WHERE intervention_id = %s',
+                    [(f"{c['intervention_id']}-{_slugify(plan['title'])}", c['intervention_id'])
+                     for c, plan in zip(created, plans)],
+                )
+                cursor.executemany(
+                    'INSERT INTO api_intervention_description_log '
+                    '(status, description, description_markdown, datetime_created, datetime_modified, order_nr, intervention_id) '
+                    'VALUES (%s, %s, %s, %s, %s, %s, %s)',
+                    [('NEW', self._description_html(plan['description']), plan['description'], now, now, 1,
+                      c['intervention_id']) for c, plan in zip(created, plans)],
+                )
+
+            for sql, params in self._bulk_statements(child_rows):
+                cursor.executemany(sql, params)
+
+            firm_links = [(firm, c['intervention_id']) for c, plan in zip(created, plans) for firm in plan['firms']]
+            if firm_links:
+                cursor.executemany(
+                    'INSERT INTO api_intervention_firm (firm_id, intervention_id, role_id) VALUES (%s, %s, %s)',
+                    [(firm['firm_id'], iid, firm['role_id']) for firm, iid in firm_links],
+                )
+            # Acting agencies also need the legacy api_acting_agency_log row (see add_firm)
+            agencies = [(firm['firm_name'], firm['firm_name'], iid) for firm, iid in firm_links if firm['role_id'] == 3]
+            if agencies:
+                cursor.executemany(
+                    'INSERT INTO api_acting_agency_log (agency_name, agency_name_original, intervention_id) '
+                    'VALUES (%s, %s, %s)',
+                    agencies,
+                )
+            recalcs = [(c['intervention_id'],) for c in created if c['queued_recalculation']]
+            if recalcs:
+                cursor.executemany('INSERT INTO api_recalculation_log (intervention_id, status) VALUES (%s, 0)', recalcs)
+
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            return {'success': False, 'error': str(e), 'message': f'Failed to create entry bundle: {e}'}
+
+        self._pin_write(state_act_id, [c['intervention_id'] for c in created])
+        if new_firms and self._lookup_index is not None:
+            self._lookup_index.expire('firm')
+        if self._duplicate_index is not None:
+            self._duplicate_index.expire()
+        return {
+            'success': True,
+            'state_act_id': state_act_id,
+            'source_ids': [source_ids[url.casefold()] for url, _ in sa['sources']],
+            'interventions': created,
+            'rows': counts,
+            'created_sources': new_sources,
+            'created_firms': new_firms,
+            'message': f"State act {state_act_id} created with {len(created)} interventions "
+                       f"({sum(counts.values())} rows) in one transaction",
+        }
+
     # ========================================================================
     # WS10: List Templates
     # ========================================================================
 
+    @_read_only(None)
+    @_pooled
     def list_templates(
         self,
         include_checklist: bool = False
@@ -2390,9 +4086,10 @@ class GTADatabaseClient:
         Returns:
             Dict with 'results' list of templates
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._run(self._list_templates_plan(include_checklist))
 
+    def _list_templates_plan(self, include_checklist: bool = False) -> Plan[dict]:
+        """Query plan for list_templates()."""
         query = '''
             SELECT comment_template_id as id,
                    comment_template_short as template_name,
@@ -2406,8 +4103,7 @@ class GTADatabaseClient:
 
         query += ' ORDER BY comment_template_short'
 
-        cursor.execute(query)
-        results = cursor.fetchall()
+        results = yield Query(query)
 
         return {'results': results}
 
@@ -2416,6 +4112,139 @@ class GTADatabaseClient:
     # Duplicate Detection
     # ========================================================================
 
+    @_read_only('intervention_ids')
+    @_pooled
+    def state_acts_for_interventions(self, intervention_ids: list[int]) -> dict[int, dict]:
+        """Map intervention IDs to their parent state act rows.
+
+        Used by find_duplicates Vector G to turn RAG intervention hits into
+        state act candidates.
+
+        Returns:
+            Dict of intervention_id → {intervention_id, state_act_id, title,
+            status_id, date_announced}. IDs with no matching row are omitted.
+        """
+        return self._run(self._state_acts_for_interventions_plan(intervention_ids))
+
+    def _state_acts_for_interventions_plan(self, intervention_ids: list[int]) -> Plan[dict[int, dict]]:
+        """Query plan for state_acts_for_interventions()."""
+        if not intervention_ids:
+            return {}
+        placeholders = ','.join(['%s'] * len(intervention_ids))
+        rows = yield Query(
+            f'''SELECT i.intervention_id, sa.state_act_id, sa.title, sa.status_id, sa.date_announced
+                FROM api_intervention_log i
+                JOIN api_state_act_log sa ON sa.state_act_id = i.state_act_id
+                WHERE i.intervention_id IN ({placeholders})''',
+            intervention_ids,
+        )
+        return {row['intervention_id']: row for row in rows}
+
+    def _refresh_duplicate_index_plan(self, force: bool = False) -> Plan[None]:
+        """Bring the find_duplicates URL / decree-token index up to date.
+
+        Only source links above the last synced id (a primary-key range scan)
+        and state acts modified since the last synced stamp are fetched; a
+        due rebuild or `force` refetches all. Runs the index work inline: for
+        warm-ups and background rebuilds.
+        """
+        index = self._duplicate_index
+        for kind in ('url', 'decree'):
+            since = index.sync_from(kind, full=force)
+            if since is not None:
+                yield from self._sync_duplicate_kind_plan(kind, since)
+
+    def _sync_duplicate_index_plan(self) -> Plan[bool]:
+        """Incremental duplicate index sync ahead of a duplicate check.
+
+        A first build or a due rebuild refetches every source link and title,
+        so it is started on a background thread (warm_duplicate_index) and
+        the check goes on with the current index.
+
+        Returns:
+            False while a kind has never been built (the check uses the LIKE
+            scans meanwhile)
+        """
+        index = self._duplicate_index
+        ready, rebuild = True, False
+        for kind in ('url', 'decree'):
+            since = index.sync_from(kind, rebuild=False)
+            if since is None:
+                continue
+            built_at = index.built_at(kind)
+            rebuild = rebuild or built_at is None or index.rebuild_due(built_at)
+            if built_at is None:
+                ready = False
+                continue
+            yield from self._sync_duplicate_kind_plan(kind, since)
+        if rebuild:
+            self._in_background('duplicate-index', self.warm_duplicate_index)
+        return ready
+
+    def _sync_duplicate_kind_plan(self, kind: str, since: int) -> Plan[None]:
+        """Fetch the rows of `kind` past watermark `since` (0: all, replacing the kind) into the index."""
+        index = self._duplicate_index
+        if kind == 'url':
+            rows = yield Query(
+                '''SELECT sas.id, sas.state_act_id, sl.source_url
+                   FROM api_state_act_source sas
+                   JOIN api_source_list sl ON sl.source_id = sas.source_id
+                   WHERE sas.id > %s
+                   ORDER BY sas.id''',
+                (since,),
+            )
+            index.sync(
+                'url',
+                [
+                    (normalize_url(r['source_url']), r['state_act_id'], r['source_url'])
+                    for r in rows if normalize_url(r.get('source_url'))
+                ],
+                max((r['id'] for r in rows), default=since),
+                replace=since == 0,
+            )
+        else:
+            # Watermark: last_modified (as a unix time), so a retitled state
+            # act is re-read too. `>=` re-reads the rows of the last synced
+            # second, which may have been written after that sync.
+            sql = 'SELECT state_act_id, title, UNIX_TIMESTAMP(last_modified) AS stamp FROM api_state_act_log'
+            if since:
+                rows = yield Query(f'{sql} WHERE last_modified >= FROM_UNIXTIME(%s)', (since,))
+            else:
+                rows = yield Query(sql)
+            index.sync(
+                'decree',
+                [
+                    (decree_key(token), r['state_act_id'], token)
+                    for r in rows for token in extract_decree_numbers(r['title'])
+                ],
+                max((int(r['stamp']) for r in rows if r['stamp'] is not None), default=since),
+                replace=since == 0,
+                refreshed=[r['state_act_id'] for r in rows],
+            )
+
+    @_read_only()
+    @_pooled
+    def warm_duplicate_index(self, force: bool = False) -> dict:
+        """Sync the find_duplicates index (run once at server start).
+
+        Args:
+            force: Rebuild from scratch instead of syncing from the watermarks
+
+        Returns:
+            The index snapshot, or {'error': ...} when disabled or on failure
+        """
+        if self._duplicate_index is None:
+            return {'error': 'Duplicate index disabled (GTA_DUPLICATE_INDEX=0)'}
+        try:
+            with self._index_lock('duplicate-index'):
+                self._run(self._refresh_duplicate_index_plan(force))
+        except Exception as e:
+            print(f"[gta-mnt] WARNING: Duplicate index sync failed: {e}", file=sys.stderr)
+            return {'error': str(e)}
+        return self._duplicate_index.snapshot()
+
+    @_read_only()
+    @_pooled
     def find_duplicates(
         self,
         state_act_id: Optional[int] = None,
@@ -2436,7 +4265,7 @@ class GTADatabaseClient:
 
         Vectors run (skipped if their inputs are missing):
           - A: Source URL host+path verbatim match
-          - B: Decree/regulation/notification number in title (LIKE within IJ)
+          - B: Decree/regulation/notification number in title (within IJ)
           - C: (jurisdiction + date_announced ±`type_date_window_days` + intervention_type)
                triple. Default `type_date_window_days=0` preserves the original
                exact-date semantics; callers that want to catch near-misses (e.g.
@@ -2464,73 +4293,127 @@ class GTADatabaseClient:
                     'shared_hs_codes': list[str],
                 }],
                 'pool_intervention_ids': list[int],   # Vector E pool — for caller's semantic search
+                'pool_state_acts': dict[int, dict],   # pool intervention_id -> state act row
                 'self_title': str | None,             # echoed for caller's RAG query
                 'self_description': str | None,
                 'vectors_run': list[str],
+                'timings_ms': dict[str, float],       # per-vector SQL time, keyed like match_vectors
                 'inputs_resolved': dict,
             }
+
+        Vectors A and B are exact-match lookups in the local duplicate index
+        (see duplicate_index.py), synced first if due; with the index disabled
+        or unavailable they fall back to LIKE scans. The vector queries run
+        concurrently, on extra pooled connections when the pool has them free.
         """
+        return self._run(self._find_duplicates_plan(
+            state_act_id=state_act_id,
+            jurisdiction_ids=jurisdiction_ids,
+            date_announced=date_announced,
+            intervention_type_ids=intervention_type_ids,
+            hs_codes=hs_codes,
+            source_urls=source_urls,
+            title=title,
+            description=description,
+            exclude_state_act_ids=exclude_state_act_ids,
+            date_window_days=date_window_days,
+            type_date_window_days=type_date_window_days,
+            include_statuses=include_statuses,
+            limit=limit,
+        ), concurrent=True)
+
+    def _find_duplicates_plan(
+        self,
+        state_act_id: Optional[int] = None,
+        jurisdiction_ids: Optional[list[int]] = None,
+        date_announced: Optional[str] = None,
+        intervention_type_ids: Optional[list[int]] = None,
+        hs_codes: Optional[list[str]] = None,
+        source_urls: Optional[list[str]] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        exclude_state_act_ids: Optional[list[int]] = None,
+        date_window_days: int = 60,
+        type_date_window_days: int = 0,
+        include_statuses: Optional[list[int]] = None,
+        limit: int = 50,
+    ) -> Plan[dict]:
+        """Query plan for find_duplicates()."""
         if include_statuses is None:
             include_statuses = [1, 2, 3, 4, 6, 19]
         exclude_ids = list(exclude_state_act_ids or [])
         if state_act_id is not None:
             exclude_ids.append(state_act_id)
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Resolve canonical fields from DB if a state_act_id is given
+        # Resolve canonical fields from DB if a state_act_id is given. The
+        # lookups are independent, so they go out as one batch.
         self_title = title
         self_description = description
         if state_act_id is not None:
-            try:
-                cursor.execute(
-                    'SELECT title, description, date_announced FROM api_state_act_log WHERE state_act_id = %s',
+            lookups = [Query(
+                'SELECT title, description, date_announced FROM api_state_act_log WHERE state_act_id = %s',
+                (state_act_id,),
+                one=True,
+            )]
+            # Pull source URLs, jurisdictions, intervention types, HS codes if not provided
+            if not source_urls:
+                lookups.append(Query(
+                    '''SELECT sl.source_url FROM api_state_act_source sas
+                       JOIN api_source_list sl ON sas.source_id = sl.source_id
+                       WHERE sas.state_act_id = %s''',
                     (state_act_id,),
-                )
-                row = cursor.fetchone()
-                if row:
-                    if not self_title:
-                        self_title = row.get('title')
-                    if not self_description:
-                        self_description = row.get('description')
-                    if not date_announced and row.get('date_announced'):
-                        date_announced = row['date_announced'].strftime('%Y-%m-%d') if hasattr(row['date_announced'], 'strftime') else str(row['date_announced'])
-                # Pull source URLs if not provided
-                if not source_urls:
-                    cursor.execute(
-                        '''SELECT sl.source_url FROM api_state_act_source sas
-                           JOIN api_source_list sl ON sas.source_id = sl.source_id
-                           WHERE sas.state_act_id = %s''',
-                        (state_act_id,),
-                    )
-                    source_urls = [r['source_url'] for r in cursor.fetchall() if r.get('source_url')]
-                # Pull jurisdictions, intervention types, HS codes if not provided
-                if not jurisdiction_ids:
-                    cursor.execute(
-                        '''SELECT DISTINCT iij.jurisdiction_id
-                           FROM api_intervention_log i
-                           JOIN api_intervention_ij iij ON iij.intervention_id = i.intervention_id
-                           WHERE i.state_act_id = %s''',
-                        (state_act_id,),
-                    )
-                    jurisdiction_ids = [r['jurisdiction_id'] for r in cursor.fetchall()]
-                if not intervention_type_ids:
-                    cursor.execute(
-                        'SELECT DISTINCT intervention_type_id FROM api_intervention_log WHERE state_act_id = %s AND intervention_type_id IS NOT NULL',
-                        (state_act_id,),
-                    )
-                    intervention_type_ids = [r['intervention_type_id'] for r in cursor.fetchall()]
-                if not hs_codes:
-                    cursor.execute(
-                        '''SELECT DISTINCT ip.product_id
-                           FROM api_intervention_log i
-                           JOIN api_intervention_product ip ON ip.intervention_id = i.intervention_id
-                           WHERE i.state_act_id = %s''',
-                        (state_act_id,),
-                    )
-                    hs_codes = [str(r['product_id']) for r in cursor.fetchall()]
-            except Exception as e:
+                ))
+            if not jurisdiction_ids:
+                lookups.append(Query(
+                    '''SELECT DISTINCT iij.jurisdiction_id
+                       FROM api_intervention_log i
+                       JOIN api_intervention_ij iij ON iij.intervention_id = i.intervention_id
+                       WHERE i.state_act_id = %s''',
+                    (state_act_id,),
+                ))
+            if not intervention_type_ids:
+                lookups.append(Query(
+                    'SELECT DISTINCT intervention_type_id FROM api_intervention_log WHERE state_act_id = %s AND intervention_type_id IS NOT NULL',
+                    (state_act_id,),
+                ))
+            if not hs_codes:
+                lookups.append(Query(
+                    '''SELECT DISTINCT ip.product_id
+                       FROM api_intervention_log i
+                       JOIN api_intervention_product ip ON ip.intervention_id = i.intervention_id
+                       WHERE i.state_act_id = %s''',
+                    (state_act_id,),
+                ))
+            results = iter((yield tuple(lookups)))
+            failures = []
+
+            def _resolved(result):
+                if isinstance(result, Exception):
+                    failures.append(result)
+                    return None
+                return result
+
+            row = _resolved(next(results))
+            if row:
+                if not self_title:
+                    self_title = row.get('title')
+                if not self_description:
+                    self_description = row.get('description')
+                if not date_announced and row.get('date_announced'):
+                    date_announced = row['date_announced'].strftime('%Y-%m-%d') if hasattr(row['date_announced'], 'strftime') else str(row['date_announced'])
+            if not source_urls:
+                rows = _resolved(next(results)) or []
+                source_urls = [r['source_url'] for r in rows if r.get('source_url')]
+            if not jurisdiction_ids:
+                rows = _resolved(next(results)) or []
+                jurisdiction_ids = [r['jurisdiction_id'] for r in rows]
+            if not intervention_type_ids:
+                rows = _resolved(next(results)) or []
+                intervention_type_ids = [r['intervention_type_id'] for r in rows]
+            if not hs_codes:
+                rows = _resolved(next(results)) or []
+                hs_codes = [str(r['product_id']) for r in rows]
+            for e in failures:
                 print(f"[gta-mnt] WARNING: find_duplicates field resolution failed: {e}", file=sys.stderr)
 
         # Aggregator: state_act_id -> candidate dict
@@ -2569,11 +4452,58 @@ class GTADatabaseClient:
         # Build status filter clause once
         status_in = ','.join(['%s'] * len(include_statuses))
 
+        # Every vector is an independent read, so the statements of all of
+        # them go out as one batch and their rows are merged afterwards.
+        # Each statement is labelled with its vector so the caller can see
+        # where the latency went.
+        timings: dict[str, float] = {}
+        vector_queries: list[tuple[Query, Callable[[list[dict]], None]]] = []
+
+        def _vector(vector: str, sql: str, params: list, handle: Callable[[list[dict]], None]) -> None:
+            vector_queries.append((Query(sql, params, label=vector, timings=timings), handle))
+
+        def _indexed(vector: str, kind: str, keys: list[str]) -> dict[int, list[str]]:
+            """state_act_id -> shared values for `keys` in the duplicate index."""
+            started = time.perf_counter()
+            shared: dict[int, list[str]] = {}
+            for key, sa_id, value in index.find(kind, keys):
+                shared.setdefault(sa_id, []).append(value)
+            timings[vector] = round((time.perf_counter() - started) * 1000, 1)
+            return shared
+
+        normalised_inputs = list({normalize_url(u) for u in source_urls or [] if u})
+        tokens = extract_decree_numbers(self_title) if jurisdiction_ids else []
+
+        index = self._duplicate_index
+        if index is not None and (normalised_inputs or tokens):
+            try:
+                if not (yield from self._sync_duplicate_index_plan()):
+                    index = None  # first build still running in the background
+            except Exception as e:
+                print(f"[gta-mnt] WARNING: duplicate index sync failed, using LIKE scans: {e}", file=sys.stderr)
+                index = None
+
         # ---- Vector A: URL match ----
-        if source_urls:
-            normalised_inputs = list({normalize_url(u) for u in source_urls if u})
-            if normalised_inputs:
-                vectors_run.append('URL')
+        if normalised_inputs:
+            vectors_run.append('URL')
+            if index is not None:
+                url_shared = _indexed('URL', 'url', normalised_inputs)
+                if url_shared:
+                    sa_in = ','.join(['%s'] * len(url_shared))
+                    sql = f'''
+                        SELECT sa.state_act_id, sa.title, sa.status_id, sa.date_announced
+                        FROM api_state_act_log sa
+                        WHERE sa.state_act_id IN ({sa_in})
+                          AND sa.status_id IN ({status_in})
+                    '''
+
+                    def _indexed_url_hits(rows):
+                        for row in rows:
+                            for url in url_shared[row['state_act_id']]:
+                                _add_hit(row, 'URL', shared_urls=url)
+
+                    _vector('URL', sql, list(url_shared) + list(include_statuses), _indexed_url_hits)
+            else:
                 # Pull all rows that share even a partial host with the inputs.
                 # We over-fetch by host substring to keep the SQL simple, then
                 # filter in Python on full normalised host+path.
@@ -2590,17 +4520,43 @@ class GTADatabaseClient:
                         WHERE ({host_clauses})
                           AND sa.status_id IN ({status_in})
                     '''
-                    cursor.execute(sql, host_params + include_statuses)
-                    for row in cursor.fetchall():
-                        if normalize_url(row['source_url']) in normalised_inputs:
-                            _add_hit(row, 'URL', shared_urls=row['source_url'])
+
+                    def _url_hits(rows):
+                        for row in rows:
+                            if normalize_url(row['source_url']) in normalised_inputs:
+                                _add_hit(row, 'URL', shared_urls=row['source_url'])
+
+                    _vector('URL', sql, host_params + include_statuses, _url_hits)
 
         # ---- Vector B: Decree number regex (within jurisdiction) ----
-        if self_title and jurisdiction_ids:
-            tokens = extract_decree_numbers(self_title)
-            if tokens:
-                vectors_run.append('DECREE')
-                jur_in = ','.join(['%s'] * len(jurisdiction_ids))
+        if tokens:
+            vectors_run.append('DECREE')
+            jur_in = ','.join(['%s'] * len(jurisdiction_ids))
+            if index is not None:
+                decree_shared = _indexed('DECREE', 'decree', [decree_key(t) for t in tokens])
+                if decree_shared:
+                    sa_in = ','.join(['%s'] * len(decree_shared))
+                    sql = f'''
+                        SELECT DISTINCT sa.state_act_id, sa.title, sa.status_id, sa.date_announced
+                        FROM api_state_act_log sa
+                        JOIN api_intervention_log i ON i.state_act_id = sa.state_act_id
+                        JOIN api_intervention_ij iij ON iij.intervention_id = i.intervention_id
+                        WHERE sa.state_act_id IN ({sa_in})
+                          AND iij.jurisdiction_id IN ({jur_in})
+                          AND sa.status_id IN ({status_in})
+                    '''
+
+                    def _indexed_decree_hits(rows):
+                        for row in rows:
+                            for token in decree_shared[row['state_act_id']]:
+                                _add_hit(row, 'DECREE', shared_decree_tokens=token)
+
+                    _vector(
+                        'DECREE', sql,
+                        list(decree_shared) + list(jurisdiction_ids) + list(include_statuses),
+                        _indexed_decree_hits,
+                    )
+            else:
                 for token in tokens:
                     sql = f'''
                         SELECT DISTINCT sa.state_act_id, sa.title, sa.status_id, sa.date_announced
@@ -2611,9 +4567,16 @@ class GTADatabaseClient:
                           AND sa.status_id IN ({status_in})
                           AND sa.title LIKE %s
                     '''
-                    cursor.execute(sql, list(jurisdiction_ids) + list(include_statuses) + [f'%{token}%'])
-                    for row in cursor.fetchall():
-                        _add_hit(row, 'DECREE', shared_decree_tokens=token)
+
+                    def _decree_hits(rows, token=token):
+                        for row in rows:
+                            _add_hit(row, 'DECREE', shared_decree_tokens=token)
+
+                    _vector(
+                        'DECREE', sql,
+                        list(jurisdiction_ids) + list(include_statuses) + [f'%{token}%'],
+                        _decree_hits,
+                    )
 
         # ---- Vector C: (IJ + date_announced ±type_date_window_days + intervention_type) triple ----
         if jurisdiction_ids and date_announced and intervention_type_ids:
@@ -2637,12 +4600,16 @@ class GTADatabaseClient:
                   AND {date_clause}
                   AND i.intervention_type_id IN ({type_in})
             '''
-            cursor.execute(
-                sql,
+
+            def _type_hits(rows):
+                for row in rows:
+                    _add_hit(row, 'TYPE+DATE', shared_intervention_types=row['intervention_type_id'])
+
+            _vector(
+                'TYPE+DATE', sql,
                 list(jurisdiction_ids) + list(include_statuses) + date_params + list(intervention_type_ids),
+                _type_hits,
             )
-            for row in cursor.fetchall():
-                _add_hit(row, 'TYPE+DATE', shared_intervention_types=row['intervention_type_id'])
 
         # ---- Vector D: (IJ + date_announced ±window + ≥1 HS code overlap) ----
         if jurisdiction_ids and date_announced and hs_codes:
@@ -2669,25 +4636,32 @@ class GTADatabaseClient:
                           DATE_SUB(%s, INTERVAL %s DAY) AND DATE_ADD(%s, INTERVAL %s DAY)
                       AND ip.product_id IN ({hs_in})
                 '''
-                cursor.execute(
-                    sql,
+
+                def _hs_hits(rows):
+                    for row in rows:
+                        _add_hit(row, 'HS+DATE', shared_hs_codes=str(row['product_id']))
+
+                _vector(
+                    'HS+DATE', sql,
                     list(jurisdiction_ids) + list(include_statuses) + [
                         date_announced, date_window_days, date_announced, date_window_days
                     ] + hs_int,
+                    _hs_hits,
                 )
-                for row in cursor.fetchall():
-                    _add_hit(row, 'HS+DATE', shared_hs_codes=str(row['product_id']))
 
         # ---- Vector E: pool collection (wide net by IJ + date window) ----
         # Collected for the caller to feed into semantic search (Vector G).
         # Returns intervention_ids of all candidates in the window — including
-        # status=4 (published) so the existing RAG can rank them.
+        # status=4 (published) so the existing RAG can rank them — together
+        # with their state acts, so RAG hits inside the pool need no second
+        # lookup.
         pool_intervention_ids: list[int] = []
+        pool_state_acts: dict[int, dict] = {}
         if jurisdiction_ids and date_announced:
             vectors_run.append('POOL')
             jur_in = ','.join(['%s'] * len(jurisdiction_ids))
             sql = f'''
-                SELECT DISTINCT i.intervention_id
+                SELECT DISTINCT i.intervention_id, sa.state_act_id, sa.title, sa.status_id, sa.date_announced
                 FROM api_intervention_log i
                 JOIN api_state_act_log sa ON sa.state_act_id = i.state_act_id
                 JOIN api_intervention_ij iij ON iij.intervention_id = i.intervention_id
@@ -2697,13 +4671,27 @@ class GTADatabaseClient:
                       DATE_SUB(%s, INTERVAL %s DAY) AND DATE_ADD(%s, INTERVAL %s DAY)
                 LIMIT 1000
             '''
-            cursor.execute(
-                sql,
+
+            def _pool(rows):
+                for r in rows:
+                    pool_intervention_ids.append(r['intervention_id'])
+                    pool_state_acts[r['intervention_id']] = r
+
+            _vector(
+                'POOL', sql,
                 list(jurisdiction_ids) + list(include_statuses) + [
                     date_announced, date_window_days, date_announced, date_window_days,
                 ],
+                _pool,
             )
-            pool_intervention_ids = [r['intervention_id'] for r in cursor.fetchall()]
+
+        if vector_queries:
+            results = yield tuple(query for query, _ in vector_queries)
+            for (query, handle), rows in zip(vector_queries, results):
+                if isinstance(rows, Exception):
+                    print(f"[gta-mnt] WARNING: find_duplicates vector {query.label} failed: {rows}", file=sys.stderr)
+                    continue
+                handle(rows)
 
         # Sort candidates: more vectors first, then by recency
         ranked = sorted(
@@ -2721,9 +4709,11 @@ class GTADatabaseClient:
         return {
             'candidates': ranked[:limit],
             'pool_intervention_ids': pool_intervention_ids,
+            'pool_state_acts': pool_state_acts,
             'self_title': self_title,
             'self_description': self_description,
             'vectors_run': vectors_run,
+            'timings_ms': timings,
             'inputs_resolved': {
                 'state_act_id': state_act_id,
                 'jurisdiction_ids': jurisdiction_ids,
@@ -2738,5 +4728,165 @@ class GTADatabaseClient:
         }
 
 
+def _native(method: Callable[..., T]) -> Callable[..., T]:
+    """Coroutine form of a plan-backed GTADatabaseClient read method.
+
+    Routed like the @_read_only method it wraps: to the async replica pool
+    unless a recent write pins it to the primary.
+    """
+    plan_name = f'_{method.__name__}_plan'
+    depends_on = method.read_depends_on
+    signature = inspect.signature(method)
+    subject = _READ_SUBJECTS.get(depends_on, depends_on)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        token = current_method.set(method.__name__)
+        try:
+            pool = self._pool
+            if self._read_pool is not None and self._sync._use_replica(subject, depends_on, signature, args, kwargs):
+                pool = self._read_pool
+            plan = getattr(self._sync, plan_name)(*args, **kwargs)
+            return await run_plan_async(plan, pool, self._sync._profiler)
+        finally:
+            current_method.reset(token)
+
+    return wrapper
+
+
+def _native_unless_indexed(method: Callable[..., T], index: str) -> Callable[..., T]:
+    """_native() for a read method that searches a local index when it is enabled.
+
+    Index work (SQLite reads and writes, in-memory search) would block the
+    event loop, so with the index enabled the pymysql implementation runs in
+    a worker thread; without it the plan (only Query steps) runs natively.
+    """
+    native = _native(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if getattr(self._sync, index) is not None:
+            return await asyncio.to_thread(getattr(self._sync, method.__name__), *args, **kwargs)
+        return await native(self, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncGTADatabaseClient:
+    """GTADatabaseClient with coroutine methods (GTA_DB_BACKEND=aiomysql).
+
+    Read paths (queue listing, measure detail, lookup, templates, duplicate
+    detection) run their query plans natively on an asyncio connection pool,
+    so a batch of independent statements goes out concurrently instead of
+    occupying a worker thread per call. Lookup and duplicate detection only
+    do so with their local index disabled: index work is SQLite and CPU, so
+    with it they run in a worker thread. Every other method is exposed as a
+    coroutine that runs the pymysql implementation via asyncio.to_thread, so
+    writes keep their single-transaction semantics.
+    """
+
+    def __init__(
+        self,
+        storage: Optional[ReviewStorage] = None,
+        connect: Optional[Callable[[], Any]] = None,
+        connect_read: Optional[Callable[[], Any]] = None,
+    ):
+        """Initialize with database credentials from environment.
+
+        Args:
+            storage: Review artifact storage (shared with the write client).
+            connect: Coroutine factory for new connections; defaults to
+                aiomysql with the GTA_DB_* credentials.
+            connect_read: Coroutine factory for read-replica connections
+                (only used with GTA_DB_HOST_READ); defaults to aiomysql with
+                the GTA_DB_*_READ credentials.
+        """
+        self._sync = GTADatabaseClient(storage=storage)
+        self.storage = self._sync.storage
+        if connect is None:
+            connect = aiomysql_connector(
+                host=self._sync.host,
+                user=self._sync.user,
+                password=self._sync.password,
+                db=self._sync.database,
+                port=self._sync.port,
+            )
+        self._pool = AsyncConnectionPool(
+            connect,
+            max_size=int(os.getenv('GTA_DB_POOL_SIZE', str(DEFAULT_POOL_SIZE))),
+            max_lifetime=float(os.getenv('GTA_DB_POOL_MAX_LIFETIME', str(DEFAULT_MAX_LIFETIME))),
+            wait_timeout=float(os.getenv('GTA_DB_POOL_TIMEOUT', str(DEFAULT_WAIT_TIMEOUT))),
+        )
+        # Replica pool for the native read paths; None unless GTA_DB_HOST_READ is set
+        self._read_pool: Optional[AsyncConnectionPool] = None
+        if self._sync._router is not None:
+            if connect_read is None:
+                connect_read = aiomysql_connector(
+                    host=self._sync.read_host,
+                    user=self._sync.read_user,
+                    password=self._sync.read_password,
+                    db=self._sync.database,
+                    port=self._sync.read_port,
+                )
+            self._read_pool = AsyncConnectionPool(
+                connect_read,
+                max_size=int(os.getenv('GTA_DB_POOL_SIZE', str(DEFAULT_POOL_SIZE))),
+                max_lifetime=float(os.getenv('GTA_DB_POOL_MAX_LIFETIME', str(DEFAULT_MAX_LIFETIME))),
+                wait_timeout=float(os.getenv('GTA_DB_POOL_TIMEOUT', str(DEFAULT_WAIT_TIMEOUT))),
+            )
+
+    list_step1_queue = _native(GTADatabaseClient.list_step1_queue)
+    get_measure = _native(GTADatabaseClient.get_measure)
+    lookup = _native_unless_indexed(GTADatabaseClient.lookup, '_lookup_index')
+    list_templates = _native(GTADatabaseClient.list_templates)
+    state_acts_for_interventions = _native(GTADatabaseClient.state_acts_for_interventions)
+    find_duplicates = _native_unless_indexed(GTADatabaseClient.find_duplicates, '_duplicate_index')
+
+    def __getattr__(self, name: str):
+        method = getattr(self._sync, name)
+        if name.startswith('_') or not callable(method):
+            return method
+
+        @functools.wraps(method)
+        async def threaded(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return threaded
+
+    def warm_lookup_index(self) -> dict:
+        """Blocking start-up warm of the lookup index shared with the pymysql client."""
+        return self._sync.warm_lookup_index()
+
+    def warm_duplicate_index(self, force: bool = False) -> dict:
+        """Blocking start-up sync of the duplicate index shared with the pymysql client."""
+        return self._sync.warm_duplicate_index(force)
+
+    def pool_stats(self) -> dict:
+        """Occupancy and counters of the async read pool and the pymysql pool."""
+        return {**self._pool.snapshot(), 'threaded': self._sync.pool_stats()}
+
+    def read_routing_stats(self) -> Optional[dict]:
+        """GTADatabaseClient.read_routing_stats(), plus the async replica pool."""
+        stats = self._sync.read_routing_stats()
+        if stats is not None:
+            stats = {**stats, 'pool': {**self._read_pool.snapshot(), 'threaded': stats['pool']}}
+        return stats
+
+    def db_stats(self, top: int = 20, method: Optional[str] = None, reset: bool = False) -> dict:
+        """GTADatabaseClient.db_stats(), with the async pools in 'pool' and 'read_routing'."""
+        return {
+            **self._sync.db_stats(top, method, reset),
+            'pool': self.pool_stats(),
+            'read_routing': self.read_routing_stats(),
+        }
+
+    def close(self):
+        """Close idle connections in all pools."""
+        self._pool.close()
+        if self._read_pool is not None:
+            self._read_pool.close()
+        self._sync.close()
+
+
 # Backwards compatibility alias
 GTAAPIClient = GTADatabaseClient
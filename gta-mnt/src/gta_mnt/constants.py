@@ -69,3 +69,35 @@ LOOKUP_TABLES = {
     'level_type': ('api_level_type_list', 'id', 'name'),
     'action': ('api_action_log', 'action_id', 'action_title'),
 }
+
+# Lookup tables too large to hold in memory. gta_mnt_lookup searches them
+# through a persistent SQLite FTS5 index instead (see lookup_index.py).
+LOOKUP_FTS_TABLES = frozenset({'firm'})
+
+# Location of that FTS index. Override per environment:
+#   export GTA_MNT_LOOKUP_INDEX_PATH=/path/to/lookup-index.sqlite
+LOOKUP_INDEX_PATH = os.getenv(
+    "GTA_MNT_LOOKUP_INDEX_PATH",
+    str(Path.home() / ".gta-mnt" / "lookup-index.sqlite"),
+)
+
+# Location of the find_duplicates URL / decree-token index (see
+# duplicate_index.py). Override per environment:
+#   export GTA_MNT_DUPLICATE_INDEX_PATH=/path/to/duplicate-index.sqlite
+DUPLICATE_INDEX_PATH = os.getenv(
+    "GTA_MNT_DUPLICATE_INDEX_PATH",
+    str(Path.home() / ".gta-mnt" / "duplicate-index.sqlite"),
+)
+
+# Location of the persistent cache of Bastiat HS code guesses (see
+# hs_guess_cache.py). Override per environment:
+#   export GTA_MNT_HS_GUESS_CACHE_PATH=/path/to/hs-guess-cache.sqlite
+HS_GUESS_CACHE_PATH = os.getenv(
+    "GTA_MNT_HS_GUESS_CACHE_PATH",
+    str(Path.home() / ".gta-mnt" / "hs-guess-cache.sqlite"),
+)
+
+# Maximum rows per gta_mnt_add_*_bulk call. Each call is one transaction;
+# larger batches should be split so a single failure does not roll back
+# an entire tariff schedule.
+BULK_MAX_ROWS = 1000
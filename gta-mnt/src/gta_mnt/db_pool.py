@@ -0,0 +1,218 @@
+"""Bounded, thread-safe pymysql connection pool for gta_mnt.
+
+Every MCP tool dispatches its database work through `asyncio.to_thread`, so
+concurrent tool calls run on different worker threads. A single shared
+pymysql connection is not thread-safe — concurrent calls interleave result
+sets and transactions on the same socket. The pool hands each call its own
+connection for the duration of its transaction:
+
+- bounded: at most `max_size` connections are open; further checkouts wait
+  up to `wait_timeout` seconds and then raise PoolTimeout
+- health-checked: a connection idle for longer than `ping_interval` is
+  pinged (and transparently reconnected) before it is handed out
+- recycled: connections older than `max_lifetime` are closed on return or
+  checkout, so server-side `wait_timeout` and failovers never surface as
+  "MySQL server has gone away"
+- clean on return: any uncommitted transaction is rolled back, so the next
+  caller never inherits half-written state or a stale REPEATABLE READ snapshot
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Tuple
+
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_MAX_LIFETIME = 1800.0  # seconds
+DEFAULT_WAIT_TIMEOUT = 10.0  # seconds
+DEFAULT_PING_INTERVAL = 30.0  # seconds
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the wait timeout."""
+
+
+class ConnectionPool:
+    """LIFO pool of DB-API connections produced by `connect`.
+
+    The pool is agnostic of the driver: connections need `ping(reconnect=True)`,
+    `rollback()`, `close()` and an `open` attribute, which pymysql provides.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = DEFAULT_POOL_SIZE,
+        max_lifetime: float = DEFAULT_MAX_LIFETIME,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+    ):
+        if max_size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {max_size}")
+        self._connect = connect
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.wait_timeout = wait_timeout
+        self.ping_interval = ping_interval
+
+        self._lock = threading.Condition()
+        # Idle connections as (conn, created_at, returned_at); most recently used last.
+        self._idle: Deque[Tuple[Any, float, float]] = deque()
+        # created_at per checked-out connection, keyed by id(conn)
+        self._in_use: Dict[int, float] = {}
+        self._size = 0
+        self._closed = False
+        self.stats = {
+            "checkouts": 0, "created": 0, "recycled": 0, "pinged": 0,
+            "discarded": 0, "waits": 0, "timeouts": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle + checked out)."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def _close_quietly(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self, wait: bool = True) -> Any:
+        """Check out a healthy connection, waiting up to `wait_timeout` seconds.
+
+        Args:
+            wait: If False, return None at once when the pool is exhausted
+                instead of waiting (for optional extra connections).
+
+        Raises:
+            PoolTimeout: If the pool is exhausted for longer than the wait timeout.
+            RuntimeError: If the pool has been closed.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                if self._idle:
+                    conn, created_at, returned_at = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    conn = None
+                    break
+                if not wait:
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats["timeouts"] += 1
+                    raise PoolTimeout(
+                        f"No database connection available within {self.wait_timeout:.0f}s "
+                        f"(pool size {self.max_size}, all in use)"
+                    )
+                self.stats["waits"] += 1
+                self._lock.wait(remaining)
+
+        # Connect / health-check outside the lock so slow network I/O
+        # doesn't block other threads returning connections.
+        try:
+            now = time.monotonic()
+            if conn is not None and now - created_at > self.max_lifetime:
+                self._close_quietly(conn)
+                self.stats["recycled"] += 1
+                conn = None
+            if conn is None:
+                conn = self._connect()
+                created_at = time.monotonic()
+                self.stats["created"] += 1
+            elif not getattr(conn, "open", True) or now - returned_at > self.ping_interval:
+                conn.ping(reconnect=True)
+                self.stats["pinged"] += 1
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._in_use[id(conn)] = created_at
+            self.stats["checkouts"] += 1
+        return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """Return a connection to the pool, rolling back any open transaction.
+
+        Args:
+            conn: A connection obtained from acquire().
+            discard: Close the connection instead of reusing it (e.g. after a
+                driver-level error left it in an unknown state).
+        """
+        with self._lock:
+            created_at = self._in_use.pop(id(conn), None)
+        if created_at is None:
+            return  # not ours, or already released
+
+        if not discard:
+            try:
+                if getattr(conn, "open", True):
+                    conn.rollback()
+                else:
+                    discard = True
+            except Exception:
+                discard = True
+        if not discard and time.monotonic() - created_at > self.max_lifetime:
+            discard = True
+            self.stats["recycled"] += 1
+        elif discard:
+            self.stats["discarded"] += 1
+
+        with self._lock:
+            if discard or self._closed:
+                self._size -= 1
+            else:
+                self._idle.append((conn, created_at, time.monotonic()))
+            self._lock.notify()
+        if discard or self._closed:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Context manager form of acquire()/release()."""
+        conn = self.acquire()
+        try:
+            yield conn
+        except BaseException:
+            self.release(conn, discard=not getattr(conn, "open", True))
+            raise
+        self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections and refuse further checkouts.
+
+        Connections still checked out are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._lock.notify_all()
+        for conn, _, _ in idle:
+            self._close_quietly(conn)
+
+    def snapshot(self) -> dict:
+        """Current pool occupancy and lifetime counters."""
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "open": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                **self.stats,
+            }
@@ -0,0 +1,231 @@
+"""Local exact-match index behind find_duplicates Vectors A and B.
+
+Vector A used to filter api_source_list with `source_url LIKE '%host%'` and
+normalise every returned row in Python; Vector B ran `title LIKE '%token%'`
+once per decree token. Neither can use an index, so both scanned more rows
+as the database grew. The keys they compare are cheap to precompute, so they
+are kept in a persistent SQLite file (DUPLICATE_INDEX_PATH) instead:
+
+- 'url': normalised host+path of every linked source -> state act
+- 'decree': decree/regulation/notification token of every title -> state act
+
+Both map a key to state act ids, and a vector becomes one indexed lookup
+here plus a primary-key read of the matching state acts in MySQL.
+
+The index is synced incrementally from a watermark per kind (the highest
+api_state_act_source.id seen; the latest api_state_act_log.last_modified
+seen, so edited titles are re-read with their state act's keys replaced),
+at most every `sync_interval` seconds or right after a write through this
+client. Sources unlinked after indexing are only picked up by the full
+rebuild, which runs after `rebuild_interval` seconds. GTADatabaseClient runs first builds
+and rebuilds on a background thread: a duplicate check only ever applies
+the incremental sync, and falls back to the LIKE queries until the first
+build is done.
+
+Configured from the environment:
+
+- GTA_DUPLICATE_INDEX: "0"/"false" to fall back to the LIKE queries (default on)
+- GTA_DUPLICATE_INDEX_SYNC_SECONDS: minimum time between syncs (default 60)
+- GTA_DUPLICATE_INDEX_REBUILD_SECONDS: age at which the index is rebuilt
+  from scratch (default 86400)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .constants import DUPLICATE_INDEX_PATH
+
+
+DEFAULT_SYNC_INTERVAL = 60.0  # seconds
+DEFAULT_REBUILD_INTERVAL = 86400.0  # seconds
+KINDS = ('url', 'decree')
+
+# SQLite's default limit on host parameters is 999
+_CHUNK = 500
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS dup_keys (
+        kind TEXT NOT NULL, key TEXT NOT NULL, state_act_id INTEGER NOT NULL, value TEXT NOT NULL,
+        PRIMARY KEY (kind, key, state_act_id, value)
+    );
+    CREATE TABLE IF NOT EXISTS dup_meta (
+        kind TEXT PRIMARY KEY, max_id INTEGER NOT NULL, synced_at REAL NOT NULL, built_at REAL NOT NULL
+    );
+'''
+
+# (key, state_act_id, value): value is what the vector reports as shared
+Entry = Tuple[str, int, str]
+
+
+class DuplicateIndex:
+    """Persistent key -> state act index for the URL and DECREE vectors.
+
+    Like LookupIndex, it never talks to MySQL itself: GTADatabaseClient asks
+    where to resume (sync_from), fetches the rows, derives the keys and hands
+    them over (sync).
+    """
+
+    def __init__(
+        self,
+        path: str = DUPLICATE_INDEX_PATH,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        rebuild_interval: float = DEFAULT_REBUILD_INTERVAL,
+    ):
+        self.path = path
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        # monotonic time of the last sync per kind (this process)
+        self._synced: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self.stats = {"lookups": 0, "syncs": 0, "rebuilds": 0, "keys_synced": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["DuplicateIndex"]:
+        """Build an index from GTA_DUPLICATE_INDEX_* variables, or None when disabled."""
+        if os.getenv("GTA_DUPLICATE_INDEX", "1").strip().lower() in {"0", "false", "no", "off"}:
+            return None
+        return cls(
+            sync_interval=float(os.getenv("GTA_DUPLICATE_INDEX_SYNC_SECONDS", str(DEFAULT_SYNC_INTERVAL))),
+            rebuild_interval=float(os.getenv("GTA_DUPLICATE_INDEX_REBUILD_SECONDS", str(DEFAULT_REBUILD_INTERVAL))),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def sync_from(self, kind: str, full: bool = False, rebuild: bool = True) -> Optional[int]:
+        """Id above which rows must be fetched to bring `kind` up to date.
+
+        0 for a full rebuild: first use, `full=True`, or (with `rebuild`) an
+        index older than the rebuild interval. With `rebuild=False`, as for
+        a duplicate check, an old index resumes from its watermark instead,
+        and None means it was synced within the sync interval.
+        """
+        if full:
+            return 0
+        synced = self._synced.get(kind)
+        if not rebuild and synced is not None and time.monotonic() - synced < self.sync_interval:
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT max_id, built_at FROM dup_meta WHERE kind = ?', (kind,)).fetchone()
+        finally:
+            conn.close()
+        if row is None or (rebuild and self.rebuild_due(row[1])):
+            return 0
+        return row[0]
+
+    def built_at(self, kind: str) -> Optional[float]:
+        """Wall-clock time `kind` was last built from scratch, or None if never."""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT built_at FROM dup_meta WHERE kind = ?', (kind,)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def rebuild_due(self, built_at: float) -> bool:
+        """True if an index built at `built_at` is older than the rebuild interval."""
+        return time.time() - built_at >= self.rebuild_interval
+
+    def sync(
+        self,
+        kind: str,
+        entries: Iterable[Entry],
+        max_id: int,
+        replace: bool = False,
+        refreshed: Iterable[int] = (),
+    ) -> None:
+        """Add keys derived from rows up to watermark `max_id` (replacing `kind` if `replace`).
+
+        `refreshed` lists state acts whose rows were re-read: their previous
+        keys of `kind` are dropped first, so an edited title loses its old
+        tokens.
+        """
+        entries = list(entries)
+        refreshed = list(refreshed)
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    now = time.time()
+                    meta = conn.execute(
+                        'SELECT max_id, built_at FROM dup_meta WHERE kind = ?', (kind,),
+                    ).fetchone()
+                    if replace or meta is None:
+                        conn.execute('DELETE FROM dup_keys WHERE kind = ?', (kind,))
+                        built_at = now
+                    else:
+                        built_at = meta[1]
+                        max_id = max(max_id, meta[0])
+                        for i in range(0, len(refreshed), _CHUNK):
+                            chunk = refreshed[i:i + _CHUNK]
+                            conn.execute(
+                                f'DELETE FROM dup_keys WHERE kind = ? AND state_act_id IN ({",".join("?" * len(chunk))})',
+                                (kind, *chunk),
+                            )
+                    conn.executemany(
+                        'INSERT OR IGNORE INTO dup_keys (kind, key, state_act_id, value) VALUES (?, ?, ?, ?)',
+                        [(kind, key, sa_id, value) for key, sa_id, value in entries],
+                    )
+                    conn.execute(
+                        'INSERT OR REPLACE INTO dup_meta (kind, max_id, synced_at, built_at) VALUES (?, ?, ?, ?)',
+                        (kind, max_id, now, built_at),
+                    )
+            finally:
+                conn.close()
+            self._synced[kind] = time.monotonic()
+            self.stats["syncs"] += 1
+            self.stats["keys_synced"] += len(entries)
+            if replace:
+                self.stats["rebuilds"] += 1
+
+    def find(self, kind: str, keys: Sequence[str]) -> List[Entry]:
+        """Entries of `kind` whose key is one of `keys` (exact match)."""
+        self.stats["lookups"] += 1
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return []
+        found: List[Entry] = []
+        conn = self._connect()
+        try:
+            for i in range(0, len(keys), _CHUNK):
+                chunk = keys[i:i + _CHUNK]
+                found += conn.execute(
+                    f'''SELECT key, state_act_id, value FROM dup_keys
+                        WHERE kind = ? AND key IN ({','.join('?' * len(chunk))})
+                        ORDER BY state_act_id''',
+                    (kind, *chunk),
+                ).fetchall()
+        finally:
+            conn.close()
+        return found
+
+    def expire(self, kind: Optional[str] = None) -> None:
+        """Force a sync on the next lookup."""
+        for k in [kind] if kind else KINDS:
+            self._synced.pop(k, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-kind key counts and watermarks, plus counters."""
+        kinds: Dict[str, Any] = {}
+        conn = self._connect()
+        try:
+            for kind, max_id, synced_at, built_at in conn.execute(
+                'SELECT kind, max_id, synced_at, built_at FROM dup_meta',
+            ):
+                count = conn.execute('SELECT COUNT(*) FROM dup_keys WHERE kind = ?', (kind,)).fetchone()[0]
+                kinds[kind] = {"keys": count, "max_id": max_id, "synced_at": synced_at, "built_at": built_at}
+        finally:
+            conn.close()
+        return {"path": self.path, "kinds": kinds, **self.stats}
@@ -157,7 +157,7 @@ def format_step1_queue(data: dict, queue_label: str = "Step 1") -> str:
     """Format review queue results as markdown.
 
     Args:
-        data: API response dict with 'results' and 'count'
+        data: API response dict with 'results', 'count' and 'next_cursor'
         queue_label: Label for the queue (e.g., 'Step 1', 'Step 2')
 
     Returns:
@@ -190,9 +190,12 @@ def format_step1_queue(data: dict, queue_label: str = "Step 1") -> str:
 
         lines.append(f"| {state_act_id} | {title} | {status_time} |")
 
+    if data.get("next_cursor"):
+        lines.append(f"\n*More measures: pass `cursor=\"{data['next_cursor']}\"` for the next page.*")
+
     return _truncate(
         "\n".join(lines),
-        hint="use `limit` and `offset` to paginate further.",
+        hint="use `limit` and `cursor` to paginate further.",
     )
 
 
@@ -200,6 +203,34 @@ def format_step1_queue(data: dict, queue_label: str = "Step 1") -> str:
 # WS3: Get Measure Detail Formatter
 # ============================================================================
 
+def format_queue_export(data: dict, queue_label: str = "Step 1") -> str:
+    """Format the summary of a queue export as markdown.
+
+    Args:
+        data: GTADatabaseClient.export_queue() dict
+        queue_label: Label for the queue (e.g., 'Step 1', 'Step 2')
+
+    Returns:
+        Markdown summary with the file path
+    """
+    filters = {k: v for k, v in data.get("filters", {}).items() if v not in (None, [])}
+    size = data.get("bytes", 0)
+    lines = [
+        f"# {queue_label} Queue Export\n",
+        f"**File:** `{data.get('path')}`",
+        f"**Format:** {str(data.get('format', '')).upper()} ({', '.join(data.get('columns') or [])})",
+        f"**Measures:** {data.get('rows', 0)}",
+        f"**Size:** {size / 1024:.1f} KiB" if size >= 1024 else f"**Size:** {size} bytes",
+    ]
+    if data.get("newest_status_time"):
+        lines.append(
+            f"**Entered status:** {str(data['oldest_status_time'])[:10]} to {str(data['newest_status_time'])[:10]}"
+        )
+    lines.append(f"**Filters:** {', '.join(f'{k}={v}' for k, v in filters.items())}")
+    lines.append(f"**Took:** {data.get('elapsed_ms', 0):g} ms")
+    return "\n".join(lines)
+
+
 def format_measure_detail(measure: dict) -> str:
     """Format complete measure details as markdown.
 
@@ -735,15 +766,8 @@ def format_measure_detail(measure: dict) -> str:
 # WS4: Get Source Formatter
 # ============================================================================
 
-def format_source_result(source_result) -> str:
-    """Format source retrieval result as markdown.
-
-    Args:
-        source_result: SourceResult object
-
-    Returns:
-        Markdown-formatted source content
-    """
+def _source_lines(source_result) -> list[str]:
+    """Metadata and content lines for one SourceResult."""
     # Surface content_type prominently so the reviewer agent can branch
     # behaviour: html sources should not trigger PDF-extraction OCR fallback;
     # pdf sources may need OCR if extraction was lossy.
@@ -764,12 +788,52 @@ def format_source_result(source_result) -> str:
         )
 
     lines = [
-        f"# Official Source\n",
         f"**Type:** {source_result.source_type}",
         f"**URL:** {source_result.source_url}",
         f"**Content Type:** {ct}{extraction_hint}\n"
     ]
 
+    if source_result.truncated:
+        pages = ""
+        if source_result.pages_total is not None:
+            pages = f"{source_result.pages_extracted} of {source_result.pages_total} pages extracted; "
+        lines.append(
+            f"**Truncated:** {pages}stopped by the {source_result.truncated}. "
+            "Claims not found below may be in the unextracted part — check the source URL.\n"
+        )
+
+    if source_result.page_numbers is not None:
+        shown = _page_ranges(source_result.page_numbers) or "none"
+        lines.append(
+            f"**Pages returned:** {shown} of {source_result.pages_total}. "
+            "Request other pages with `pages`, or drop `pages`/`search` for the whole document.\n"
+        )
+
+    return lines
+
+
+def _page_ranges(numbers) -> str:
+    """Compact sorted page numbers: [1, 2, 3, 7] -> "1-3, 7"."""
+    ranges = []
+    for n in numbers:
+        if ranges and n == ranges[-1][1] + 1:
+            ranges[-1][1] = n
+        else:
+            ranges.append([n, n])
+    return ", ".join(str(lo) if lo == hi else f"{lo}-{hi}" for lo, hi in ranges)
+
+
+def format_source_result(source_result) -> str:
+    """Format source retrieval result as markdown.
+
+    Args:
+        source_result: SourceResult object
+
+    Returns:
+        Markdown-formatted source content
+    """
+    lines = [f"# Official Source\n"] + _source_lines(source_result)
+
     if source_result.content:
         lines.append("## Extracted Content\n")
         lines.append(source_result.content)
@@ -782,37 +846,57 @@ def format_source_result(source_result) -> str:
     )
 
 
-# ============================================================================
-# WS10: List Templates Formatter
-# ============================================================================
-
-def format_guessed_hs_codes(data: Any) -> str:
-    """Format Bastiat API HS code guess results as markdown.
+def format_multi_source_result(result) -> str:
+    """Format all sources of a StateAct (get_source with fetch_all) as markdown.
 
     Args:
-        data: Bastiat API response dict.
+        result: MultiSourceResult object
 
     Returns:
-        Markdown-formatted HS code suggestions.
+        Markdown with a status table, then each source's content
     """
-    if not data:
-        return "# HS Code Guess\n\n*No results returned from Bastiat API.*"
+    failed = [s for s in result.sources if s.error]
+    lines = [
+        f"# Official Sources — StateAct {result.state_act_id}\n",
+        f"**Sources:** {len(result.sources)} ({len(result.sources) - len(failed)} ok, {len(failed)} failed)\n",
+        "| # | Status | Type | URL |",
+        "|---|---|---|---|",
+    ]
+    for source in result.sources:
+        status = f"❌ {source.error}" if source.error else "✅ ok"
+        lines.append(f"| {source.source_index} | {status} | {source.content_type} | {source.source_url} |")
+
+    for source in result.sources:
+        lines.append(f"\n## Source {source.source_index}\n")
+        if source.error:
+            lines.append(f"*Not retrieved: {source.error}*")
+            continue
+        lines.extend(_source_lines(source))
+        if source.saved_path:
+            lines.append(f"**Saved as:** `{source.saved_path}`\n")
+        if source.content:
+            lines.append("### Extracted Content\n")
+            lines.append(source.content)
+        else:
+            lines.append("*Content not fetched (fetch_content=False)*")
 
-    # Handle various response shapes from the API
-    hs_codes = data.get("hs_codes", data.get("results", []))
+    return _truncate(
+        "\n".join(lines),
+        hint="re-call gta_mnt_get_source with fetch_all=False and one source_index at a time.",
+    )
 
-    if not hs_codes:
-        return "# HS Code Guess\n\n*No HS codes identified for the given text.*"
 
+# ============================================================================
+# WS10: List Templates Formatter
+# ============================================================================
+
+def _hs_code_table(hs_codes: list) -> tuple[list[str], list[str]]:
+    """Markdown table rows for Bastiat HS code guesses, and the codes themselves."""
     lines = [
-        f"# AI-Guessed HS Codes ({len(hs_codes)} results)\n",
         "| HS Code | Description | Confidence | Level |",
         "|---------|-------------|------------|-------|",
     ]
-
-    # Build ready-to-use product IDs list
-    product_ids = []
-
+    codes = []
     for code in hs_codes:
         hs_code = code.get("hs_code", code.get("code", "N/A"))
         description = code.get("description", code.get("name", "N/A"))
@@ -826,7 +910,30 @@ def format_guessed_hs_codes(data: Any) -> str:
             confidence_str = str(confidence)
 
         lines.append(f"| {hs_code} | {description} | {confidence_str} | {level}-digit |")
-        product_ids.append(str(hs_code))
+        codes.append(str(hs_code))
+    return lines, codes
+
+
+def format_guessed_hs_codes(data: Any) -> str:
+    """Format Bastiat API HS code guess results as markdown.
+
+    Args:
+        data: Bastiat API response dict.
+
+    Returns:
+        Markdown-formatted HS code suggestions.
+    """
+    if not data:
+        return "# HS Code Guess\n\n*No results returned from Bastiat API.*"
+
+    # Handle various response shapes from the API
+    hs_codes = data.get("hs_codes", data.get("results", []))
+
+    if not hs_codes:
+        return "# HS Code Guess\n\n*No HS codes identified for the given text.*"
+
+    table, product_ids = _hs_code_table(hs_codes)
+    lines = [f"# AI-Guessed HS Codes ({len(hs_codes)} results)\n", *table]
 
     # Add ready-to-use lookup hint
     lines.append("")
@@ -839,6 +946,52 @@ def format_guessed_hs_codes(data: Any) -> str:
     return "\n".join(lines)
 
 
+def format_guessed_hs_codes_bulk(data: dict) -> str:
+    """Format guess_hs_codes_bulk() results as markdown, one section per description.
+
+    Args:
+        data: Dict with 'results' rows and the 'requested', 'unique',
+            'cached' and 'failed' counts
+
+    Returns:
+        Markdown-formatted HS code suggestions per description
+    """
+    lines = [
+        f"# AI-Guessed HS Codes ({data['requested']} descriptions)\n",
+        f"**Unique:** {data['unique']} | **From cache:** {data['cached']} | **Failed:** {data['failed']}",
+    ]
+    all_codes: list[str] = []
+
+    for row in data.get("results", []):
+        lines.append("")
+        lines.append(f"## {row['index'] + 1}. {row['article_text']}")
+        lines.append("")
+        if row["status"] == "duplicate":
+            lines.append(f"*Same description as {row['duplicate_of'] + 1}.*")
+            continue
+        if row["status"] == "error":
+            lines.append(f"❌ {row['error']}")
+            continue
+        result = row.get("result") or {}
+        hs_codes = result.get("hs_codes", result.get("results", []))
+        if not hs_codes:
+            lines.append("*No HS codes identified.*")
+            continue
+        table, codes = _hs_code_table(hs_codes)
+        lines.extend(table)
+        all_codes.extend(codes)
+
+    lines.append("")
+    lines.append("## Next Steps")
+    lines.append("")
+    lines.append("Use `gta_mnt_lookup(table='product', query='<hs_code>')` to find the database product_id for each code.")
+    if all_codes:
+        lines.append("")
+        lines.append(f"**Codes for lookup:** {', '.join(dict.fromkeys(all_codes))}")
+
+    return "\n".join(lines)
+
+
 def format_templates(data: dict) -> str:
     """Format comment templates as markdown.
 
@@ -869,3 +1022,89 @@ def format_templates(data: dict) -> str:
         lines.append(f"| {template_id} | {name} | {is_checklist} | {preview}... |")
 
     return "\n".join(lines)
+
+
+# ============================================================================
+# Database Stats Formatter
+# ============================================================================
+
+# Sections of format_db_stats() below the SQL profile, in display order
+_DB_STATS_COMPONENTS = [
+    ("pool", "Connection pool"),
+    ("measure_cache", "Measure cache"),
+    ("lookup_index", "Lookup index"),
+    ("duplicate_index", "Duplicate index"),
+    ("queue_counts", "Queue totals"),
+    ("read_routing", "Read replica routing"),
+    ("source_cache", "Source cache"),
+    ("prefetch", "Review-queue prefetch"),
+    ("hs_guess_cache", "HS guess cache"),
+    ("rag", "RAG client"),
+]
+
+
+def _stat_value(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:g}"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k}: {_stat_value(v)}" for k, v in value.items()) + "}"
+    return str(value)
+
+
+def format_db_stats(data: dict) -> str:
+    """Format the SQL profile and cache snapshots as markdown.
+
+    Args:
+        data: GTADatabaseClient.db_stats() dict, plus the server-side
+            'source_cache', 'prefetch', 'hs_guess_cache' and 'rag' entries
+            (None when disabled or not used yet)
+
+    Returns:
+        Markdown-formatted statistics
+    """
+    lines = ["# Database Stats\n", "## SQL profile\n"]
+    profile = data.get("profile")
+    if profile is None:
+        lines.append("*Profiling is off. Set `GTA_SQL_PROFILE=1` (and optionally `GTA_SQL_EXPLAIN=1`) and restart the server.*")
+    else:
+        lines.append(
+            f"**Since:** {profile['since']} | **Statements:** {profile['executed']} | "
+            f"**Slow (≥ {profile['slow_ms']:g} ms):** {profile['slow']} | "
+            f"**EXPLAIN:** {'on' if profile['explain'] else 'off'}"
+        )
+        lines.append(f"**Slow-query log:** `{profile['slow_log']}`")
+        if profile["methods"]:
+            lines.extend([
+                "",
+                "### By method\n",
+                "| Method | Statements | Total ms | Rows |",
+                "|--------|------------|----------|------|",
+            ])
+            for name, totals in profile["methods"].items():
+                lines.append(f"| {name} | {totals['statements']} | {totals['total_ms']:.0f} | {totals['rows']} |")
+        if profile["statements"]:
+            lines.extend([
+                "",
+                "### Top statements by total time\n",
+                "| # | Method | Calls | Total ms | Avg ms | Max ms | Rows | Slow | Statement |",
+                "|---|--------|-------|----------|--------|--------|------|------|-----------|",
+            ])
+            for i, stmt in enumerate(profile["statements"], 1):
+                shape = stmt["fingerprint"]
+                if len(shape) > 160:
+                    shape = shape[:157] + "..."
+                shape = shape.replace("|", "\\|")
+                lines.append(
+                    f"| {i} | {stmt['method']} | {stmt['calls']} | {stmt['total_ms']:.0f} | "
+                    f"{stmt['avg_ms']:.1f} | {stmt['max_ms']:.1f} | {stmt['rows']} | {stmt['slow']} | `{shape}` |"
+                )
+        else:
+            lines.append("\n*No statements recorded yet.*")
+
+    lines.extend(["", "## Caches and indexes\n", "| Component | State |", "|-----------|-------|"])
+    for key, label in _DB_STATS_COMPONENTS:
+        value = data.get(key)
+        state = _stat_value(value)[1:-1] if isinstance(value, dict) else "disabled or not used yet"
+        lines.append(f"| {label} | {state} |")
+
+    return "\n".join(lines)
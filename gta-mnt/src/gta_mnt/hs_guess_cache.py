@@ -0,0 +1,146 @@
+"""Persistent cache of Bastiat HS code guesses.
+
+A guess costs one Bastiat request of up to 90s, and the same product texts
+come back again and again: a tariff schedule repeats lines, and a re-drafted
+entry asks for the same products as the previous draft. Guesses are kept in
+a SQLite file (HS_GUESS_CACHE_PATH) keyed by the request as Bastiat sees it:
+
+- the product description, normalised (Unicode NFKC, case-folded,
+  whitespace collapsed), so trivially different spellings share an entry
+- the target HS levels and hint codes, sorted
+
+Entries older than `ttl` seconds are ignored and replaced on the next
+request, so model updates on the Bastiat side are picked up eventually.
+Failed requests are not cached.
+
+Configured from the environment:
+
+- GTA_HS_GUESS_CACHE_TTL: entry lifetime in seconds (default 2592000,
+  30 days; 0 disables the cache)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from .constants import HS_GUESS_CACHE_PATH
+
+
+DEFAULT_TTL = 30 * 86400.0  # seconds
+
+# SQLite's default limit on host parameters is 999
+_CHUNK = 500
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS hs_guesses (
+        text TEXT NOT NULL, levels TEXT NOT NULL, hints TEXT NOT NULL,
+        result TEXT NOT NULL, stored_at REAL NOT NULL,
+        PRIMARY KEY (text, levels, hints)
+    );
+'''
+
+# (normalised text, levels, hints)
+GuessKey = Tuple[str, str, str]
+
+
+def normalize_text(text: str) -> str:
+    """Product description as cached: NFKC, case-folded, single-spaced."""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFKC', text)).strip().casefold()
+
+
+def guess_key(
+    article_text: str,
+    target_hs_levels: Optional[Sequence[int]] = None,
+    initial_hs_codes: Optional[Sequence[str]] = None,
+) -> GuessKey:
+    """Cache key of a guess request; also used to de-duplicate a batch."""
+    return (
+        normalize_text(article_text),
+        ','.join(str(level) for level in sorted(set(target_hs_levels or ()))),
+        ','.join(sorted({code.strip() for code in initial_hs_codes or ()})),
+    )
+
+
+class HSGuessCache:
+    """SQLite-backed map from guess request to Bastiat response."""
+
+    def __init__(self, path: str = HS_GUESS_CACHE_PATH, ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["HSGuessCache"]:
+        """Build a cache from GTA_HS_GUESS_CACHE_TTL, or None when disabled."""
+        ttl = float(os.getenv("GTA_HS_GUESS_CACHE_TTL", str(DEFAULT_TTL)))
+        if ttl <= 0:
+            return None
+        return cls(ttl=ttl)
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def get_many(self, keys: Iterable[GuessKey]) -> Dict[GuessKey, Any]:
+        """Cached responses for those of `keys` stored within the TTL."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[GuessKey, Any] = {}
+        if not keys:
+            return found
+        oldest = time.time() - self.ttl
+        conn = self._connect()
+        try:
+            for i in range(0, len(keys), _CHUNK):
+                chunk = keys[i:i + _CHUNK]
+                rows = conn.execute(
+                    f'''SELECT text, levels, hints, result FROM hs_guesses
+                        WHERE stored_at >= ? AND (text, levels, hints) IN
+                        (VALUES {', '.join(['(?, ?, ?)'] * len(chunk))})''',
+                    (oldest, *[part for key in chunk for part in key]),
+                ).fetchall()
+                for text, levels, hints, result in rows:
+                    found[(text, levels, hints)] = json.loads(result)
+        finally:
+            conn.close()
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(keys) - len(found)
+        return found
+
+    def put_many(self, results: Dict[GuessKey, Any]) -> None:
+        """Store fresh responses, replacing older entries under the same keys."""
+        if not results:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        'INSERT OR REPLACE INTO hs_guesses (text, levels, hints, result, stored_at) VALUES (?, ?, ?, ?, ?)',
+                        [(*key, json.dumps(result), now) for key, result in results.items()],
+                    )
+            finally:
+                conn.close()
+            self.stats["stores"] += len(results)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Entry count and settings, plus counters."""
+        conn = self._connect()
+        try:
+            entries = conn.execute('SELECT COUNT(*) FROM hs_guesses').fetchone()[0]
+        finally:
+            conn.close()
+        return {"path": self.path, "ttl": self.ttl, "entries": entries, **self.stats}
@@ -0,0 +1,328 @@
+"""Local search indexes behind gta_mnt_lookup.
+
+The lookup tool used to run `SELECT * ... WHERE name LIKE '%q%'` on every
+call — a full scan of the production table (a leading wildcard cannot use an
+index), with results in arbitrary order. Authoring sessions issue dozens of
+lookups per entry. The reference tables change rarely, so they are searched
+locally instead:
+
+- small and medium tables (jurisdictions, HS6 products, sectors, units, ...)
+  are held in memory as rows plus normalised names and reloaded after
+  `refresh_interval` seconds or on demand (GTADatabaseClient does the load
+  on a background thread and serves lookups meanwhile)
+- large tables (LOOKUP_FTS_TABLES, i.e. firms) live in a persistent SQLite
+  FTS5 index at LOOKUP_INDEX_PATH. It survives restarts and is synced
+  incrementally by primary key (only rows above the last synced id are
+  fetched), at most every `sync_interval` seconds or right after a write
+
+Matches are ranked: exact name, prefix, word-prefix, then any substring (the
+rows the old LIKE returned) always come before fuzzy matches. Fuzzy scoring
+uses rapidfuzz when it is installed (`pip install 'gta-mnt[fuzzy]'`) and
+difflib otherwise.
+
+Configured from the environment:
+
+- GTA_LOOKUP_INDEX: "0"/"false" to fall back to live LIKE queries (default on)
+- GTA_LOOKUP_REFRESH_SECONDS: lifetime of an in-memory table (default 3600)
+- GTA_LOOKUP_SYNC_SECONDS: minimum time between FTS syncs (default 60)
+"""
+
+import difflib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .constants import LOOKUP_FTS_TABLES, LOOKUP_INDEX_PATH
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional extra: gta-mnt[fuzzy]
+    fuzz = process = None
+
+
+DEFAULT_REFRESH_INTERVAL = 3600.0  # seconds
+DEFAULT_SYNC_INTERVAL = 60.0  # seconds
+FUZZY_CUTOFF = 70.0
+FTS_CANDIDATES = 200
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+_FTS_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS lookup_rows (
+        tbl TEXT NOT NULL, id INTEGER NOT NULL, row TEXT NOT NULL,
+        PRIMARY KEY (tbl, id)
+    );
+    CREATE VIRTUAL TABLE IF NOT EXISTS lookup_fts USING fts5(
+        name, tbl UNINDEXED, id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2'
+    );
+    CREATE TABLE IF NOT EXISTS lookup_meta (
+        tbl TEXT PRIMARY KEY, max_id INTEGER NOT NULL, synced_at REAL NOT NULL
+    );
+'''
+
+
+def normalize(text: Any) -> str:
+    """Lowercase, strip accents and collapse punctuation to single spaces."""
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(' ', text.lower()).strip()
+
+
+def fuzzy_score(query: str, name: str) -> float:
+    """Similarity of two normalised strings, 0-100."""
+    if fuzz is not None:
+        return fuzz.WRatio(query, name)
+    return 100.0 * difflib.SequenceMatcher(
+        None, ' '.join(sorted(query.split())), ' '.join(sorted(name.split())),
+    ).ratio()
+
+
+def substring_score(query: str, name: str) -> Optional[float]:
+    """Score of a name containing the query (what LIKE matched), else None."""
+    if query not in name:
+        return None
+    if name == query:
+        return 100.0
+    if name.startswith(query):
+        return 98.0
+    if f' {query}' in f' {name}':
+        return 95.0
+    return 90.0
+
+
+def score(query: str, name: str) -> float:
+    """Rank a normalised name against a normalised query, 0-100.
+
+    Substring matches always outrank fuzzy ones (capped at 89).
+    """
+    hit = substring_score(query, name)
+    if hit is not None:
+        return hit
+    return min(fuzzy_score(query, name), 89.0)
+
+
+@dataclass
+class _MemoryTable:
+    rows: List[dict]
+    names: List[str]
+    loaded_at: float
+
+
+class LookupIndex:
+    """In-memory and FTS5 indexes of the LOOKUP_TABLES reference tables.
+
+    The index never talks to MySQL itself: GTADatabaseClient asks which rows
+    it needs (needs_load / sync_from), fetches them, and hands them over.
+    """
+
+    def __init__(
+        self,
+        fts_path: str = LOOKUP_INDEX_PATH,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ):
+        self.fts_path = fts_path
+        self.refresh_interval = refresh_interval
+        self.sync_interval = sync_interval
+        self._memory: Dict[str, _MemoryTable] = {}
+        # monotonic time of the last FTS sync per table (this process)
+        self._synced: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self.stats = {"searches": 0, "loads": 0, "syncs": 0, "rows_synced": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["LookupIndex"]:
+        """Build an index from GTA_LOOKUP_* variables, or None when disabled."""
+        if os.getenv("GTA_LOOKUP_INDEX", "1").strip().lower() in {"0", "false", "no", "off"}:
+            return None
+        return cls(
+            refresh_interval=float(os.getenv("GTA_LOOKUP_REFRESH_SECONDS", str(DEFAULT_REFRESH_INTERVAL))),
+            sync_interval=float(os.getenv("GTA_LOOKUP_SYNC_SECONDS", str(DEFAULT_SYNC_INTERVAL))),
+        )
+
+    @staticmethod
+    def is_fts(table: str) -> bool:
+        return table in LOOKUP_FTS_TABLES
+
+    # ------------------------------------------------------------------
+    # In-memory tables
+    # ------------------------------------------------------------------
+
+    def needs_load(self, table: str) -> bool:
+        """True if an in-memory table is missing or older than the refresh interval."""
+        loaded = self._memory.get(table)
+        return loaded is None or time.monotonic() - loaded.loaded_at >= self.refresh_interval
+
+    def is_loaded(self, table: str) -> bool:
+        """True if an in-memory table has been loaded (possibly stale)."""
+        return table in self._memory
+
+    def load(self, table: str, rows: List[dict], id_col: str, name_col: str) -> None:
+        """Replace an in-memory table with freshly fetched rows."""
+        rows = sorted(rows, key=lambda r: (r.get(id_col) is None, r.get(id_col)))
+        self._memory[table] = _MemoryTable(
+            rows, [normalize(r.get(name_col)) for r in rows], time.monotonic(),
+        )
+        self.stats["loads"] += 1
+
+    # ------------------------------------------------------------------
+    # FTS tables
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            Path(self.fts_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.fts_path, timeout=10)
+        if not self._schema_ready:
+            conn.executescript(_FTS_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def sync_from(self, table: str, full: bool = False) -> Optional[int]:
+        """Id above which rows must be fetched to bring an FTS table up to date.
+
+        None when it was synced within the sync interval; 0 for a full rebuild
+        (first use, or `full=True`).
+        """
+        if full:
+            return 0
+        synced = self._synced.get(table)
+        if synced is not None and time.monotonic() - synced < self.sync_interval:
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT max_id FROM lookup_meta WHERE tbl = ?', (table,)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else 0
+
+    def sync(self, table: str, rows: List[dict], id_col: str, name_col: str, replace: bool = False) -> None:
+        """Add fetched rows to an FTS table (replacing its contents if `replace`)."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    if replace:
+                        conn.execute('DELETE FROM lookup_rows WHERE tbl = ?', (table,))
+                        conn.execute('DELETE FROM lookup_fts WHERE tbl = ?', (table,))
+                    max_id = 0 if replace else (conn.execute(
+                        'SELECT max_id FROM lookup_meta WHERE tbl = ?', (table,),
+                    ).fetchone() or (0,))[0]
+                    for r in rows:
+                        rid = r[id_col]
+                        exists = conn.execute(
+                            'SELECT 1 FROM lookup_rows WHERE tbl = ? AND id = ?', (table, rid),
+                        ).fetchone()
+                        conn.execute(
+                            'INSERT OR REPLACE INTO lookup_rows (tbl, id, row) VALUES (?, ?, ?)',
+                            (table, rid, json.dumps(r, default=str)),
+                        )
+                        if not exists:
+                            conn.execute(
+                                'INSERT INTO lookup_fts (name, tbl, id) VALUES (?, ?, ?)',
+                                (normalize(r.get(name_col)), table, rid),
+                            )
+                        max_id = max(max_id, rid)
+                    conn.execute(
+                        'INSERT OR REPLACE INTO lookup_meta (tbl, max_id, synced_at) VALUES (?, ?, ?)',
+                        (table, max_id, time.time()),
+                    )
+            finally:
+                conn.close()
+            self._synced[table] = time.monotonic()
+            self.stats["syncs"] += 1
+            self.stats["rows_synced"] += len(rows)
+
+    def _fts_candidates(self, table: str, tokens: List[str], limit: int) -> List[tuple]:
+        conn = self._connect()
+        try:
+            found: Dict[int, tuple] = {}
+            # All tokens first; widen to any token when that is too narrow.
+            for joiner in (' AND ', ' OR '):
+                match = joiner.join(f'"{t}"*' for t in tokens)
+                for rid, name, row in conn.execute('''
+                    SELECT f.id, f.name, r.row
+                    FROM lookup_fts f
+                    JOIN lookup_rows r ON r.tbl = f.tbl AND r.id = f.id
+                    WHERE lookup_fts MATCH ? AND f.tbl = ?
+                    ORDER BY bm25(lookup_fts)
+                    LIMIT ?
+                ''', (match, table, FTS_CANDIDATES)):
+                    found.setdefault(rid, (name, row))
+                if len(found) >= limit or len(tokens) == 1:
+                    break
+            return [(rid, name, json.loads(row)) for rid, (name, row) in found.items()]
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Search and maintenance
+    # ------------------------------------------------------------------
+
+    def search(self, table: str, query: str, limit: int) -> List[dict]:
+        """Rows of `table` matching `query`, best first."""
+        self.stats["searches"] += 1
+        q = normalize(query)
+
+        if self.is_fts(table):
+            tokens = q.split()
+            if not tokens:
+                return []
+            candidates = self._fts_candidates(table, tokens, limit)
+            ranked = [(score(q, name), rid, row) for rid, name, row in candidates]
+            ranked = [r for r in ranked if r[0] >= FUZZY_CUTOFF]
+            ranked.sort(key=lambda r: (-r[0], r[1]))
+            return [row for _, _, row in ranked[:limit]]
+
+        loaded = self._memory.get(table)
+        if loaded is None:
+            return []
+        if not q:
+            # LIKE '%%' matched everything
+            return loaded.rows[:limit]
+        ranked = []
+        for i, name in enumerate(loaded.names):
+            s = substring_score(q, name)
+            if s is not None:
+                ranked.append((-s, len(name), i))
+        if len(ranked) < limit:
+            # Too few substring hits: add the closest fuzzy matches
+            hit = {i for _, _, i in ranked}
+            if process is not None:
+                fuzzy = process.extract(
+                    q, loaded.names, scorer=fuzz.WRatio,
+                    score_cutoff=FUZZY_CUTOFF, limit=limit + len(hit),
+                )
+                scored = [(s, i) for _, s, i in fuzzy]
+            else:
+                scored = [(fuzzy_score(q, name), i) for i, name in enumerate(loaded.names)]
+            ranked += [
+                (-min(s, 89.0), len(loaded.names[i]), i)
+                for s, i in scored if s >= FUZZY_CUTOFF and i not in hit
+            ]
+        ranked.sort()
+        return [loaded.rows[i] for _, _, i in ranked[:limit]]
+
+    def expire(self, table: Optional[str] = None) -> None:
+        """Force a reload (memory) or sync (FTS) on the next lookup."""
+        tables = [table] if table else list(self._memory) + list(self._synced)
+        for t in tables:
+            self._memory.pop(t, None)
+            self._synced.pop(t, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Loaded tables and counters."""
+        return {
+            "memory_tables": {t: len(m.rows) for t, m in self._memory.items()},
+            "fts_tables": sorted(LOOKUP_FTS_TABLES),
+            "fuzzy_backend": "rapidfuzz" if fuzz is not None else "difflib",
+            **self.stats,
+        }
@@ -0,0 +1,189 @@
+"""Per-state-act cache of assembled get_measure() results.
+
+A review step loads the same measure several times (`gta_mnt_get_measure`,
+then `gta_mnt_get_source`, which calls get_measure again), and author
+workflows re-read the measure after every write. Each load is ~25 queries;
+the cache serves repeats from memory:
+
+- versioned: every entry records a version token from a single cheap probe
+  query (last-modified stamps of the state act, its interventions and its
+  comments). A hit is only served when the probe still returns the same
+  token, so writes from other processes that bump a stamp are picked up on
+  the next call; anything else is bounded by the TTL. A probe that hits a
+  missing table or column (a legacy schema) is switched off, and entries
+  are then served on the TTL alone; other probe failures load that call
+  uncached
+- write-through invalidation: every GTADatabaseClient write method drops the
+  entries of the state act it touched (intervention writes are mapped back
+  to their state act through the cached measures)
+- bounded: entries expire after `ttl` seconds and the least recently used
+  entry is evicted beyond `max_entries`
+
+Configured from the environment:
+
+- GTA_MEASURE_CACHE_TTL: entry lifetime in seconds (default 300; 0 disables)
+- GTA_MEASURE_CACHE_SIZE: maximum cached measures (default 64)
+"""
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Hashable, Optional, Tuple
+
+
+DEFAULT_TTL = 300.0  # seconds
+DEFAULT_MAX_ENTRIES = 64
+
+# (state_act_id, include_interventions, include_comments)
+CacheKey = Tuple[int, bool, bool]
+
+
+@dataclass
+class CacheEntry:
+    """A cached measure with the version token it was loaded under."""
+    value: dict
+    version: Hashable
+    expires_at: float
+    intervention_ids: FrozenSet[int]
+
+
+class MeasureCache:
+    """Thread-safe LRU cache of measure dicts keyed by state act and load options.
+
+    Values are deep-copied on the way in and out, so callers can annotate the
+    dicts they get back without corrupting the cache.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        # intervention_id -> state_act_id, for the interventions of cached measures
+        self._by_intervention: Dict[int, int] = {}
+        # Bumped on every invalidation so a load that raced a write is not stored
+        self._writes = 0
+        # Cleared by the first failed freshness probe
+        self.probe_enabled = True
+        self.stats = {
+            "hits": 0, "misses": 0, "stale": 0, "stores": 0, "discarded": 0,
+            "invalidations": 0, "expired": 0, "evicted": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional["MeasureCache"]:
+        """Build a cache from GTA_MEASURE_CACHE_* variables, or None when disabled."""
+        ttl = float(os.getenv("GTA_MEASURE_CACHE_TTL", str(DEFAULT_TTL)))
+        if ttl <= 0:
+            return None
+        return cls(
+            ttl=ttl,
+            max_entries=int(os.getenv("GTA_MEASURE_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES))),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def token(self) -> int:
+        """Snapshot taken before a load; store() rejects the result if a write intervened."""
+        with self._lock:
+            return self._writes
+
+    def get(self, key: CacheKey, version: Hashable) -> Optional[dict]:
+        """Return a copy of the cached measure if it is live and still at `version`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            if entry.version != version:
+                self._remove(key)
+                self.stats["stale"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def store(self, key: CacheKey, value: dict, version: Hashable, token: int) -> bool:
+        """Cache a freshly loaded measure unless it was invalidated while loading."""
+        state_act_id = key[0]
+        value = copy.deepcopy(value)
+        intervention_ids = frozenset(i['id'] for i in value.get('interventions') or ())
+        with self._lock:
+            if token != self._writes:
+                self.stats["discarded"] += 1
+                return False
+            self._remove(key)
+            self._entries[key] = CacheEntry(value, version, time.monotonic() + self.ttl, intervention_ids)
+            for iid in intervention_ids:
+                self._by_intervention[iid] = state_act_id
+            self.stats["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats["evicted"] += 1
+        return True
+
+    def invalidate(self, state_act_id: int) -> None:
+        """Drop every cached variant of a state act after a write to it."""
+        with self._lock:
+            self._invalidate(state_act_id)
+
+    def invalidate_intervention(self, intervention_id: int) -> None:
+        """Drop the cached state act an intervention belongs to after a write to it.
+
+        If the intervention is not part of any cached measure, only variants
+        loaded without interventions can hold its data (e.g. implementing
+        jurisdictions); those are dropped and in-flight loads are not stored.
+        """
+        with self._lock:
+            state_act_id = self._by_intervention.get(intervention_id)
+            if state_act_id is not None:
+                self._invalidate(state_act_id)
+                return
+            self._writes += 1
+            for key in [k for k, e in self._entries.items() if not e.intervention_ids]:
+                self._remove(key)
+                self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_intervention.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Entry count, configuration and counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "probe_enabled": self.probe_enabled,
+                **self.stats,
+            }
+
+    def _invalidate(self, state_act_id: int) -> None:
+        self._writes += 1
+        for key in [k for k in self._entries if k[0] == state_act_id]:
+            self._remove(key)
+            self.stats["invalidations"] += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        still_cached = set().union(*(
+            e.intervention_ids for k, e in self._entries.items() if k[0] == key[0]
+        ))
+        for iid in entry.intervention_ids - still_cached:
+            if self._by_intervention.get(iid) == key[0]:
+                del self._by_intervention[iid]
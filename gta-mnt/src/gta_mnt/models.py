@@ -1,6 +1,6 @@
 """Pydantic models for gta_mnt MCP server."""
 
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -96,6 +96,19 @@ class SourceResult(BaseModel):
     source_url: str
     content: Optional[str] = None
     content_type: str  # "pdf", "html", "text"
+    pages_total: Optional[int] = None  # PDFs only
+    pages_extracted: Optional[int] = None
+    truncated: Optional[str] = None  # budget that cut extraction short
+    page_numbers: Optional[List[int]] = None  # pages returned, when pages/search was given
+    source_index: int = 0
+    saved_path: Optional[str] = None  # copy in the review folder
+    error: Optional[str] = None  # set when the source could not be fetched
+
+
+class MultiSourceResult(BaseModel):
+    """Result from get_source tool with fetch_all=True."""
+    state_act_id: int
+    sources: List[SourceResult]
 
 
 class CommentResult(BaseModel):
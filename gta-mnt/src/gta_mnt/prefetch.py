@@ -0,0 +1,142 @@
+"""Background warm-up of the review queue ahead of the reviewer.
+
+A review is strictly serial: list the queue, get the measure, get the
+source, review, comment, set status, next. Loading a measure (~25 queries)
+and downloading and extracting its source take seconds each time, all of it
+spent while the reviewer waits.
+
+After every queue listing the server hands the state acts at the head of the
+queue to a QueuePrefetcher, which warms them in the background, in queue
+order and at most `concurrency` at a time. What "warm" means is up to the
+callback; the server loads both measure variants the review tools read into
+the measure cache and fetches and extracts the first source into the source
+cache, so opening the item is served locally.
+
+A listing with a different head replaces the plan: items not yet started are
+dropped. Work already under way finishes (a query running in a worker thread
+cannot be interrupted), and what it loaded stays cached.
+
+Configured from the environment:
+
+- GTA_PREFETCH_DEPTH: queue items warmed after each listing (default 5;
+  0 disables prefetching)
+- GTA_PREFETCH_CONCURRENCY: items warmed at once (default 2)
+- GTA_PREFETCH_TTL: seconds a warmed item is not warmed again (default
+  300, the measure cache TTL)
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_DEPTH = 5
+DEFAULT_CONCURRENCY = 2
+DEFAULT_TTL = 300.0  # seconds
+
+
+class QueuePrefetcher:
+    """Warms the head of the review queue in a background task.
+
+    Must be used from the event loop the tools run on: schedule() starts an
+    asyncio task there.
+    """
+
+    def __init__(
+        self,
+        warm: Callable[[int], Awaitable[Any]],
+        depth: int = DEFAULT_DEPTH,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ttl: float = DEFAULT_TTL,
+    ):
+        """
+        Args:
+            warm: Loads everything the reviewer opens for one state act
+            depth: Queue items warmed per listing
+            concurrency: Items warmed at once
+            ttl: Seconds after which a warmed item is warmed again
+        """
+        self._warm = warm
+        self.depth = depth
+        self.concurrency = max(1, concurrency)
+        self.ttl = ttl
+        self._plan: Tuple[int, ...] = ()
+        self._task: Optional[asyncio.Task] = None
+        # state_act_id -> monotonic time it was last warmed
+        self._warmed: Dict[int, float] = {}
+        self.stats = {"scheduled": 0, "warmed": 0, "failed": 0, "skipped": 0, "cancelled": 0}
+
+    @classmethod
+    def from_env(cls, warm: Callable[[int], Awaitable[Any]]) -> Optional["QueuePrefetcher"]:
+        """Build a prefetcher from GTA_PREFETCH_* variables, or None when disabled."""
+        depth = int(os.getenv("GTA_PREFETCH_DEPTH", str(DEFAULT_DEPTH)))
+        if depth <= 0:
+            return None
+        return cls(
+            warm,
+            depth=depth,
+            concurrency=int(os.getenv("GTA_PREFETCH_CONCURRENCY", str(DEFAULT_CONCURRENCY))),
+            ttl=float(os.getenv("GTA_PREFETCH_TTL", str(DEFAULT_TTL))),
+        )
+
+    def schedule(self, state_act_ids: Iterable[int]) -> None:
+        """Warm the first `depth` of a freshly listed queue, replacing the current plan.
+
+        Listing the same head again while it is being warmed changes nothing;
+        items warmed within the TTL are skipped.
+        """
+        plan = tuple(dict.fromkeys(state_act_ids))[:self.depth]
+        if plan == self._plan and self.running:
+            return
+        self.cancel()
+        self._plan = plan
+
+        now = time.monotonic()
+        self._warmed = {i: t for i, t in self._warmed.items() if now - t < self.ttl}
+        todo = [i for i in plan if i not in self._warmed]
+        self.stats["skipped"] += len(plan) - len(todo)
+        if todo:
+            self.stats["scheduled"] += len(todo)
+            self._task = asyncio.get_running_loop().create_task(self._run(todo))
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def cancel(self) -> None:
+        """Drop the current plan; items already being warmed still finish."""
+        if self.running:
+            self._task.cancel()
+            self.stats["cancelled"] += 1
+        self._task = None
+        self._plan = ()
+
+    async def _run(self, state_act_ids: List[int]) -> None:
+        # Semaphore waiters are woken in FIFO order, so items start in queue order
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def warm(state_act_id: int) -> None:
+            async with slots:
+                try:
+                    await self._warm(state_act_id)
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    print(f"[gta-mnt] WARNING: Prefetch of StateAct {state_act_id} failed: {e}", file=sys.stderr)
+                    return
+                self._warmed[state_act_id] = time.monotonic()
+                self.stats["warmed"] += 1
+
+        await asyncio.gather(*(warm(i) for i in state_act_ids))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current plan and settings, plus counters."""
+        return {
+            "depth": self.depth,
+            "concurrency": self.concurrency,
+            "plan": list(self._plan),
+            "running": self.running,
+            "warm": len(self._warmed),
+            **self.stats,
+        }
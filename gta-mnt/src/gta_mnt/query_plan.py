@@ -0,0 +1,204 @@
+"""Driver-independent query plans for gta_mnt read paths.
+
+The heavy read methods of GTADatabaseClient (get_measure, the queue listing,
+find_duplicates, ...) are written once as *plans*: generators that yield the
+statements they need and receive the rows back. A plan never touches a
+connection itself, so the same code runs on either backend:
+
+- run_plan() executes it on a blocking pymysql cursor (one connection,
+  statements in order) — the default backend
+- run_plan_async() executes it on an async connection pool, running the
+  statements of a batch concurrently on separate connections
+- run_plan() with a `lease` runs each batch concurrently on extra blocking
+  connections in worker threads (run_batch_threaded())
+
+Plan protocol:
+
+    rows = yield Query(sql, params)            # list of dict rows
+    row = yield Query(sql, params, one=True)   # dict or None
+    results = yield (Query(...), Query(...))   # batch of independent reads
+
+A failing single Query raises inside the plan at the `yield`, so ordinary
+try/except works. A batch never raises: each slot of the returned list holds
+either the query's result or the Exception it raised, and the plan decides
+which failures are tolerable.
+
+A Query with a `label` and a `timings` dict adds its execution time (ms) to
+`timings[label]`, so a plan can report per-step latency whichever runner
+executes it.
+
+run_plan_async() takes an optional SQLProfiler (sql_profiler.py); blocking
+cursors are profiled by their cursor class instead.
+"""
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Generator, List, Optional, Sequence, TypeVar, Union
+
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class Query:
+    """One read statement in a plan."""
+    sql: str
+    params: Optional[Sequence[Any]] = None
+    one: bool = False  # fetchone() instead of fetchall()
+    label: Optional[str] = None
+    timings: Optional[Dict[str, float]] = field(default=None, compare=False, repr=False)
+
+    def record(self, started: float) -> None:
+        """Add the time since `started` to this query's timing slot, if it has one."""
+        if self.timings is not None and self.label:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.timings[self.label] = round(self.timings.get(self.label, 0.0) + elapsed, 1)
+
+
+Step = Union[Query, Sequence[Query]]
+Plan = Generator[Step, Any, T]
+
+
+def _fetch(cursor: Any, query: Query) -> Any:
+    started = time.perf_counter()
+    try:
+        cursor.execute(query.sql, query.params)
+        if query.one:
+            return cursor.fetchone()
+        return list(cursor.fetchall())
+    finally:
+        query.record(started)
+
+
+def _fetch_all(cursor: Any, batch: Sequence[Query]) -> List[Any]:
+    results = []
+    for query in batch:
+        try:
+            results.append(_fetch(cursor, query))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def run_batch_threaded(
+    batch: Sequence[Query],
+    cursor: Any,
+    lease: Callable[[], ContextManager[Optional[Any]]],
+) -> List[Any]:
+    """Run the statements of a batch concurrently on blocking connections.
+
+    The first statement runs on `cursor` in the calling thread. Every other
+    statement runs in a worker thread on a cursor from `lease()`, entered in
+    that thread so connection checkout overlaps too. A lease that yields None
+    (no connection free) sends its statement back to `cursor` afterwards.
+    Results come back in batch order, with Exceptions in failed slots.
+    """
+    results: List[Any] = [None] * len(batch)
+
+    def run_leased(i: int) -> bool:
+        with lease() as leased:
+            if leased is None:
+                return False
+            results[i] = _fetch_all(leased, [batch[i]])[0]
+            return True
+
+    with ThreadPoolExecutor(max_workers=len(batch) - 1) as executor:
+        # Each worker runs in a copy of the caller's context, so context
+        # variables (e.g. the profiler's current method) carry over
+        futures = [
+            (i, executor.submit(contextvars.copy_context().run, run_leased, i))
+            for i in range(1, len(batch))
+        ]
+        results[0] = _fetch_all(cursor, [batch[0]])[0]
+        for i, future in futures:
+            if not future.result():
+                results[i] = _fetch_all(cursor, [batch[i]])[0]
+    return results
+
+
+def run_plan(
+    plan: Plan[T],
+    cursor_factory: Callable[[], Any],
+    lease: Optional[Callable[[], ContextManager[Optional[Any]]]] = None,
+) -> T:
+    """Execute a plan on a blocking DB-API cursor.
+
+    The cursor is created on the first statement, so plans that return early
+    (empty input, dry runs) never check out a connection. Batches run
+    sequentially on the same cursor unless `lease` is given, in which case
+    they run concurrently on leased connections (see run_batch_threaded()).
+    """
+    cursor = None
+    send: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            step = plan.throw(error) if error is not None else plan.send(send)
+        except StopIteration as stop:
+            return stop.value
+        send, error = None, None
+        if cursor is None:
+            cursor = cursor_factory()
+        if isinstance(step, Query):
+            try:
+                send = _fetch(cursor, step)
+            except Exception as e:
+                error = e
+        elif lease is not None and len(step) > 1:
+            send = run_batch_threaded(step, cursor, lease)
+        else:
+            send = _fetch_all(cursor, step)
+
+
+async def _fetch_async(pool: Any, query: Query, profiler: Any = None) -> Any:
+    async with pool.connection() as conn:
+        async with conn.cursor() as cursor:
+            started = time.perf_counter()
+            try:
+                await cursor.execute(query.sql, query.params)
+                if query.one:
+                    result = await cursor.fetchone()
+                else:
+                    result = list(await cursor.fetchall())
+            finally:
+                query.record(started)
+            if profiler is not None:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                rows = len(result) if isinstance(result, list) else int(result is not None)
+                await profiler.observe_async(conn, query.sql, query.params, elapsed_ms, rows)
+            return result
+
+
+async def _fetch_captured(pool: Any, query: Query, profiler: Any = None) -> Any:
+    try:
+        return await _fetch_async(pool, query, profiler)
+    except Exception as e:
+        return e
+
+
+async def run_plan_async(plan: Plan[T], pool: Any, profiler: Any = None) -> T:
+    """Execute a plan on an AsyncConnectionPool.
+
+    Every statement checks out its own connection, so the statements of a
+    batch run concurrently (bounded by the pool size). Reads run in
+    autocommit mode; a plan must not rely on a shared transaction snapshot.
+    Statements are reported to `profiler` (an SQLProfiler) when given.
+    """
+    send: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            step = plan.throw(error) if error is not None else plan.send(send)
+        except StopIteration as stop:
+            return stop.value
+        send, error = None, None
+        if isinstance(step, Query):
+            try:
+                send = await _fetch_async(pool, step, profiler)
+            except Exception as e:
+                error = e
+        else:
+            send = list(await asyncio.gather(*(_fetch_captured(pool, q, profiler) for q in step)))
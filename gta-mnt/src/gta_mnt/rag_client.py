@@ -0,0 +1,183 @@
+"""Pooled, cached client for the GTA RAG semantic search (find_duplicates Vector G).
+
+Duplicate checks are repeated on the same draft, e.g. after each round of
+edits, and every check used to open a new HTTP client and run the same
+embedding search again. A RAGClient lives as long as the server and:
+
+- keeps its HTTPS connections open between calls
+- caches responses for `cache_ttl` seconds, keyed by (SHA-256 of the query
+  text, SHA-256 of the sorted pool intervention ids, limit); LRU-bounded
+- runs one request for concurrent identical searches
+- gives each search a latency budget: past it the caller gets a `skipped`
+  result, like any other RAG failure, instead of waiting up to the 60s
+  HTTP timeout. The request itself keeps running and its response is
+  cached, so the next check of the same draft gets the hits
+
+Failed searches are not cached.
+
+Configured from the environment:
+
+- RAG_BASE_URL, RAG_API_KEY: the RAG service (Vector G is skipped without them)
+- GTA_RAG_BUDGET: seconds a duplicate check waits for the RAG (default 10)
+- GTA_RAG_CACHE_TTL: seconds a search result is reused (default 300; 0
+  disables the cache)
+- GTA_RAG_CACHE_SIZE: maximum cached searches (default 256)
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import httpx
+
+
+DEFAULT_BUDGET = 10.0  # seconds
+DEFAULT_CACHE_TTL = 300.0  # seconds
+DEFAULT_CACHE_SIZE = 256
+HTTP_TIMEOUT = 60.0  # seconds
+
+# (query sha256, pool sha256 or '', limit)
+SearchKey = Tuple[str, str, int]
+
+
+def search_key(query: str, intervention_ids: Optional[Sequence[int]], limit: int) -> SearchKey:
+    """Cache key of a semantic search."""
+    pool = ','.join(str(i) for i in sorted(set(intervention_ids or ())))
+    return (
+        hashlib.sha256(query.encode()).hexdigest(),
+        hashlib.sha256(pool.encode()).hexdigest() if pool else '',
+        limit,
+    )
+
+
+def skipped(reason: str) -> dict:
+    """Result reported when Vector G cannot run; find_duplicates carries on without it."""
+    return {'results': [], 'skipped': True, 'reason': reason}
+
+
+class RAGClient:
+    """Semantic search against the GTA RAG with pooling, caching and a latency budget.
+
+    Must be used from a single event loop (it keeps an httpx.AsyncClient).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        budget: float = DEFAULT_BUDGET,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.endpoint = f"{base_url.rstrip('/')}/chat/gta/semantic-search"
+        self.headers = {'X-API-Key': api_key, 'Content-Type': 'application/json'}
+        self.budget = budget
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._client: Optional[httpx.AsyncClient] = None
+        # key -> (expires_at monotonic, response)
+        self._cache: "OrderedDict[SearchKey, Tuple[float, dict]]" = OrderedDict()
+        self._inflight: Dict[SearchKey, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "shared": 0, "over_budget": 0, "errors": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["RAGClient"]:
+        """Build a client from RAG_* and GTA_RAG_* variables, or None when the RAG is not configured."""
+        base_url = os.environ.get('RAG_BASE_URL')
+        api_key = os.environ.get('RAG_API_KEY')
+        if not base_url or not api_key:
+            return None
+        return cls(
+            base_url,
+            api_key,
+            budget=float(os.getenv('GTA_RAG_BUDGET', str(DEFAULT_BUDGET))),
+            cache_ttl=float(os.getenv('GTA_RAG_CACHE_TTL', str(DEFAULT_CACHE_TTL))),
+            cache_size=int(os.getenv('GTA_RAG_CACHE_SIZE', str(DEFAULT_CACHE_SIZE))),
+        )
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=HTTP_TIMEOUT)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def search(
+        self,
+        query: str,
+        intervention_ids: Optional[Sequence[int]] = None,
+        limit: int = 10,
+    ) -> dict:
+        """Semantic search, optionally scoped to a pool of interventions.
+
+        Returns:
+            The RAG response ({'results': [...]}), or {'results': [],
+            'skipped': True, 'reason': ...} when the search failed or ran
+            past the latency budget
+        """
+        key = search_key(query, intervention_ids, limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached[1]
+            del self._cache[key]
+        self.stats["misses"] += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(key, query, intervention_ids, limit))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["shared"] += 1
+
+        try:
+            # shield: a search past the budget keeps running and fills the cache
+            return await asyncio.wait_for(asyncio.shield(task), self.budget)
+        except asyncio.TimeoutError:
+            self.stats["over_budget"] += 1
+            return skipped(f'RAG did not answer within the {self.budget:g}s latency budget; Vector G skipped')
+
+    async def _request(
+        self,
+        key: SearchKey,
+        query: str,
+        intervention_ids: Optional[Sequence[int]],
+        limit: int,
+    ) -> dict:
+        body: dict = {'query': query, 'limit': limit}
+        if intervention_ids:
+            body['intervention_ids'] = list(intervention_ids)
+        try:
+            response = await self._http().post(self.endpoint, json=body, headers=self.headers)
+            response.raise_for_status()
+            result = response.json()
+        except Exception as e:
+            self.stats["errors"] += 1
+            return skipped(f'RAG call failed: {type(e).__name__}: {str(e)[:200]}')
+
+        if self.cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Entry count and settings, plus counters."""
+        return {
+            "entries": len(self._cache),
+            "max_entries": self.cache_size,
+            "ttl": self.cache_ttl,
+            "budget": self.budget,
+            **self.stats,
+        }
@@ -0,0 +1,145 @@
+"""Read-replica routing with read-your-writes pins.
+
+Every read (queue listings, get_measure, lookup refreshes, find_duplicates)
+used to run on the primary with the write credentials, competing with
+production writes. With GTA_DB_HOST_READ set, GTADatabaseClient opens a
+second pool against the replica and sends its read-only methods there.
+
+A replica lags the primary, so a read right after a write by this process
+could miss it. Every write therefore pins what it touched to the primary
+for `pin_seconds`:
+
+- the state act, and the interventions written (intervention writes pin
+  their state act too, when this process has seen which one it is: loaded
+  by get_measure or created here; otherwise every state act is pinned)
+- reads whose result can include any state act (queue listings,
+  find_duplicates, lookup and index refreshes) stay on the primary while
+  any write is within the window
+
+Reads of reference data the client never writes (comment templates) always
+go to the replica. Writes by other processes are not tracked: their reads
+may trail by the replication lag, as they would with any replica.
+
+Configured from the environment:
+
+- GTA_DB_HOST_READ: replica host (routing is off without it)
+- GTA_DB_READ_PIN_SECONDS: how long a write keeps its reads on the primary
+  (default 10; should exceed the replication lag)
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+
+DEFAULT_PIN_SECONDS = 10.0
+# Intervention -> state act mappings kept for pinning intervention writes
+MAX_KNOWN_INTERVENTIONS = 100_000
+
+# What a read method's result depends on (see GTADatabaseClient._read_only)
+STATE_ACT = 'state_act'
+INTERVENTION = 'intervention'
+ANY_WRITE = 'any'
+
+
+class ReadRouter:
+    """Decides per read whether the replica is fresh enough, from the recent writes of this process."""
+
+    def __init__(self, pin_seconds: float = DEFAULT_PIN_SECONDS):
+        self.pin_seconds = pin_seconds
+        self._lock = threading.Lock()
+        # id -> monotonic time the pin ends
+        self._state_acts: Dict[int, float] = {}
+        self._interventions: Dict[int, float] = {}
+        self._by_intervention: Dict[int, int] = {}
+        self._any_until = 0.0
+        # Set by a write to an intervention of unknown state act
+        self._all_state_acts_until = 0.0
+        self.stats = {"replica": 0, "primary": 0, "pins": 0, "fallbacks": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["ReadRouter"]:
+        """Build a router from GTA_DB_READ_PIN_SECONDS, or None when GTA_DB_HOST_READ is unset."""
+        if not os.getenv("GTA_DB_HOST_READ"):
+            return None
+        return cls(pin_seconds=float(os.getenv("GTA_DB_READ_PIN_SECONDS", str(DEFAULT_PIN_SECONDS))))
+
+    def learn(self, state_act_id: int, intervention_ids: Iterable[int]) -> None:
+        """Record which state act the interventions belong to."""
+        with self._lock:
+            self._learn(state_act_id, intervention_ids)
+
+    def _learn(self, state_act_id: int, intervention_ids: Iterable[int]) -> None:
+        for intervention_id in intervention_ids:
+            self._by_intervention[intervention_id] = state_act_id
+        while len(self._by_intervention) > MAX_KNOWN_INTERVENTIONS:
+            del self._by_intervention[next(iter(self._by_intervention))]
+
+    def pin(self, state_act_id: Optional[int] = None, intervention_ids: Iterable[int] = ()) -> None:
+        """Keep reads of a state act and/or interventions just written on the primary."""
+        intervention_ids = list(intervention_ids)
+        now = time.monotonic()
+        until = now + self.pin_seconds
+        with self._lock:
+            self._expire(now)
+            if state_act_id is not None:
+                self._learn(state_act_id, intervention_ids)
+                self._state_acts[state_act_id] = until
+            for intervention_id in intervention_ids:
+                self._interventions[intervention_id] = until
+                owner = self._by_intervention.get(intervention_id)
+                if owner is None:
+                    self._all_state_acts_until = until
+                else:
+                    self._state_acts[owner] = until
+            self._any_until = until
+            self.stats["pins"] += 1
+
+    def _expire(self, now: float) -> None:
+        for pins in (self._state_acts, self._interventions):
+            for key in [k for k, until in pins.items() if until <= now]:
+                del pins[key]
+
+    def use_replica(self, depends_on: Optional[str], ids: Any = None) -> bool:
+        """Whether a read may go to the replica.
+
+        Args:
+            depends_on: STATE_ACT or INTERVENTION (the read is about `ids`),
+                ANY_WRITE (its result can include any state act) or None
+                (reference data this client never writes)
+            ids: The state act id, or intervention id(s), the read is about
+        """
+        now = time.monotonic()
+        with self._lock:
+            if depends_on is None:
+                pinned = False
+            elif depends_on == ANY_WRITE:
+                pinned = self._any_until > now
+            elif self._all_state_acts_until > now:
+                pinned = True
+            elif depends_on == STATE_ACT:
+                pinned = self._state_acts.get(ids, 0.0) > now
+            else:
+                ids = ids if isinstance(ids, (list, tuple, set, frozenset)) else [ids]
+                pinned = any(
+                    self._interventions.get(i, 0.0) > now
+                    or self._state_acts.get(self._by_intervention.get(i), 0.0) > now
+                    for i in ids
+                )
+            self.stats["primary" if pinned else "replica"] += 1
+        return not pinned
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Active pins and settings, plus counters."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            return {
+                "pin_seconds": self.pin_seconds,
+                "pinned_state_acts": len(self._state_acts),
+                "pinned_interventions": len(self._interventions),
+                "all_pinned": self._all_state_acts_until > now,
+                "known_interventions": len(self._by_intervention),
+                **self.stats,
+            }
@@ -8,28 +8,42 @@ These must never be mixed. A reviewer must not appear as entry author.
 """
 
 import asyncio
+import inspect
 import os
 import sys
-from typing import Optional, List
+import threading
+import time
+from typing import Any, Callable, Optional, List, Union
 import httpx
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 
-from .api import GTADatabaseClient, BastiatAPIClient, semantic_search_via_rag
-from .source_fetcher import SourceFetcher
+from .api import (
+    AsyncGTADatabaseClient, GTADatabaseClient, BastiatAPIClient, EXPORT_FORMATS, decode_queue_cursor,
+    semantic_search_via_rag,
+)
+from .db_async import BACKENDS
+from .prefetch import QueuePrefetcher
+from .rag_client import RAGClient
+from .source_fetcher import SourceFetcher, parse_page_ranges
 from .constants import (
     SANCHO_USER_ID,
     SANCHO_AUTHOR_ID,
     SANCHO_FRAMEWORK_ID,
     FRAMEWORK_IDS,
+    BULK_MAX_ROWS,
 )
 from .formatters import (
     format_step1_queue,
     format_measure_detail,
     format_source_result,
+    format_multi_source_result,
     format_templates,
-    format_guessed_hs_codes
+    format_guessed_hs_codes,
+    format_guessed_hs_codes_bulk,
+    format_db_stats,
+    format_queue_export
 )
 
 
@@ -48,18 +62,46 @@ class _StrictInput(BaseModel):
     )
 
 # Global singletons (lazy-initialized)
-_db_client: Optional[GTADatabaseClient] = None
+_db_client: Optional[Union[GTADatabaseClient, AsyncGTADatabaseClient]] = None
 _source_fetcher: Optional[SourceFetcher] = None
+_prefetcher: Optional[QueuePrefetcher] = None
+_bastiat_client: Optional[BastiatAPIClient] = None
+_rag_client: Optional[RAGClient] = None
+_rag_client_ready = False
+_prefetcher_ready = False
+
 
+def get_db_client() -> Union[GTADatabaseClient, AsyncGTADatabaseClient]:
+    """Get or create the database client for the configured GTA_DB_BACKEND.
 
-def get_db_client() -> GTADatabaseClient:
-    """Get or create the database client."""
+    'pymysql' (default) is the blocking client, run via run_db() on worker
+    threads; 'aiomysql' serves read paths natively from the event loop.
+    """
     global _db_client
     if _db_client is None:
-        _db_client = GTADatabaseClient()
+        backend = os.getenv('GTA_DB_BACKEND', 'pymysql').strip().lower()
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown GTA_DB_BACKEND '{backend}'. Valid: {', '.join(BACKENDS)}"
+            )
+        if backend == 'aiomysql':
+            _db_client = AsyncGTADatabaseClient()
+        else:
+            _db_client = GTADatabaseClient()
     return _db_client
 
 
+async def run_db(method: Callable[..., Any], *args, **kwargs) -> Any:
+    """Await a database client method on either backend.
+
+    Coroutine methods (async backend) are awaited directly; blocking pymysql
+    methods run on a worker thread.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await asyncio.to_thread(method, *args, **kwargs)
+
+
 def get_source_fetcher() -> SourceFetcher:
     """Get or create the source fetcher."""
     global _source_fetcher
@@ -68,14 +110,82 @@ def get_source_fetcher() -> SourceFetcher:
     return _source_fetcher
 
 
+def get_bastiat_client() -> BastiatAPIClient:
+    """Get or create the Bastiat client, which keeps its connections and guess cache across calls."""
+    global _bastiat_client
+    if _bastiat_client is None:
+        _bastiat_client = BastiatAPIClient.from_env()
+        if _bastiat_client is None:
+            raise ToolError(
+                "GTA_API_KEY environment variable not set. "
+                "Cannot access Bastiat API for HS code inference."
+            )
+    return _bastiat_client
+
+
+def get_rag_client() -> Optional[RAGClient]:
+    """Get or create the RAG client behind Vector G (None when RAG_* is not set)."""
+    global _rag_client, _rag_client_ready
+    if not _rag_client_ready:
+        _rag_client = RAGClient.from_env()
+        _rag_client_ready = True
+    return _rag_client
+
+
+async def warm_review_item(state_act_id: int) -> None:
+    """Load what reviewing a queue item reads into the measure and source caches.
+
+    That is the measure as both gta_mnt_get_measure and gta_mnt_get_source
+    load it, and its first source.
+    """
+    db_client = get_db_client()
+    await run_db(db_client.get_measure, state_act_id=state_act_id,
+                 include_interventions=True, include_comments=True)
+    measure = await run_db(db_client.get_measure, state_act_id=state_act_id,
+                           include_interventions=False, include_comments=False)
+    if measure.get('sources'):
+        await get_source_fetcher().warm_source(state_act_id, measure)
+
+
+def get_prefetcher() -> Optional[QueuePrefetcher]:
+    """Get or create the review-queue prefetcher (None when GTA_PREFETCH_DEPTH=0)."""
+    global _prefetcher, _prefetcher_ready
+    if not _prefetcher_ready:
+        _prefetcher = QueuePrefetcher.from_env(warm_review_item)
+        _prefetcher_ready = True
+    return _prefetcher
+
+
+def prefetch_queue(data: dict) -> None:
+    """Start warming the head of a just-listed review queue in the background."""
+    prefetcher = get_prefetcher()
+    if prefetcher is not None:
+        prefetcher.schedule(row['id'] for row in data.get('results', []) if row.get('id') is not None)
+
+
 # Input models for tools
-class ListStep1QueueInput(_StrictInput):
+class _QueuePageInput(_StrictInput):
+    """Keyset cursor shared by the queue listings."""
+    cursor: Optional[str] = Field(
+        default=None,
+        description="`next_cursor` from the previous page; the page starts right after it (offset is then ignored)",
+    )
+
+    @field_validator('cursor')
+    @classmethod
+    def _cursor_must_decode(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            decode_queue_cursor(v)
+        return v
+
+
+class ListStep1QueueInput(_QueuePageInput):
     """Input for listing Step 1 review queue."""
     limit: Optional[int] = Field(default=None, ge=1, description="Max measures to return. Omit or null to return all.")
     offset: int = Field(default=0, ge=0, description="Offset for pagination")
     implementing_jurisdictions: Optional[List[str]] = Field(
         default=None,
-        description="Filter by jurisdiction codes (e.g., ['USA', 'CHN'])"
+        description="Filter by implementing jurisdiction: ISO codes (e.g., ['USA', 'CHN']) or jurisdiction IDs"
     )
     date_entered_review_gte: Optional[str] = Field(
         default=None,
@@ -87,13 +197,13 @@ class ListStep1QueueInput(_StrictInput):
     )
 
 
-class ListStep2QueueInput(_StrictInput):
+class ListStep2QueueInput(_QueuePageInput):
     """Input for listing Step 2 review queue."""
     limit: Optional[int] = Field(default=None, ge=1, description="Max measures to return. Omit or null to return all.")
     offset: int = Field(default=0, ge=0, description="Offset for pagination")
     implementing_jurisdictions: Optional[List[str]] = Field(
         default=None,
-        description="Filter by jurisdiction codes (e.g., ['USA', 'CHN'])"
+        description="Filter by implementing jurisdiction: ISO codes (e.g., ['USA', 'CHN']) or jurisdiction IDs"
     )
     date_entered_review_gte: Optional[str] = Field(
         default=None,
@@ -105,14 +215,14 @@ class ListStep2QueueInput(_StrictInput):
     )
 
 
-class ListQueueByStatusInput(_StrictInput):
+class ListQueueByStatusInput(_QueuePageInput):
     """Input for listing measures by arbitrary status ID."""
     status_id: int = Field(..., description="Status ID: 1=In progress, 2=Step 1, 3=Publishable, 6=Under revision, 19=Step 2")
     limit: int = Field(default=20, ge=1, le=100, description="Max measures to return (1-100)")
     offset: int = Field(default=0, ge=0, description="Offset for pagination")
     implementing_jurisdictions: Optional[List[str]] = Field(
         default=None,
-        description="Filter by jurisdiction codes (e.g., ['USA', 'CHN'])"
+        description="Filter by implementing jurisdiction: ISO codes (e.g., ['USA', 'CHN']) or jurisdiction IDs"
     )
     date_entered_review_gte: Optional[str] = Field(
         default=None,
@@ -120,6 +230,32 @@ class ListQueueByStatusInput(_StrictInput):
     )
 
 
+class ExportQueueInput(_StrictInput):
+    """Input for exporting a whole review queue to a file."""
+    status_id: int = Field(default=2, description="Status ID: 1=In progress, 2=Step 1, 3=Publishable, 6=Under revision, 19=Step 2")
+    format: str = Field(default="jsonl", description="'jsonl' (one JSON object per measure) or 'csv'")
+    implementing_jurisdictions: Optional[List[str]] = Field(
+        default=None,
+        description="Filter by implementing jurisdiction: ISO codes (e.g., ['USA', 'CHN']) or jurisdiction IDs"
+    )
+    date_entered_review_gte: Optional[str] = Field(
+        default=None,
+        description="Filter by date entered review (YYYY-MM-DD)"
+    )
+    exclude_framework_id: Optional[int] = Field(
+        default=None,
+        description="Exclude measures that have this framework ID attached (e.g., 495 for 'sancho claudino review')"
+    )
+
+    @field_validator('format')
+    @classmethod
+    def _format_must_be_known(cls, v: str) -> str:
+        v = v.lower()
+        if v not in EXPORT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}; got {v!r}")
+        return v
+
+
 class GetMeasureInput(_StrictInput):
     """Input for getting measure details."""
     state_act_id: int = Field(..., description="StateAct ID")
@@ -132,6 +268,26 @@ class GetSourceInput(_StrictInput):
     state_act_id: int = Field(..., description="StateAct ID")
     source_index: int = Field(default=0, ge=0, description="Which source to fetch (0-indexed)")
     fetch_content: bool = Field(default=True, description="Fetch and extract content")
+    fetch_all: bool = Field(
+        default=False,
+        description="Fetch every linked source concurrently in one call (source_index is ignored)",
+    )
+    pages: Optional[str] = Field(
+        default=None,
+        description="Return only these PDF pages, 1-based, e.g. '1-3,10'. Ignored for HTML sources",
+    )
+    search: Optional[str] = Field(
+        default=None,
+        min_length=2,
+        description="Return only the PDF pages (or HTML lines) containing this text, case-insensitive",
+    )
+
+    @field_validator('pages')
+    @classmethod
+    def _pages_must_parse(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            parse_page_ranges(v)
+        return v
 
 
 class AddCommentInput(_StrictInput):
@@ -190,12 +346,13 @@ class LogReviewInput(_StrictInput):
 class LookupInput(_StrictInput):
     """Input for looking up reference table values."""
     table: str = Field(..., description="Table short name: jurisdiction, product, sector, rationale, unit, firm, intervention_type, mast_chapter, mast_subchapter, evaluation, affected_flow, eligible_firm, implementation_level, intervention_area, firm_role, level_type, action")
-    query: str = Field(..., description="Search string (matched with LIKE %%query%%)")
+    query: str = Field(..., description="Search string. Names containing it rank first (exact, prefix, word start), then close fuzzy matches")
     limit: int = Field(default=20, ge=1, le=100, description="Max results to return")
+    refresh: bool = Field(default=False, description="Reload the table from the database (after reference-table edits made outside gta-mnt); this call searches the live table while the index reloads")
 
 
-class CreateStateActInput(_StrictInput):
-    """Input for creating a new state act (measure)."""
+class StateActRow(_StrictInput):
+    """A new state act — the gta_mnt_create_state_act fields."""
     title: str = Field(..., description="State act title")
     description: str = Field(..., description="Announcement description text")
     source_url: str = Field(..., description="Primary source URL")
@@ -206,12 +363,15 @@ class CreateStateActInput(_StrictInput):
         default=None,
         description="Full GTA citation string: 'Author (Date). TITLE. Publisher (Retrieved date): URL'. Stored in source_markdown and source fields. Falls back to source_url if omitted."
     )
+
+
+class CreateStateActInput(StateActRow):
+    """Input for creating a new state act (measure)."""
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class CreateInterventionInput(_StrictInput):
-    """Input for creating a new intervention."""
-    state_act_id: int = Field(..., description="FK to state act (from gta_mnt_create_state_act)")
+class InterventionRow(_StrictInput):
+    """A new intervention — the gta_mnt_create_intervention fields without the state act."""
     description: str = Field(..., description="Intervention description text")
     intervention_type_id: int = Field(..., description="FK to api_intervention_type_list (e.g. 81=Equity stake)")
     chapter_id: int = Field(..., description="MAST chapter ID (e.g. 10=L)")
@@ -228,6 +388,11 @@ class CreateInterventionInput(_StrictInput):
     is_horizontal: int = Field(default=0, description="1 if measure affects practically all sectors with uncertain intensity. Mutually exclusive with specific products/sectors (QC-TAX-005).")
     aj_type: int = Field(default=1, description="1=inferred, 2=targeted, 3=excluded, 4=incidental")
     dm_type: int = Field(default=1, description="1=inferred, 2=targeted, 3=excluded, 4=incidental")
+
+
+class CreateInterventionInput(InterventionRow):
+    """Input for creating a new intervention."""
+    state_act_id: int = Field(..., description="FK to state act (from gta_mnt_create_state_act)")
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
@@ -238,10 +403,8 @@ class AddIJInput(_StrictInput):
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class AddProductInput(_StrictInput):
-    """Input for adding affected product (HS6) to an intervention. For sources
-    that publish at HS8/10/12/14, use gta_mnt_add_product_level instead."""
-    intervention_id: int = Field(..., description="FK to api_intervention_log")
+class ProductRow(_StrictInput):
+    """One affected product (HS6) — a gta_mnt_add_product row without the intervention."""
     product_id: int = Field(..., description="FK to api_product_list (look up HS code via gta_mnt_lookup)")
     prior_level: Optional[str] = Field(default=None, description="Prior tariff/level value for this product (e.g. '5.0')")
     new_level: Optional[str] = Field(default=None, description="New tariff/level value for this product (e.g. '25.0')")
@@ -249,35 +412,30 @@ class AddProductInput(_StrictInput):
     date_implemented: Optional[str] = Field(default=None, description="Per-product implementation date (YYYY-MM-DD)")
     date_removed: Optional[str] = Field(default=None, description="Per-product removal date (YYYY-MM-DD)")
     is_investigated_only: bool = Field(default=False, description="True for trade-defence cases (anti-dumping/anti-subsidy/safeguard) where this product is under investigation only; False for ordinary affected products")
-    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class AddSectorInput(_StrictInput):
-    """Input for adding affected sector to an intervention."""
+class AddProductInput(ProductRow):
+    """Input for adding affected product (HS6) to an intervention. For sources
+    that publish at HS8/10/12/14, use gta_mnt_add_product_level instead."""
     intervention_id: int = Field(..., description="FK to api_intervention_log")
+    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
+
+
+class SectorRow(_StrictInput):
+    """One affected sector — a gta_mnt_add_sector row without the intervention."""
     sector_id: int = Field(..., description="FK to api_sector_list")
     sector_type: str = Field(default='N', description="'N'=normal, 'A'=additional, 'D'=deleted")
     is_investigated_only: bool = Field(default=False, description="True for trade-defence cases where this sector is under investigation only; False for normal affected-sector tags")
-    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class AddProductLevelInput(_StrictInput):
-    """Input for adding a tariff-line row at HS8/10/12/14 to an intervention.
+class AddSectorInput(SectorRow):
+    """Input for adding affected sector to an intervention."""
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
+    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
-    Analysts insert at the ORIGINAL SOURCE's HS granularity — if the source
-    publishes 10-digit codes, pass level=10; if it publishes 8-digit codes,
-    pass level=8. The gta-api back-end aggregates upward to HS6 and produces
-    the A/A_MIN/A_MAX type markers on coarser tables; this tool always writes
-    type='N'.
 
-    HS code formatting: pass the source's HS code as a string in any of:
-      '0102.10.20', '0102-10-20', '0102 10 20', '01021020'
-    The handler strips non-digits and validates the length matches `level`.
-    Leading zeros (chapters 01–09) survive validation; the master table stores
-    HS codes as integers and drops them, but the lookup remains consistent
-    because both sides drop the same way.
-    """
-    intervention_id: int = Field(..., description="FK to api_intervention_log")
+class ProductLevelRow(_StrictInput):
+    """One HS8/10/12/14 tariff line — a gta_mnt_add_product_level row without the intervention."""
     level: int = Field(..., description="HS granularity: 8, 10, 12, or 14")
     hs_code: str = Field(..., description="HS code as stated in the source (any common formatting; will be cleaned)")
     jurisdiction_id: int = Field(..., description="FK to api_jurisdiction_list — jurisdiction whose tariff schedule this line belongs to")
@@ -295,6 +453,53 @@ class AddProductLevelInput(_StrictInput):
     applicability_reason_id: int = Field(default=1, description="1='explicit in scope' (default), 2='explicit out of scope', 3='implicit in scope'. Level 8/10 only")
     verification_status_id: int = Field(default=1, description="1='HS code is in official source (HS 2022)' (default), 2='HS 2017 or earlier', 3='Not official'. Level 8/10 only")
     is_completely_captured: bool = Field(default=False, description="Aggregation hint; default False. Level 8/10 only")
+
+
+class AddProductLevelInput(ProductLevelRow):
+    """Input for adding a tariff-line row at HS8/10/12/14 to an intervention.
+
+    Analysts insert at the ORIGINAL SOURCE's HS granularity — if the source
+    publishes 10-digit codes, pass level=10; if it publishes 8-digit codes,
+    pass level=8. The gta-api back-end aggregates upward to HS6 and produces
+    the A/A_MIN/A_MAX type markers on coarser tables; this tool always writes
+    type='N'.
+
+    HS code formatting: pass the source's HS code as a string in any of:
+      '0102.10.20', '0102-10-20', '0102 10 20', '01021020'
+    The handler strips non-digits and validates the length matches `level`.
+    Leading zeros (chapters 01–09) survive validation; the master table stores
+    HS codes as integers and drops them, but the lookup remains consistent
+    because both sides drop the same way.
+    """
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
+    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
+
+
+class AddIJsBulkInput(_StrictInput):
+    """Input for adding many implementing jurisdictions to an intervention at once."""
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
+    jurisdiction_ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ROWS, description="FKs to api_jurisdiction_list (look up via gta_mnt_lookup)")
+    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
+
+
+class AddProductsBulkInput(_StrictInput):
+    """Input for adding many HS6 products to an intervention at once."""
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
+    products: List[ProductRow] = Field(..., min_length=1, max_length=BULK_MAX_ROWS, description="Products to add, each with the gta_mnt_add_product fields")
+    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
+
+
+class AddProductLevelsBulkInput(_StrictInput):
+    """Input for adding many HS8/10/12/14 tariff lines to an intervention at once."""
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
+    lines: List[ProductLevelRow] = Field(..., min_length=1, max_length=BULK_MAX_ROWS, description="Tariff lines to add, each with the gta_mnt_add_product_level fields")
+    dry_run: bool = Field(default=False, description="If True, return SQL without executing")
+
+
+class AddSectorsBulkInput(_StrictInput):
+    """Input for adding many affected sectors to an intervention at once."""
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
+    sectors: List[SectorRow] = Field(..., min_length=1, max_length=BULK_MAX_ROWS, description="Sectors to add, each with the gta_mnt_add_sector fields")
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
@@ -305,20 +510,28 @@ class AddRationaleInput(_StrictInput):
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class AddFirmInput(_StrictInput):
-    """Input for adding a firm to an intervention."""
-    intervention_id: int = Field(..., description="FK to api_intervention_log")
+class FirmRow(_StrictInput):
+    """One firm — a gta_mnt_add_firm row without the intervention."""
     firm_name: str = Field(..., description="Firm name (looked up or created in mtz_firm_log)")
     role_id: int = Field(..., description="FK to mtz_firm_role: 1=beneficiary, 2=target, 3=acting agency, 4=petitioner, 5=exempted, 6=intermediary")
     jurisdiction_id: Optional[int] = Field(default=None, description="Optional: firm's home jurisdiction ID")
+
+
+class AddFirmInput(FirmRow):
+    """Input for adding a firm to an intervention."""
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class AddSourceInput(_StrictInput):
-    """Input for adding a source URL to a state act."""
-    state_act_id: int = Field(..., description="FK to api_state_act_log")
+class SourceRow(_StrictInput):
+    """One source — a gta_mnt_add_source row without the state act."""
     source_url: str = Field(..., description="Source URL")
     source_citation: Optional[str] = Field(default=None, description="Full GTA citation string (e.g. 'Author (Date). TITLE. Publisher (Retrieved): URL'). Stored in api_state_act_source_log_new for admin dashboard display. If omitted, source_url is used.")
+
+
+class AddSourceInput(SourceRow):
+    """Input for adding a source URL to a state act."""
+    state_act_id: int = Field(..., description="FK to api_state_act_log")
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
@@ -328,25 +541,54 @@ class QueueRecalculationInput(_StrictInput):
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class AddMotiveQuoteInput(_StrictInput):
-    """Input for adding a stated motive quote to a state act."""
-    state_act_id: int = Field(..., description="FK to api_state_act_log")
+class MotiveQuoteRow(_StrictInput):
+    """One stated-motive quote — a gta_mnt_add_motive_quote row without the state act."""
     motive_quote: str = Field(..., description="The quoted text from the source justifying the motive tag")
     source_url: Optional[str] = Field(default=None, description="URL where the quote was found")
+
+
+class AddMotiveQuoteInput(MotiveQuoteRow):
+    """Input for adding a stated motive quote to a state act."""
+    state_act_id: int = Field(..., description="FK to api_state_act_log")
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
-class AddLevelInput(_StrictInput):
-    """Input for adding a level row to an intervention."""
-    intervention_id: int = Field(..., description="FK to api_intervention_log")
+class LevelRow(_StrictInput):
+    """One level row — a gta_mnt_add_level row without the intervention."""
     prior_level: Optional[str] = Field(default=None, description="Prior level value")
     new_level: Optional[str] = Field(default=None, description="New level value")
     unit_id: Optional[int] = Field(default=None, description="FK to api_unit_list")
     level_type_id: Optional[int] = Field(default=None, description="FK to api_level_type_list")
     tariff_peak: Optional[int] = Field(default=None, description="Tariff peak indicator")
+
+
+class AddLevelInput(LevelRow):
+    """Input for adding a level row to an intervention."""
+    intervention_id: int = Field(..., description="FK to api_intervention_log")
     dry_run: bool = Field(default=False, description="If True, return SQL without executing")
 
 
+class BundleIntervention(InterventionRow):
+    """One intervention of an entry bundle, with the rows to attach to it."""
+    implementing_jurisdictions: List[int] = Field(default_factory=list, max_length=BULK_MAX_ROWS, description="FKs to api_jurisdiction_list")
+    products: List[ProductRow] = Field(default_factory=list, max_length=BULK_MAX_ROWS, description="HS6 products (gta_mnt_add_product fields)")
+    product_levels: List[ProductLevelRow] = Field(default_factory=list, max_length=BULK_MAX_ROWS, description="HS8/10/12/14 tariff lines (gta_mnt_add_product_level fields)")
+    sectors: List[SectorRow] = Field(default_factory=list, max_length=BULK_MAX_ROWS, description="Affected sectors (gta_mnt_add_sector fields)")
+    rationales: List[int] = Field(default_factory=list, description="FKs to api_rationale_list")
+    firms: List[FirmRow] = Field(default_factory=list, description="Firms (gta_mnt_add_firm fields); existing firms are matched by name")
+    levels: List[LevelRow] = Field(default_factory=list, description="Level rows (gta_mnt_add_level fields)")
+    queue_recalculation: Optional[bool] = Field(default=None, description="Queue AJ/DM recalculation. Default: queued when aj_type or dm_type is 1 (inferred)")
+
+
+class CreateEntryBundleInput(_StrictInput):
+    """Input for creating a complete state act graph in one transaction."""
+    state_act: StateActRow = Field(..., description="The state act (gta_mnt_create_state_act fields)")
+    interventions: List[BundleIntervention] = Field(default_factory=list, max_length=50, description="Interventions with their IJs, products, tariff lines, sectors, rationales, firms and levels")
+    sources: List[SourceRow] = Field(default_factory=list, description="Additional sources beyond state_act.source_url")
+    motive_quotes: List[MotiveQuoteRow] = Field(default_factory=list, description="Stated-motive quotes")
+    dry_run: bool = Field(default=False, description="If True, validate and return row counts without executing")
+
+
 class FindDuplicatesInput(_StrictInput):
     """Input for find_duplicates duplicate detection.
 
@@ -378,13 +620,15 @@ async def list_step1_queue(params: ListStep1QueueInput) -> str:
     Pass exclude_framework_id=495 to exclude measures already reviewed by Sancho Claudino.
     """
     db_client = get_db_client()
-    data = await asyncio.to_thread(db_client.list_step1_queue, 
+    data = await run_db(db_client.list_step1_queue, 
         limit=params.limit,
         offset=params.offset,
         implementing_jurisdictions=params.implementing_jurisdictions,
         date_entered_review_gte=params.date_entered_review_gte,
-        exclude_framework_id=params.exclude_framework_id
+        exclude_framework_id=params.exclude_framework_id,
+        cursor=params.cursor,
     )
+    prefetch_queue(data)
     return format_step1_queue(data)
 
 
@@ -396,14 +640,16 @@ async def list_step2_queue(params: ListStep2QueueInput) -> str:
     Pass exclude_framework_id=495 to exclude measures already reviewed by Sancho Claudino.
     """
     db_client = get_db_client()
-    data = await asyncio.to_thread(db_client.list_step1_queue, 
+    data = await run_db(db_client.list_step1_queue, 
         status_id=19,
         limit=params.limit,
         offset=params.offset,
         implementing_jurisdictions=params.implementing_jurisdictions,
         date_entered_review_gte=params.date_entered_review_gte,
-        exclude_framework_id=params.exclude_framework_id
+        exclude_framework_id=params.exclude_framework_id,
+        cursor=params.cursor,
     )
+    prefetch_queue(data)
     return format_step1_queue(data, queue_label="Step 2")
 
 
@@ -417,17 +663,38 @@ async def list_queue_by_status(params: ListQueueByStatusInput) -> str:
     Status IDs: 1=In progress, 2=Step 1 review, 3=Publishable, 6=Under revision, 19=Step 2 review.
     """
     db_client = get_db_client()
-    data = await asyncio.to_thread(db_client.list_step1_queue, 
+    data = await run_db(db_client.list_step1_queue, 
         status_id=params.status_id,
         limit=params.limit,
         offset=params.offset,
         implementing_jurisdictions=params.implementing_jurisdictions,
-        date_entered_review_gte=params.date_entered_review_gte
+        date_entered_review_gte=params.date_entered_review_gte,
+        cursor=params.cursor,
     )
     label = STATUS_LABELS.get(params.status_id, f"Status {params.status_id}")
     return format_step1_queue(data, queue_label=label)
 
 
+@mcp.tool(name="gta_mnt_export_queue")
+async def export_queue(params: ExportQueueInput) -> str:
+    """Export every measure at a status to a JSONL or CSV file in review storage.
+
+    For full-queue exports: rows are streamed from the database into the file
+    instead of being listed, and the tool returns the file path with summary
+    statistics. Use the list tools to browse a queue page by page.
+    """
+    db_client = get_db_client()
+    data = await run_db(db_client.export_queue,
+        status_id=params.status_id,
+        implementing_jurisdictions=params.implementing_jurisdictions,
+        date_entered_review_gte=params.date_entered_review_gte,
+        exclude_framework_id=params.exclude_framework_id,
+        format=params.format,
+    )
+    label = STATUS_LABELS.get(params.status_id, f"Status {params.status_id}")
+    return format_queue_export(data, queue_label=label)
+
+
 @mcp.tool(name="gta_mnt_get_measure")
 async def get_measure(params: GetMeasureInput) -> str:
     """Get complete StateAct details including all interventions, comments, and source references.
@@ -435,7 +702,7 @@ async def get_measure(params: GetMeasureInput) -> str:
     Returns full measure data for validation.
     """
     db_client = get_db_client()
-    measure = await asyncio.to_thread(db_client.get_measure, 
+    measure = await run_db(db_client.get_measure, 
         state_act_id=params.state_act_id,
         include_interventions=params.include_interventions,
         include_comments=params.include_comments
@@ -448,13 +715,15 @@ async def get_source(params: GetSourceInput) -> str:
     """Retrieve official source for a StateAct.
 
     Priority: S3 archived file, fallback to URL. Extracts text from PDFs and HTML.
-    Use source_index to fetch different sources (0=first, 1=second, etc.).
+    Use source_index to fetch different sources (0=first, 1=second, etc.), or
+    fetch_all=True to get every source at once with a per-source status.
+    For long PDFs, pass pages='12-14' or search='tariff' to get only those pages.
     """
     db_client = get_db_client()
     source_fetcher = get_source_fetcher()
 
     # First get measure to retrieve source URLs
-    measure = await asyncio.to_thread(db_client.get_measure, 
+    measure = await run_db(db_client.get_measure, 
         state_act_id=params.state_act_id,
         include_interventions=False,
         include_comments=False
@@ -467,6 +736,16 @@ async def get_source(params: GetSourceInput) -> str:
             f"StateAct {params.state_act_id} has no linked sources. "
             "Cannot fetch source content."
         )
+    pages = parse_page_ranges(params.pages) if params.pages else None
+    if params.fetch_all:
+        result = await source_fetcher.fetch_all_sources(
+            state_act_id=params.state_act_id,
+            measure_data=measure,
+            fetch_content=params.fetch_content,
+            pages=pages,
+            search=params.search
+        )
+        return format_multi_source_result(result)
     if params.source_index >= len(sources):
         raise ToolError(
             f"source_index {params.source_index} out of range. "
@@ -479,7 +758,9 @@ async def get_source(params: GetSourceInput) -> str:
         state_act_id=params.state_act_id,
         measure_data=measure,
         fetch_content=params.fetch_content,
-        source_index=params.source_index
+        source_index=params.source_index,
+        pages=pages,
+        search=params.search
     )
 
     return format_source_result(source_result)
@@ -492,7 +773,7 @@ async def add_comment(params: AddCommentInput) -> str:
     Supports issue comments, verification comments, and review complete comments.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_comment, 
+    result = await run_db(db_client.add_comment, 
         measure_id=params.measure_id,
         comment_text=params.comment_text,
         template_id=params.template_id
@@ -511,7 +792,7 @@ async def set_status(params: SetStatusInput) -> str:
     Creates entry in api_state_act_status_log.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.set_status, 
+    result = await run_db(db_client.set_status, 
         state_act_id=params.state_act_id,
         new_status_id=params.new_status_id,
         comment=params.comment
@@ -539,7 +820,7 @@ async def add_framework(params: AddFrameworkInput) -> str:
         )
 
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_framework,
+    result = await run_db(db_client.add_framework,
         state_act_id=params.state_act_id,
         framework_name=params.framework_name
     )
@@ -554,7 +835,7 @@ async def add_framework(params: AddFrameworkInput) -> str:
 async def list_templates(params: ListTemplatesInput) -> str:
     """List available comment templates for standardized feedback."""
     db_client = get_db_client()
-    data = await asyncio.to_thread(db_client.list_templates, 
+    data = await run_db(db_client.list_templates, 
         include_checklist=params.include_checklist
     )
     return format_templates(data)
@@ -592,12 +873,17 @@ async def lookup(params: LookupInput) -> str:
     Supports: jurisdiction, product, sector, rationale, unit, firm, intervention_type,
     mast_chapter, mast_subchapter, evaluation, affected_flow, eligible_firm,
     implementation_level, intervention_area, firm_role, level_type, action.
+
+    Results are ranked: names containing the query come first (exact match,
+    prefix, word start), followed by close fuzzy matches for typos and
+    reordered words.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.lookup, 
+    result = await run_db(db_client.lookup,
         table=params.table,
         query=params.query,
-        limit=params.limit
+        limit=params.limit,
+        refresh=params.refresh
     )
 
     if result.get('error'):
@@ -621,7 +907,7 @@ async def create_state_act(params: CreateStateActInput) -> str:
     Also creates source URL entry and links it to the state act.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.create_state_act, 
+    result = await run_db(db_client.create_state_act, 
         title=params.title,
         description=params.description,
         source_url=params.source_url,
@@ -649,7 +935,7 @@ async def create_intervention(params: CreateInterventionInput) -> str:
     Use gta_mnt_lookup to find IDs for intervention_type, chapter, subchapter, etc.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.create_intervention, 
+    result = await run_db(db_client.create_intervention, 
         state_act_id=params.state_act_id,
         description=params.description,
         intervention_type_id=params.intervention_type_id,
@@ -679,6 +965,46 @@ async def create_intervention(params: CreateInterventionInput) -> str:
         return f"❌ {result.get('message', result.get('error', 'Unknown error'))}"
 
 
+@mcp.tool(name="gta_mnt_create_entry_bundle")
+async def create_entry_bundle(params: CreateEntryBundleInput) -> str:
+    """Create a state act and its whole intervention graph in one transaction.
+
+    Replaces the create_state_act → create_intervention → add_ij / add_product /
+    add_sector / add_rationale / add_firm / add_source / add_level /
+    queue_recalculation chain with a single call. Every row is validated first
+    (FKs are checked in batch, one query per reference table); if anything is
+    invalid, nothing is written and each bad row is listed by path, e.g.
+    `interventions[0].products[3]`. Otherwise all rows are committed together
+    and the generated state_act_id and intervention_ids are returned.
+
+    Use gta_mnt_lookup to resolve IDs first. Run with dry_run=True to validate
+    the bundle shape without touching the database.
+    """
+    db_client = get_db_client()
+    bundle = params.model_dump(exclude={'dry_run'})
+    result = await run_db(db_client.create_entry_bundle, **bundle, dry_run=params.dry_run)
+
+    lines = []
+    if result.get('dry_run'):
+        lines.append(f"🔍 DRY RUN — Create Entry Bundle\n\n{result['message']}")
+        lines.extend(f"- {table}: {n}" for table, n in result['rows'].items())
+    elif result['success']:
+        lines.append(f"✅ {result['message']}")
+        lines.append(f"State act ID: {result['state_act_id']}")
+        for n, created in enumerate(result['interventions']):
+            line = f"- interventions[{n}]: intervention_id {created['intervention_id']}"
+            if created['firm_ids']:
+                line += f", firm_ids {created['firm_ids']}"
+            if created['queued_recalculation']:
+                line += ", recalculation queued"
+            lines.append(line)
+        lines.append(f"Source IDs: {result['source_ids']}")
+    else:
+        lines.append(f"❌ {result['message'] if 'errors' in result else result.get('error', 'Unknown error')}")
+    lines.extend(f"- {error}" for error in result.get('errors', []))
+    return "\n".join(lines)
+
+
 @mcp.tool(name="gta_mnt_add_ij")
 async def add_ij(params: AddIJInput) -> str:
     """Add implementing jurisdiction to an intervention.
@@ -686,7 +1012,7 @@ async def add_ij(params: AddIJInput) -> str:
     Use gta_mnt_lookup with table='jurisdiction' to find the jurisdiction_id.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_ij, 
+    result = await run_db(db_client.add_ij, 
         intervention_id=params.intervention_id,
         jurisdiction_id=params.jurisdiction_id,
         dry_run=params.dry_run
@@ -713,7 +1039,7 @@ async def add_product(params: AddProductInput) -> str:
     anti-subsidy, safeguard) where the product is under investigation only.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_product,
+    result = await run_db(db_client.add_product,
         intervention_id=params.intervention_id,
         product_id=params.product_id,
         prior_level=params.prior_level,
@@ -759,7 +1085,7 @@ async def add_product_level(params: AddProductLevelInput) -> str:
     by the back-end, never set by analyst inserts.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_product_level,
+    result = await run_db(db_client.add_product_level,
         intervention_id=params.intervention_id,
         level=params.level,
         hs_code=params.hs_code,
@@ -802,7 +1128,7 @@ async def add_sector(params: AddSectorInput) -> str:
     is under investigation only.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_sector,
+    result = await run_db(db_client.add_sector,
         intervention_id=params.intervention_id,
         sector_id=params.sector_id,
         sector_type=params.sector_type,
@@ -819,6 +1145,96 @@ async def add_sector(params: AddSectorInput) -> str:
         return f"❌ {result.get('error', 'Unknown error')}"
 
 
+def _format_bulk_result(title: str, result: dict) -> str:
+    """Render a gta_mnt_add_*_bulk result: summary line plus per-row problems."""
+    if 'results' not in result:
+        return f"❌ {result.get('error', 'Unknown error')}"
+
+    if result.get('dry_run'):
+        lines = [f"🔍 DRY RUN — {title}", "", result['message']]
+        for statement in result['statements']:
+            lines.append(f"SQL ({len(statement['params'])} rows): `{statement['sql']}`")
+    else:
+        lines = [f"{'✅' if result['success'] else '⚠️'} {result['message']}"]
+        if result['invalid'] or result['failed']:
+            lines.append(f"Invalid: {result['invalid']}, failed: {result['failed']}")
+
+    for row in result['results']:
+        if 'error' in row:
+            lines.append(f"- row {row['index']} ({row['status']}): {row['error']}")
+    return "\n".join(lines)
+
+
+@mcp.tool(name="gta_mnt_add_ijs_bulk")
+async def add_ijs_bulk(params: AddIJsBulkInput) -> str:
+    """Add many implementing jurisdictions to an intervention in one transaction.
+
+    All jurisdiction_ids are validated with a single query; unknown ids are
+    reported per row and skipped, the rest are inserted together.
+    """
+    db_client = get_db_client()
+    result = await run_db(db_client.add_ijs_bulk,
+        intervention_id=params.intervention_id,
+        jurisdiction_ids=params.jurisdiction_ids,
+        dry_run=params.dry_run,
+    )
+    return _format_bulk_result("Add IJs", result)
+
+
+@mcp.tool(name="gta_mnt_add_products_bulk")
+async def add_products_bulk(params: AddProductsBulkInput) -> str:
+    """Add many HS6 products to an intervention in one transaction.
+
+    Each row takes the gta_mnt_add_product fields. All product_ids are
+    validated with a single query; unknown ids are reported per row and
+    skipped, the rest are inserted together. Prefer this over repeated
+    gta_mnt_add_product calls when an intervention lists many products.
+    """
+    db_client = get_db_client()
+    result = await run_db(db_client.add_products_bulk,
+        intervention_id=params.intervention_id,
+        products=[row.model_dump() for row in params.products],
+        dry_run=params.dry_run,
+    )
+    return _format_bulk_result("Add Products", result)
+
+
+@mcp.tool(name="gta_mnt_add_product_levels_bulk")
+async def add_product_levels_bulk(params: AddProductLevelsBulkInput) -> str:
+    """Add many HS8/10/12/14 tariff lines to an intervention in one transaction.
+
+    Each row takes the gta_mnt_add_product_level fields and is cleaned and
+    checked the same way (digits-only HS code of exactly `level` digits;
+    action_id required for level 8/10). The (HS code, jurisdiction) pairs are
+    validated against the master lists with one query per level; rows that
+    fail are reported and skipped, the rest are inserted together.
+    """
+    db_client = get_db_client()
+    result = await run_db(db_client.add_product_levels_bulk,
+        intervention_id=params.intervention_id,
+        lines=[row.model_dump() for row in params.lines],
+        dry_run=params.dry_run,
+    )
+    return _format_bulk_result("Add Product Levels", result)
+
+
+@mcp.tool(name="gta_mnt_add_sectors_bulk")
+async def add_sectors_bulk(params: AddSectorsBulkInput) -> str:
+    """Add many affected sectors to an intervention in one transaction.
+
+    Each row takes the gta_mnt_add_sector fields. All sector_ids are
+    validated with a single query; unknown ids are reported per row and
+    skipped, the rest are inserted together.
+    """
+    db_client = get_db_client()
+    result = await run_db(db_client.add_sectors_bulk,
+        intervention_id=params.intervention_id,
+        sectors=[row.model_dump() for row in params.sectors],
+        dry_run=params.dry_run,
+    )
+    return _format_bulk_result("Add Sectors", result)
+
+
 @mcp.tool(name="gta_mnt_add_rationale")
 async def add_rationale(params: AddRationaleInput) -> str:
     """Add rationale/motive tag to an intervention.
@@ -826,7 +1242,7 @@ async def add_rationale(params: AddRationaleInput) -> str:
     Use gta_mnt_lookup with table='rationale' to find the rationale_id.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_rationale, 
+    result = await run_db(db_client.add_rationale, 
         intervention_id=params.intervention_id,
         rationale_id=params.rationale_id,
         dry_run=params.dry_run
@@ -848,7 +1264,7 @@ async def add_firm(params: AddFirmInput) -> str:
     Firm roles: 1=beneficiary, 2=target, 3=acting agency, 4=petitioner, 5=exempted, 6=intermediary.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_firm, 
+    result = await run_db(db_client.add_firm, 
         intervention_id=params.intervention_id,
         firm_name=params.firm_name,
         role_id=params.role_id,
@@ -873,7 +1289,7 @@ async def add_source_tool(params: AddSourceInput) -> str:
     Note: gta_mnt_create_state_act already adds the primary source. Use this for additional sources.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_source, 
+    result = await run_db(db_client.add_source, 
         state_act_id=params.state_act_id,
         source_url=params.source_url,
         source_citation=params.source_citation,
@@ -897,7 +1313,7 @@ async def queue_recalculation(params: QueueRecalculationInput) -> str:
     The population_procedure runs asynchronously and populates api_intervention_aj and api_intervention_dm.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.queue_recalculation, 
+    result = await run_db(db_client.queue_recalculation, 
         intervention_id=params.intervention_id,
         dry_run=params.dry_run
     )
@@ -918,7 +1334,7 @@ async def add_level(params: AddLevelInput) -> str:
     Use gta_mnt_lookup with table='unit' or table='level_type' to find IDs.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_level, 
+    result = await run_db(db_client.add_level, 
         intervention_id=params.intervention_id,
         prior_level=params.prior_level,
         new_level=params.new_level,
@@ -945,7 +1361,7 @@ async def add_motive_quote(params: AddMotiveQuoteInput) -> str:
     Use after gta_mnt_add_rationale to provide the supporting quote.
     """
     db_client = get_db_client()
-    result = await asyncio.to_thread(db_client.add_motive_quote, 
+    result = await run_db(db_client.add_motive_quote, 
         state_act_id=params.state_act_id,
         motive_quote=params.motive_quote,
         source_url=params.source_url,
@@ -993,15 +1409,8 @@ async def guess_hs_codes(params: GuessHSCodesInput) -> str:
     After getting results, use gta_mnt_lookup(table='product', query='<hs_code>') to get
     the database product_id needed for gta_mnt_add_product.
     """
-    api_key = os.getenv("GTA_API_KEY")
-    if not api_key:
-        raise ToolError(
-            "GTA_API_KEY environment variable not set. "
-            "Cannot access Bastiat API for HS code inference."
-        )
-
+    client = get_bastiat_client()
     try:
-        client = BastiatAPIClient(api_key=api_key)
         result = await client.guess_hs_codes(
             article_text=params.product_description,
             target_hs_levels=params.target_hs_levels,
@@ -1015,11 +1424,50 @@ async def guess_hs_codes(params: GuessHSCodesInput) -> str:
         ) from e
     except httpx.TimeoutException as e:
         raise ToolError(
-            "Bastiat API timed out after 90s. "
+            f"Bastiat API timed out after {client.TIMEOUT:g}s. "
             "Try a shorter product_description."
         ) from e
 
 
+class GuessHSCodesBulkInput(_StrictInput):
+    """Input for guessing HS codes for many product descriptions at once."""
+    product_descriptions: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=BULK_MAX_ROWS,
+        description="Product descriptions, e.g. the lines of a tariff schedule. Repeated lines are only guessed once."
+    )
+    target_hs_levels: Optional[List[int]] = Field(
+        default=None,
+        description="HS digit levels to return for every description (e.g. [6]). Default: all levels."
+    )
+    hint_codes: Optional[List[str]] = Field(
+        default=None,
+        description="Optional HS codes to guide the search, applied to every description"
+    )
+
+
+@mcp.tool(name="gta_mnt_guess_hs_codes_bulk")
+async def guess_hs_codes_bulk(params: GuessHSCodesBulkInput) -> str:
+    """Guess HS codes for many product descriptions in one call.
+
+    Takes the gta_mnt_guess_hs_codes fields, with a list of descriptions.
+    Identical descriptions (ignoring case and spacing) are guessed once,
+    descriptions guessed before are served from the local cache, and the
+    rest are sent to Bastiat concurrently. Results come back in input order;
+    a failed description is reported in its row and does not fail the others.
+    Prefer this over repeated gta_mnt_guess_hs_codes calls for a schedule of
+    product lines.
+    """
+    client = get_bastiat_client()
+    result = await client.guess_hs_codes_bulk(
+        article_texts=params.product_descriptions,
+        target_hs_levels=params.target_hs_levels,
+        initial_hs_codes=params.hint_codes,
+    )
+    return format_guessed_hs_codes_bulk(result)
+
+
 @mcp.tool(name="gta_mnt_find_duplicates")
 async def find_duplicates(params: FindDuplicatesInput) -> str:
     """Find candidate duplicate state acts via deterministic SQL vectors plus optional semantic ranking.
@@ -1028,8 +1476,15 @@ async def find_duplicates(params: FindDuplicatesInput) -> str:
 
     - **A — URL**: state acts that share a normalised host+path with any input source URL.
     - **B — DECREE**: regex-extracted decree/regulation/notification numbers from the
-      title (e.g. "MP 1340", "VR 2036/2026", "BGBl I Nr. 96/2018"), LIKE-matched within
-      the same implementing jurisdiction.
+      title (e.g. "MP 1340", "VR 2036/2026", "BGBl I Nr. 96/2018"), matched within the
+      same implementing jurisdiction. With the local duplicate index (the default), a
+      token matches only the same whole token extracted from another title, ignoring
+      case and spacing: "Decree 123" does not match "Decree 123/2024". With
+      `GTA_DUPLICATE_INDEX=0`, or before the index's first build after a server start,
+      tokens are LIKE-matched as substrings of titles, so "Decree 123" also matches
+      "Decree 123/2024" (and "Decree 1234"). New and retitled state acts reach the
+      index within `GTA_DUPLICATE_INDEX_SYNC_SECONDS` (default 60s), or at once when
+      written through gta-mnt.
     - **C — TYPE+DATE**: same jurisdiction, `date_announced` within ±`type_date_window_days` (default 0 = exact match), same `intervention_type_id`. Set `type_date_window_days=7` for Claudino's Gate 0 to catch near-misses (JCC-1105).
     - **D — HS+DATE**: same jurisdiction, `date_announced` within ±`date_window_days`,
       ≥1 shared HS code.
@@ -1050,7 +1505,7 @@ async def find_duplicates(params: FindDuplicatesInput) -> str:
     when checking a draft before insertion.
     """
     db_client = get_db_client()
-    sql_result = await asyncio.to_thread(
+    sql_result = await run_db(
         db_client.find_duplicates,
         state_act_id=params.state_act_id,
         jurisdiction_ids=params.jurisdiction_ids,
@@ -1069,38 +1524,34 @@ async def find_duplicates(params: FindDuplicatesInput) -> str:
 
     candidates = sql_result['candidates']
     pool_ids = sql_result['pool_intervention_ids']
+    timings = dict(sql_result.get('timings_ms') or {})
     semantic_skipped_reason = None
     semantic_hits: list[dict] = []
 
     if params.semantic_search and (sql_result['self_title'] or sql_result['self_description']):
         query_text = ' '.join(filter(None, [sql_result['self_title'], (sql_result['self_description'] or '')[:1500]])).strip()
         if query_text:
+            started = time.perf_counter()
             rag = await semantic_search_via_rag(
                 query=query_text,
                 intervention_ids=pool_ids if pool_ids else None,
                 limit=20,
+                client=get_rag_client(),
             )
+            timings['SEMANTIC'] = round((time.perf_counter() - started) * 1000, 1)
             if rag.get('skipped'):
                 semantic_skipped_reason = rag.get('reason')
             else:
                 # Merge RAG hits into candidate set, mapping intervention_id → state_act_id
                 rag_results = rag.get('results', []) or []
-                # Build interv→state_act mapping for hits we don't already have
+                # Build interv→state_act mapping: hits inside the Vector E pool
+                # already carry their state act; look up only the rest
                 hit_iids = [r['intervention_id'] for r in rag_results if r.get('score', 0) >= params.semantic_threshold_review]
                 if hit_iids:
-                    iid_to_sa = {}
-                    conn = db_client._get_connection()
-                    cur = conn.cursor()
-                    placeholders = ','.join(['%s'] * len(hit_iids))
-                    cur.execute(
-                        f'''SELECT i.intervention_id, sa.state_act_id, sa.title, sa.status_id, sa.date_announced
-                            FROM api_intervention_log i
-                            JOIN api_state_act_log sa ON sa.state_act_id = i.state_act_id
-                            WHERE i.intervention_id IN ({placeholders})''',
-                        hit_iids,
-                    )
-                    for row in cur.fetchall():
-                        iid_to_sa[row['intervention_id']] = row
+                    iid_to_sa = {iid: sql_result['pool_state_acts'][iid] for iid in hit_iids if iid in sql_result['pool_state_acts']}
+                    unmapped = [iid for iid in hit_iids if iid not in iid_to_sa]
+                    if unmapped:
+                        iid_to_sa.update(await run_db(db_client.state_acts_for_interventions, unmapped))
                     excluded = set(sql_result['inputs_resolved'].get('exclude_state_act_ids') or [])
                     for r in rag_results:
                         if r.get('score', 0) < params.semantic_threshold_review:
@@ -1169,6 +1620,8 @@ async def find_duplicates(params: FindDuplicatesInput) -> str:
     lines = ['# Duplicate detection results\n']
     lines.append(f"**Vectors run:** {', '.join(vectors_run) or '(none — no inputs given)'}")
     lines.append(f"**Candidate pool size (Vector E):** {len(pool_ids)} interventions")
+    if timings:
+        lines.append(f"**Vector timings:** {', '.join(f'{v} {ms:.0f} ms' for v, ms in timings.items())}")
     if semantic_skipped_reason:
         lines.append(f"**Note:** {semantic_skipped_reason}")
     lines.append(f"**Candidates found:** {len(candidates)}\n")
@@ -1204,6 +1657,33 @@ async def find_duplicates(params: FindDuplicatesInput) -> str:
     return '\n'.join(lines)
 
 
+class DbStatsInput(_StrictInput):
+    """Input for the SQL profile and cache statistics."""
+    top: int = Field(default=20, ge=1, le=200, description="Statement shapes to list, slowest total first")
+    method: Optional[str] = Field(default=None, description="Only statements issued by this client method (e.g. 'get_measure', 'find_duplicates', 'list_step1_queue')")
+    reset: bool = Field(default=False, description="Clear the SQL profile after reading it (the slow-query log is kept)")
+
+
+@mcp.tool(name="gta_mnt_db_stats")
+async def db_stats(params: DbStatsInput) -> str:
+    """Show where database time goes, plus the state of the server's caches.
+
+    With GTA_SQL_PROFILE=1, lists the statements that took the most total
+    time per client method (calls, avg/max ms, rows), and where slow
+    statements are logged. Always reports the connection pool, measure cache,
+    lookup and duplicate indexes, queue totals, source cache, review-queue
+    prefetch, HS guess cache and RAG cache.
+    """
+    db_client = get_db_client()
+    data = await run_db(db_client.db_stats, top=params.top, method=params.method, reset=params.reset)
+    data['source_cache'] = dict(_source_fetcher.cache_stats) if _source_fetcher is not None else None
+    data['prefetch'] = _prefetcher.snapshot() if _prefetcher is not None else None
+    hs_cache = _bastiat_client.cache if _bastiat_client is not None else None
+    data['hs_guess_cache'] = await asyncio.to_thread(hs_cache.snapshot) if hs_cache is not None else None
+    data['rag'] = _rag_client.snapshot() if _rag_client is not None else None
+    return format_db_stats(data)
+
+
 # ========================================================================
 # MCP Resources — agent-facing reference docs
 # ========================================================================
@@ -1282,6 +1762,17 @@ def main():
         )
         sys.exit(1)
 
+    # Populate the lookup and duplicate indexes in the background so lookups
+    # and duplicate checks are served locally from the first call. Calls
+    # before a warm-up finishes use the live LIKE queries.
+    db_client = get_db_client()
+    threading.Thread(
+        target=db_client.warm_lookup_index, name='gta-mnt-lookup-warm', daemon=True,
+    ).start()
+    threading.Thread(
+        target=db_client.warm_duplicate_index, name='gta-mnt-duplicate-index-warm', daemon=True,
+    ).start()
+
     # Run the server with stdio transport (default for MCP)
     mcp.run()
 
@@ -1,14 +1,284 @@
-"""Source fetching and content extraction for gta_mnt."""
+"""Source fetching and content extraction for gta_mnt.
+
+Nothing here blocks the event loop. boto3 S3 reads and review-folder writes
+run in a worker thread, and PDF/HTML extraction (pypdf, BeautifulSoup; pure
+CPU) runs in worker processes, so one 300-page PDF no longer stalls every
+other tool call. Each document gets a page and time budget; the result
+reports how far extraction got when a budget cut it short. A document that
+overruns is abandoned by killing its own worker only.
+
+Fetched sources go through ReviewStorage's content-addressed cache: a source
+checked within GTA_SOURCE_CACHE_MAX_AGE is served from disk without a
+request, an older one is revalidated with a conditional GET (ETag /
+If-Modified-Since; IfNoneMatch for S3), and extracted text is reused for any
+source with the same bytes, whichever StateAct or URL it came from.
+
+Downloads stream straight into the cache, and workers read sources from
+there by path. PDF text is stored per page, so a request for a few pages
+(or a search) only extracts pages not already stored, and only returns the
+matching pages.
+
+Concurrent requests for the same download or extraction (the review-queue
+prefetcher and the reviewer opening the same source) share one run.
+
+Configured from the environment:
+
+- GTA_EXTRACT_WORKERS: extraction processes (default 2; 0 extracts in a
+  thread instead, e.g. where subprocesses are unavailable)
+- GTA_EXTRACT_MAX_PAGES: PDF pages extracted per document (default 200)
+- GTA_EXTRACT_TIMEOUT: seconds of extraction per document (default 60)
+- GTA_SOURCE_CACHE_MAX_AGE: seconds a cached source is used without
+  revalidation (default 3600; 0 always revalidates)
+- GTA_SOURCE_FETCH_CONCURRENCY: sources downloaded at once by
+  fetch_all_sources (default 4)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
-from typing import Optional
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
-from io import BytesIO
 import httpx
-import os
 
-from .models import SourceResult
-from .storage import ReviewStorage
+from .models import MultiSourceResult, SourceResult
+from .storage import BlobWriter, ReviewStorage
+
+
+DEFAULT_EXTRACT_WORKERS = 2
+DEFAULT_MAX_PAGES = 200
+DEFAULT_EXTRACT_TIMEOUT = 60.0  # seconds
+# Extra time a worker gets past the budget (process start-up, one slow page)
+# before it is presumed stuck and the pool is restarted
+EXTRACT_GRACE = 15.0  # seconds
+# Bump whenever extraction output changes, so cached text is re-extracted
+EXTRACTOR_VERSION = 2
+DEFAULT_SOURCE_CACHE_MAX_AGE = 3600.0  # seconds
+DEFAULT_FETCH_CONCURRENCY = 4
+# Read size when streaming a download into the cache
+CHUNK_SIZE = 1 << 20
+# Largest page selection accepted by parse_page_ranges()
+MAX_PAGE_SELECTION = 5000
+# Lines kept either side of a search hit in HTML/text sources
+SEARCH_CONTEXT_LINES = 1
+
+# (modified, etag, last_modified); modified is False when the cached copy is current
+Fetched = Tuple[bool, Optional[str], Optional[str]]
+
+
+def parse_page_ranges(spec: str) -> List[int]:
+    """Parse a 1-based page selection such as "1-3,7" into sorted page numbers.
+
+    Raises:
+        ValueError: If the selection is malformed, empty or too large
+    """
+    pages = set()
+    for part in spec.replace(' ', '').split(','):
+        if not part:
+            continue
+        first, dash, last = part.partition('-')
+        try:
+            lo = int(first)
+            hi = int(last) if dash else lo
+        except ValueError:
+            raise ValueError(f"Invalid page range {part!r}: expected N or N-M") from None
+        if lo < 1 or hi < lo:
+            raise ValueError(f"Invalid page range {part!r}: pages start at 1 and ranges must ascend")
+        if hi - lo >= MAX_PAGE_SELECTION:
+            raise ValueError(f"Page range {part!r} selects more than {MAX_PAGE_SELECTION} pages")
+        pages.update(range(lo, hi + 1))
+    if not pages:
+        raise ValueError("No pages selected")
+    if len(pages) > MAX_PAGE_SELECTION:
+        raise ValueError(f"Selection has more than {MAX_PAGE_SELECTION} pages")
+    return sorted(pages)
+
+
+def _read_source(source: Union[str, bytes]) -> bytes:
+    if isinstance(source, bytes):
+        return source
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def extract_pdf_pages(
+    source: Union[str, bytes],
+    page_numbers: Optional[Sequence[int]] = None,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    time_budget: float = DEFAULT_EXTRACT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Extract text from a PDF page by page, within a page and time budget.
+
+    pypdf parses pages lazily, so only the selected pages are decoded.
+
+    Args:
+        source: Path of the PDF (nothing to pickle to the worker) or its bytes
+        page_numbers: 1-based pages to extract (default: all, from page 1)
+        max_pages: Most pages extracted by this call
+        time_budget: Seconds after which no further page is started
+
+    Returns:
+        Dict with 'pages_total', 'pages' ({page number: text}) and
+        'truncated' (which budget stopped extraction, else None), or
+        'error' if the PDF cannot be read
+    """
+    deadline = time.monotonic() + time_budget
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(BytesIO(source) if isinstance(source, bytes) else source)
+        pages_total = len(reader.pages)
+        wanted = [n for n in (page_numbers or range(1, pages_total + 1)) if 1 <= n <= pages_total]
+        pages = {}
+        truncated = None
+
+        for i, n in enumerate(wanted):
+            if i >= max_pages:
+                truncated = f"page budget of {max_pages} pages"
+                break
+            if time.monotonic() >= deadline:
+                truncated = f"time budget of {time_budget:g}s"
+                break
+            pages[n] = reader.pages[n - 1].extract_text() or ""
+
+        return {'pages_total': pages_total, 'pages': pages, 'truncated': truncated}
+
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def pdf_text(pages_total: int, pages: Dict[int, str], truncated: Optional[str]) -> Dict[str, Any]:
+    """Whole-document result from extracted pages.
+
+    Returns:
+        Dict with 'content' (pages in order, or a bracketed message if
+        nothing usable was extracted), 'pages_total', 'pages_extracted' and
+        'truncated'
+    """
+    full_text = "\n\n".join(pages[n] for n in sorted(pages))
+
+    # Check if extraction yielded meaningful content
+    if truncated and not pages:
+        content = f"[PDF extraction stopped by the {truncated} before any page. Refer to source URL.]"
+    elif len(full_text.strip()) < 100:
+        content = "[PDF extraction failed - likely scanned document. Refer to source URL.]"
+    else:
+        content = full_text
+
+    return {
+        'content': content,
+        'pages_total': pages_total,
+        'pages_extracted': len(pages),
+        'truncated': truncated,
+    }
+
+
+def extract_pdf_text(
+    pdf_bytes: bytes,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    time_budget: float = DEFAULT_EXTRACT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Extract the text of a whole PDF using pypdf, within a page and time budget.
+
+    Returns:
+        pdf_text() result; 'content' is a bracketed error message if the
+        PDF cannot be read
+    """
+    result = extract_pdf_pages(pdf_bytes, None, max_pages, time_budget)
+    if 'error' in result:
+        return {'content': f"[PDF extraction error: {result['error']}]"}
+    return pdf_text(result['pages_total'], result['pages'], result['truncated'])
+
+
+def extract_html_text(source: Union[str, bytes]) -> Dict[str, Any]:
+    """Extract text from HTML using BeautifulSoup.
+
+    Args:
+        source: Path of the HTML file or its bytes
+
+    Returns:
+        Dict with 'content', or 'error' if parsing fails
+    """
+    try:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(_read_source(source), 'lxml')
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        # Get text
+        text = soup.get_text()
+
+        # Clean up whitespace
+        lines = (line.strip() for line in text.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        text = '\n'.join(chunk for chunk in chunks if chunk)
+
+        return {'content': text}
+
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def extract_content(
+    content_type: str,
+    source: Union[str, bytes],
+    page_numbers: Optional[Sequence[int]] = None,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    time_budget: float = DEFAULT_EXTRACT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Extract text by content type ("pdf", "html", "text").
+
+    Module-level so it can run in an extraction worker process.
+
+    Returns:
+        extract_pdf_pages() result for PDFs, else a dict with 'content' or 'error'
+    """
+    if content_type == "pdf":
+        return extract_pdf_pages(source, page_numbers, max_pages, time_budget)
+    if content_type == "html":
+        return extract_html_text(source)
+    return {'content': _read_source(source).decode('utf-8', errors='ignore')}
+
+
+def page_windows(pages: Dict[int, str], numbers: Sequence[int]) -> str:
+    """Render selected pages, each under a page marker."""
+    return "\n\n".join(f"--- Page {n} ---\n{pages[n]}" for n in numbers)
+
+
+def search_pages(pages: Dict[int, str], term: str) -> List[int]:
+    """Pages whose text contains `term` (case-insensitive)."""
+    needle = term.casefold()
+    return [n for n in sorted(pages) if needle in pages[n].casefold()]
+
+
+def search_lines(text: str, term: str, context: int = SEARCH_CONTEXT_LINES) -> Optional[str]:
+    """Lines containing `term` with `context` lines either side, or None if absent.
+
+    Overlapping windows are merged; separate windows are joined by "…".
+    """
+    needle = term.casefold()
+    lines = text.splitlines()
+    windows: List[List[int]] = []
+    for i, line in enumerate(lines):
+        if needle not in line.casefold():
+            continue
+        lo, hi = max(0, i - context), min(len(lines) - 1, i + context)
+        if windows and lo <= windows[-1][1] + 1:
+            windows[-1][1] = hi
+        else:
+            windows.append([lo, hi])
+    if not windows:
+        return None
+    return "\n…\n".join("\n".join(lines[lo:hi + 1]) for lo, hi in windows)
 
 
 class SourceFetcher:
@@ -32,6 +302,25 @@ class SourceFetcher:
         )
         self.storage = storage or ReviewStorage()
 
+        self.extract_workers = int(os.getenv('GTA_EXTRACT_WORKERS', str(DEFAULT_EXTRACT_WORKERS)))
+        self.max_pages = int(os.getenv('GTA_EXTRACT_MAX_PAGES', str(DEFAULT_MAX_PAGES)))
+        self.extract_timeout = float(os.getenv('GTA_EXTRACT_TIMEOUT', str(DEFAULT_EXTRACT_TIMEOUT)))
+        # One single-process executor per slot, so a document that overruns
+        # its budget only takes down its own worker, not the extractions
+        # running beside it. Slot -> executor, started on first use.
+        self._pools: Dict[int, ProcessPoolExecutor] = {}
+        # Free slot numbers: the hard timeout only runs while a document is
+        # actually being extracted, not while it queues
+        self._slots: Optional[asyncio.Queue] = None
+
+        self.cache_max_age = float(os.getenv('GTA_SOURCE_CACHE_MAX_AGE', str(DEFAULT_SOURCE_CACHE_MAX_AGE)))
+        self.fetch_concurrency = int(os.getenv('GTA_SOURCE_FETCH_CONCURRENCY', str(DEFAULT_FETCH_CONCURRENCY)))
+        self.cache_stats = dict.fromkeys(
+            ('fresh', 'not_modified', 'downloaded', 'text_hits', 'text_misses', 'shared'), 0,
+        )
+        # Download/extraction key -> task doing it, see _shared()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
     def _parse_s3_url(self, s3_url: str) -> tuple[str, str]:
         """Parse S3 URL into bucket and key.
 
@@ -48,84 +337,324 @@ class SourceFetcher:
         key = parts[1] if len(parts) > 1 else ""
         return bucket, key
 
-    async def _fetch_s3_file(self, bucket: str, key: str) -> bytes:
-        """Fetch file content from S3.
+    async def _fetch_s3_file(self, bucket: str, key: str) -> Path:
+        """Fetch an S3 object into the source cache (boto3 runs in a worker thread).
 
         Args:
             bucket: S3 bucket name
             key: Object key
 
         Returns:
-            File content as bytes
+            Path of the cached file
 
         Raises:
             ClientError: If S3 access fails
         """
-        response = self.s3_client.get_object(Bucket=bucket, Key=key)
-        return response['Body'].read()
+        async def fetch(etag: Optional[str], last_modified: Optional[str], sink: BlobWriter) -> Fetched:
+            return await asyncio.to_thread(self._read_s3_object, bucket, key, etag, sink)
 
-    def _extract_pdf_text(self, pdf_bytes: bytes) -> str:
-        """Extract text from PDF using pypdf.
+        return await self._fetch_cached(f"s3://{bucket}/{key}", fetch)
 
-        Args:
-            pdf_bytes: PDF file content
+    def _read_s3_object(self, bucket: str, key: str, etag: Optional[str], sink: BlobWriter) -> Fetched:
+        try:
+            if etag:
+                response = self.s3_client.get_object(Bucket=bucket, Key=key, IfNoneMatch=etag)
+            else:
+                response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if etag and e.response.get('Error', {}).get('Code') in ('304', 'NotModified'):
+                return False, etag, None
+            raise
+        body = response['Body']
+        for chunk in iter(lambda: body.read(CHUNK_SIZE), b''):
+            sink.write(chunk)
+        return True, response.get('ETag'), None
+
+    async def _fetch_url(self, source_url: str) -> Path:
+        """Fetch URL content into the source cache, conditionally when already cached.
 
         Returns:
-            Extracted text content
+            Path of the cached file
 
-        Note:
-            Returns error message if extraction fails or PDF is scanned.
+        Raises:
+            httpx.HTTPError: If the request fails
         """
-        try:
-            from pypdf import PdfReader
-
-            reader = PdfReader(BytesIO(pdf_bytes))
-            text_parts = []
+        async def fetch(etag: Optional[str], last_modified: Optional[str], sink: BlobWriter) -> Fetched:
+            headers = {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                async with client.stream('GET', source_url, headers=headers, follow_redirects=True) as response:
+                    validators = response.headers.get('etag'), response.headers.get('last-modified')
+                    if headers and response.status_code == 304:
+                        return (False, *validators)
+                    response.raise_for_status()
+                    # Appending a chunk to a local file costs far less than
+                    # the socket read that produced it
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        sink.write(chunk)
+            return (True, *validators)
 
-            for page in reader.pages:
-                text_parts.append(page.extract_text())
+        return await self._fetch_cached(source_url, fetch)
 
-            full_text = "\n\n".join(text_parts)
+    async def _shared(self, key: Hashable, run: Callable[[], Awaitable[Any]]) -> Any:
+        """Await run(), or the run already in progress under the same key.
 
-            # Check if extraction yielded meaningful content
-            if len(full_text.strip()) < 100:
-                return "[PDF extraction failed - likely scanned document. Refer to source URL.]"
+        The run is shielded: a caller that is cancelled (e.g. a prefetch
+        whose queue changed) stops waiting, but the work completes into the
+        cache for whoever asks next.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
 
-            return full_text
+            def done(t: asyncio.Future) -> None:
+                self._inflight.pop(key, None)
+                if not t.cancelled():
+                    t.exception()  # retrieved even when every caller has gone
 
-        except Exception as e:
-            return f"[PDF extraction error: {e}]"
+            task.add_done_callback(done)
+        else:
+            self.cache_stats['shared'] += 1
+        return await asyncio.shield(task)
 
-    def _extract_html_text(self, html_bytes: bytes) -> str:
-        """Extract text from HTML using BeautifulSoup.
+    async def _fetch_cached(
+        self,
+        source_url: str,
+        fetch: Callable[[Optional[str], Optional[str], BlobWriter], Awaitable[Fetched]],
+    ) -> Path:
+        """Serve `source_url` from the source cache, revalidating when stale.
 
         Args:
-            html_bytes: HTML file content
+            source_url: Cache key (s3:// or http(s) URL)
+            fetch: Performs the request given the cached ETag/Last-Modified
+                (both None for an unconditional fetch), streaming any body
+                into the writer it is handed
 
         Returns:
-            Extracted text content
+            Path of the current cached file
         """
-        try:
-            from bs4 import BeautifulSoup
+        return await self._shared(('fetch', source_url), lambda: self._revalidate(source_url, fetch))
 
-            soup = BeautifulSoup(html_bytes, 'lxml')
+    async def _revalidate(
+        self,
+        source_url: str,
+        fetch: Callable[[Optional[str], Optional[str], BlobWriter], Awaitable[Fetched]],
+    ) -> Path:
+        meta = await asyncio.to_thread(self.storage.get_source_meta, source_url)
+        cached = None
+        if meta is not None:
+            path = self.storage.blob_path(meta['sha256'])
+            if await asyncio.to_thread(path.exists):
+                cached = path
+        if cached is None:
+            meta = {}
+        elif time.time() - meta['checked_at'] < self.cache_max_age:
+            self.cache_stats['fresh'] += 1
+            return cached
+
+        sink = await asyncio.to_thread(self.storage.blob_writer)
+        try:
+            modified, etag, last_modified = await fetch(meta.get('etag'), meta.get('last_modified'), sink)
+        except BaseException:
+            sink.discard()
+            raise
+        if modified:
+            self.cache_stats['downloaded'] += 1
+            digest = await asyncio.to_thread(sink.commit)
+        else:
+            self.cache_stats['not_modified'] += 1
+            sink.discard()
+            digest = meta['sha256']
+            etag = etag or meta.get('etag')
+            last_modified = last_modified or meta.get('last_modified')
+
+        await asyncio.to_thread(self.storage.put_source_meta, source_url, {
+            'sha256': digest,
+            'etag': etag,
+            'last_modified': last_modified,
+            'checked_at': time.time(),
+        })
+        return self.storage.blob_path(digest)
+
+    def _get_pool(self, slot: int) -> ProcessPoolExecutor:
+        pool = self._pools.get(slot)
+        if pool is None:
+            # spawn, not fork: the server process runs threads and an event loop
+            pool = self._pools[slot] = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return pool
+
+    def _reset_pool(self, slot: int) -> None:
+        """Kill one slot's worker; its next extraction starts a fresh one."""
+        pool = self._pools.pop(slot, None)
+        if pool is not None:
+            # A worker stuck inside one page cannot be interrupted, and the
+            # executor has no public way to stop a running task.
+            for process in list((getattr(pool, '_processes', None) or {}).values()):
+                process.terminate()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Shut down the extraction workers."""
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _extract_content(
+        self,
+        content_type: str,
+        source: Union[str, bytes],
+        page_numbers: Optional[Sequence[int]] = None,
+    ) -> Dict[str, Any]:
+        """Extract text off the event loop, within this fetcher's budgets.
 
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+        Returns:
+            extract_content() result, or 'error' if the worker timed out or died
+        """
+        if content_type not in ("pdf", "html"):
+            return extract_content(content_type, source)
+        args = (content_type, source, page_numbers, self.max_pages, self.extract_timeout)
+        if self.extract_workers <= 0:
+            return await asyncio.to_thread(extract_content, *args)
+
+        if self._slots is None:
+            self._slots = asyncio.Queue()
+            for slot in range(self.extract_workers):
+                self._slots.put_nowait(slot)
+        slot = await self._slots.get()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._get_pool(slot), extract_content, *args)
+            return await asyncio.wait_for(future, self.extract_timeout + EXTRACT_GRACE)
+        except asyncio.TimeoutError:
+            self._reset_pool(slot)
+            return {
+                'error': f"timed out after {self.extract_timeout:g}s",
+                'truncated': f"time budget of {self.extract_timeout:g}s",
+            }
+        except BrokenProcessPool as e:
+            self._reset_pool(slot)
+            return {'error': f"worker failed ({e})"}
+        finally:
+            self._slots.put_nowait(slot)
+
+    def _selected_pages(self, pages_total: int, pages: Optional[Sequence[int]]) -> Tuple[List[int], bool]:
+        """Pages to extract for a request, and whether the page budget cut them."""
+        requested = [n for n in (pages or range(1, pages_total + 1)) if 1 <= n <= pages_total]
+        return requested[:self.max_pages], len(requested) > self.max_pages
+
+    async def _pdf_pages(self, source: Path, pages: Optional[Sequence[int]]) -> Dict[str, Any]:
+        """Text of the selected PDF pages, extracting only those not yet stored.
+
+        Per-page text is deterministic, so pages extracted before a time
+        budget ran out are stored too, and the next call resumes after them.
 
-            # Get text
-            text = soup.get_text()
+        Returns:
+            Dict with 'pages_total', 'pages' (every stored page), 'selected'
+            and 'truncated', or 'error'
+        """
+        version = f"v{EXTRACTOR_VERSION}-pdf"
+        digest = await asyncio.to_thread(self.storage.digest_file, source)
+        record = await asyncio.to_thread(self.storage.get_text, digest, version) or {}
+        texts = {int(n): text for n, text in record.get('pages', {}).items()}
+        pages_total = record.get('pages_total')
+        truncated = None
+
+        missing = None
+        if pages_total is not None:
+            selected, _ = self._selected_pages(pages_total, pages)
+            missing = [n for n in selected if n not in texts]
+        if missing == []:
+            self.cache_stats['text_hits'] += 1
+        else:
+            self.cache_stats['text_misses'] += 1
+            result = await self._extract_content("pdf", str(source), missing or pages)
+            if 'error' in result:
+                return result
+            texts.update(result['pages'])
+            pages_total = result['pages_total']
+            truncated = result['truncated']
+            await asyncio.to_thread(
+                self.storage.put_text, digest, version, {'pages_total': pages_total, 'pages': texts},
+            )
 
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
+        selected, cut = self._selected_pages(pages_total, pages)
+        if cut and not truncated:
+            truncated = f"page budget of {self.max_pages} pages"
+        return {'pages_total': pages_total, 'pages': texts, 'selected': selected, 'truncated': truncated}
+
+    async def _text_cached(self, content_type: str, source: Path) -> Dict[str, Any]:
+        """Text of an HTML/plain source, reusing HTML already extracted from identical bytes."""
+        if content_type != "html":
+            return extract_content(content_type, await asyncio.to_thread(source.read_bytes))
+        version = f"v{EXTRACTOR_VERSION}-html"
+        digest = await asyncio.to_thread(self.storage.digest_file, source)
+        cached = await asyncio.to_thread(self.storage.get_text, digest, version)
+        if cached is not None:
+            self.cache_stats['text_hits'] += 1
+            return cached
+
+        self.cache_stats['text_misses'] += 1
+        extraction = await self._extract_content(content_type, str(source))
+        if 'error' not in extraction:
+            await asyncio.to_thread(self.storage.put_text, digest, version, extraction)
+        return extraction
+
+    async def _extract_cached(
+        self,
+        content_type: str,
+        source: Path,
+        pages: Optional[Sequence[int]] = None,
+        search: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Extract a cached source, optionally only some pages or the hits of a search.
 
-            return text
+        Args:
+            content_type: "pdf", "html" or "text"
+            source: Cached file to extract
+            pages: 1-based PDF pages to return (ignored for HTML/text)
+            search: Return only the PDF pages, or HTML/text lines, mentioning this
 
-        except Exception as e:
-            return f"[HTML extraction error: {e}]"
+        Returns:
+            SourceResult fields: 'content' plus, for PDFs, page counts,
+            truncation reason and (for pages/search) 'page_numbers'
+        """
+        label = content_type.upper()
+        if content_type != "pdf":
+            extraction = await self._shared(('text', source), lambda: self._text_cached(content_type, source))
+            if 'error' in extraction:
+                return {'content': f"[{label} extraction error: {extraction['error']}]"}
+            content = extraction['content']
+            if search:
+                content = search_lines(content, search) or f"[No line mentions {search!r}.]"
+            return {'content': content}
+
+        record = await self._shared(
+            ('pdf', source, tuple(pages or ())), lambda: self._pdf_pages(source, pages),
+        )
+        if 'error' in record:
+            return {'content': f"[PDF extraction error: {record['error']}]", 'truncated': record.get('truncated')}
+        pages_total, truncated = record['pages_total'], record['truncated']
+        texts = {n: record['pages'][n] for n in record['selected'] if n in record['pages']}
+        if not pages and not search:
+            return pdf_text(pages_total, texts, truncated)
+
+        result = {'pages_total': pages_total, 'pages_extracted': len(texts), 'truncated': truncated}
+        if pages and not record['selected']:
+            return {**result, 'page_numbers': [], 'content': f"[No selected page exists: the PDF has {pages_total} pages.]"}
+        numbers = search_pages(texts, search) if search else sorted(texts)
+        if not numbers:
+            return {
+                **result,
+                'page_numbers': [],
+                'content': f"[No page mentions {search!r} ({len(texts)} of {pages_total} pages searched).]",
+            }
+        return {**result, 'page_numbers': numbers, 'content': page_windows(texts, numbers)}
 
     def _get_content_type(self, filename: str) -> str:
         """Determine content type from filename.
@@ -148,26 +677,19 @@ class SourceFetcher:
     # WS4: Get Source Implementation
     # ========================================================================
 
-    async def get_source(
+    def _resolve_source(
         self,
         state_act_id: int,
         measure_data: dict,
-        fetch_content: bool = True,
-        source_index: int = 0
-    ) -> SourceResult:
-        """Retrieve official source for a StateAct.
-
-        Priority: S3 archived file first, fallback to URL.
-        Extracts text from PDFs and HTML when fetch_content=True.
-
-        Args:
-            state_act_id: StateAct ID
-            measure_data: Measure dict from API (contains sources list)
-            fetch_content: Whether to fetch and extract content
-            source_index: Which source to fetch (0-indexed, default first source)
+        source_index: int
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Pick the S3 file and URL of one linked source.
 
         Returns:
-            SourceResult with source type, URL, and optional content
+            (source_file, source_url), either may be None
+
+        Raises:
+            ValueError: If no source is available at that index
         """
         # Get sources list from measure data
         sources = measure_data.get('sources', [])
@@ -194,6 +716,35 @@ class SourceFetcher:
             source_url = src.get('source_url')
         elif not source_file and not source_url:
             raise ValueError(f"No source available for StateAct {state_act_id} (index {source_index})")
+        return source_file, source_url
+
+    async def get_source(
+        self,
+        state_act_id: int,
+        measure_data: dict,
+        fetch_content: bool = True,
+        source_index: int = 0,
+        pages: Optional[Sequence[int]] = None,
+        search: Optional[str] = None
+    ) -> SourceResult:
+        """Retrieve official source for a StateAct.
+
+        Priority: S3 archived file first, fallback to URL.
+        Extracts text from PDFs and HTML when fetch_content=True.
+
+        Args:
+            state_act_id: StateAct ID
+            measure_data: Measure dict from API (contains sources list)
+            fetch_content: Whether to fetch and extract content
+            source_index: Which source to fetch (0-indexed, default first source)
+            pages: Return only these 1-based PDF pages
+            search: Return only the PDF pages (HTML/text lines) mentioning this
+
+        Returns:
+            SourceResult with source type, URL, and optional content
+        """
+        source_file, source_url = self._resolve_source(state_act_id, measure_data, source_index)
+        s3_error = None
 
         # Priority 1: S3 file
         if source_file and source_file.startswith("s3://"):
@@ -206,38 +757,38 @@ class SourceFetcher:
                         source_type="file",
                         source_url=source_file,
                         content=None,
-                        content_type=content_type
+                        content_type=content_type,
+                        source_index=source_index
                     )
 
                 # Fetch file from S3
-                file_bytes = await self._fetch_s3_file(bucket, key)
+                cached_file = await self._fetch_s3_file(bucket, key)
 
                 # Save to persistent storage
-                self.storage.save_source(
+                saved_path = await asyncio.to_thread(
+                    self.storage.save_source,
                     state_act_id=state_act_id,
-                    content=file_bytes,
+                    content=cached_file,
                     content_type=content_type,
-                    source_url=source_file
+                    source_url=source_file,
+                    source_index=source_index
                 )
 
                 # Extract text based on type
-                if content_type == "pdf":
-                    content = self._extract_pdf_text(file_bytes)
-                elif content_type == "html":
-                    content = self._extract_html_text(file_bytes)
-                else:
-                    content = file_bytes.decode('utf-8', errors='ignore')
+                extraction = await self._extract_cached(content_type, cached_file, pages, search)
 
                 return SourceResult(
                     source_type="file",
                     source_url=source_file,
-                    content=content,
-                    content_type=content_type
+                    content_type=content_type,
+                    source_index=source_index,
+                    saved_path=str(saved_path),
+                    **extraction
                 )
 
             except (BotoCoreError, ClientError) as e:
                 # S3 access failed, fallback to URL
-                pass
+                s3_error = e
 
         # Priority 2: Source URL
         if source_url:
@@ -249,36 +800,33 @@ class SourceFetcher:
                         source_type="url",
                         source_url=source_url,
                         content=None,
-                        content_type=content_type
+                        content_type=content_type,
+                        source_index=source_index
                     )
 
                 # Fetch URL content
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(source_url, follow_redirects=True)
-                    response.raise_for_status()
-                    url_bytes = response.content
+                cached_file = await self._fetch_url(source_url)
 
                 # Save to persistent storage
-                self.storage.save_source(
+                saved_path = await asyncio.to_thread(
+                    self.storage.save_source,
                     state_act_id=state_act_id,
-                    content=url_bytes,
+                    content=cached_file,
                     content_type=content_type,
-                    source_url=source_url
+                    source_url=source_url,
+                    source_index=source_index
                 )
 
                 # Extract text based on type
-                if content_type == "pdf":
-                    content = self._extract_pdf_text(url_bytes)
-                elif content_type == "html":
-                    content = self._extract_html_text(url_bytes)
-                else:
-                    content = url_bytes.decode('utf-8', errors='ignore')
+                extraction = await self._extract_cached(content_type, cached_file, pages, search)
 
                 return SourceResult(
                     source_type="url",
                     source_url=source_url,
-                    content=content,
-                    content_type=content_type
+                    content_type=content_type,
+                    source_index=source_index,
+                    saved_path=str(saved_path),
+                    **extraction
                 )
 
             except Exception as e:
@@ -287,8 +835,87 @@ class SourceFetcher:
                     source_type="url",
                     source_url=source_url,
                     content=f"[URL fetch error: {e}]",
-                    content_type=content_type
+                    content_type=content_type,
+                    source_index=source_index,
+                    error=f"URL fetch error: {e}"
                 )
 
         # No source available
+        if s3_error is not None:
+            raise ValueError(f"No source available for StateAct {state_act_id} (S3 fetch failed: {s3_error})")
         raise ValueError(f"No source available for StateAct {state_act_id}")
+
+    async def warm_source(self, state_act_id: int, measure_data: dict, source_index: int = 0) -> None:
+        """Fetch and extract a source into the caches, without saving it to the review folder.
+
+        Used by the review-queue prefetcher: a later get_source() for the
+        same source is then served from the caches.
+
+        Raises:
+            ValueError: If no source is available at that index
+            httpx.HTTPError: If the URL fetch fails
+        """
+        source_file, source_url = self._resolve_source(state_act_id, measure_data, source_index)
+        if source_file and source_file.startswith("s3://"):
+            bucket, key = self._parse_s3_url(source_file)
+            try:
+                cached_file = await self._fetch_s3_file(bucket, key)
+            except (BotoCoreError, ClientError) as e:
+                if not source_url:
+                    raise ValueError(f"No source available for StateAct {state_act_id} (S3 fetch failed: {e})")
+            else:
+                await self._extract_cached(self._get_content_type(key), cached_file)
+                return
+        if source_url:
+            cached_file = await self._fetch_url(source_url)
+            await self._extract_cached(self._get_content_type(source_url), cached_file)
+
+    async def fetch_all_sources(
+        self,
+        state_act_id: int,
+        measure_data: dict,
+        fetch_content: bool = True,
+        pages: Optional[Sequence[int]] = None,
+        search: Optional[str] = None
+    ) -> MultiSourceResult:
+        """Retrieve every linked source of a StateAct concurrently.
+
+        At most `fetch_concurrency` sources are downloaded at once; extraction
+        is further bounded by the extraction workers. A source that fails is
+        reported in its slot instead of failing the others.
+
+        Args:
+            state_act_id: StateAct ID
+            measure_data: Measure dict from API (contains sources list)
+            fetch_content: Whether to fetch and extract content
+            pages: Return only these 1-based pages of each PDF
+            search: Return only the pages/lines mentioning this, per source
+
+        Returns:
+            MultiSourceResult with one SourceResult per source, in source order
+        """
+        source_info = measure_data.get('source_info', {})
+        linked_sources = source_info.get('linked_sources', measure_data.get('sources', []))
+        slots = asyncio.Semaphore(max(1, self.fetch_concurrency))
+
+        async def fetch(index: int) -> SourceResult:
+            async with slots:
+                try:
+                    return await self.get_source(state_act_id, measure_data, fetch_content, index, pages, search)
+                except Exception as e:
+                    source_file, source_url = None, None
+                    try:
+                        source_file, source_url = self._resolve_source(state_act_id, measure_data, index)
+                    except ValueError:
+                        pass
+                    target = source_url or source_file or ""
+                    return SourceResult(
+                        source_type="url" if source_url else "file",
+                        source_url=target,
+                        content_type=self._get_content_type(target),
+                        source_index=index,
+                        error=str(e) or type(e).__name__
+                    )
+
+        results = await asyncio.gather(*(fetch(i) for i in range(max(1, len(linked_sources)))))
+        return MultiSourceResult(state_act_id=state_act_id, sources=list(results))
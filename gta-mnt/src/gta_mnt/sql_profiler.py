@@ -0,0 +1,252 @@
+"""Opt-in per-statement SQL profiling for GTADatabaseClient.
+
+get_measure, find_duplicates and the queue listings each run many
+statements, and which of them dominate latency on the production RDS
+instance is not visible from the tool timings. With profiling on, every
+statement is timed where it executes (a pymysql cursor subclass, and the
+async plan runner) and aggregated per (client method, statement shape):
+call count, total and worst wall time, and rows returned.
+
+Statements slower than `slow_ms` are also appended to a JSONL slow-query log
+(`_slow-queries.jsonl` under REVIEW_STORAGE_PATH) with their parameters and,
+with `explain`, MySQL's EXPLAIN output, as evidence for index and rewrite
+decisions. gta_mnt_db_stats summarises the aggregates.
+
+The calling method is taken from `current_method`, set by the client's
+@_pooled wrapper (and the async plan wrapper), so statements run by
+internal helpers are attributed to the public method that issued them.
+
+Configured from the environment:
+
+- GTA_SQL_PROFILE: "1"/"true" to enable profiling (default off)
+- GTA_SQL_SLOW_MS: statements at or above this wall time (ms) go to the
+  slow-query log (default 500)
+- GTA_SQL_EXPLAIN: "1"/"true" to run EXPLAIN for slow SELECTs (default off;
+  costs one extra round trip per slow statement)
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pymysql.cursors
+
+
+DEFAULT_SLOW_MS = 500.0
+SLOW_LOG_NAME = "_slow-queries.jsonl"
+# Longest parameter repr kept in the slow-query log
+MAX_PARAMS_CHARS = 500
+
+# Public client method currently running in this context ('' outside one)
+current_method: contextvars.ContextVar[str] = contextvars.ContextVar('gta_mnt_sql_method', default='')
+
+_WHITESPACE = re.compile(r'\s+')
+_PLACEHOLDER_LIST = re.compile(r'\(\s*%s(?:\s*,\s*%s)+\s*\)')
+_ROW_LIST = re.compile(r'(\(%s(?:, \.\.\.)?\))(?:\s*,\s*\1)+')
+_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\b\d+\b")
+
+# (method, statement shape)
+StatKey = Tuple[str, str]
+
+
+def _enabled(name: str, default: str = "0") -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def fingerprint(sql: str) -> str:
+    """Statement shape: whitespace collapsed, literals and IN/VALUES lists folded.
+
+    Statements that differ only in their parameters, or in the length of a
+    placeholder list, share a fingerprint.
+    """
+    shape = _WHITESPACE.sub(' ', sql).strip()
+    shape = _LITERAL.sub('?', shape)
+    shape = _PLACEHOLDER_LIST.sub('(%s, ...)', shape)
+    return _ROW_LIST.sub(r'\1, ...', shape)
+
+
+def is_explainable(sql: str) -> bool:
+    """Whether EXPLAIN can be run for `sql` without side effects (reads only)."""
+    words = sql.split(None, 1)
+    return bool(words) and words[0].upper() in ('SELECT', 'WITH')
+
+
+class SQLProfiler:
+    """Thread-safe aggregate of statement timings, plus the slow-query log."""
+
+    def __init__(self, log_path: str, slow_ms: float = DEFAULT_SLOW_MS, explain: bool = False):
+        self.log_path = Path(log_path)
+        self.slow_ms = slow_ms
+        self.explain = explain
+        self._lock = threading.Lock()
+        self._stats: Dict[StatKey, Dict[str, float]] = {}
+        self.started_at = time.time()
+        self.counters = {"executed": 0, "slow": 0, "explain_failures": 0}
+
+    @classmethod
+    def from_env(cls, storage_path: str) -> Optional["SQLProfiler"]:
+        """Build a profiler from GTA_SQL_* variables, or None when profiling is off."""
+        if not _enabled("GTA_SQL_PROFILE"):
+            return None
+        return cls(
+            log_path=str(Path(storage_path) / SLOW_LOG_NAME),
+            slow_ms=float(os.getenv("GTA_SQL_SLOW_MS", str(DEFAULT_SLOW_MS))),
+            explain=_enabled("GTA_SQL_EXPLAIN"),
+        )
+
+    def record(self, sql: str, elapsed_ms: float, rows: int) -> bool:
+        """Add one execution to the aggregates; True if it was slow."""
+        key = (current_method.get() or '(unattributed)', fingerprint(sql))
+        slow = elapsed_ms >= self.slow_ms
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "slow": 0}
+            entry["calls"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["rows"] += max(rows, 0)
+            entry["slow"] += slow
+            self.counters["executed"] += 1
+            self.counters["slow"] += slow
+        return slow
+
+    def log_slow(
+        self,
+        sql: str,
+        params: Any,
+        elapsed_ms: float,
+        rows: int,
+        plan: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """Append a slow statement to the JSONL log."""
+        entry = {
+            "at": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            "method": current_method.get() or None,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "rows": rows,
+            "fingerprint": fingerprint(sql),
+            "sql": _WHITESPACE.sub(' ', sql).strip(),
+            "params": repr(params)[:MAX_PARAMS_CHARS] if params is not None else None,
+        }
+        if plan is not None:
+            entry["explain"] = plan
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+    async def observe_async(self, conn: Any, sql: str, params: Any, elapsed_ms: float, rows: int) -> None:
+        """record() a statement run on an async connection, logging (and explaining) it if slow."""
+        if not self.record(sql, elapsed_ms, rows):
+            return
+        plan = None
+        if self.explain and is_explainable(sql):
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute('EXPLAIN ' + sql, params)
+                    plan = list(await cursor.fetchall())
+            except Exception:
+                self.counters["explain_failures"] += 1
+        await asyncio.to_thread(self.log_slow, sql, params, elapsed_ms, rows, plan)
+
+    def summary(self, top: int = 20, method: Optional[str] = None) -> Dict[str, Any]:
+        """Statement shapes by total time, per-method totals and counters."""
+        with self._lock:
+            items = [(k, dict(v)) for k, v in self._stats.items() if method is None or k[0] == method]
+            counters = dict(self.counters)
+
+        methods: Dict[str, Dict[str, float]] = {}
+        for (name, _), entry in items:
+            totals = methods.setdefault(name, {"statements": 0, "total_ms": 0.0, "rows": 0})
+            totals["statements"] += entry["calls"]
+            totals["total_ms"] += entry["total_ms"]
+            totals["rows"] += entry["rows"]
+
+        items.sort(key=lambda item: item[1]["total_ms"], reverse=True)
+        statements = [
+            {
+                "method": name,
+                "fingerprint": shape,
+                **entry,
+                "avg_ms": entry["total_ms"] / entry["calls"],
+            }
+            for (name, shape), entry in items[:top]
+        ]
+        return {
+            "since": time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started_at)),
+            "slow_ms": self.slow_ms,
+            "explain": self.explain,
+            "slow_log": str(self.log_path),
+            **counters,
+            "methods": dict(sorted(methods.items(), key=lambda m: m[1]["total_ms"], reverse=True)),
+            "statements": statements,
+        }
+
+    def reset(self) -> None:
+        """Drop the aggregates (the slow-query log is kept)."""
+        with self._lock:
+            self._stats.clear()
+            self.counters = dict.fromkeys(self.counters, 0)
+            self.started_at = time.time()
+
+
+def profiled_cursor_class(profiler: SQLProfiler, base: type = pymysql.cursors.DictCursor) -> type:
+    """A pymysql cursor class that reports every statement to `profiler`.
+
+    With an unbuffered base (SSCursor / SSDictCursor) execute() returns once
+    the first rows arrive, so the recorded time is the time to first row and
+    the row count is unknown. Slow statements are logged without EXPLAIN:
+    the connection cannot run another statement until the stream is read.
+    """
+    unbuffered = issubclass(base, pymysql.cursors.SSCursor)
+
+    class ProfiledCursor(base):
+        _in_many = False
+
+        def execute(self, query: str, args: Any = None) -> int:
+            if self._in_many:
+                return super().execute(query, args)
+            started = time.perf_counter()
+            try:
+                return super().execute(query, args)
+            finally:
+                self._profile(query, args, started)
+
+        def executemany(self, query: str, args: Sequence[Any]) -> Optional[int]:
+            # Profiled as one statement, whether pymysql batches the rows
+            # into one INSERT or executes them one by one
+            started = time.perf_counter()
+            self._in_many = True
+            try:
+                return super().executemany(query, args)
+            finally:
+                self._in_many = False
+                self._profile(query, None, started)
+
+        def _profile(self, query: str, args: Any, started: float) -> None:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            rows = self.rowcount if self.rowcount is not None and not unbuffered else -1
+            if profiler.record(query, elapsed_ms, rows):
+                explain = profiler.explain and not unbuffered and is_explainable(query)
+                plan = self._explain(query, args) if explain else None
+                profiler.log_slow(query, args, elapsed_ms, rows, plan)
+
+        def _explain(self, query: str, args: Any) -> Optional[List[Dict[str, Any]]]:
+            # A separate plain cursor, so this one keeps its result rows
+            try:
+                with self.connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                    cursor.execute('EXPLAIN ' + query, args)
+                    return list(cursor.fetchall())
+            except Exception:
+                profiler.counters["explain_failures"] += 1
+                return None
+
+    return ProfiledCursor
@@ -1,23 +1,96 @@
 """Review artifact storage for gta_mnt server.
 
-Stores source files, comments, and review logs for each reviewed StateAct.
+Stores source files, comments, and review logs for each reviewed StateAct,
+plus a content-addressed cache of fetched sources shared by all of them.
 """
 
+import hashlib
+import json
 import os
+import shutil
+import tempfile
+import threading
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
 from .constants import REVIEW_STORAGE_PATH
 
 
+# Cache folder under the storage root (never a StateAct id)
+SOURCE_CACHE_DIR = "_source-cache"
+# Queue exports (list_step1_queue streamed to JSONL / CSV)
+EXPORTS_DIR = "_exports"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename, so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class BlobWriter:
+    """Streams source bytes into the cache, hashing as it goes.
+
+    Obtained from ReviewStorage.blob_writer(). Chunks go to a temp file next
+    to the blobs; commit() moves it to its content address, discard() drops it.
+    """
+
+    def __init__(self, storage: "ReviewStorage"):
+        self._storage = storage
+        self._hash = hashlib.sha256()
+        blobs = storage.cache_path / "blobs"
+        blobs.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(dir=blobs, prefix=".incoming.")
+        self._file = os.fdopen(fd, 'wb')
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self) -> str:
+        """Finish the blob; returns its SHA-256 digest."""
+        self._file.close()
+        digest = self._hash.hexdigest()
+        path = self._storage.blob_path(digest)
+        if path.exists():
+            Path(self._tmp).unlink(missing_ok=True)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp, path)
+        return digest
+
+    def discard(self) -> None:
+        self._file.close()
+        Path(self._tmp).unlink(missing_ok=True)
+
+
 class ReviewStorage:
     """Manages persistent storage of review artifacts.
 
     Each StateAct gets a dedicated folder containing:
-    - source.{pdf|html|txt} - Downloaded source file
+    - source.{pdf|html|txt} - Downloaded primary source file (index 0)
+    - source-<sha256[:12]>.{ext} - Any further linked source
+    - sources.json - Manifest of saved sources: index -> file, URL, SHA-256
     - comments.md - All review comments
     - review-log.md - Review activity log
+
+    The source cache (`_source-cache/`) holds:
+    - blobs/ - raw source bytes keyed by SHA-256
+    - text/ - extracted text keyed by (SHA-256, extractor version)
+    - sources/ - per source URL: current digest plus ETag/Last-Modified
+      validators for conditional re-fetching
+
+    Queue exports go to `_exports/`.
     """
 
     def __init__(self, base_path: str = REVIEW_STORAGE_PATH):
@@ -27,6 +100,8 @@ class ReviewStorage:
             base_path: Root directory for review artifacts
         """
         self.base_path = Path(base_path)
+        # Sources of one StateAct may be saved concurrently (fetch_all)
+        self._manifest_lock = threading.Lock()
 
     def get_review_path(self, state_act_id: int) -> Path:
         """Get path to review folder for a StateAct.
@@ -44,17 +119,23 @@ class ReviewStorage:
     def save_source(
         self,
         state_act_id: int,
-        content: bytes,
+        content: Union[bytes, Path],
         content_type: str,
-        source_url: str
+        source_url: str,
+        source_index: int = 0
     ) -> Path:
         """Save source file to review folder.
 
+        The primary source keeps the fixed `source.{ext}` name; others are
+        named by content, so saving source 1 never overwrites source 0.
+
         Args:
             state_act_id: StateAct ID
-            content: File content as bytes
+            content: File content as bytes, or a cached blob (copied, never
+                loaded into memory)
             content_type: File type (pdf, html, txt)
             source_url: Original source URL
+            source_index: Position of the source among the StateAct's sources
 
         Returns:
             Path to saved file
@@ -69,17 +150,103 @@ class ReviewStorage:
         }
         ext = ext_map.get(content_type, "txt")
 
-        file_path = review_path / f"source.{ext}"
+        if isinstance(content, Path):
+            digest = self.digest_file(content)
+        else:
+            digest = self.digest(content)
+        if source_index == 0:
+            file_path = review_path / f"source.{ext}"
+        else:
+            file_path = review_path / f"source-{digest[:12]}.{ext}"
 
         # Write binary content
-        file_path.write_bytes(content)
+        if isinstance(content, Path):
+            shutil.copyfile(content, file_path)
+        else:
+            file_path.write_bytes(content)
 
         # Also save source URL for reference
-        meta_path = review_path / "source-url.txt"
-        meta_path.write_text(source_url)
+        if source_index == 0:
+            meta_path = review_path / "source-url.txt"
+            meta_path.write_text(source_url)
+
+        with self._manifest_lock:
+            manifest_path = review_path / "sources.json"
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except (FileNotFoundError, ValueError):
+                manifest = {}
+            manifest[str(source_index)] = {'file': file_path.name, 'url': source_url, 'sha256': digest}
+            _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode())
 
         return file_path
 
+    @property
+    def cache_path(self) -> Path:
+        return self.base_path / SOURCE_CACHE_DIR
+
+    def export_path(self, name: str) -> Path:
+        """Path for a new export file called `name` (folder created)."""
+        path = self.base_path / EXPORTS_DIR / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        """SHA-256 hex digest identifying source bytes in the cache."""
+        return hashlib.sha256(content).hexdigest()
+
+    def digest_file(self, path: Path) -> str:
+        """SHA-256 of a file; free for cached blobs, which are named by it."""
+        if path.parent.parent == self.cache_path / "blobs":
+            return path.name
+        h = hashlib.sha256()
+        with path.open('rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def blob_path(self, digest: str) -> Path:
+        return self.cache_path / "blobs" / digest[:2] / digest
+
+    def _text_path(self, digest: str, version: str) -> Path:
+        return self.cache_path / "text" / digest[:2] / f"{digest}.{version}.json"
+
+    def _source_meta_path(self, source_url: str) -> Path:
+        return self.cache_path / "sources" / f"{self.digest(source_url.encode())}.json"
+
+    def blob_writer(self) -> BlobWriter:
+        """Start streaming a source into the cache (see BlobWriter)."""
+        return BlobWriter(self)
+
+    def put_text(self, digest: str, version: str, extraction: Dict[str, Any]) -> None:
+        """Cache an extraction result for the source bytes with `digest`.
+
+        Args:
+            digest: SHA-256 of the source bytes
+            version: Extractor version (anything that changes the output)
+            extraction: Extraction result (JSON-serialisable)
+        """
+        _write_atomic(self._text_path(digest, version), json.dumps(extraction).encode())
+
+    def get_text(self, digest: str, version: str) -> Optional[Dict[str, Any]]:
+        """Get a cached extraction result, or None if not cached."""
+        try:
+            return json.loads(self._text_path(digest, version).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put_source_meta(self, source_url: str, meta: Dict[str, Any]) -> None:
+        """Record what `source_url` last resolved to (digest, validators, check time)."""
+        _write_atomic(self._source_meta_path(source_url), json.dumps({'url': source_url, **meta}).encode())
+
+    def get_source_meta(self, source_url: str) -> Optional[Dict[str, Any]]:
+        """Get the cache record for `source_url`, or None if never fetched."""
+        try:
+            return json.loads(self._source_meta_path(source_url).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
     def save_comment(
         self,
         state_act_id: int,
@@ -0,0 +1,190 @@
+"""Tests for the bulk entry-creation methods (add_*_bulk).
+
+Uses a fake connection that answers the set-based FK queries from fixed
+master lists and records every executemany() — no live DB needed.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from gta_mnt.api import GTADatabaseClient
+from gta_mnt.server import AddProductLevelsBulkInput, AddProductsBulkInput
+from gta_mnt.storage import ReviewStorage
+
+
+PRODUCTS = {10, 11}
+SECTORS = {211}
+JURISDICTIONS = {276, 840}
+LEVEL8 = {(1021020, 840), (72081000, 840)}
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((sql, params))
+        if 'FROM api_intervention_log' in sql:
+            self.rows = [{'intervention_id': params[0]}] if params[0] == 1 else []
+        elif 'FROM api_product_list' in sql:
+            self.rows = [{'product_id': p} for p in params if p in PRODUCTS]
+        elif 'FROM api_sector_list' in sql:
+            self.rows = [{'sector_id': p} for p in params if p in SECTORS]
+        elif 'FROM api_jurisdiction_list' in sql:
+            self.rows = [{'jurisdiction_id': p} for p in params if p in JURISDICTIONS]
+        elif 'FROM api_product_level8_list' in sql:
+            pairs = list(zip(params[::2], params[1::2]))
+            self.rows = [{'hs': hs, 'jurisdiction_id': j} for hs, j in pairs if (hs, j) in LEVEL8]
+        else:
+            self.rows = []
+
+    def executemany(self, sql, params):
+        if self.conn.insert_error:
+            raise self.conn.insert_error
+        self.conn.inserted.append((sql, list(params)))
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    open = True
+
+    def __init__(self):
+        self.executed = []
+        self.inserted = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.insert_error = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection()
+
+
+@pytest.fixture
+def client(tmp_path, conn, monkeypatch):
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client._pool, '_connect', lambda: conn)
+    return client
+
+
+class TestBulkProducts:
+    def test_valid_rows_inserted_in_one_transaction(self, client, conn):
+        result = client.add_products_bulk(1, [
+            {'product_id': 10},
+            {'product_id': 11, 'new_level': '25.0'},
+            {'product_id': 10, 'is_investigated_only': True},
+        ])
+        assert result['success'] and result['inserted'] == 3
+        # Rows with the same column list share one executemany
+        assert len(conn.inserted) == 2
+        assert conn.inserted[0][1] == [(1, 10, 0, 1, 0, 'N'), (1, 10, 0, 1, 1, 'N')]
+        assert conn.commits == 1
+        # One intervention check + one set-based FK query
+        assert len(conn.executed) == 2
+        assert conn.executed[1][1] == (10, 11)
+
+    def test_unknown_fk_reported_and_skipped(self, client, conn):
+        result = client.add_products_bulk(1, [{'product_id': 10}, {'product_id': 99}])
+        assert not result['success']
+        assert (result['inserted'], result['invalid']) == (1, 1)
+        assert result['results'][1] == {
+            'index': 1, 'status': 'invalid', 'key': 99, 'error': 'Product 99 not found',
+        }
+
+    def test_bad_row_rejected_locally(self, client, conn):
+        result = client.add_products_bulk(1, [{'product_id': 10}, {'productid': 11}])
+        assert result['results'][1]['status'] == 'invalid'
+        assert result['inserted'] == 1
+
+    def test_insert_error_rolls_back_batch(self, client, conn):
+        conn.insert_error = RuntimeError('deadlock')
+        result = client.add_products_bulk(1, [{'product_id': 10}, {'product_id': 11}])
+        assert result['failed'] == 2 and result['inserted'] == 0
+        assert conn.rollbacks >= 1 and conn.commits == 0
+
+    def test_missing_intervention(self, client, conn):
+        result = client.add_products_bulk(2, [{'product_id': 10}])
+        assert result == {'success': False, 'error': 'Intervention 2 not found'}
+        assert conn.inserted == []
+
+
+class TestBulkProductLevels:
+    def test_pairs_checked_in_one_query(self, client, conn):
+        result = client.add_product_levels_bulk(1, [
+            {'level': 8, 'hs_code': '0102.10.20', 'jurisdiction_id': 840, 'action_id': 1},
+            {'level': 8, 'hs_code': '7208.10.00', 'jurisdiction_id': 840, 'action_id': 1},
+            {'level': 8, 'hs_code': '7208.10.00', 'jurisdiction_id': 276, 'action_id': 1},
+        ])
+        assert (result['inserted'], result['invalid']) == (2, 1)
+        pair_queries = [q for q in conn.executed if 'api_product_level8_list' in q[0]]
+        assert len(pair_queries) == 1
+        assert '(product_level8_id, jurisdiction_id) IN ((%s, %s), (%s, %s), (%s, %s))' in pair_queries[0][0]
+        assert result['results'][0]['master_id'] == 1021020840
+        assert 'for jurisdiction 276' in result['results'][2]['error']
+
+    def test_local_validation_matches_single_add(self, client, conn):
+        result = client.add_product_levels_bulk(1, [
+            {'level': 8, 'hs_code': '0102.10', 'jurisdiction_id': 840, 'action_id': 1},
+            {'level': 8, 'hs_code': '01021020', 'jurisdiction_id': 840},
+        ], dry_run=True)
+        assert 'expected exactly 8 digits' in result['results'][0]['error']
+        assert 'action_id is required' in result['results'][1]['error']
+        assert result['statements'] == []
+
+
+class TestBulkSectorsAndIJs:
+    def test_sectors(self, client, conn):
+        result = client.add_sectors_bulk(1, [{'sector_id': 211, 'sector_type': 'A'}, {'sector_id': 5}])
+        assert conn.inserted[0][1] == [(1, 211, 'A', 0)]
+        assert result['results'][1]['error'] == 'Sector 5 not found'
+
+    def test_ijs(self, client, conn):
+        result = client.add_ijs_bulk(1, [276, 840])
+        assert result['success'] and result['inserted'] == 2
+        assert conn.inserted == [(
+            'INSERT INTO api_intervention_ij (intervention_id, jurisdiction_id) VALUES (%s, %s)',
+            [(1, 276), (1, 840)],
+        )]
+
+
+class TestBulkDryRun:
+    def test_dry_run_never_connects(self, client, monkeypatch):
+        monkeypatch.setattr(client._pool, '_connect', lambda: pytest.fail('dry run connected'))
+        result = client.add_products_bulk(1, [{'product_id': 10}, {'product_id': 11}], dry_run=True)
+        assert result['dry_run'] is True
+        assert [r['status'] for r in result['results']] == ['dry_run', 'dry_run']
+        assert result['statements'][0]['params'] == [
+            ['1', '10', '0', '1', '0', 'N'], ['1', '11', '0', '1', '0', 'N'],
+        ]
+
+
+class TestBulkInputs:
+    def test_rows_are_strict(self):
+        with pytest.raises(ValidationError):
+            AddProductsBulkInput(intervention_id=1, products=[{'product_id': 10, 'intervention_id': 1}])
+
+    def test_empty_batch_rejected(self):
+        with pytest.raises(ValidationError):
+            AddProductLevelsBulkInput(intervention_id=1, lines=[])
@@ -0,0 +1,448 @@
+"""Tests for query plans and the asyncio MySQL backend.
+
+Uses a recorded-query fake: statements are answered by a responder keyed on
+SQL fragments and every execute is recorded — no live DB or aiomysql needed.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+
+import pymysql
+import pytest
+
+from gta_mnt import db_async
+from gta_mnt.api import AsyncGTADatabaseClient, GTADatabaseClient
+from gta_mnt.db_async import AsyncConnectionPool, aiomysql_connector
+from gta_mnt.db_pool import PoolTimeout
+from gta_mnt.query_plan import Query, run_batch_threaded, run_plan, run_plan_async
+from gta_mnt.storage import ReviewStorage
+
+
+def respond(sql, params):
+    """Canned answers for a small measure with two interventions."""
+    if 'FROM gta_measure m' in sql:
+        raise pymysql.err.ProgrammingError(1146, "Table 'gta_measure' doesn't exist")
+    if 'FROM api_state_act_log sa' in sql and 'api_state_act_status_list' in sql:
+        return [{
+            'id': 7, 'title': 'Decree 12/2026', 'description': 'Tariff increase',
+            'source': None, 'source_markdown': 'See https://gov.example/decree-12',
+            'status_id': 2,
+        }]
+    if 'i.intervention_id as id' in sql:
+        return [
+            {'id': 1, 'legacy_description': 'old text'},
+            {'id': 2, 'legacy_description': 'legacy only'},
+        ]
+    if 'FROM api_intervention_description_log' in sql:
+        return [{'intervention_id': 1, 'id': 10, 'description': 'New text', 'description_markdown': '**New**'}]
+    if 'FROM api_intervention_description_date_log' in sql:
+        return [{'intervention_id': 1, 'description_id': 10, 'date': '2026-01-01'}]
+    if 'FROM api_intervention_aj' in sql:
+        return [{'intervention_id': i, 'jurisdiction_id': 840, 'iso_code': 'USA'} for i in params]
+    if 'FROM api_intervention_dm' in sql:
+        raise pymysql.err.ProgrammingError(1146, "Table 'api_intervention_dm' doesn't exist")
+    if 'FROM api_acting_agency_log' in sql:
+        return [
+            {'intervention_id': i, 'agency_id': 3, 'agency_name': 'Customs', 'agency_name_original': 'Aduana'}
+            for i in params
+        ]
+    if 'FROM api_intervention_product_level8 ' in sql:
+        return [{'intervention_id': 1, 'composite_id': '01012100840'}]
+    if 'FROM api_intervention_theme' in sql:
+        return [{'intervention_id': 1, 'theme_id': 5}, {'intervention_id': 2, 'theme_id': 9}]
+    if 'COUNT(DISTINCT sa.state_act_id)' in sql:
+        return [{'count': 42}]
+    if 'FROM api_state_act_log sa' in sql and 'sl.status_time' in sql:
+        return [{'id': 7, 'title': 'Decree 12/2026'}]
+    return []
+
+
+class RecordedDB:
+    def __init__(self, responder=respond, delay=0.0):
+        self.responder = responder
+        self.delay = delay
+        self.executed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections = []
+
+
+class SyncCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        self.db.executed.append((sql, params))
+        self.rows = self.db.responder(sql, params)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class SyncConnection:
+    open = True
+
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return SyncCursor(self.db)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+class AsyncCursor(SyncCursor):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        self.db.in_flight += 1
+        self.db.max_in_flight = max(self.db.max_in_flight, self.db.in_flight)
+        try:
+            await asyncio.sleep(self.db.delay)
+            SyncCursor.execute(self, sql, params)
+        finally:
+            self.db.in_flight -= 1
+
+    async def fetchall(self):
+        return SyncCursor.fetchall(self)
+
+    async def fetchone(self):
+        return SyncCursor.fetchone(self)
+
+
+class AsyncConnection:
+    def __init__(self, db):
+        self.db = db
+        self.closed = False
+        self.pings = 0
+
+    def cursor(self):
+        return AsyncCursor(self.db)
+
+    async def ping(self, reconnect=False):
+        self.pings += 1
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def async_connect(db):
+    async def connect():
+        conn = AsyncConnection(db)
+        db.connections.append(conn)
+        return conn
+    return connect
+
+
+@pytest.fixture
+def db():
+    return RecordedDB()
+
+
+@pytest.fixture
+def sync_client(tmp_path, db, monkeypatch):
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client._pool, '_connect', lambda: SyncConnection(db))
+    return client
+
+
+@pytest.fixture
+def async_client(tmp_path, db):
+    return AsyncGTADatabaseClient(
+        storage=ReviewStorage(base_path=str(tmp_path)),
+        connect=async_connect(db),
+    )
+
+
+def _plan():
+    row = yield Query('SELECT one', one=True)
+    try:
+        yield Query('SELECT broken')
+    except RuntimeError as e:
+        row['error'] = str(e)
+    row['batch'] = yield (Query('SELECT a'), Query('SELECT broken'))
+    return row
+
+
+def _plan_responder(sql, params):
+    if 'broken' in sql:
+        raise RuntimeError('boom')
+    return [{'sql': sql}]
+
+
+class TestRunPlan:
+    def test_sync_runner(self):
+        db = RecordedDB(_plan_responder)
+        result = run_plan(_plan(), lambda: SyncCursor(db))
+        assert result['sql'] == 'SELECT one'
+        assert result['error'] == 'boom'
+        assert result['batch'][0] == [{'sql': 'SELECT a'}]
+        assert isinstance(result['batch'][1], RuntimeError)
+
+    async def test_async_runner_matches_sync(self):
+        db = RecordedDB(_plan_responder)
+        pool = AsyncConnectionPool(async_connect(db))
+        result = await run_plan_async(_plan(), pool)
+        assert result['error'] == 'boom'
+        assert result['batch'][0] == [{'sql': 'SELECT a'}]
+        assert isinstance(result['batch'][1], RuntimeError)
+        assert pool.snapshot()['in_use'] == 0
+
+    def test_cursor_created_lazily(self):
+        def early_return():
+            return {}
+            yield  # pragma: no cover
+
+        def no_cursor():
+            raise AssertionError('cursor requested')
+
+        assert run_plan(early_return(), no_cursor) == {}
+
+    def test_uncaught_error_propagates(self):
+        def plan():
+            yield Query('SELECT broken')
+
+        with pytest.raises(RuntimeError):
+            run_plan(plan(), lambda: SyncCursor(RecordedDB(_plan_responder)))
+
+
+    def test_timings_recorded_per_label(self):
+        timings = {}
+
+        def plan():
+            yield (
+                Query('SELECT a', label='A', timings=timings),
+                Query('SELECT b', label='B', timings=timings),
+                Query('SELECT b', label='B', timings=timings),
+            )
+            yield Query('SELECT c')
+            return timings
+
+        result = run_plan(plan(), lambda: SyncCursor(RecordedDB(_plan_responder)))
+        assert set(result) == {'A', 'B'}
+        assert all(ms >= 0 for ms in result.values())
+
+
+class TestThreadedBatch:
+    def test_leased_statements_run_on_worker_threads(self):
+        db = RecordedDB(_plan_responder)
+        threads = {}
+
+        class ThreadCursor(SyncCursor):
+            def execute(self, sql, params=None):
+                threads[sql] = threading.get_ident()
+                super().execute(sql, params)
+
+        @contextmanager
+        def lease():
+            yield ThreadCursor(db)
+
+        batch = [Query('SELECT a'), Query('SELECT b'), Query('SELECT broken')]
+        results = run_batch_threaded(batch, ThreadCursor(db), lease)
+        assert results[:2] == [[{'sql': 'SELECT a'}], [{'sql': 'SELECT b'}]]
+        assert isinstance(results[2], RuntimeError)
+        assert threads['SELECT a'] == threading.get_ident()
+        assert threads['SELECT b'] != threading.get_ident()
+
+    def test_no_free_connection_falls_back_to_main_cursor(self):
+        db = RecordedDB(_plan_responder)
+
+        @contextmanager
+        def lease():
+            yield None
+
+        results = run_batch_threaded([Query('SELECT a'), Query('SELECT b')], SyncCursor(db), lease)
+        assert results == [[{'sql': 'SELECT a'}], [{'sql': 'SELECT b'}]]
+        assert len(db.executed) == 2
+
+
+class TestAsyncConnectionPool:
+    async def test_reuses_released_connection(self, db):
+        pool = AsyncConnectionPool(async_connect(db), max_size=2)
+        first = await pool.acquire()
+        pool.release(first)
+        assert await pool.acquire() is first
+        assert len(db.connections) == 1
+
+    async def test_bounded_and_times_out(self, db):
+        pool = AsyncConnectionPool(async_connect(db), max_size=1, wait_timeout=0.02)
+        await pool.acquire()
+        with pytest.raises(PoolTimeout):
+            await pool.acquire()
+        assert pool.stats['timeouts'] == 1
+        assert pool.stats['waits'] == 1
+
+    async def test_waiter_gets_released_connection(self, db):
+        pool = AsyncConnectionPool(async_connect(db), max_size=1, wait_timeout=1)
+        conn = await pool.acquire()
+        waiter = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0.01)
+        pool.release(conn)
+        assert await waiter is conn
+
+    async def test_idle_connection_pinged(self, db):
+        pool = AsyncConnectionPool(async_connect(db), ping_interval=0)
+        conn = await pool.acquire()
+        pool.release(conn)
+        await pool.acquire()
+        assert conn.pings == 1
+
+    async def test_max_lifetime_recycles(self, db):
+        pool = AsyncConnectionPool(async_connect(db), max_lifetime=0)
+        conn = await pool.acquire()
+        pool.release(conn)
+        assert conn.closed
+        assert await pool.acquire() is not conn
+        assert pool.stats['recycled'] == 1
+
+    async def test_failed_connect_frees_slot(self):
+        async def broken():
+            raise pymysql.err.OperationalError(2003, "can't connect")
+
+        pool = AsyncConnectionPool(broken, max_size=1, wait_timeout=0.02)
+        for _ in range(2):
+            with pytest.raises(pymysql.err.OperationalError):
+                await pool.acquire()
+        assert pool.size == 0
+
+    async def test_close(self, db):
+        pool = AsyncConnectionPool(async_connect(db))
+        conn = await pool.acquire()
+        pool.release(conn)
+        pool.close()
+        assert conn.closed
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+
+
+class TestAsyncClient:
+    async def test_get_measure_matches_sync_backend(self, sync_client, async_client):
+        expected = sync_client.get_measure(7)
+        assert await async_client.get_measure(7) == expected
+
+        first, second = expected['interventions']
+        assert first['description'] == 'New text'
+        assert first['description_rows'][0]['dates'] == [{'description_id': 10, 'date': '2026-01-01'}]
+        assert first['distorted_markets'] == []
+        assert first['firms'][-1]['role_name'] == 'acting agency (legacy)'
+        assert first['products_level8'][0]['hs_code'] == '01012100'
+        assert first['themes'] == [5]
+        assert second['description'] == 'legacy only'
+        assert second['themes'] == [9]
+        assert second['products_level8'] == []
+        assert 'intervention_id' not in first['affected_jurisdictions'][0]
+
+    async def test_child_tables_loaded_once_per_measure(self, sync_client, db):
+        sync_client.get_measure(7)
+        child = [p for sql, p in db.executed if 'SELECT intervention_id, theme_id' in sql]
+        assert child == [(1, 2)]
+        # 2 interventions, 18 child tables -> 18 set-based reads instead of 36
+        assert sum('IN (%s,%s)' in sql for sql, _ in db.executed) == 18
+
+    async def test_intervention_children_run_concurrently(self, db, async_client):
+        db.delay = 0.005
+        await async_client.get_measure(7)
+        assert db.max_in_flight > 1
+        assert async_client.pool_stats()['in_use'] == 0
+
+    async def test_queue_page_and_count(self, async_client, db):
+        data = await async_client.list_step1_queue(status_id=2, limit=10)
+        assert data == {'results': [{'id': 7, 'title': 'Decree 12/2026'}], 'count': 42, 'next_cursor': None}
+        # page + count watermark, then the count itself
+        assert len(db.executed) == 3
+
+    async def test_required_query_failure_raises(self, tmp_path):
+        def responder(sql, params):
+            raise pymysql.err.OperationalError(2013, 'Lost connection')
+
+        client = AsyncGTADatabaseClient(
+            storage=ReviewStorage(base_path=str(tmp_path)),
+            connect=async_connect(RecordedDB(responder)),
+        )
+        with pytest.raises(pymysql.err.OperationalError):
+            await client.list_step1_queue()
+
+    async def test_lookup_validates_without_query(self, async_client, db):
+        result = await async_client.lookup('nope', 'steel')
+        assert 'error' in result
+        assert db.executed == []
+
+    async def test_indexed_lookup_runs_off_the_loop(self, async_client, monkeypatch):
+        threads = []
+
+        def lookup(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return {'results': []}
+
+        monkeypatch.setattr(async_client._sync, 'lookup', lookup)
+        await async_client.lookup('firm', 'steel')
+        assert threads and threads[0] != threading.get_ident()
+
+    async def test_indexed_find_duplicates_runs_off_the_loop(self, async_client, monkeypatch):
+        threads = []
+
+        def find_duplicates(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return {'candidates': []}
+
+        monkeypatch.setattr(async_client._sync, 'find_duplicates', find_duplicates)
+        await async_client.find_duplicates(state_act_id=7)
+        assert threads and threads[0] != threading.get_ident()
+
+    async def test_unindexed_lookup_runs_natively(self, async_client, db):
+        async_client._sync._lookup_index = None
+        await async_client.lookup('jurisdiction', 'ghana', limit=5)
+        assert db.executed == [(
+            'SELECT * FROM api_jurisdiction_list WHERE jurisdiction_name LIKE %s LIMIT %s',
+            ('%ghana%', 5),
+        )]
+
+    async def test_writes_delegate_to_pymysql_client(self, async_client, monkeypatch):
+        calls = []
+
+        def add_comment(**kwargs):
+            calls.append(kwargs)
+            return {'success': True}
+
+        monkeypatch.setattr(async_client._sync, 'add_comment', add_comment)
+        assert await async_client.add_comment(state_act_id=7, comment_text='x') == {'success': True}
+        assert calls == [{'state_act_id': 7, 'comment_text': 'x'}]
+
+    @pytest.mark.skipif(db_async.aiomysql is not None, reason='aiomysql installed')
+    def test_missing_driver_raises(self):
+        with pytest.raises(RuntimeError, match='aiomysql'):
+            aiomysql_connector(host='localhost')
+
+
+class TestServerDispatch:
+    async def test_run_db_handles_both_backends(self, sync_client, async_client):
+        from gta_mnt.server import run_db
+
+        sync_result = await run_db(sync_client.list_step1_queue, status_id=2)
+        async_result = await run_db(async_client.list_step1_queue, status_id=2)
+        assert sync_result == async_result
+
+    def test_unknown_backend_rejected(self, monkeypatch):
+        from gta_mnt import server
+
+        monkeypatch.setattr(server, '_db_client', None)
+        monkeypatch.setenv('GTA_DB_BACKEND', 'sqlite')
+        with pytest.raises(ValueError, match='GTA_DB_BACKEND'):
+            server.get_db_client()
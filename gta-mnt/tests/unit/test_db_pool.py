@@ -0,0 +1,225 @@
+"""Tests for the pymysql connection pool and GTADatabaseClient's per-call checkout.
+
+Uses a fake connection object — no live DB needed.
+"""
+
+import threading
+import time
+
+import pymysql
+import pytest
+
+from gta_mnt.api import GTADatabaseClient
+from gta_mnt.db_pool import ConnectionPool, PoolTimeout
+from gta_mnt.storage import ReviewStorage
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return {'title': 'T', 'count': 0}
+
+
+class FakeConnection:
+    _ids = 0
+
+    def __init__(self):
+        FakeConnection._ids += 1
+        self.id = FakeConnection._ids
+        self.open = True
+        self.rollbacks = 0
+        self.pings = 0
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        self.open = True
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+@pytest.fixture
+def made():
+    return []
+
+
+@pytest.fixture
+def connect(made):
+    def _connect():
+        conn = FakeConnection()
+        made.append(conn)
+        return conn
+    return _connect
+
+
+class TestConnectionPool:
+    def test_reuses_released_connection(self, connect, made):
+        pool = ConnectionPool(connect, max_size=2)
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        assert len(made) == 1
+
+    def test_release_rolls_back(self, connect):
+        pool = ConnectionPool(connect)
+        conn = pool.acquire()
+        pool.release(conn)
+        assert conn.rollbacks == 1
+
+    def test_bounded_and_times_out(self, connect):
+        pool = ConnectionPool(connect, max_size=1, wait_timeout=0.05)
+        pool.acquire()
+        with pytest.raises(PoolTimeout):
+            pool.acquire()
+        assert pool.stats['timeouts'] == 1
+
+    def test_acquire_without_wait(self, connect):
+        pool = ConnectionPool(connect, max_size=1, wait_timeout=2)
+        held = pool.acquire(wait=False)
+        assert held is not None
+        assert pool.acquire(wait=False) is None
+        assert pool.stats['timeouts'] == 0
+
+    def test_waiter_gets_released_connection(self, connect):
+        pool = ConnectionPool(connect, max_size=1, wait_timeout=2)
+        conn = pool.acquire()
+        got = []
+        waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+        waiter.start()
+        time.sleep(0.05)
+        pool.release(conn)
+        waiter.join(timeout=2)
+        assert got == [conn]
+        assert pool.stats['waits'] >= 1
+
+    def test_idle_connection_pinged(self, connect):
+        pool = ConnectionPool(connect, ping_interval=0)
+        conn = pool.acquire()
+        pool.release(conn)
+        pool.acquire()
+        assert conn.pings == 1
+
+    def test_closed_connection_reconnected_via_ping(self, connect):
+        pool = ConnectionPool(connect, ping_interval=3600)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.open = False  # server dropped it while idle
+        assert pool.acquire() is conn
+        assert conn.open
+
+    def test_max_lifetime_recycles(self, connect, made):
+        pool = ConnectionPool(connect, max_lifetime=0)
+        conn = pool.acquire()
+        pool.release(conn)
+        assert not conn.open
+        assert pool.acquire() is not conn
+        assert len(made) == 2
+        assert pool.stats['recycled'] == 1
+
+    def test_discard_frees_slot(self, connect):
+        pool = ConnectionPool(connect, max_size=1, wait_timeout=0.05)
+        conn = pool.acquire()
+        pool.release(conn, discard=True)
+        assert not conn.open
+        assert pool.size == 0
+        assert pool.acquire() is not conn
+
+    def test_failed_connect_frees_slot(self):
+        def broken():
+            raise pymysql.err.OperationalError(2003, "can't connect")
+        pool = ConnectionPool(broken, max_size=1, wait_timeout=0.05)
+        for _ in range(2):
+            with pytest.raises(pymysql.err.OperationalError):
+                pool.acquire()
+        assert pool.size == 0
+
+    def test_close(self, connect):
+        pool = ConnectionPool(connect)
+        conn = pool.acquire()
+        pool.release(conn)
+        pool.close()
+        assert not conn.open
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+
+@pytest.fixture
+def client(tmp_path, connect, monkeypatch):
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client._pool, '_connect', connect)
+    return client
+
+
+class TestClientCheckout:
+    def test_method_returns_connection_to_pool(self, client):
+        client.list_templates()
+        snap = client.pool_stats()
+        assert snap['in_use'] == 0
+        assert snap['idle'] == 1
+
+    def test_dry_run_never_checks_out(self, client, made):
+        client.add_sector(intervention_id=1, sector_id=722, dry_run=True)
+        assert made == []
+
+    def test_concurrent_calls_get_distinct_connections(self, client, monkeypatch):
+        barrier = threading.Barrier(3)
+        seen = []
+        original = FakeCursor.execute
+
+        def slow_execute(self, query, params=None):
+            original(self, query, params)
+            seen.append(self.conn.id)
+            barrier.wait(timeout=2)
+
+        monkeypatch.setattr(FakeCursor, 'execute', slow_execute)
+        threads = [threading.Thread(target=client.list_templates) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+        assert len(set(seen)) == 3
+        assert client.pool_stats()['idle'] == 3
+
+    def test_connection_context_manager(self, client):
+        with client.connection() as conn:
+            with client.connection() as inner:
+                assert inner is conn
+            assert client.pool_stats()['in_use'] == 1
+        assert client.pool_stats()['in_use'] == 0
+
+    def test_get_connection_requires_scope(self, client):
+        with pytest.raises(RuntimeError):
+            client._get_connection()
+
+    def test_driver_error_discards_connection(self, client, made):
+        with pytest.raises(pymysql.err.OperationalError):
+            with client.connection():
+                raise pymysql.err.OperationalError(2013, 'Lost connection')
+        assert not made[0].open
+        assert client.pool_stats()['open'] == 0
+
+    def test_state_acts_for_interventions(self, client, made):
+        assert client.state_acts_for_interventions([]) == {}
+        assert made == []
+        assert client.state_acts_for_interventions([1, 2]) == {}
+        query, params = made[0].executed[0]
+        assert 'IN (%s,%s)' in query
+        assert params == [1, 2]
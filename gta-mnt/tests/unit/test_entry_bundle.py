@@ -0,0 +1,236 @@
+"""Tests for create_entry_bundle(): one transaction for a whole state act graph.
+
+Uses a fake connection with fixed master lists that records every statement
+and hands out auto-increment ids — no live DB needed.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from gta_mnt.api import GTADatabaseClient
+from gta_mnt.server import CreateEntryBundleInput
+from gta_mnt.storage import ReviewStorage
+
+
+MASTER = {
+    'api_jurisdiction_list': {276, 840},
+    'api_product_list': {720810},
+    'api_sector_list': {411},
+    'api_rationale_list': {3},
+}
+FIRMS = [{'firm_id': 77, 'firm_name': 'Nippon Steel Corporation'}]
+SOURCES = [{'source_id': 500, 'source_url': 'https://example.gov/decree'}]
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+        self.lastrowid = None
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((sql, params))
+        self.rows = []
+        if sql.lstrip().startswith('INSERT'):
+            self.conn.next_id += 1
+            self.lastrowid = self.conn.next_id
+            return
+        for table, ids in MASTER.items():
+            if f'FROM {table}' in sql:
+                column = sql.split()[1]
+                self.rows = [{column: p} for p in params if p in ids]
+        if 'FROM mtz_firm_log' in sql:
+            self.rows = [f for f in FIRMS if f['firm_name'] in params]
+        elif 'FROM api_source_list' in sql:
+            self.rows = [s for s in SOURCES if s['source_url'] in params]
+
+    def executemany(self, sql, params):
+        if self.conn.fail_on and self.conn.fail_on in sql:
+            raise RuntimeError('constraint violation')
+        self.conn.many.append((sql, list(params)))
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    open = True
+
+    def __init__(self):
+        self.executed = []
+        self.many = []
+        self.next_id = 1000
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_on = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    def many_into(self, table):
+        return [params for sql, params in self.many if f'INTO {table} ' in sql]
+
+
+STATE_ACT = {
+    'title': 'Japan: Steel safeguard',
+    'description': 'First paragraph.\n\nSecond paragraph.',
+    'source_url': 'https://example.gov/decree',
+    'is_source_official': 1,
+    'date_announced': '2026-10-01',
+    'evaluation_id': 1,
+}
+
+INTERVENTION = {
+    'description': 'Import tariff increase on flat-rolled steel.',
+    'intervention_type_id': 47,
+    'chapter_id': 4,
+    'subchapter_id': 20,
+    'gta_evaluation_id': 1,
+    'affected_flow_id': 1,
+    'eligible_firm_id': 1,
+    'implementation_level_id': 1,
+    'intervention_area_id': 1,
+    'date_implemented': '2026-11-01',
+    'date_announced': '2026-10-01',
+}
+
+
+def bundle_intervention(**children):
+    return {**INTERVENTION, **children}
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection()
+
+
+@pytest.fixture
+def client(tmp_path, conn, monkeypatch):
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client._pool, '_connect', lambda: conn)
+    return client
+
+
+class TestEntryBundle:
+    def test_full_graph_in_one_transaction(self, client, conn):
+        result = client.create_entry_bundle(
+            STATE_ACT,
+            interventions=[
+                bundle_intervention(
+                    implementing_jurisdictions=[840],
+                    products=[{'product_id': 720810, 'new_level': '25'}],
+                    sectors=[{'sector_id': 411}],
+                    rationales=[3],
+                    firms=[{'firm_name': 'Nippon Steel Corporation', 'role_id': 2},
+                           {'firm_name': 'Ministry of Trade', 'role_id': 3}],
+                ),
+                bundle_intervention(implementing_jurisdictions=[276, 840], aj_type=2, dm_type=2),
+            ],
+            sources=[{'source_url': 'https://example.gov/annex'}],
+            motive_quotes=[{'motive_quote': 'to protect domestic producers'}],
+        )
+        assert result['success'], result
+        assert conn.commits == 1
+        state_act_id = result['state_act_id']
+        ids = [c['intervention_id'] for c in result['interventions']]
+        assert len(ids) == 2
+
+        # Interventions hang off the new state act, titles default to its title
+        inserts = [p for sql, p in conn.executed if 'INSERT INTO api_intervention_log' in sql]
+        assert [p[0] for p in inserts] == [state_act_id, state_act_id]
+        assert inserts[0][1] == STATE_ACT['title']
+
+        # Leaf tables are one executemany each, with the generated ids patched in
+        assert conn.many_into('api_intervention_ij') == [[(ids[0], 840), (ids[1], 276), (ids[1], 840)]]
+        assert conn.many_into('api_intervention_rationale') == [[(ids[0], 3)]]
+
+        # Existing firm reused, new firm created; acting agency gets its legacy row
+        firm_ids = result['interventions'][0]['firm_ids']
+        assert firm_ids[0] == 77 and firm_ids[1] != 77
+        assert result['created_firms'] == 1
+        assert conn.many_into('api_acting_agency_log') == [[('Ministry of Trade', 'Ministry of Trade', ids[0])]]
+
+        # Existing primary source reused, annex created; citations ordered
+        assert result['source_ids'][0] == 500
+        assert [r[5] for r in conn.many_into('api_state_act_source_log_new')[0]] == [1, 2]
+
+        # Recalculation queued only for the inferred-AJ/DM intervention
+        assert conn.many_into('api_recalculation_log') == [[(ids[0],)]]
+
+    def test_fk_checks_batched_across_interventions(self, client, conn):
+        client.create_entry_bundle(STATE_ACT, interventions=[
+            bundle_intervention(implementing_jurisdictions=[840]),
+            bundle_intervention(implementing_jurisdictions=[276]),
+        ])
+        checks = [p for sql, p in conn.executed if 'FROM api_jurisdiction_list' in sql]
+        assert checks == [(276, 840)]
+
+    def test_invalid_fk_writes_nothing(self, client, conn):
+        result = client.create_entry_bundle(STATE_ACT, interventions=[
+            bundle_intervention(products=[{'product_id': 720810}, {'product_id': 999999}]),
+        ])
+        assert not result['success']
+        assert result['errors'] == ['interventions[0].products[1]: Product 999999 not found']
+        assert not any(sql.lstrip().startswith('INSERT') for sql, _ in conn.executed)
+        assert conn.many == [] and conn.commits == 0
+
+    def test_malformed_rows_rejected_before_connecting(self, client, monkeypatch):
+        monkeypatch.setattr(client._pool, '_connect', lambda: pytest.fail('connected'))
+        result = client.create_entry_bundle(STATE_ACT, interventions=[
+            {**INTERVENTION, 'state_act_id': 5},
+            bundle_intervention(product_levels=[{'level': 8, 'hs_code': '7208', 'jurisdiction_id': 840}]),
+        ])
+        assert not result['success']
+        assert result['errors'][0].startswith('interventions[0]:')
+        assert 'expected exactly 8 digits' in result['errors'][1]
+
+    def test_mid_transaction_failure_rolls_back(self, client, conn):
+        conn.fail_on = 'api_intervention_sector'
+        result = client.create_entry_bundle(STATE_ACT, interventions=[
+            bundle_intervention(sectors=[{'sector_id': 411}]),
+        ])
+        assert not result['success']
+        assert 'constraint violation' in result['error']
+        assert conn.rollbacks >= 1 and conn.commits == 0
+
+    def test_dry_run_counts_rows(self, client, monkeypatch):
+        monkeypatch.setattr(client._pool, '_connect', lambda: pytest.fail('connected'))
+        result = client.create_entry_bundle(
+            STATE_ACT,
+            interventions=[bundle_intervention(implementing_jurisdictions=[840, 276], levels=[{'new_level': '25'}])],
+            dry_run=True,
+        )
+        assert result['dry_run'] and result['success']
+        assert result['rows']['api_intervention_ij'] == 2
+        assert result['rows']['api_intervention_level'] == 1
+        assert result['rows']['api_recalculation_log'] == 1
+
+
+class TestEntryBundleInput:
+    def test_nested_rows_are_strict(self):
+        with pytest.raises(ValidationError):
+            CreateEntryBundleInput(
+                state_act=STATE_ACT,
+                interventions=[{**INTERVENTION, 'products': [{'product_id': 1, 'hs_code': '7208'}]}],
+            )
+
+    def test_dump_matches_client_signature(self, client, monkeypatch):
+        monkeypatch.setattr(client._pool, '_connect', lambda: pytest.fail('connected'))
+        params = CreateEntryBundleInput(state_act=STATE_ACT, interventions=[INTERVENTION], dry_run=True)
+        result = client.create_entry_bundle(**params.model_dump(exclude={'dry_run'}), dry_run=True)
+        assert result['success'], result
@@ -1,13 +1,19 @@
 """Tests for the duplicate-detection helpers in api.py.
 
-These cover the pure functions only — the SQL-backed `find_duplicates`
-method is exercised end-to-end via the regression script that scans the
+The pure functions are tested directly; the SQL-backed `find_duplicates`
+method is covered here for batching and concurrency against a fake
+connection, and end-to-end via the regression script that scans the
 JCC-747 trial batch.
 """
 
+import threading
+from datetime import date
+
 import pytest
 
-from gta_mnt.api import extract_decree_numbers, normalize_url
+from gta_mnt.api import GTADatabaseClient, decree_key, extract_decree_numbers, normalize_url
+from gta_mnt.duplicate_index import DuplicateIndex
+from gta_mnt.storage import ReviewStorage
 
 
 class TestExtractDecreeNumbers:
@@ -73,3 +79,248 @@ class TestNormalizeUrl:
         a = "https://www.example.gov/path/?utm_source=twitter"
         b = "http://example.gov/path"
         assert normalize_url(a) == normalize_url(b)
+
+
+SA_9 = {'state_act_id': 9, 'title': 'Brazil: MP 1340 diesel taxes', 'status_id': 4, 'date_announced': date(2026, 3, 2)}
+
+
+class FakeDB:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executed = []
+        self.connections = 0
+        self.fail = None
+        self.links = [
+            {'id': 1, 'state_act_id': 9, 'source_url': 'http://gov.br/mp-1340/'},
+            {'id': 2, 'state_act_id': 5, 'source_url': 'https://gov.br/other'},
+        ]
+        # stamp: UNIX_TIMESTAMP(last_modified)
+        self.titles = [
+            {'state_act_id': 5, 'title': 'Brazil: MP 1341 on ethanol', 'stamp': 100},
+            {'state_act_id': 9, 'title': SA_9['title'], 'stamp': 200},
+        ]
+
+    def respond(self, sql, params):
+        if self.fail and self.fail in sql:
+            raise RuntimeError('lock wait timeout')
+        if 'SELECT title, description, date_announced' in sql:
+            return [{'title': 'Brazil: MP 1340 zeroes diesel taxes', 'description': 'Tariff cut', 'date_announced': date(2026, 3, 1)}]
+        if 'SELECT sl.source_url FROM' in sql:
+            return [{'source_url': 'https://www.gov.br/mp-1340'}]
+        if 'SELECT DISTINCT iij.jurisdiction_id' in sql:
+            return [{'jurisdiction_id': 76}]
+        if 'SELECT DISTINCT intervention_type_id' in sql:
+            return [{'intervention_type_id': 47}]
+        if 'SELECT DISTINCT ip.product_id' in sql and 'sa.title' not in sql:
+            return [{'product_id': 271019}]
+        # Duplicate index sync
+        if 'WHERE sas.id > %s' in sql:
+            return [row for row in self.links if row['id'] > params[0]]
+        if 'UNIX_TIMESTAMP(last_modified) AS stamp' in sql:
+            return [row for row in self.titles if not params or row['stamp'] >= params[0]]
+        if 'AS next_nr' in sql or 'as next_nr' in sql:
+            return [{'next_nr': 1}]
+        # Indexed vectors A and B
+        if 'sa.state_act_id IN' in sql:
+            return [SA_9] if 9 in params else []
+        if 'sl.source_url LIKE' in sql:
+            return [{**SA_9, 'source_url': 'http://gov.br/mp-1340/'}]
+        if 'sa.title LIKE' in sql:
+            return [SA_9]
+        if 'SELECT DISTINCT i.intervention_id' in sql:
+            return [{'intervention_id': 91, **SA_9}]
+        return []
+
+
+class FakeCursor:
+    lastrowid = 1
+
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        with self.db.lock:
+            self.db.executed.append(sql)
+        self.rows = self.db.respond(sql, params)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    open = True
+
+    def __init__(self, db):
+        self.db = db
+        with db.lock:
+            db.connections += 1
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class Jobs(list):
+    """Stands in for GTADatabaseClient._in_background: queues jobs to run on demand."""
+
+    def __call__(self, name, target, *args):
+        self.append((target, args))
+
+    def run(self):
+        while self:
+            target, args = self.pop(0)
+            target(*args)
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+@pytest.fixture
+def cold_client(tmp_path, db, monkeypatch):
+    """Client whose duplicate index has not been built yet."""
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    client._duplicate_index = DuplicateIndex(path=str(tmp_path / 'dup.sqlite'))
+    client._in_background = Jobs()
+    monkeypatch.setattr(client._pool, '_connect', lambda: FakeConnection(db))
+    return client
+
+
+@pytest.fixture
+def client(cold_client):
+    cold_client.warm_duplicate_index()
+    return cold_client
+
+
+@pytest.fixture(params=['index', 'like'])
+def any_client(request, client):
+    if request.param == 'like':
+        client._duplicate_index = None
+    return client
+
+
+class TestFindDuplicatesQueries:
+    def test_vectors_merge_and_report_timings(self, any_client, db):
+        result = any_client.find_duplicates(state_act_id=1)
+        assert result['vectors_run'] == ['URL', 'DECREE', 'TYPE+DATE', 'HS+DATE', 'POOL']
+        assert set(result['timings_ms']) == set(result['vectors_run'])
+        [candidate] = result['candidates']
+        assert candidate['match_vectors'] == ['URL', 'DECREE']
+        assert candidate['date_announced'] == '2026-03-02'
+        assert result['pool_intervention_ids'] == [91]
+        assert result['pool_state_acts'][91]['state_act_id'] == 9
+
+    def test_vectors_use_extra_pooled_connections(self, client, db):
+        client.find_duplicates(state_act_id=1)
+        assert db.connections > 1
+        assert client.pool_stats()['in_use'] == 0
+
+    def test_exhausted_pool_runs_on_one_connection(self, client, db):
+        client._pool.max_size = 1
+        result = client.find_duplicates(state_act_id=1)
+        assert db.connections == 1
+        assert result['candidates'][0]['match_vectors'] == ['URL', 'DECREE']
+
+    def test_failed_vector_is_skipped(self, client, db, capsys):
+        client._duplicate_index = None
+        db.fail = 'sa.title LIKE'
+        result = client.find_duplicates(state_act_id=1)
+        assert result['candidates'][0]['match_vectors'] == ['URL']
+        assert 'vector DECREE failed' in capsys.readouterr().err
+
+
+class TestDuplicateIndex:
+    def test_vectors_a_and_b_are_exact_lookups(self, client, db):
+        result = client.find_duplicates(state_act_id=1)
+        assert result['candidates'][0]['shared_urls'] == ['http://gov.br/mp-1340/']
+        assert result['candidates'][0]['shared_decree_tokens'] == ['MP 1340']
+        assert not [sql for sql in db.executed if 'LIKE' in sql]
+
+    def test_incremental_sync_from_watermark(self, client, db):
+        client.find_duplicates(state_act_id=1)
+        db.links.append({'id': 3, 'state_act_id': 12, 'source_url': 'https://www.gov.br/mp-1340'})
+        db.titles.append({'state_act_id': 12, 'title': 'Brazil: mp  1340 extended', 'stamp': 300})
+        client._duplicate_index.expire()
+        client.find_duplicates(state_act_id=1)
+        entries = client._duplicate_index.find('url', ['gov.br/mp-1340'])
+        assert [sa_id for _, sa_id, _ in entries] == [9, 12]
+        assert [sa_id for _, sa_id, _ in client._duplicate_index.find('decree', [decree_key('MP 1340')])] == [9, 12]
+        # 4 keys from the build, then the URL link and the titles stamped >= 200
+        assert client._duplicate_index.stats['keys_synced'] == 7
+
+    def test_edited_title_replaces_decree_tokens(self, client, db):
+        db.titles[0].update(title='Brazil: MP 1351 on ethanol', stamp=250)
+        client._duplicate_index.expire()
+        client.find_duplicates(state_act_id=1)
+        index = client._duplicate_index
+        assert index.find('decree', [decree_key('MP 1341')]) == []
+        assert [sa_id for _, sa_id, _ in index.find('decree', [decree_key('MP 1351')])] == [5]
+        assert index.snapshot()['kinds']['decree']['max_id'] == 250
+
+    def test_sync_skipped_within_interval(self, client, db):
+        client.find_duplicates(state_act_id=1)
+        client.find_duplicates(state_act_id=1)
+        assert len([sql for sql in db.executed if 'WHERE sas.id > %s' in sql]) == 1
+
+    def test_rebuild_replaces_keys(self, tmp_path):
+        index = DuplicateIndex(path=str(tmp_path / 'dup.sqlite'))
+        index.sync('decree', [('mp 1340', 9, 'MP 1340')], 9)
+        assert index.sync_from('decree', full=True) == 0
+        index.sync('decree', [('mp 1341', 9, 'MP 1341')], 9, replace=True)
+        assert index.find('decree', ['mp 1340']) == []
+        assert index.snapshot()['kinds']['decree']['keys'] == 1
+
+    def test_rebuild_due_after_interval(self, tmp_path):
+        index = DuplicateIndex(path=str(tmp_path / 'dup.sqlite'), sync_interval=0, rebuild_interval=0)
+        index.sync('url', [], 40)
+        assert index.sync_from('url') == 0
+        persisted = DuplicateIndex(path=str(tmp_path / 'dup.sqlite'), sync_interval=0)
+        assert persisted.sync_from('url') == 40
+
+    def test_unbuilt_index_uses_like_and_builds_in_background(self, cold_client, db):
+        result = cold_client.find_duplicates(state_act_id=1)
+        assert result['candidates'][0]['match_vectors'] == ['URL', 'DECREE']
+        assert [sql for sql in db.executed if 'LIKE' in sql]
+        assert not [sql for sql in db.executed if 'WHERE sas.id > %s' in sql]
+        cold_client._in_background.run()
+        assert cold_client._duplicate_index.snapshot()['kinds']['url']['max_id'] == 2
+
+    def test_due_rebuild_runs_in_background(self, client, db):
+        index = client._duplicate_index
+        index.rebuild_interval = 0
+        index.expire()
+        db.executed.clear()
+        result = client.find_duplicates(state_act_id=1)
+        assert result['candidates'][0]['shared_decree_tokens'] == ['MP 1340']
+        assert index.stats['rebuilds'] == 2  # only the warm-up's
+        assert len(client._in_background) == 1
+        client._in_background.run()
+        assert index.stats['rebuilds'] == 4
+
+    def test_write_expires_index(self, client, db):
+        client.find_duplicates(state_act_id=1)
+        assert client.add_source(9, 'https://gov.br/annex', 'Annex')['success']
+        assert client._duplicate_index.sync_from('url') == 2
+
+    def test_sync_failure_falls_back_to_like(self, client, db, capsys):
+        db.fail = 'WHERE sas.id > %s'
+        client._duplicate_index.expire()
+        result = client.find_duplicates(state_act_id=1)
+        assert result['candidates'][0]['match_vectors'] == ['URL', 'DECREE']
+        assert 'using LIKE scans' in capsys.readouterr().err
@@ -11,9 +11,10 @@ from gta_mnt.formatters import (
     format_step1_queue,
     format_measure_detail,
     format_source_result,
+    format_multi_source_result,
     format_templates
 )
-from gta_mnt.models import SourceResult
+from gta_mnt.models import MultiSourceResult, SourceResult
 
 
 def test_format_issue_comment():
@@ -121,6 +122,13 @@ def test_format_step1_queue_with_measures():
     assert "Date Entered Review" in result
 
 
+def test_format_step1_queue_next_cursor():
+    """A full page points at the next one by cursor."""
+    data = {"results": [{"id": 123, "title": "T", "status_time": None}], "count": 9, "next_cursor": "abc"}
+    assert 'cursor="abc"' in format_step1_queue(data)
+    assert "cursor=" not in format_step1_queue({**data, "next_cursor": None})
+
+
 def test_format_measure_detail():
     """Test format_measure_detail with full data."""
     measure = {
@@ -263,6 +271,55 @@ def test_format_source_result_without_content():
     assert "Content not fetched (fetch_content=False)" in result
 
 
+def test_format_source_result_reports_extraction_budget():
+    """Test format_source_result flags a PDF cut short by the page budget."""
+    source = SourceResult(
+        source_type="file",
+        source_url="s3://bucket/file.pdf",
+        content="First pages.",
+        content_type="pdf",
+        pages_total=340,
+        pages_extracted=200,
+        truncated="page budget of 200 pages",
+    )
+    result = format_source_result(source)
+
+    assert "**Truncated:** 200 of 340 pages extracted; stopped by the page budget of 200 pages." in result
+
+
+def test_format_multi_source_result():
+    """Test format_multi_source_result lists per-source status and content."""
+    result = MultiSourceResult(state_act_id=7, sources=[
+        SourceResult(source_type="file", source_url="s3://b/a.pdf", content="Decree text",
+                     content_type="pdf", source_index=0, saved_path="/r/7/source.pdf"),
+        SourceResult(source_type="url", source_url="https://a.gov/b", content_type="html",
+                     source_index=1, error="URL fetch error: 404"),
+    ])
+    text = format_multi_source_result(result)
+
+    assert "**Sources:** 2 (1 ok, 1 failed)" in text
+    assert "| 1 | ❌ URL fetch error: 404 | html | https://a.gov/b |" in text
+    assert "Decree text" in text
+    assert "**Saved as:** `/r/7/source.pdf`" in text
+
+
+def test_format_source_result_page_window():
+    """Test format_source_result names the pages returned for a page/search request."""
+    source = SourceResult(
+        source_type="file",
+        source_url="s3://bucket/gazette.pdf",
+        content="--- Page 12 ---\nTariff schedule",
+        content_type="pdf",
+        pages_total=340,
+        pages_extracted=200,
+        page_numbers=[12, 13, 14, 40],
+    )
+    result = format_source_result(source)
+
+    assert "**Pages returned:** 12-14, 40 of 340." in result
+    assert "--- Page 12 ---" in result
+
+
 def test_format_source_result_truncates_long_content():
     """Test format_source_result caps at CHARACTER_LIMIT with a pagination hint."""
     from gta_mnt.formatters import CHARACTER_LIMIT
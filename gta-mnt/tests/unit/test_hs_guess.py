@@ -0,0 +1,124 @@
+"""Tests for batched, cached Bastiat HS code guessing.
+
+Bastiat is replaced by an httpx.MockTransport that answers from the request
+text and counts requests — no network needed.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from gta_mnt.api import BastiatAPIClient
+from gta_mnt.formatters import format_guessed_hs_codes_bulk
+from gta_mnt.hs_guess_cache import HSGuessCache, guess_key
+
+
+class FakeBastiat:
+    def __init__(self, fail=()):
+        self.requests = []
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, request):
+        payload = json.loads(request.content)
+        self.requests.append(payload)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if payload['article_text'] in self.fail:
+            return httpx.Response(502, text='bad gateway')
+        code = str(len(payload['article_text'])).zfill(6)
+        return httpx.Response(200, json={'hs_codes': [{'hs_code': code, 'description': payload['article_text']}]})
+
+
+def client_for(bastiat, cache=None, concurrency=2):
+    client = BastiatAPIClient(api_key='key', cache=cache, concurrency=concurrency)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(bastiat))
+    return client
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HSGuessCache(path=str(tmp_path / 'hs.sqlite'))
+
+
+class TestGuessKey:
+    def test_normalised_text_and_sorted_options(self):
+        assert guess_key('  Steel\tCOILS ', [6, 4], ['7208 ', '7209']) == guess_key('steel coils', [4, 6], ['7209', '7208'])
+        assert guess_key('steel coils', [6]) != guess_key('steel coils', [4])
+
+
+class TestHSGuessCache:
+    def test_round_trip_and_ttl(self, tmp_path):
+        key = guess_key('steel coils')
+        HSGuessCache(path=str(tmp_path / 'hs.sqlite')).put_many({key: {'hs_codes': []}})
+        assert HSGuessCache(path=str(tmp_path / 'hs.sqlite')).get_many([key]) == {key: {'hs_codes': []}}
+        assert HSGuessCache(path=str(tmp_path / 'hs.sqlite'), ttl=-1).get_many([key]) == {}
+
+    def test_disabled_from_env(self, monkeypatch):
+        monkeypatch.setenv('GTA_HS_GUESS_CACHE_TTL', '0')
+        assert HSGuessCache.from_env() is None
+
+
+class TestBulkGuess:
+    @pytest.mark.asyncio
+    async def test_deduplicated_concurrent_and_in_order(self, cache):
+        bastiat = FakeBastiat()
+        client = client_for(bastiat, cache)
+        texts = ['steel coils', 'Steel  Coils', 'lithium-ion batteries', 'wheat', 'rice']
+        result = await client.guess_hs_codes_bulk(texts, target_hs_levels=[6])
+        await client.aclose()
+
+        assert len(bastiat.requests) == 4
+        assert bastiat.peak == 2
+        assert bastiat.requests[0]['target_hs_levels'] == [6]
+        assert [row['status'] for row in result['results']] == ['ok', 'duplicate', 'ok', 'ok', 'ok']
+        assert result['results'][1]['duplicate_of'] == 0
+        assert result['results'][1]['result'] == result['results'][0]['result']
+        assert result['results'][2]['result']['hs_codes'][0]['description'] == 'lithium-ion batteries'
+        assert (result['requested'], result['unique'], result['fetched']) == (5, 4, 4)
+
+    @pytest.mark.asyncio
+    async def test_repeats_served_from_cache(self, cache):
+        bastiat = FakeBastiat()
+        client = client_for(bastiat, cache)
+        await client.guess_hs_codes('steel coils')
+        result = await client.guess_hs_codes_bulk(['STEEL COILS', 'wheat'])
+        await client.aclose()
+
+        assert [p['article_text'] for p in bastiat.requests] == ['steel coils', 'wheat']
+        assert [row['status'] for row in result['results']] == ['cached', 'ok']
+        assert result['cached'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_per_row_and_not_cached(self, cache):
+        bastiat = FakeBastiat(fail={'wheat'})
+        client = client_for(bastiat, cache)
+        result = await client.guess_hs_codes_bulk(['wheat', 'rice', 'wheat'])
+        assert result['results'][0] == {
+            'index': 0, 'article_text': 'wheat', 'status': 'error',
+            'error': 'Bastiat API returned 502: bad gateway',
+        }
+        assert result['results'][1]['status'] == 'ok'
+        assert result['failed'] == 1
+
+        await client.guess_hs_codes_bulk(['wheat'])
+        await client.aclose()
+        assert [p['article_text'] for p in bastiat.requests].count('wheat') == 2
+
+    def test_formatter_points_repeats_at_first_row(self):
+        output = format_guessed_hs_codes_bulk({
+            'requested': 2, 'unique': 1, 'cached': 0, 'fetched': 1, 'failed': 0,
+            'results': [
+                {'index': 0, 'article_text': 'steel coils', 'status': 'ok',
+                 'result': {'hs_codes': [{'hs_code': '720810', 'description': 'Flat-rolled'}]}},
+                {'index': 1, 'article_text': 'Steel coils', 'status': 'duplicate', 'duplicate_of': 0,
+                 'result': {'hs_codes': [{'hs_code': '720810', 'description': 'Flat-rolled'}]}},
+            ],
+        })
+        assert '## 2. Steel coils\n\n*Same description as 1.*' in output
+        assert output.endswith('**Codes for lookup:** 720810')
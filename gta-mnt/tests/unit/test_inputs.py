@@ -4,6 +4,7 @@ import pytest
 from pydantic import ValidationError
 
 from gta_mnt.server import (
+    GetSourceInput,
     SetStatusInput,
     GetMeasureInput,
     ListStep1QueueInput,
@@ -49,3 +50,11 @@ class TestListStep1QueueInput:
         # List[str] items: pydantic strips each string element.
         assert model.implementing_jurisdictions == ["USA", "CHN"]
         assert model.date_entered_review_gte == "2026-01-01"
+
+
+class TestGetSourceInput:
+    def test_page_selection_validated(self):
+        assert GetSourceInput(state_act_id=1, pages="1-3, 7").pages == "1-3, 7"
+        with pytest.raises(ValidationError) as exc:
+            GetSourceInput(state_act_id=1, pages="7-3")
+        assert "ranges must ascend" in str(exc.value)
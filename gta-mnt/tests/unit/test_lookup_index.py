@@ -0,0 +1,238 @@
+"""Tests for the local lookup index (in-memory tables and the SQLite FTS index).
+
+Uses a fake connection that records queries — no live DB needed.
+"""
+
+import threading
+
+import pytest
+
+from gta_mnt.api import GTADatabaseClient
+from gta_mnt.lookup_index import LookupIndex, normalize, score
+from gta_mnt.storage import ReviewStorage
+
+
+JURISDICTIONS = [
+    {'jurisdiction_id': 276, 'jurisdiction_name': 'Germany', 'iso_code': 'DEU'},
+    {'jurisdiction_id': 250, 'jurisdiction_name': 'France', 'iso_code': 'FRA'},
+    {'jurisdiction_id': 288, 'jurisdiction_name': 'Ghana', 'iso_code': 'GHA'},
+    {'jurisdiction_id': 840, 'jurisdiction_name': 'United States of America', 'iso_code': 'USA'},
+    {'jurisdiction_id': 826, 'jurisdiction_name': 'United Kingdom', 'iso_code': 'GBR'},
+]
+
+FIRMS = [
+    {'firm_id': 1, 'firm_name': 'Nippon Steel Corporation'},
+    {'firm_id': 2, 'firm_name': 'United States Steel Corp.'},
+    {'firm_id': 3, 'firm_name': 'Société Générale'},
+]
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((sql, params))
+        if 'FROM api_jurisdiction_list' in sql:
+            self.rows = list(JURISDICTIONS)
+        elif 'FROM mtz_firm_log' in sql and 'LIKE' in sql:
+            needle = params[0].strip('%').lower()
+            self.rows = [f for f in self.conn.firms if needle in f['firm_name'].lower()]
+        elif 'FROM mtz_firm_log' in sql:
+            self.rows = [f for f in self.conn.firms if f['firm_id'] > params[0]]
+        else:
+            self.rows = []
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    open = True
+
+    def __init__(self):
+        self.executed = []
+        self.firms = list(FIRMS)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class Jobs(list):
+    """Stands in for GTADatabaseClient._in_background: queues jobs to run on demand."""
+
+    def __call__(self, name, target, *args):
+        self.append((target, args))
+
+    def run(self):
+        while self:
+            target, args = self.pop(0)
+            target(*args)
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection()
+
+
+@pytest.fixture
+def client(tmp_path, conn, monkeypatch):
+    monkeypatch.delenv('GTA_LOOKUP_INDEX', raising=False)
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    client._lookup_index = LookupIndex(fts_path=str(tmp_path / 'lookup.sqlite'))
+    monkeypatch.setattr(client._pool, '_connect', lambda: conn)
+    client._in_background = Jobs()
+    return client
+
+
+class TestScoring:
+    def test_normalize_strips_case_accents_and_punctuation(self):
+        assert normalize('Société  Générale, S.A.') == 'societe generale s a'
+
+    def test_substring_tiers_outrank_fuzzy(self):
+        q = 'steel'
+        assert score(q, 'steel') > score(q, 'steel pipes') > score(q, 'nippon steel') > score(q, 'nonsteely')
+        assert score(q, 'nonsteely') > score(q, 'stele')
+
+
+class TestMemoryIndex:
+    def test_ranked_substring_then_fuzzy(self):
+        index = LookupIndex()
+        index.load('jurisdiction', JURISDICTIONS, 'jurisdiction_id', 'jurisdiction_name')
+        names = [r['jurisdiction_name'] for r in index.search('jurisdiction', 'united', 5)]
+        assert names == ['United Kingdom', 'United States of America']
+        assert index.search('jurisdiction', 'Grmany', 5)[0]['jurisdiction_name'] == 'Germany'
+
+    def test_empty_query_returns_first_rows(self):
+        index = LookupIndex()
+        index.load('jurisdiction', JURISDICTIONS, 'jurisdiction_id', 'jurisdiction_name')
+        assert [r['jurisdiction_id'] for r in index.search('jurisdiction', '', 2)] == [250, 276]
+
+    def test_refresh_interval(self):
+        index = LookupIndex(refresh_interval=0)
+        assert index.needs_load('jurisdiction')
+        index.load('jurisdiction', JURISDICTIONS, 'jurisdiction_id', 'jurisdiction_name')
+        assert index.needs_load('jurisdiction')
+
+
+class TestFTSIndex:
+    def test_sync_and_search(self, tmp_path):
+        index = LookupIndex(fts_path=str(tmp_path / 'idx.sqlite'))
+        assert index.sync_from('firm') == 0
+        index.sync('firm', FIRMS, 'firm_id', 'firm_name')
+        assert [r['firm_id'] for r in index.search('firm', 'steel', 5)] == [1, 2]
+        assert index.search('firm', 'societe generale', 5)[0]['firm_id'] == 3
+        assert index.search('firm', 'nipon steel', 5)[0]['firm_id'] == 1
+
+    def test_persisted_and_incremental(self, tmp_path):
+        path = str(tmp_path / 'idx.sqlite')
+        LookupIndex(fts_path=path).sync('firm', FIRMS, 'firm_id', 'firm_name')
+        reopened = LookupIndex(fts_path=path)
+        assert reopened.sync_from('firm') == 3
+        reopened.sync('firm', [{'firm_id': 4, 'firm_name': 'Tata Steel'}], 'firm_id', 'firm_name')
+        assert len(reopened.search('firm', 'steel', 10)) == 3
+        assert reopened.sync_from('firm') is None
+
+    def test_replace_rebuilds(self, tmp_path):
+        index = LookupIndex(fts_path=str(tmp_path / 'idx.sqlite'))
+        index.sync('firm', FIRMS, 'firm_id', 'firm_name')
+        index.sync('firm', [{'firm_id': 1, 'firm_name': 'Nippon Steel'}], 'firm_id', 'firm_name', replace=True)
+        assert [r['firm_id'] for r in index.search('firm', 'steel', 10)] == [1]
+
+
+class TestClientLookup:
+    def test_unloaded_table_uses_like_and_loads_in_background(self, client, conn):
+        result = client.lookup('jurisdiction', 'ghana')
+        assert conn.executed == [(
+            'SELECT * FROM api_jurisdiction_list WHERE jurisdiction_name LIKE %s LIMIT %s',
+            ('%ghana%', 20),
+        )]
+        assert result['id_column'] == 'jurisdiction_id'
+        client._in_background.run()
+        assert conn.executed[-1] == ('SELECT * FROM api_jurisdiction_list', None)
+        assert client._lookup_index.is_loaded('jurisdiction')
+
+    def test_table_loaded_once(self, client, conn):
+        client.warm_lookup_index()
+        conn.executed.clear()
+        client.lookup('jurisdiction', 'ghana')
+        result = client.lookup('jurisdiction', 'france')
+        assert result['results'][0]['jurisdiction_id'] == 250
+        assert conn.executed == []
+        assert not client._in_background
+
+    def test_stale_table_served_while_reloading(self, client, conn):
+        client.warm_lookup_index()
+        conn.executed.clear()
+        client._lookup_index.refresh_interval = 0
+        result = client.lookup('jurisdiction', 'france')
+        assert result['results'][0]['jurisdiction_id'] == 250
+        assert conn.executed == []
+        client._in_background.run()
+        assert conn.executed == [('SELECT * FROM api_jurisdiction_list', None)]
+
+    def test_refresh_searches_live_and_reloads_in_background(self, client, conn):
+        client.warm_lookup_index()
+        conn.executed.clear()
+        client.lookup('jurisdiction', 'ghana', refresh=True)
+        assert 'LIKE' in conn.executed[0][0]
+        client._in_background.run()
+        assert conn.executed[1:] == [('SELECT * FROM api_jurisdiction_list', None)]
+
+    def test_firm_index_built_in_background(self, client, conn):
+        result = client.lookup('firm', 'steel')
+        assert {r['firm_id'] for r in result['results']} == {1, 2}
+        assert conn.executed[0][1] == ('%steel%', 20)
+        client._in_background.run()
+        assert conn.executed[-1][1] == (0,)
+        assert client.lookup('firm', 'steel')['results']
+        assert len(conn.executed) == 2
+
+    def test_firm_sync_is_incremental(self, client, conn):
+        client.warm_lookup_index()
+        assert [params for sql, params in conn.executed if 'mtz_firm_log' in sql] == [(0,)]
+        conn.firms.append({'firm_id': 9, 'firm_name': 'Tata Steel'})
+        client._lookup_index.expire('firm')
+        result = client.lookup('firm', 'steel')
+        assert conn.executed[-1][1] == (3,)
+        assert {r['firm_id'] for r in result['results']} == {1, 2, 9}
+
+    def test_disabled_index_uses_like(self, client, conn):
+        client._lookup_index = None
+        client.lookup('jurisdiction', 'ghana', limit=5)
+        assert conn.executed == [(
+            'SELECT * FROM api_jurisdiction_list WHERE jurisdiction_name LIKE %s LIMIT %s',
+            ('%ghana%', 5),
+        )]
+
+    def test_background_job_runs_once_at_a_time(self, client):
+        release = threading.Event()
+        runs = []
+
+        def job():
+            runs.append(1)
+            release.wait(5)
+
+        GTADatabaseClient._in_background(client, 'lookup-firm', job)
+        GTADatabaseClient._in_background(client, 'lookup-firm', job)
+        release.set()
+        client._index_jobs['lookup-firm'].join(5)
+        assert runs == [1]
+
+    def test_warm_loads_every_table(self, client):
+        status = client.warm_lookup_index()
+        assert status['jurisdiction'] == 'ok'
+        assert status['firm'] == 'ok'
@@ -0,0 +1,224 @@
+"""Tests for the versioned get_measure() cache and write-through invalidation.
+
+Uses a fake connection whose freshness probe returns a settable version —
+no live DB needed.
+"""
+
+import pymysql
+import pytest
+
+from gta_mnt.api import GTADatabaseClient
+from gta_mnt.measure_cache import MeasureCache
+from gta_mnt.storage import ReviewStorage
+
+
+class FakeDB:
+    def __init__(self):
+        self.version = {'last_modified': '2026-10-01 12:00:00', 'status_id': 2}
+        self.loads = 0
+        self.probe_error = None
+        self.probes = 0
+
+    def respond(self, sql, params):
+        if 'COALESCE(MAX(i.last_modified)' in sql:
+            self.probes += 1
+            if self.probe_error:
+                raise self.probe_error
+            return [dict(self.version)]
+        if 'FROM api_state_act_log sa' in sql and 'api_state_act_status_list' in sql:
+            self.loads += 1
+            return [{'id': params[0], 'title': 'Decree 12/2026', 'source': None, 'source_markdown': None}]
+        if 'i.intervention_id as id' in sql:
+            return [{'id': 11, 'legacy_description': 'text'}]
+        if 'FROM api_intervention_aj' in sql:
+            return []
+        return []
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+        self.lastrowid = 1
+        self.rowcount = 1
+
+    def execute(self, sql, params=None):
+        self.rows = self.db.respond(sql, params)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    open = True
+
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+@pytest.fixture
+def client(tmp_path, db, monkeypatch):
+    monkeypatch.delenv('GTA_MEASURE_CACHE_TTL', raising=False)
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client._pool, '_connect', lambda: FakeConnection(db))
+    return client
+
+
+class TestMeasureCache:
+    def test_get_requires_matching_version(self):
+        cache = MeasureCache()
+        assert cache.store((1, True, True), {'id': 1}, ('v1',), cache.token())
+        assert cache.get((1, True, True), ('v1',)) == {'id': 1}
+        assert cache.get((1, True, True), ('v2',)) is None
+        assert cache.stats['stale'] == 1
+        assert len(cache) == 0
+
+    def test_values_are_copies(self):
+        cache = MeasureCache()
+        value = {'interventions': [{'id': 5}]}
+        cache.store((1, True, True), value, 'v', cache.token())
+        value['interventions'].append({'id': 6})
+        served = cache.get((1, True, True), 'v')
+        served['title'] = 'annotated'
+        assert cache.get((1, True, True), 'v') == {'interventions': [{'id': 5}]}
+
+    def test_ttl_expiry(self):
+        cache = MeasureCache(ttl=0.0)
+        cache.store((1, True, True), {}, 'v', cache.token())
+        assert cache.get((1, True, True), 'v') is None
+        assert cache.stats['expired'] == 1
+
+    def test_lru_eviction(self):
+        cache = MeasureCache(max_entries=2)
+        for sa in (1, 2):
+            cache.store((sa, True, True), {}, 'v', cache.token())
+        cache.get((1, True, True), 'v')
+        cache.store((3, True, True), {}, 'v', cache.token())
+        assert cache.get((2, True, True), 'v') is None
+        assert cache.get((1, True, True), 'v') == {}
+
+    def test_invalidate_drops_all_variants(self):
+        cache = MeasureCache()
+        cache.store((1, True, True), {}, 'v', cache.token())
+        cache.store((1, False, False), {}, 'v', cache.token())
+        cache.store((2, True, True), {}, 'v', cache.token())
+        cache.invalidate(1)
+        assert len(cache) == 1
+
+    def test_intervention_write_maps_to_state_act(self):
+        cache = MeasureCache()
+        cache.store((1, True, True), {'interventions': [{'id': 11}]}, 'v', cache.token())
+        cache.store((2, True, True), {'interventions': [{'id': 22}]}, 'v', cache.token())
+        cache.invalidate_intervention(11)
+        assert cache.get((1, True, True), 'v') is None
+        assert cache.get((2, True, True), 'v') is not None
+
+    def test_unmapped_intervention_write_drops_variants_without_interventions(self):
+        cache = MeasureCache()
+        cache.store((1, False, True), {'id': 1}, 'v', cache.token())
+        cache.store((2, True, True), {'interventions': [{'id': 22}]}, 'v', cache.token())
+        cache.invalidate_intervention(99)
+        assert cache.get((1, False, True), 'v') is None
+        assert cache.get((2, True, True), 'v') is not None
+
+    def test_load_racing_a_write_is_not_stored(self):
+        cache = MeasureCache()
+        token = cache.token()
+        cache.invalidate(1)
+        assert not cache.store((1, True, True), {}, 'v', token)
+        assert cache.stats['discarded'] == 1
+
+    def test_disabled_by_zero_ttl(self, monkeypatch):
+        monkeypatch.setenv('GTA_MEASURE_CACHE_TTL', '0')
+        assert MeasureCache.from_env() is None
+
+
+class TestClientCaching:
+    def test_repeat_load_served_from_cache(self, client, db):
+        first = client.get_measure(7)
+        second = client.get_measure(7)
+        assert first == second
+        assert db.loads == 1
+        assert client._measure_cache.stats['hits'] == 1
+
+    def test_probe_change_reloads(self, client, db):
+        client.get_measure(7)
+        db.version['status_id'] = 3
+        client.get_measure(7)
+        assert db.loads == 2
+
+    def test_write_invalidates(self, client, db):
+        client.get_measure(7)
+        client.add_comment(7, 'note')
+        client.get_measure(7)
+        assert db.loads == 2
+
+    def test_intervention_write_invalidates(self, client, db):
+        client.get_measure(7)
+        client.add_rationale(11, 3)
+        client.get_measure(7)
+        assert db.loads == 2
+
+    def test_dry_run_keeps_entry(self, client, db):
+        client.get_measure(7)
+        client.add_rationale(11, 3, dry_run=True)
+        client.get_measure(7)
+        assert db.loads == 1
+
+    def test_probe_failure_switches_probe_off(self, client, db, capsys):
+        db.probe_error = pymysql.err.ProgrammingError(1146, "Table 'gta.api_comment_log' doesn't exist")
+        client.get_measure(7)
+        client.get_measure(7)
+        assert db.loads == 1
+        assert db.probes == 1
+        assert client._measure_cache.snapshot()['probe_enabled'] is False
+        assert capsys.readouterr().err.count('probe failed') == 1
+
+    def test_transient_probe_failure_keeps_probing(self, client, db):
+        db.probe_error = pymysql.err.OperationalError(2013, 'Lost connection to MySQL server during query')
+        client.get_measure(7)
+        db.probe_error = None
+        client.get_measure(7)
+        client.get_measure(7)
+        assert db.loads == 2
+        assert db.probes == 3
+        assert client._measure_cache.probe_enabled is True
+
+    def test_probe_off_still_invalidates_on_write(self, client, db):
+        db.probe_error = pymysql.err.ProgrammingError(1146, "Table 'gta.api_comment_log' doesn't exist")
+        client.get_measure(7)
+        client.add_comment(7, 'note')
+        client.get_measure(7)
+        assert db.loads == 2
+
+    def test_probe_reads_only_required_tables(self):
+        sql = GTADatabaseClient._measure_version_query(7).sql
+        assert 'api_intervention_product_level' not in sql
+        assert 'api_comment_log' in sql
+        assert 'api_comment_log' not in GTADatabaseClient._measure_version_query(7, include_comments=False).sql
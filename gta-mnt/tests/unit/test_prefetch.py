@@ -0,0 +1,140 @@
+"""Tests for the review-queue prefetcher and its server wiring.
+
+The warm callback is a fake that records which state acts it was asked for
+and can be held open — no DB or network needed.
+"""
+
+import asyncio
+
+import pytest
+
+from gta_mnt import server
+from gta_mnt.prefetch import QueuePrefetcher
+
+
+class FakeWarm:
+    def __init__(self, fail=()):
+        self.started = []
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, state_act_id):
+        self.started.append(state_act_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self.release.wait()
+            if state_act_id in self.fail:
+                raise RuntimeError('boom')
+        finally:
+            self.active -= 1
+
+
+async def settle():
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class TestQueuePrefetcher:
+    @pytest.mark.asyncio
+    async def test_head_warmed_in_order_with_bounded_concurrency(self):
+        warm = FakeWarm()
+        prefetcher = QueuePrefetcher(warm, depth=3, concurrency=2)
+        prefetcher.schedule([5, 4, 4, 3, 2, 1])
+        await settle()
+        assert warm.started == [5, 4]
+
+        warm.release.set()
+        await prefetcher._task
+        assert warm.started == [5, 4, 3]
+        assert warm.peak == 2
+        assert prefetcher.stats['warmed'] == 3
+
+    @pytest.mark.asyncio
+    async def test_same_head_is_not_restarted(self):
+        warm = FakeWarm()
+        prefetcher = QueuePrefetcher(warm, depth=2, concurrency=2)
+        prefetcher.schedule([1, 2, 3])
+        task = prefetcher._task
+        prefetcher.schedule([1, 2, 9])
+        assert prefetcher._task is task
+        assert prefetcher.stats['cancelled'] == 0
+        prefetcher.cancel()
+
+    @pytest.mark.asyncio
+    async def test_changed_queue_cancels_pending_items(self):
+        warm = FakeWarm()
+        prefetcher = QueuePrefetcher(warm, depth=3, concurrency=1)
+        prefetcher.schedule([1, 2, 3])
+        await settle()
+        prefetcher.schedule([7, 8])
+        await settle()
+        assert prefetcher.stats['cancelled'] == 1
+
+        warm.release.set()
+        await prefetcher._task
+        # 2 and 3 were never started
+        assert warm.started == [1, 7, 8]
+        assert prefetcher.snapshot()['plan'] == [7, 8]
+
+    @pytest.mark.asyncio
+    async def test_warmed_items_skipped_and_failures_retried(self):
+        warm = FakeWarm(fail={2})
+        warm.release.set()
+        prefetcher = QueuePrefetcher(warm, depth=2, concurrency=2, ttl=60)
+        prefetcher.schedule([1, 2])
+        await prefetcher._task
+        assert prefetcher.stats['failed'] == 1
+
+        prefetcher.schedule([2, 1])
+        await prefetcher._task
+        assert warm.started == [1, 2, 2]
+        assert prefetcher.stats['skipped'] == 1
+
+    def test_disabled_from_env(self, monkeypatch):
+        monkeypatch.setenv('GTA_PREFETCH_DEPTH', '0')
+        assert QueuePrefetcher.from_env(FakeWarm()) is None
+        monkeypatch.setenv('GTA_PREFETCH_DEPTH', '3')
+        monkeypatch.setenv('GTA_PREFETCH_CONCURRENCY', '1')
+        prefetcher = QueuePrefetcher.from_env(FakeWarm())
+        assert (prefetcher.depth, prefetcher.concurrency) == (3, 1)
+
+
+class FakeDBClient:
+    def __init__(self):
+        self.calls = []
+
+    def get_measure(self, state_act_id, include_interventions, include_comments):
+        self.calls.append((state_act_id, include_interventions, include_comments))
+        return {'id': state_act_id, 'sources': [{'source_url': f'https://example.gov/{state_act_id}.pdf'}]}
+
+
+class FakeFetcher:
+    def __init__(self):
+        self.warmed = []
+
+    async def warm_source(self, state_act_id, measure_data, source_index=0):
+        self.warmed.append(state_act_id)
+
+
+class TestServerWiring:
+    @pytest.mark.asyncio
+    async def test_warm_review_item_loads_both_measure_variants_and_source(self, monkeypatch):
+        db, fetcher = FakeDBClient(), FakeFetcher()
+        monkeypatch.setattr(server, '_db_client', db)
+        monkeypatch.setattr(server, '_source_fetcher', fetcher)
+        await server.warm_review_item(42)
+        assert db.calls == [(42, True, True), (42, False, False)]
+        assert fetcher.warmed == [42]
+
+    @pytest.mark.asyncio
+    async def test_queue_listing_schedules_its_ids(self, monkeypatch):
+        warm = FakeWarm()
+        prefetcher = QueuePrefetcher(warm, depth=2)
+        monkeypatch.setattr(server, '_prefetcher', prefetcher)
+        monkeypatch.setattr(server, '_prefetcher_ready', True)
+        server.prefetch_queue({'results': [{'id': 11}, {'id': 12}, {'id': 13}]})
+        assert prefetcher.snapshot()['plan'] == [11, 12]
+        prefetcher.cancel()
@@ -0,0 +1,258 @@
+"""Tests for list_step1_queue(): keyset pages, cached totals, jurisdiction filter;
+and export_queue(), its streamed file export.
+
+Uses a fake connection that serves a fixed queue and records every
+statement — no live DB needed.
+"""
+
+import csv
+import json
+from datetime import datetime
+
+import pymysql.cursors
+import pytest
+from pydantic import ValidationError
+
+from gta_mnt import api
+from gta_mnt.api import GTADatabaseClient, decode_queue_cursor, encode_queue_cursor
+from gta_mnt.formatters import format_queue_export
+from gta_mnt.server import ExportQueueInput, ListStep1QueueInput
+from gta_mnt.storage import ReviewStorage
+
+
+# (status_time, state_act_id) in queue order: newest first, NULL last
+QUEUE = [
+    {'id': 30, 'title': 'C', 'status_time': datetime(2026, 10, 3)},
+    {'id': 21, 'title': 'B2', 'status_time': datetime(2026, 10, 2)},
+    {'id': 20, 'title': 'B1', 'status_time': datetime(2026, 10, 2)},
+    {'id': 10, 'title': 'A', 'status_time': datetime(2026, 10, 1)},
+    {'id': 5, 'title': 'no log', 'status_time': None},
+]
+
+
+class FakeDB:
+    def __init__(self):
+        self.executed = []
+        self.cursors = []
+        self.marks = {'status_mark': 100, 'framework_mark': 7, 'ij_mark': 40}
+        self.total = 5
+
+    def respond(self, sql, params):
+        self.executed.append((sql, params))
+        if 'AS status_mark' in sql:
+            return [dict(self.marks)]
+        if 'COUNT(DISTINCT sa.state_act_id)' in sql:
+            return [{'count': self.total}]
+        rows = list(QUEUE)
+        if 'sa.state_act_id < %s' in sql:
+            if '(sl.status_time IS NULL AND' in sql:
+                after_time, after_id = None, params[-2]
+            else:
+                after_time, after_id = params[-4], params[-2]
+            rows = [r for r in rows if self._after(r, after_time, after_id)]
+        return rows[:params[-1]] if 'LIMIT %s' in sql else rows
+
+    @staticmethod
+    def _after(row, after_time, after_id):
+        t = row['status_time']
+        if after_time is None:
+            return t is None and row['id'] < after_id
+        after_time = datetime.fromisoformat(after_time)
+        return t is None or t < after_time or (t == after_time and row['id'] < after_id)
+
+
+class FakeCursor:
+    def __init__(self, db, cursor_class=None):
+        self.db = db
+        self.cursor_class = cursor_class
+        self.rows = []
+        self.description = None
+        self.fetches = 0
+        self.closed = False
+
+    def execute(self, sql, params=None):
+        self.rows = self.db.respond(sql, params)
+        self.description = [(name,) for name in (self.rows[0] if self.rows else {})]
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchmany(self, size):
+        self.fetches += 1
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    open = True
+
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, cursor_class=None):
+        cursor = FakeCursor(self.db, cursor_class)
+        self.db.cursors.append(cursor)
+        return cursor
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+@pytest.fixture
+def client(tmp_path, db, monkeypatch):
+    monkeypatch.delenv('GTA_QUEUE_COUNT_TTL', raising=False)
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client._pool, '_connect', lambda: FakeConnection(db))
+    return client
+
+
+def page_sql(db):
+    return [sql for sql, _ in db.executed if 'ORDER BY' in sql]
+
+
+class TestKeysetPagination:
+    def test_walks_queue_without_offset(self, client, db):
+        seen, cursor = [], None
+        while True:
+            page = client.list_step1_queue(limit=2, cursor=cursor)
+            seen += [r['id'] for r in page['results']]
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        assert seen == [30, 21, 20, 10, 5]
+        assert not any('OFFSET' in sql for sql in page_sql(db))
+        assert 'ORDER BY sl.status_time DESC, sa.state_act_id DESC' in page_sql(db)[0]
+
+    def test_cursor_round_trip(self):
+        cursor = encode_queue_cursor(datetime(2026, 10, 2, 9, 30), 21)
+        assert decode_queue_cursor(cursor) == ('2026-10-02 09:30:00', 21)
+        assert decode_queue_cursor(encode_queue_cursor(None, 5)) == (None, 5)
+
+    def test_bad_cursor_rejected(self, client):
+        with pytest.raises(ValueError, match='Invalid queue cursor'):
+            client.list_step1_queue(limit=2, cursor='not-a-cursor')
+        with pytest.raises(ValidationError):
+            ListStep1QueueInput(cursor='%%%')
+
+    def test_offset_still_supported(self, client, db):
+        client.list_step1_queue(limit=2, offset=2)
+        assert page_sql(db)[0].rstrip().endswith('LIMIT %s OFFSET %s')
+
+
+class TestCachedCount:
+    def test_count_reused_while_watermark_unchanged(self, client, db):
+        client.list_step1_queue(limit=2)
+        db.total = 99
+        assert client.list_step1_queue(limit=2)['count'] == 5
+        counts = [sql for sql, _ in db.executed if 'COUNT(DISTINCT' in sql]
+        assert len(counts) == 1
+
+    def test_watermark_move_recounts(self, client, db):
+        client.list_step1_queue(limit=2)
+        db.total, db.marks['status_mark'] = 4, 101
+        assert client.list_step1_queue(limit=2)['count'] == 4
+
+    def test_new_implementing_jurisdiction_recounts(self, client, db):
+        client.list_step1_queue(limit=2, implementing_jurisdictions=['DEU'])
+        db.total, db.marks['ij_mark'] = 6, 41
+        assert client.list_step1_queue(limit=2, implementing_jurisdictions=['DEU'])['count'] == 6
+
+    def test_cached_per_filter(self, client, db):
+        client.list_step1_queue(limit=2)
+        client.list_step1_queue(limit=2, exclude_framework_id=495)
+        client.list_step1_queue(status_id=19, limit=2)
+        assert len([sql for sql, _ in db.executed if 'COUNT(DISTINCT' in sql]) == 3
+
+    def test_ttl_zero_disables(self, client, db):
+        client._queue_count_ttl = 0
+        client.list_step1_queue(limit=2)
+        client.list_step1_queue(limit=2)
+        assert len([sql for sql, _ in db.executed if 'COUNT(DISTINCT' in sql]) == 2
+
+
+class TestJurisdictionFilter:
+    def test_semi_join_on_page_and_count(self, client, db):
+        client.list_step1_queue(limit=2, implementing_jurisdictions=['usa', '276'])
+        page = next((sql, p) for sql, p in db.executed if 'ORDER BY' in sql)
+        count = next((sql, p) for sql, p in db.executed if 'COUNT(DISTINCT' in sql)
+        for sql, params in (page, count):
+            assert 'EXISTS (' in sql and 'WHERE i.state_act_id = sa.state_act_id' in sql
+            assert 'j.iso_code IN (%s)' in sql
+            assert params[1:3] == [276, 'USA']
+
+    def test_jurisdictions_are_part_of_the_count_key(self, client, db):
+        client.list_step1_queue(limit=2, implementing_jurisdictions=['USA'])
+        client.list_step1_queue(limit=2)
+        assert len([sql for sql, _ in db.executed if 'COUNT(DISTINCT' in sql]) == 2
+
+
+class TestExport:
+    def test_jsonl_streamed_in_batches(self, client, db, tmp_path, monkeypatch):
+        monkeypatch.setattr(api, 'EXPORT_BATCH_ROWS', 2)
+        data = client.export_queue(status_id=19, exclude_framework_id=495)
+
+        cursor = db.cursors[-1]
+        assert cursor.cursor_class is pymysql.cursors.SSDictCursor
+        assert cursor.fetches == 4 and cursor.closed
+        sql, params = db.executed[-1]
+        assert 'LIMIT' not in sql and 'COUNT' not in sql
+        assert params == [495, 19]
+
+        path = tmp_path / '_exports' / data['path'].rsplit('/', 1)[1]
+        assert data['path'] == str(path) and path.name.startswith('queue-status19-')
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r['id'] for r in rows] == [30, 21, 20, 10, 5]
+        assert rows[0]['status_time'] == '2026-10-03 00:00:00'
+        assert data['rows'] == 5 and data['bytes'] == path.stat().st_size
+        assert data['newest_status_time'] == '2026-10-03 00:00:00'
+        assert data['oldest_status_time'] == '2026-10-01 00:00:00'
+        assert list((tmp_path / '_exports').iterdir()) == [path]
+
+    def test_csv_with_header(self, client, tmp_path):
+        data = client.export_queue(format='csv', implementing_jurisdictions=['USA'])
+        with open(data['path'], newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [r['title'] for r in rows] == ['C', 'B2', 'B1', 'A', 'no log']
+        assert data['columns'] == ['id', 'title', 'status_time']
+        assert data['filters']['implementing_jurisdictions'] == ['USA']
+
+    def test_failed_export_leaves_no_file(self, client, db, tmp_path, monkeypatch):
+        def fail(sql, params):
+            raise RuntimeError('connection lost')
+
+        monkeypatch.setattr(db, 'respond', fail)
+        with pytest.raises(RuntimeError):
+            client.export_queue()
+        assert list((tmp_path / '_exports').iterdir()) == []
+        assert db.cursors[-1].closed
+
+    def test_unknown_format_rejected(self, client):
+        with pytest.raises(ValueError):
+            client.export_queue(format='xlsx')
+        with pytest.raises(ValidationError):
+            ExportQueueInput(format='xlsx')
+        assert ExportQueueInput(format='CSV').format == 'csv'
+
+    def test_summary_formatting(self, client):
+        output = format_queue_export(client.export_queue(exclude_framework_id=495), queue_label='Step 2')
+        assert output.startswith('# Step 2 Queue Export')
+        assert '**Measures:** 5' in output
+        assert '**Entered status:** 2026-10-01 to 2026-10-03' in output
+        assert 'exclude_framework_id=495' in output
@@ -0,0 +1,103 @@
+"""Tests for the pooled, cached RAG client behind find_duplicates Vector G.
+
+The RAG service is an httpx.MockTransport that counts requests and can be
+slowed down — no network needed.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from gta_mnt.api import semantic_search_via_rag
+from gta_mnt.rag_client import RAGClient, search_key
+
+
+class FakeRAG:
+    def __init__(self, delay=0.0, status=200):
+        self.requests = []
+        self.delay = delay
+        self.status = status
+
+    async def __call__(self, request):
+        body = json.loads(request.content)
+        self.requests.append(body)
+        await asyncio.sleep(self.delay)
+        if self.status != 200:
+            return httpx.Response(self.status, text='unavailable')
+        return httpx.Response(200, json={'results': [{'intervention_id': 7, 'score': 0.9}]})
+
+
+def client_for(rag, **kwargs):
+    client = RAGClient('https://rag.example', 'key', **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(rag))
+    return client
+
+
+class TestSearchKey:
+    def test_pool_order_and_duplicates_ignored(self):
+        assert search_key('steel', [3, 1, 3], 20) == search_key('steel', [1, 3], 20)
+        assert search_key('steel', [1, 3], 20) != search_key('steel', [1, 3], 10)
+        assert search_key('steel', None, 20)[1] == ''
+
+
+class TestRAGClient:
+    @pytest.mark.asyncio
+    async def test_repeat_served_from_cache(self):
+        rag = FakeRAG()
+        client = client_for(rag)
+        first = await client.search('steel safeguard', [5, 4], 20)
+        second = await client.search('steel safeguard', [4, 5], 20)
+        await client.aclose()
+        assert first == second == {'results': [{'intervention_id': 7, 'score': 0.9}]}
+        assert rag.requests == [{'query': 'steel safeguard', 'limit': 20, 'intervention_ids': [5, 4]}]
+        assert client.stats['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_request(self):
+        rag = FakeRAG(delay=0.02)
+        client = client_for(rag)
+        results = await asyncio.gather(*(client.search('steel', None, 20) for _ in range(3)))
+        await client.aclose()
+        assert len(rag.requests) == 1
+        assert results[0] == results[2]
+        assert client.stats['shared'] == 2
+
+    @pytest.mark.asyncio
+    async def test_over_budget_degrades_to_skipped_and_caches_late_answer(self):
+        rag = FakeRAG(delay=0.05)
+        client = client_for(rag, budget=0.01)
+        result = await client.search('steel', None, 20)
+        assert result['skipped'] and 'latency budget' in result['reason']
+
+        await asyncio.sleep(0.08)
+        result = await client.search('steel', None, 20)
+        await client.aclose()
+        assert result == {'results': [{'intervention_id': 7, 'score': 0.9}]}
+        assert len(rag.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_skipped_and_not_cached(self):
+        rag = FakeRAG(status=503)
+        client = client_for(rag)
+        result = await client.search('steel', None, 20)
+        assert result['skipped'] and 'HTTPStatusError' in result['reason']
+        await client.search('steel', None, 20)
+        await client.aclose()
+        assert len(rag.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        client = client_for(FakeRAG(), cache_size=2)
+        for query in ('a', 'b', 'c'):
+            await client.search(query, None, 20)
+        await client.aclose()
+        assert client.snapshot()['entries'] == 2
+
+
+@pytest.mark.asyncio
+async def test_unconfigured_rag_is_skipped(monkeypatch):
+    monkeypatch.delenv('RAG_BASE_URL', raising=False)
+    result = await semantic_search_via_rag('steel')
+    assert result['skipped'] and 'RAG_BASE_URL' in result['reason']
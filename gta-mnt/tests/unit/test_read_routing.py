@@ -0,0 +1,249 @@
+"""Tests for read-replica routing and read-your-writes pins.
+
+Primary and replica are two recording fakes; a test checks which one saw
+each statement — no live DB needed.
+"""
+
+import asyncio
+
+import pymysql
+import pytest
+
+from gta_mnt.api import AsyncGTADatabaseClient, GTADatabaseClient
+from gta_mnt.read_routing import ANY_WRITE, INTERVENTION, STATE_ACT, ReadRouter
+from gta_mnt.storage import ReviewStorage
+
+
+def respond(sql, params):
+    if 'FROM api_state_act_log sa' in sql and 'api_state_act_status_list' in sql:
+        return [{'id': params[0], 'title': 'Decree 12/2026', 'status_id': 2}]
+    if 'i.intervention_id as id' in sql:
+        return [{'id': 70}, {'id': 71}]
+    if 'FROM api_intervention_log' in sql and 'state_act_id' in sql:
+        return [{'intervention_id': i, 'state_act_id': 7, 'title': 'Decree 12/2026'} for i in params]
+    if 'COUNT(DISTINCT sa.state_act_id)' in sql:
+        return [{'count': 1}]
+    return []
+
+
+class DB:
+    def __init__(self, name):
+        self.name = name
+        self.executed = []
+
+
+class Cursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+        self.lastrowid = 1
+
+    def execute(self, sql, params=None):
+        self.db.executed.append(sql)
+        self.rows = respond(sql, params)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class Connection:
+    open = True
+
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return Cursor(self.db)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+class AsyncCursor(Cursor):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        Cursor.execute(self, sql, params)
+
+    async def fetchall(self):
+        return Cursor.fetchall(self)
+
+    async def fetchone(self):
+        return Cursor.fetchone(self)
+
+
+class AsyncConnection(Connection):
+    closed = False
+
+    def cursor(self):
+        return AsyncCursor(self.db)
+
+    async def ping(self, reconnect=False):
+        pass
+
+
+def async_connect(db):
+    async def connect():
+        return AsyncConnection(db)
+    return connect
+
+
+@pytest.fixture
+def dbs():
+    return DB('primary'), DB('replica')
+
+
+@pytest.fixture
+def routed_env(monkeypatch):
+    monkeypatch.setenv('GTA_DB_HOST_READ', 'replica.example')
+    monkeypatch.setenv('GTA_DB_READ_PIN_SECONDS', '10')
+    monkeypatch.setenv('GTA_MEASURE_CACHE_TTL', '0')
+
+
+@pytest.fixture
+def client(tmp_path, dbs, routed_env, monkeypatch):
+    primary, replica = dbs
+    client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+    monkeypatch.setattr(client._pool, '_connect', lambda: Connection(primary))
+    monkeypatch.setattr(client._read_pool, '_connect', lambda: Connection(replica))
+    return client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('gta_mnt.read_routing.time.monotonic', lambda: now[0])
+    return now
+
+
+class TestReadRouter:
+    def test_state_act_pin_expires(self, clock):
+        router = ReadRouter(pin_seconds=10)
+        router.pin(7)
+        assert not router.use_replica(STATE_ACT, 7)
+        assert router.use_replica(STATE_ACT, 8)
+        assert not router.use_replica(ANY_WRITE)
+        assert router.use_replica(None)
+        clock[0] += 10
+        assert router.use_replica(STATE_ACT, 7)
+        assert router.use_replica(ANY_WRITE)
+        assert router.stats == {'replica': 4, 'primary': 2, 'pins': 1, 'fallbacks': 0}
+
+    def test_intervention_write_pins_known_state_act(self, clock):
+        router = ReadRouter()
+        router.learn(7, [70, 71])
+        router.pin(intervention_ids=[70])
+        assert not router.use_replica(STATE_ACT, 7)
+        assert router.use_replica(STATE_ACT, 8)
+        assert not router.use_replica(INTERVENTION, [71])
+
+    def test_unknown_intervention_pins_every_state_act(self, clock):
+        router = ReadRouter()
+        router.pin(intervention_ids=[99])
+        assert not router.use_replica(STATE_ACT, 8)
+        assert not router.use_replica(INTERVENTION, [1])
+        assert router.snapshot()['all_pinned'] is True
+
+    def test_off_without_replica_host(self, monkeypatch):
+        monkeypatch.delenv('GTA_DB_HOST_READ', raising=False)
+        assert ReadRouter.from_env() is None
+
+
+class TestClientRouting:
+    def test_reads_go_to_replica(self, client, dbs):
+        primary, replica = dbs
+        assert client.get_measure(7, include_comments=False)['title'] == 'Decree 12/2026'
+        client.list_templates()
+        assert primary.executed == []
+        assert replica.executed
+
+    def test_write_pins_its_state_act_to_primary(self, client, dbs, clock):
+        primary, replica = dbs
+        client.set_status(7, 3)
+        writes = len(primary.executed)
+
+        client.get_measure(7, include_comments=False)
+        assert len(primary.executed) > writes
+        assert replica.executed == []
+
+        # Other state acts still read from the replica, but listings do not
+        client.get_measure(8, include_comments=False)
+        assert replica.executed
+        seen = len(replica.executed)
+        client.list_step1_queue(limit=5)
+        assert len(replica.executed) == seen
+
+        clock[0] += 10
+        client.get_measure(7, include_comments=False)
+        client.list_step1_queue(limit=5)
+        assert len(replica.executed) > seen
+
+    def test_intervention_write_pins_loaded_measure(self, client, dbs, clock):
+        primary, replica = dbs
+        client.get_measure(7, include_comments=False)
+        client.add_ij(70, 840)
+        before = len(replica.executed)
+        client.get_measure(7, include_comments=False)
+        client.state_acts_for_interventions([71])
+        assert len(replica.executed) == before
+
+    def test_dry_run_does_not_pin(self, client, dbs):
+        client.add_ij(70, 840, dry_run=True)
+        assert client._router.stats['pins'] == 0
+
+    def test_unreachable_replica_falls_back_to_primary(self, client, dbs, monkeypatch, capsys):
+        primary, replica = dbs
+
+        def refuse():
+            raise pymysql.err.OperationalError(2003, "Can't connect to MySQL server")
+
+        monkeypatch.setattr(client._read_pool, '_connect', refuse)
+        assert client.get_measure(7, include_comments=False)['title'] == 'Decree 12/2026'
+        assert primary.executed
+        assert client.db_stats()['read_routing']['fallbacks'] == 1
+        assert 'Read replica unavailable' in capsys.readouterr().err
+
+    def test_without_replica_everything_uses_primary(self, tmp_path, dbs, monkeypatch):
+        monkeypatch.delenv('GTA_DB_HOST_READ', raising=False)
+        primary, replica = dbs
+        client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+        monkeypatch.setattr(client._pool, '_connect', lambda: Connection(primary))
+        client.list_templates()
+        assert primary.executed
+        assert client._read_pool is None
+        assert client.db_stats()['read_routing'] is None
+
+
+async def test_async_native_reads_follow_pins(tmp_path, dbs, routed_env, clock, monkeypatch):
+    primary, replica = dbs
+    client = AsyncGTADatabaseClient(
+        storage=ReviewStorage(base_path=str(tmp_path)),
+        connect=async_connect(primary),
+        connect_read=async_connect(replica),
+    )
+    monkeypatch.setattr(client._sync._pool, '_connect', lambda: Connection(primary))
+
+    await client.get_measure(7, include_comments=False)
+    assert primary.executed == []
+
+    await client.set_status(7, 3)
+    seen = len(replica.executed)
+    await asyncio.gather(client.get_measure(7, include_comments=False), client.list_step1_queue(limit=5))
+    assert len(replica.executed) == seen
+    assert client.db_stats()['read_routing']['pool']['threaded']['max_size'] >= 1
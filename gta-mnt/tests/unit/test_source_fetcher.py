@@ -1,18 +1,82 @@
 """Unit tests for source fetcher."""
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 from io import BytesIO
 
-from gta_mnt.source_fetcher import SourceFetcher
+from contextlib import asynccontextmanager
+
+from botocore.exceptions import ClientError
+
+from gta_mnt import source_fetcher as source_fetcher_module
+from gta_mnt.source_fetcher import (
+    SourceFetcher,
+    extract_html_text,
+    extract_pdf_pages,
+    extract_pdf_text,
+    parse_page_ranges,
+    search_lines,
+)
 from gta_mnt.models import SourceResult
 
 
 @pytest.fixture
-def source_fetcher():
+def source_fetcher(tmp_path):
     """Create SourceFetcher instance."""
+    from gta_mnt.storage import ReviewStorage
     with patch('gta_mnt.source_fetcher.boto3.client'):
-        return SourceFetcher()
+        fetcher = SourceFetcher(storage=ReviewStorage(base_path=str(tmp_path)))
+    yield fetcher
+    fetcher.close()
+
+
+def cached(fetcher, content):
+    """Put bytes in the fetcher's source cache, as a completed download would."""
+    writer = fetcher.storage.blob_writer()
+    writer.write(content)
+    return fetcher.storage.blob_path(writer.commit())
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, chunks=(), headers=None):
+        self.status_code = status_code
+        self.chunks = list(chunks)
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class FakeAsyncClient:
+    """Stands in for httpx.AsyncClient: serves queued responses to stream()."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @asynccontextmanager
+    async def stream(self, method, url, headers=None, follow_redirects=False):
+        self.requests.append((method, url, headers))
+        yield self.responses.pop(0)
 
 
 def test_parse_s3_url(source_fetcher):
@@ -55,7 +119,7 @@ def test_extract_pdf_text_success(source_fetcher):
         mock_page.extract_text.return_value = "This is PDF content." * 10  # Ensure > 100 chars
         mock_reader.return_value.pages = [mock_page]
 
-        result = source_fetcher._extract_pdf_text(b"fake-pdf-bytes")
+        result = extract_pdf_text(b"fake-pdf-bytes")["content"]
 
         assert "This is PDF content." in result
         assert "[PDF extraction failed" not in result
@@ -68,7 +132,7 @@ def test_extract_pdf_text_scanned_document(source_fetcher):
         mock_page.extract_text.return_value = ""  # Scanned PDF returns empty
         mock_reader.return_value.pages = [mock_page]
 
-        result = source_fetcher._extract_pdf_text(b"fake-pdf-bytes")
+        result = extract_pdf_text(b"fake-pdf-bytes")["content"]
 
         assert "[PDF extraction failed - likely scanned document" in result
 
@@ -76,7 +140,7 @@ def test_extract_pdf_text_scanned_document(source_fetcher):
 def test_extract_pdf_text_error(source_fetcher):
     """Test PDF extraction handles errors gracefully."""
     with patch('pypdf.PdfReader', side_effect=Exception("Parse error")):
-        result = source_fetcher._extract_pdf_text(b"fake-pdf-bytes")
+        result = extract_pdf_text(b"fake-pdf-bytes")["content"]
 
         assert "[PDF extraction error:" in result
 
@@ -94,7 +158,7 @@ def test_extract_html_text(source_fetcher):
     </html>
     """
 
-    result = source_fetcher._extract_html_text(html)
+    result = extract_html_text(html)["content"]
 
     assert "This is content." in result
     assert "Another paragraph." in result
@@ -110,8 +174,8 @@ async def test_get_source_s3_file(source_fetcher):
         "source_url": None
     }
 
-    with patch.object(source_fetcher, '_fetch_s3_file', return_value=b"PDF content bytes"):
-        with patch.object(source_fetcher, '_extract_pdf_text', return_value="Extracted text"):
+    with patch.object(source_fetcher, '_fetch_s3_file', return_value=cached(source_fetcher, b"PDF content bytes")):
+        with patch.object(source_fetcher, '_extract_cached', return_value={"content": "Extracted text"}):
             result = await source_fetcher.get_source(
                 state_act_id=123,
                 measure_data=measure_data,
@@ -133,16 +197,9 @@ async def test_get_source_url_fallback(source_fetcher):
         "source_url": "https://example.com/doc.html"
     }
 
-    with patch('httpx.AsyncClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = b"<html>HTML content</html>"
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        with patch.object(source_fetcher, '_extract_html_text', return_value="Extracted HTML"):
+    client = FakeAsyncClient(FakeResponse(chunks=[b"<html>HTML content</html>"]))
+    with patch('httpx.AsyncClient', client):
+        with patch.object(source_fetcher, '_extract_content', return_value={"content": "Extracted HTML"}):
             result = await source_fetcher.get_source(
                 state_act_id=123,
                 measure_data=measure_data,
@@ -186,3 +243,422 @@ async def test_get_source_no_source_available(source_fetcher):
             measure_data=measure_data,
             fetch_content=True
         )
+
+
+def _pdf_pages(n):
+    page = MagicMock()
+    page.extract_text.return_value = "This is PDF content." * 10
+    return [page] * n
+
+
+def test_extract_pdf_text_page_budget():
+    """Test PDF extraction stops at the page budget and says so."""
+    with patch('pypdf.PdfReader') as mock_reader:
+        mock_reader.return_value.pages = _pdf_pages(5)
+        result = extract_pdf_text(b"fake-pdf-bytes", max_pages=2)
+
+    assert (result["pages_extracted"], result["pages_total"]) == (2, 5)
+    assert result["truncated"] == "page budget of 2 pages"
+    assert "This is PDF content." in result["content"]
+
+
+def test_extract_pdf_text_time_budget():
+    """Test PDF extraction stops at the time budget, even before the first page."""
+    with patch('pypdf.PdfReader') as mock_reader:
+        mock_reader.return_value.pages = _pdf_pages(3)
+        result = extract_pdf_text(b"fake-pdf-bytes", time_budget=0)
+
+    assert result["pages_extracted"] == 0
+    assert result["truncated"] == "time budget of 0s"
+    assert "stopped by the time budget" in result["content"]
+
+
+@pytest.mark.asyncio
+async def test_s3_read_runs_off_event_loop(source_fetcher):
+    """Test the blocking boto3 read happens in a worker thread."""
+    threads = []
+
+    def get_object(Bucket, Key):
+        threads.append(threading.get_ident())
+        return {"Body": BytesIO(b"data")}
+
+    source_fetcher.s3_client.get_object = get_object
+    assert (await source_fetcher._fetch_s3_file("bucket", "key")).read_bytes() == b"data"
+    assert threads and threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_extraction_runs_in_process_pool(source_fetcher):
+    """Test HTML extraction round-trips through a worker process."""
+    source_fetcher.extract_workers = 1
+    result = await source_fetcher._extract_content("html", b"<p>Worker text</p>")
+    assert result == {"content": "Worker text"}
+    assert list(source_fetcher._pools) == [0]
+
+
+@pytest.mark.asyncio
+async def test_extraction_hard_timeout_resets_pool(source_fetcher, monkeypatch):
+    """Test a worker stuck past budget + grace is abandoned and the pool reset."""
+    def stuck(*args):
+        time.sleep(0.5)
+
+    monkeypatch.setattr(source_fetcher_module, "extract_content", stuck)
+    monkeypatch.setattr(source_fetcher_module, "EXTRACT_GRACE", 0.05)
+    source_fetcher.extract_timeout = 0
+    source_fetcher.extract_workers = 1
+    source_fetcher._pools = {0: ThreadPoolExecutor(1)}
+
+    result = await source_fetcher._extract_content("pdf", b"fake-pdf-bytes")
+
+    assert result["error"] == "timed out after 0s"
+    assert result["truncated"] == "time budget of 0s"
+    assert source_fetcher._pools == {}
+
+
+@pytest.mark.asyncio
+async def test_extraction_timeout_spares_other_workers(source_fetcher, monkeypatch):
+    """Test a stuck document only resets its own worker, not a concurrent extraction."""
+    def extract(content_type, source, *args):
+        if source == b"stuck":
+            time.sleep(0.6)
+        return {"content": "done"}
+
+    monkeypatch.setattr(source_fetcher_module, "extract_content", extract)
+    monkeypatch.setattr(source_fetcher_module, "EXTRACT_GRACE", 0.3)
+    source_fetcher.extract_timeout = 0
+    source_fetcher.extract_workers = 2
+    healthy = ThreadPoolExecutor(1)
+    source_fetcher._pools = {0: ThreadPoolExecutor(1), 1: healthy}
+
+    stuck, fine = await asyncio.gather(
+        source_fetcher._extract_content("pdf", b"stuck"),
+        source_fetcher._extract_content("pdf", b"fine"),
+    )
+
+    assert stuck["error"] == "timed out after 0s"
+    assert fine == {"content": "done"}
+    assert source_fetcher._pools == {1: healthy}
+
+
+@pytest.mark.asyncio
+async def test_extraction_inline_when_workers_disabled(source_fetcher):
+    """Test GTA_EXTRACT_WORKERS=0 extracts in a thread without a process pool."""
+    source_fetcher.extract_workers = 0
+    result = await source_fetcher._extract_content("html", b"<p>Thread text</p>")
+    assert result == {"content": "Thread text"}
+    assert source_fetcher._pools == {}
+
+
+class FakeS3:
+    """get_object that honours IfNoneMatch like S3 does."""
+
+    def __init__(self, body=b"%PDF bytes", etag='"v1"'):
+        self.body, self.etag = body, etag
+        self.calls = []
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        self.calls.append(IfNoneMatch)
+        if IfNoneMatch == self.etag:
+            raise ClientError({'Error': {'Code': '304', 'Message': 'Not Modified'}}, 'GetObject')
+        return {'Body': BytesIO(self.body), 'ETag': self.etag}
+
+
+@pytest.mark.asyncio
+async def test_s3_source_served_from_cache_while_fresh(source_fetcher):
+    """Test a second fetch within the max age makes no S3 request."""
+    source_fetcher.s3_client = FakeS3()
+    first = await source_fetcher._fetch_s3_file("bucket", "a.pdf")
+    second = await source_fetcher._fetch_s3_file("bucket", "a.pdf")
+    assert first == second and first.read_bytes() == b"%PDF bytes"
+    assert source_fetcher.s3_client.calls == [None]
+    assert source_fetcher.cache_stats['fresh'] == 1
+
+
+@pytest.mark.asyncio
+async def test_s3_source_revalidated_when_stale(source_fetcher):
+    """Test a stale cached object is revalidated with IfNoneMatch, then refetched on change."""
+    source_fetcher.s3_client = s3 = FakeS3()
+    source_fetcher.cache_max_age = 0
+    await source_fetcher._fetch_s3_file("bucket", "a.pdf")
+    assert (await source_fetcher._fetch_s3_file("bucket", "a.pdf")).read_bytes() == b"%PDF bytes"
+    assert s3.calls == [None, '"v1"']
+    assert source_fetcher.cache_stats['not_modified'] == 1
+
+    s3.body, s3.etag = b"%PDF amended", '"v2"'
+    assert (await source_fetcher._fetch_s3_file("bucket", "a.pdf")).read_bytes() == b"%PDF amended"
+    assert source_fetcher.cache_stats['downloaded'] == 2
+
+
+@pytest.mark.asyncio
+async def test_url_source_conditional_get(source_fetcher):
+    """Test URL revalidation sends the stored validators and accepts a 304."""
+    source_fetcher.cache_max_age = 0
+    client = FakeAsyncClient(
+        FakeResponse(chunks=[b"<p>Dec", b"ree</p>"],
+                     headers={'etag': 'W/"abc"', 'last-modified': 'Mon, 05 Oct 2026 10:00:00 GMT'}),
+        FakeResponse(status_code=304),
+    )
+    with patch('httpx.AsyncClient', client):
+        url = "https://example.gov/decree.html"
+        assert (await source_fetcher._fetch_url(url)).read_bytes() == b"<p>Decree</p>"
+        assert (await source_fetcher._fetch_url(url)).read_bytes() == b"<p>Decree</p>"
+
+    assert client.requests[0][2] == {}
+    assert client.requests[1][2] == {
+        'If-None-Match': 'W/"abc"',
+        'If-Modified-Since': 'Mon, 05 Oct 2026 10:00:00 GMT',
+    }
+    # Validators survive a 304 that omits them
+    meta = source_fetcher.storage.get_source_meta(url)
+    assert meta['etag'] == 'W/"abc"'
+
+
+@pytest.mark.asyncio
+async def test_failed_download_leaves_no_partial_blob(source_fetcher):
+    """Test an HTTP error discards the streamed temp file."""
+    with patch('httpx.AsyncClient', FakeAsyncClient(FakeResponse(status_code=503))):
+        with pytest.raises(RuntimeError, match="HTTP 503"):
+            await source_fetcher._fetch_url("https://example.gov/down.pdf")
+
+    assert list((source_fetcher.storage.cache_path / "blobs").iterdir()) == []
+    assert source_fetcher.storage.get_source_meta("https://example.gov/down.pdf") is None
+
+
+def pdf_pages_result(pages, total=3, truncated=None):
+    return {"pages_total": total, "pages": dict(pages), "truncated": truncated}
+
+
+PAGE_TEXT = {n: f"Page {n} of the decree. " * 8 for n in (1, 2, 3)}
+PAGE_TEXT[3] += "Tariff rate quota for steel."
+
+
+@pytest.mark.asyncio
+async def test_extracted_text_reused_for_identical_bytes(source_fetcher):
+    """Test the same bytes are extracted once, whichever source they came from."""
+    extract = AsyncMock(return_value=pdf_pages_result(PAGE_TEXT))
+    with patch.object(source_fetcher, '_extract_content', extract):
+        first = await source_fetcher._extract_cached("pdf", cached(source_fetcher, b"%PDF same"))
+        second = await source_fetcher._extract_cached("pdf", cached(source_fetcher, b"%PDF same"))
+
+    assert first == second
+    assert first["pages_extracted"] == 3 and first["content"].startswith("Page 1 of the decree.")
+    assert extract.await_count == 1
+    assert source_fetcher.cache_stats['text_hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_not_cached(source_fetcher):
+    """Test extraction errors are retried on the next request."""
+    extract = AsyncMock(side_effect=[{"error": "boom"}, pdf_pages_result(PAGE_TEXT)])
+    blob = cached(source_fetcher, b"%PDF flaky")
+    with patch.object(source_fetcher, '_extract_content', extract):
+        first = await source_fetcher._extract_cached("pdf", blob)
+        last = await source_fetcher._extract_cached("pdf", blob)
+
+    assert first["content"] == "[PDF extraction error: boom]"
+    assert extract.await_count == 2
+    assert last["pages_extracted"] == 3
+
+
+@pytest.mark.asyncio
+async def test_page_window_extracts_only_missing_pages(source_fetcher):
+    """Test a page request extracts just the pages not yet stored."""
+    calls = []
+
+    async def extract(content_type, source, page_numbers=None):
+        calls.append(page_numbers)
+        return pdf_pages_result({n: PAGE_TEXT[n] for n in (page_numbers or PAGE_TEXT)})
+
+    blob = cached(source_fetcher, b"%PDF gazette")
+    with patch.object(source_fetcher, '_extract_content', side_effect=extract):
+        window = await source_fetcher._extract_cached("pdf", blob, pages=[2])
+        await source_fetcher._extract_cached("pdf", blob, pages=[2, 3])
+        whole = await source_fetcher._extract_cached("pdf", blob)
+
+    assert calls == [[2], [3], [1]]
+    assert window["page_numbers"] == [2]
+    assert window["content"].startswith("--- Page 2 ---\nPage 2 of the decree.")
+    assert "Page 1" not in window["content"]
+    assert whole["pages_extracted"] == 3
+
+
+@pytest.mark.asyncio
+async def test_search_returns_only_matching_pages(source_fetcher):
+    """Test search narrows the result to the pages mentioning the term."""
+    extract = AsyncMock(return_value=pdf_pages_result(PAGE_TEXT))
+    with patch.object(source_fetcher, '_extract_content', extract):
+        hit = await source_fetcher._extract_cached("pdf", cached(source_fetcher, b"%PDF q"), search="TARIFF rate")
+        miss = await source_fetcher._extract_cached("pdf", cached(source_fetcher, b"%PDF q"), search="subsidy")
+
+    assert hit["page_numbers"] == [3]
+    assert hit["content"].startswith("--- Page 3 ---")
+    assert miss["page_numbers"] == []
+    assert miss["content"] == "[No page mentions 'subsidy' (3 of 3 pages searched).]"
+
+
+@pytest.mark.asyncio
+async def test_time_limited_pages_kept_and_resumed(source_fetcher):
+    """Test pages extracted before the time budget ran out are stored, and the rest extracted later."""
+    extract = AsyncMock(side_effect=[
+        pdf_pages_result({1: PAGE_TEXT[1]}, truncated="time budget of 60s"),
+        pdf_pages_result({2: PAGE_TEXT[2], 3: PAGE_TEXT[3]}),
+    ])
+    blob = cached(source_fetcher, b"%PDF slow")
+    with patch.object(source_fetcher, '_extract_content', extract):
+        partial = await source_fetcher._extract_cached("pdf", blob)
+        full = await source_fetcher._extract_cached("pdf", blob)
+
+    assert partial["truncated"] == "time budget of 60s" and partial["pages_extracted"] == 1
+    assert extract.await_args_list[1].args[2] == [2, 3]
+    assert full["truncated"] is None and full["pages_extracted"] == 3
+
+
+@pytest.mark.asyncio
+async def test_page_budget_reported_on_cache_hit(source_fetcher):
+    """Test a document longer than the page budget is reported as truncated every time."""
+    source_fetcher.max_pages = 2
+    extract = AsyncMock(return_value=pdf_pages_result({1: PAGE_TEXT[1], 2: PAGE_TEXT[2]}, total=3,
+                                                      truncated="page budget of 2 pages"))
+    blob = cached(source_fetcher, b"%PDF long")
+    with patch.object(source_fetcher, '_extract_content', extract):
+        await source_fetcher._extract_cached("pdf", blob)
+        again = await source_fetcher._extract_cached("pdf", blob)
+
+    assert extract.await_count == 1
+    assert again["truncated"] == "page budget of 2 pages"
+    assert (again["pages_extracted"], again["pages_total"]) == (2, 3)
+
+
+@pytest.mark.asyncio
+async def test_html_search_returns_matching_lines(source_fetcher):
+    """Test search on an HTML source returns hit lines with context."""
+    source_fetcher.extract_workers = 0
+    html = b"<p>Intro</p>\n<p>Scope</p>\n<p>Export ban on rice</p>\n<p>Entry into force</p>\n<p>Annex</p>"
+    result = await source_fetcher._extract_cached("html", cached(source_fetcher, html), search="export ban")
+    assert result == {"content": "Scope\nExport ban on rice\nEntry into force"}
+
+
+def test_extract_pdf_pages_decodes_only_selected_pages():
+    """Test page-ranged extraction leaves other pages untouched."""
+    pages = [MagicMock() for _ in range(5)]
+    for n, page in enumerate(pages, 1):
+        page.extract_text.return_value = f"text {n}"
+    with patch('pypdf.PdfReader') as mock_reader:
+        mock_reader.return_value.pages = pages
+        result = extract_pdf_pages(b"fake-pdf-bytes", [2, 4, 9])
+
+    assert result == {"pages_total": 5, "pages": {2: "text 2", 4: "text 4"}, "truncated": None}
+    assert [p.extract_text.called for p in pages] == [False, True, False, True, False]
+
+
+def test_parse_page_ranges():
+    """Test page selections parse to sorted unique pages and reject nonsense."""
+    assert parse_page_ranges("3, 1-2,2") == [1, 2, 3]
+    for bad in ("", "0", "5-2", "a-b", "1-100000"):
+        with pytest.raises(ValueError):
+            parse_page_ranges(bad)
+
+
+def test_search_lines_merges_windows():
+    """Test adjacent hits share one window and misses return None."""
+    text = "a\nduty x\nb\nduty y\nc\nd\ne\nduty z"
+    assert search_lines(text, "duty") == "a\nduty x\nb\nduty y\nc\n…\ne\nduty z"
+    assert search_lines(text, "quota") is None
+
+
+MULTI_SOURCE_MEASURE = {
+    "sources": [
+        {"s3_url": "s3://bucket/a.pdf", "source_url": "https://a.gov/a.pdf"},
+        {"source_url": "https://a.gov/b.html"},
+        {"s3_url": "s3://bucket/c.pdf", "source_url": None},
+    ]
+}
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_sources_concurrently(source_fetcher):
+    """Test every source is fetched, at most fetch_concurrency at a time, in source order."""
+    active = peak = 0
+
+    async def fetch_s3(bucket, key):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return cached(source_fetcher, f"%PDF {key}".encode())
+
+    async def fetch_url(url):
+        return cached(source_fetcher, b"<p>Page</p>")
+
+    async def extract(content_type, source, pages=None, search=None):
+        return {"content": f"text of {source.read_bytes().decode()}"}
+
+    source_fetcher.fetch_concurrency = 2
+    with patch.object(source_fetcher, '_fetch_s3_file', side_effect=fetch_s3), \
+            patch.object(source_fetcher, '_fetch_url', side_effect=fetch_url), \
+            patch.object(source_fetcher, '_extract_cached', side_effect=extract):
+        result = await source_fetcher.fetch_all_sources(123, MULTI_SOURCE_MEASURE)
+
+    assert [s.source_index for s in result.sources] == [0, 1, 2]
+    assert [s.content for s in result.sources] == [
+        "text of %PDF a.pdf", "text of <p>Page</p>", "text of %PDF c.pdf",
+    ]
+    assert all(s.error is None for s in result.sources)
+    assert peak == 2
+    # Each source keeps its own file in the review folder
+    assert len({s.saved_path for s in result.sources}) == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_sources_reports_failures_per_source(source_fetcher):
+    """Test a failing source is reported in its slot without failing the others."""
+    async def fetch_s3(bucket, key):
+        if key == "c.pdf":
+            raise ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'denied'}}, 'GetObject')
+        return cached(source_fetcher, b"%PDF ok")
+
+    async def fetch_url(url):
+        raise RuntimeError("connection reset")
+
+    with patch.object(source_fetcher, '_fetch_s3_file', side_effect=fetch_s3), \
+            patch.object(source_fetcher, '_fetch_url', side_effect=fetch_url), \
+            patch.object(source_fetcher, '_extract_cached', return_value={"content": "ok"}):
+        result = await source_fetcher.fetch_all_sources(123, MULTI_SOURCE_MEASURE)
+
+    ok, url_failed, s3_failed = result.sources
+    assert ok.error is None and ok.content == "ok"
+    assert url_failed.error == "URL fetch error: connection reset"
+    assert "S3 fetch failed" in s3_failed.error and "AccessDenied" in s3_failed.error
+    assert s3_failed.source_url == "s3://bucket/c.pdf"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_download(source_fetcher):
+    """Test two callers asking for the same URL at once trigger one request."""
+    client = FakeAsyncClient(FakeResponse(chunks=[b"<p>Decree</p>"]))
+    with patch('httpx.AsyncClient', client):
+        url = "https://example.gov/decree.html"
+        first, second = await asyncio.gather(source_fetcher._fetch_url(url), source_fetcher._fetch_url(url))
+
+    assert first == second
+    assert len(client.requests) == 1
+    assert source_fetcher.cache_stats['shared'] == 1
+    assert source_fetcher._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_warm_source_fills_caches_without_saving(source_fetcher):
+    """Test warm_source downloads and extracts, and get_source then reuses both."""
+    source_fetcher.extract_workers = 0
+    measure_data = {"sources": [{"source_url": "https://example.gov/decree.html"}]}
+    client = FakeAsyncClient(FakeResponse(chunks=[b"<html><p>Tariff decree</p></html>"]))
+    with patch('httpx.AsyncClient', client):
+        await source_fetcher.warm_source(123, measure_data)
+        assert not (source_fetcher.storage.base_path / "123").exists()
+
+        result = await source_fetcher.get_source(123, measure_data)
+
+    assert "Tariff decree" in result.content
+    assert len(client.requests) == 1
+    assert source_fetcher.cache_stats['text_hits'] == 1
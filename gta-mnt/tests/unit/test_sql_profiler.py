@@ -0,0 +1,241 @@
+"""Tests for the opt-in SQL profiler and gta_mnt_db_stats.
+
+Cursors are profiled subclasses of a recording fake instead of pymysql's
+DictCursor — no live DB needed.
+"""
+
+import json
+
+import pymysql.cursors
+import pytest
+
+from gta_mnt.api import GTADatabaseClient
+from gta_mnt.formatters import format_db_stats
+from gta_mnt.query_plan import Query, run_plan_async
+from gta_mnt.sql_profiler import SQLProfiler, current_method, fingerprint, profiled_cursor_class
+from gta_mnt.storage import ReviewStorage
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.connection = conn
+        self.rowcount = -1
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        self.connection.executed.append((sql, params))
+        self.connection.clock[0] += self.connection.cost(sql)
+        self.rows = [{'plan': 'ALL'}] if sql.startswith('EXPLAIN') else [{'id': 1}, {'id': 2}]
+        self.rowcount = len(self.rows)
+        return self.rowcount
+
+    def executemany(self, sql, rows):
+        for row in rows:
+            self.execute(sql, row)
+        self.rowcount = len(rows)
+        return self.rowcount
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    open = True
+
+    def __init__(self, profiler, clock, slow_marker='slow_table'):
+        self.executed = []
+        self.clock = clock
+        self.slow_marker = slow_marker
+        self.cursor_class = profiled_cursor_class(profiler, FakeCursor)
+
+    def cost(self, sql):
+        return 1.0 if self.slow_marker in sql else 0.0
+
+    def cursor(self, cursor_class=None):
+        return (cursor_class and FakeCursor or self.cursor_class)(self)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+    __del__ = close
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """perf_counter that only advances when a fake statement says so."""
+    now = [0.0]
+    monkeypatch.setattr('gta_mnt.sql_profiler.time.perf_counter', lambda: now[0])
+    monkeypatch.setattr('gta_mnt.query_plan.time.perf_counter', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return SQLProfiler(log_path=str(tmp_path / '_slow-queries.jsonl'), slow_ms=500, explain=True)
+
+
+class TestFingerprint:
+    def test_literals_and_lists_folded(self):
+        assert fingerprint("SELECT *\n  FROM t WHERE id IN (%s, %s, %s) AND name = 'x' LIMIT 20") == \
+            'SELECT * FROM t WHERE id IN (%s, ...) AND name = ? LIMIT ?'
+        assert fingerprint('INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)') == \
+            fingerprint('INSERT INTO t (a, b) VALUES (%s, %s)') + ', ...'
+        assert fingerprint('SELECT * FROM api_product_level8_list') == 'SELECT * FROM api_product_level8_list'
+
+
+class TestProfiledCursor:
+    def test_statements_aggregated_per_method_and_shape(self, profiler, clock):
+        conn = FakeConnection(profiler, clock)
+        token = current_method.set('get_measure')
+        try:
+            for ids in ([1, 2], [3, 4, 5]):
+                conn.cursor().execute(f"SELECT * FROM t WHERE id IN ({', '.join(['%s'] * len(ids))})", ids)
+        finally:
+            current_method.reset(token)
+        conn.cursor().executemany('INSERT INTO t (a) VALUES (%s)', [(1,), (2,), (3,)])
+
+        summary = profiler.summary()
+        assert summary['executed'] == 3
+        assert summary['methods']['get_measure']['statements'] == 2
+        stmt = next(s for s in summary['statements'] if s['method'] == 'get_measure')
+        assert (stmt['calls'], stmt['rows']) == (2, 4)
+        assert summary['methods']['(unattributed)']['rows'] == 3
+
+    def test_slow_statement_logged_with_explain(self, profiler, clock):
+        conn = FakeConnection(profiler, clock)
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM slow_table WHERE id = %s', (7,))
+        assert cursor.fetchall() == [{'id': 1}, {'id': 2}]
+
+        entry = json.loads(profiler.log_path.read_text().strip())
+        assert entry['elapsed_ms'] == 1000.0
+        assert entry['params'] == '(7,)'
+        assert entry['explain'] == [{'plan': 'ALL'}]
+        assert conn.executed[-1] == ('EXPLAIN SELECT * FROM slow_table WHERE id = %s', (7,))
+        assert profiler.summary()['slow'] == 1
+
+    def test_writes_not_explained(self, profiler, clock):
+        conn = FakeConnection(profiler, clock)
+        conn.cursor().execute('UPDATE slow_table SET a = %s', (1,))
+        entry = json.loads(profiler.log_path.read_text().strip())
+        assert 'explain' not in entry
+
+
+class FakeStreamingCursor(FakeCursor, pymysql.cursors.SSDictCursor):
+    """Passes for an unbuffered cursor; behaves like FakeCursor."""
+
+    execute = FakeCursor.execute
+
+    def close(self):
+        pass
+
+    __del__ = close
+
+
+def test_unbuffered_statement_logged_without_explain(profiler, clock):
+    conn = FakeConnection(profiler, clock)
+    cursor = profiled_cursor_class(profiler, FakeStreamingCursor)(conn)
+    cursor.execute('SELECT * FROM slow_table')
+
+    entry = json.loads(profiler.log_path.read_text())
+    assert 'explain' not in entry and entry['rows'] == -1
+    assert not any(sql.startswith('EXPLAIN') for sql, _ in conn.executed)
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def connection(self):
+        pool = self
+
+        class Scope:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Scope()
+
+
+class AsyncFakeCursor(FakeCursor):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        return FakeCursor.execute(self, sql, params)
+
+    async def fetchall(self):
+        return FakeCursor.fetchall(self)
+
+    async def fetchone(self):
+        return FakeCursor.fetchone(self)
+
+
+class AsyncFakeConnection(FakeConnection):
+    def cursor(self):
+        return AsyncFakeCursor(self)
+
+
+async def test_async_plans_profiled(profiler, clock):
+    conn = AsyncFakeConnection(profiler, clock)
+
+    def plan():
+        rows = yield Query('SELECT * FROM slow_table')
+        batch = yield (Query('SELECT a FROM t', one=True), Query('SELECT b FROM t'))
+        return rows, batch
+
+    token = current_method.set('find_duplicates')
+    try:
+        await run_plan_async(plan(), FakePool(conn), profiler)
+    finally:
+        current_method.reset(token)
+
+    summary = profiler.summary()
+    assert summary['methods']['find_duplicates'] == {'statements': 3, 'total_ms': 1000.0, 'rows': 5}
+    assert json.loads(profiler.log_path.read_text())['explain'] == [{'plan': 'ALL'}]
+
+
+class TestDbStats:
+    def test_client_attributes_statements_to_pooled_method(self, tmp_path, clock, monkeypatch):
+        monkeypatch.setenv('GTA_SQL_PROFILE', '1')
+        client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+        monkeypatch.setattr(client._pool, '_connect', lambda: FakeConnection(client._profiler, clock))
+        client.list_templates()
+
+        stats = client.db_stats()
+        assert list(stats['profile']['methods']) == ['list_templates']
+        assert stats['profile']['slow_log'] == str(tmp_path / '_slow-queries.jsonl')
+        assert stats['pool']['max_size'] >= 1
+
+        client.db_stats(reset=True)
+        assert client.db_stats()['profile']['executed'] == 0
+
+    def test_profiling_off_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('GTA_SQL_PROFILE', raising=False)
+        client = GTADatabaseClient(storage=ReviewStorage(base_path=str(tmp_path)))
+        output = format_db_stats({**client.db_stats(), 'rag': None})
+        assert 'Profiling is off' in output
+        assert '| RAG client | disabled or not used yet |' in output
@@ -396,3 +396,72 @@ def test_get_log_path(temp_storage):
 
     assert log_path.name == "review-log.md"
     assert str(state_act_id) in str(log_path)
+
+
+def test_secondary_sources_do_not_overwrite_primary(temp_storage, sample_pdf_bytes, sample_html_bytes):
+    """Test sources beyond index 0 get content-addressed names and a manifest entry."""
+    import json
+    state_act_id = 12345
+    primary = temp_storage.save_source(state_act_id, sample_pdf_bytes, "pdf", "https://a.gov/1.pdf")
+    second = temp_storage.save_source(state_act_id, b"%PDF-1.4 annex", "pdf", "https://a.gov/2.pdf", source_index=1)
+    third = temp_storage.save_source(state_act_id, sample_html_bytes, "html", "https://a.gov/3", source_index=2)
+
+    assert primary.name == "source.pdf"
+    assert primary.read_bytes() == sample_pdf_bytes
+    assert second.name == f"source-{temp_storage.digest(b'%PDF-1.4 annex')[:12]}.pdf"
+    assert third.suffix == ".html"
+    # source-url.txt still names the primary source
+    assert (primary.parent / "source-url.txt").read_text() == "https://a.gov/1.pdf"
+
+    manifest = json.loads((primary.parent / "sources.json").read_text())
+    assert [manifest[i]["file"] for i in ("0", "1", "2")] == [primary.name, second.name, third.name]
+    assert manifest["1"]["url"] == "https://a.gov/2.pdf"
+
+
+# ============================================================================
+# Source Cache Tests
+# ============================================================================
+
+def put_blob(storage, content):
+    """Stream bytes into the source cache in one chunk; returns the digest."""
+    writer = storage.blob_writer()
+    writer.write(content)
+    return writer.commit()
+
+
+def test_blob_stored_once_by_digest(temp_storage, sample_pdf_bytes):
+    """Test identical source bytes share one content-addressed blob."""
+    digest = put_blob(temp_storage, sample_pdf_bytes)
+
+    assert put_blob(temp_storage, sample_pdf_bytes) == digest
+    assert temp_storage.blob_path(digest).read_bytes() == sample_pdf_bytes
+    assert len(list((temp_storage.cache_path / "blobs").rglob("*"))) == 2  # shard dir + blob
+    assert not temp_storage.blob_path("0" * 64).exists()
+
+
+def test_text_cached_per_extractor_version(temp_storage, sample_pdf_bytes):
+    """Test extracted text is keyed by (digest, extractor version)."""
+    digest = put_blob(temp_storage, sample_pdf_bytes)
+    temp_storage.put_text(digest, "v1-pdf-p200", {"content": "Text", "pages_total": 1})
+
+    assert temp_storage.get_text(digest, "v1-pdf-p200") == {"content": "Text", "pages_total": 1}
+    assert temp_storage.get_text(digest, "v2-pdf-p200") is None
+
+
+def test_source_meta_roundtrip(temp_storage):
+    """Test per-URL cache records are stored and read back."""
+    url = "https://example.gov/decree.pdf"
+    assert temp_storage.get_source_meta(url) is None
+
+    temp_storage.put_source_meta(url, {"sha256": "ab" * 32, "etag": '"v1"', "checked_at": 1.0})
+
+    assert temp_storage.get_source_meta(url) == {
+        "url": url, "sha256": "ab" * 32, "etag": '"v1"', "checked_at": 1.0,
+    }
+
+
+def test_cache_folder_is_not_a_review(temp_storage, sample_pdf_bytes):
+    """Test the cache lives beside, not inside, the per-StateAct folders."""
+    put_blob(temp_storage, sample_pdf_bytes)
+    assert temp_storage.cache_path.parent == temp_storage.base_path
+    assert not temp_storage.cache_path.name.isdigit()
@@ -2,10 +2,15 @@
 
 import asyncio
 import json
+import time
 from typing import Dict, Any, Optional, List, Tuple
 import httpx
 from rapidfuzz import fuzz
 
+from .hedging import RequestHedger
+from .prefetch import Prefetcher
+from .instrumentation import detach_call, record_cache, record_upstream, stage
+
 # MAST chapter letter to API ID mapping
 # Based on API schema MastChaptersEnum
 MAST_CHAPTER_TO_ID = {
@@ -592,27 +597,120 @@ class GTAAPIClient:
 
     DEFAULT_BASE_URL = "https://api.globaltradealert.org"
 
-    def __init__(self, api_key: str, base_url: str | None = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str | None = None,
+        hedger: Optional[RequestHedger] = None,
+        prefetcher: Optional[Prefetcher] = None,
+    ):
         """Initialize the GTA API client.
 
         Args:
             api_key: The GTA API key for authentication
             base_url: Optional base URL override for the API
+            hedger: Optional shared RequestHedger. When set, read paths
+                (search, batch fetch, counts, semantic search) are hedged
+                against slow upstream workers.
+            prefetcher: Optional shared Prefetcher. When set, paginated reads
+                (search, ticker, impact chains) prefetch the next page after
+                returning a full one.
         """
         self.api_key = api_key
         self.base_url = base_url or self.DEFAULT_BASE_URL
+        self.hedger = hedger
+        self.prefetcher = prefetcher
         self.headers = {
             "Authorization": f"APIKey {api_key}",
             "Content-Type": "application/json"
         }
-    
+
+    async def _post(
+        self,
+        endpoint: str,
+        body: Dict[str, Any],
+        timeout: float = 30.0,
+        hedge: bool = False,
+        paginated: bool = False,
+    ) -> Any:
+        """POST a JSON body to an API endpoint and return the decoded response.
+
+        Args:
+            endpoint: Absolute endpoint URL
+            body: JSON request body
+            timeout: Request timeout in seconds
+            hedge: Whether the call is an idempotent read that may be hedged
+            paginated: Whether the body is a limit/offset page read. With a
+                prefetcher configured, such reads are served from prefetched
+                pages and a full page triggers a prefetch of the next one.
+
+        Raises:
+            httpx.HTTPStatusError: If API request fails
+        """
+        path = endpoint[len(self.base_url):]
+        if self.prefetcher is None or not paginated:
+            data, _ = await self._fetch(endpoint, path, body, timeout, hedge)
+            return data
+
+        self.prefetcher.touch()
+        found, data = await self.prefetcher.lookup(self.prefetcher.make_key(path, body))
+        record_cache("prefetch", hit=found)
+        if not found:
+            data, _ = await self._fetch(endpoint, path, body, timeout, hedge)
+
+        rows = data if isinstance(data, list) else data.get("results") if isinstance(data, dict) else None
+        if isinstance(rows, list) and body.get("limit") and len(rows) >= body["limit"]:
+            next_body = dict(body, offset=body.get("offset", 0) + body["limit"])
+
+            async def _prefetch_next() -> Tuple[Any, int]:
+                detach_call()
+                return await self._fetch(endpoint, path, next_body, timeout, hedge)
+
+            self.prefetcher.schedule(self.prefetcher.make_key(path, next_body), _prefetch_next)
+        return data
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        path: str,
+        body: Dict[str, Any],
+        timeout: float,
+        hedge: bool,
+    ) -> Tuple[Any, int]:
+        """Send one request upstream, returning (decoded response, body size in bytes)."""
+
+        async def _send() -> Tuple[Any, int]:
+            started = time.perf_counter()
+            try:
+                async with httpx.AsyncClient(timeout=timeout) as client:
+                    with stage("upstream"):
+                        response = await client.post(endpoint, json=body, headers=self.headers)
+            except httpx.HTTPError as e:
+                record_upstream(path, type(e).__name__, (time.perf_counter() - started) * 1000)
+                raise
+            record_upstream(
+                path,
+                str(response.status_code),
+                (time.perf_counter() - started) * 1000,
+                bytes_sent=len(response.request.content),
+                bytes_received=len(response.content),
+            )
+            response.raise_for_status()
+            with stage("json_decode"):
+                return response.json(), len(response.content)
+
+        if hedge and self.hedger is not None:
+            return await self.hedger.run(path, _send)
+        return await _send()
+
     async def search_interventions(
         self,
         filters: Dict[str, Any],
         limit: int = 50,
         offset: int = 0,
         sorting: Optional[str] = None,
-        show_keys: Optional[List[str]] = None
+        show_keys: Optional[List[str]] = None,
+        paginated: bool = False,
     ) -> List[Dict[str, Any]]:
         """Search for interventions using GTA Data V2 endpoint.
 
@@ -627,6 +725,8 @@ class GTAAPIClient:
             show_keys: Optional list of response keys to include. When provided,
                     only these fields are returned per intervention, reducing response size.
                     Example: ["intervention_id", "state_act_title", "gta_evaluation"]
+            paginated: True when the caller pages through results with offset,
+                    making the next page eligible for prefetch.
 
         Returns:
             List of intervention data
@@ -651,14 +751,7 @@ class GTAAPIClient:
         if show_keys:
             body["show_keys"] = show_keys
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                endpoint,
-                json=body,
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post(endpoint, body, hedge=True, paginated=paginated)
     
     async def get_intervention(self, intervention_id: int) -> Dict[str, Any]:
         """Get a specific intervention by ID.
@@ -684,19 +777,12 @@ class GTAAPIClient:
             }
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                endpoint,
-                json=body,
-                headers=self.headers
-            )
-            response.raise_for_status()
-            data = response.json()
+        data = await self._post(endpoint, body)
 
-            if not data or len(data) == 0:
-                raise ValueError(f"Intervention {intervention_id} not found")
+        if not data or len(data) == 0:
+            raise ValueError(f"Intervention {intervention_id} not found")
 
-            return data[0]
+        return data[0]
     
     async def get_interventions_batch(
         self,
@@ -730,10 +816,7 @@ class GTAAPIClient:
         if show_keys and show_keys != ["*"]:
             body["show_keys"] = show_keys
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(endpoint, json=body, headers=self.headers)
-            response.raise_for_status()
-            raw = response.json()
+        raw = await self._post(endpoint, body, hedge=True)
 
         fetched = raw if isinstance(raw, list) else raw.get("results", [])
 
@@ -781,14 +864,7 @@ class GTAAPIClient:
             "request_data": filters
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                endpoint,
-                json=body,
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post(endpoint, body, paginated=True)
     
     async def count_interventions(
         self,
@@ -819,16 +895,9 @@ class GTAAPIClient:
             "request_data": request_data,
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                endpoint,
-                json=payload,
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            data = response.json()
-            # API returns {"count": N, "results": [...]}, extract results
-            return data.get("results", data)
+        data = await self._post(endpoint, payload, timeout=60.0, hedge=True)
+        # API returns {"count": N, "results": [...]}, extract results
+        return data.get("results", data)
 
     async def get_facets(
         self,
@@ -878,6 +947,29 @@ class GTAAPIClient:
         results = await asyncio.gather(*tasks)
         return dict(results)
 
+    async def count_total(self, count_filters: Dict[str, Any]) -> int:
+        """Return the number of interventions matching the given count filters.
+
+        Groups by gta_evaluation (a handful of rows, one evaluation per
+        intervention) and sums the buckets, so this is a cheap way to size
+        a search before fetching any records.
+
+        Args:
+            count_filters: Already-built count endpoint filters (from build_count_filters).
+
+        Returns:
+            Total number of matching interventions.
+
+        Raises:
+            httpx.HTTPStatusError: If API request fails.
+        """
+        records = await self.count_interventions(
+            count_by=["gta_evaluation"],
+            count_variable="intervention_id",
+            filters=count_filters,
+        )
+        return sum(int(rec.get("value", 0)) for rec in records)
+
     async def get_impact_chains(
         self,
         granularity: str,
@@ -907,14 +999,7 @@ class GTAAPIClient:
             "request_data": filters
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                endpoint,
-                json=body,
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post(endpoint, body, paginated=True)
 
 
     async def semantic_search_interventions(
@@ -956,10 +1041,7 @@ class GTAAPIClient:
         if include_matched_snippets:
             body["include_matched_snippets"] = True
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(endpoint, json=body, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        return await self._post(endpoint, body, hedge=True)
 
 
 def convert_intervention_types(type_names: List[Any]) -> List[int]:
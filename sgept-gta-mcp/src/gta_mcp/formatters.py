@@ -1024,3 +1024,101 @@ def format_interventions_batch_json(
     if len(out) > CHARACTER_LIMIT:
         out = out[:CHARACTER_LIMIT] + "\n// truncated"
     return out
+
+
+# ============================================================================
+# Server diagnostics
+# ============================================================================
+
+
+def _format_summary_cells(summary: Optional[Dict[str, Any]]) -> str:
+    """Render a histogram summary as 'p50 | p95 | max' table cells."""
+    if not summary or not summary.get("count"):
+        return "– | – | –"
+    return f"{summary['p50']:,.0f} | {summary['p95']:,.0f} | {summary['max']:,.0f}"
+
+
+def format_server_stats_markdown(snapshot: Dict[str, Any]) -> str:
+    """Render an instrumentation snapshot as markdown tables.
+
+    Args:
+        snapshot: Output of ``MetricsRegistry.snapshot()``, optionally with a
+            ``hedging`` dict of request-hedger counters.
+
+    Returns:
+        Markdown string with per-tool, per-stage, upstream and cache tables.
+    """
+    lines = [
+        "# GTA MCP Server Stats",
+        f"Uptime: {snapshot.get('uptime_seconds', 0):,.0f}s",
+        "",
+    ]
+
+    tools = snapshot.get("tools") or {}
+    lines.append("## Tools")
+    if tools:
+        lines.append("| Tool | Calls | Errors | p50 ms | p95 ms | max ms | p95 response bytes | p95 upstream bytes |")
+        lines.append("|---|---:|---:|---:|---:|---:|---:|---:|")
+        for name, entry in sorted(tools.items()):
+            resp = (entry.get("response_bytes") or {}).get("p95")
+            upstream = (entry.get("upstream_bytes") or {}).get("p95")
+            lines.append(
+                f"| {name} | {entry.get('calls', 0):,} | {entry.get('errors', 0):,} | "
+                f"{_format_summary_cells(entry.get('latency_ms'))} | "
+                f"{f'{resp:,.0f}' if resp is not None else '–'} | "
+                f"{f'{upstream:,.0f}' if upstream is not None else '–'} |"
+            )
+    else:
+        lines.append("*No tool calls recorded yet.*")
+    lines.append("")
+
+    stages = snapshot.get("stages") or {}
+    if stages:
+        lines.append("## Stages")
+        lines.append("| Tool / stage | Count | p50 ms | p95 ms | max ms |")
+        lines.append("|---|---:|---:|---:|---:|")
+        for name, summary in sorted(stages.items()):
+            lines.append(f"| {name} | {summary.get('count', 0):,} | {_format_summary_cells(summary)} |")
+        lines.append("")
+
+    upstream = snapshot.get("upstream") or {}
+    if upstream:
+        lines.append("## Upstream endpoints")
+        lines.append("| Endpoint | Requests | Statuses | p50 ms | p95 ms | max ms | p95 response bytes |")
+        lines.append("|---|---:|---|---:|---:|---:|---:|")
+        for endpoint, entry in sorted(upstream.items()):
+            statuses = ", ".join(f"{k}: {v}" for k, v in sorted(entry.get("statuses", {}).items()))
+            resp = (entry.get("response_bytes") or {}).get("p95")
+            lines.append(
+                f"| {endpoint} | {entry.get('requests', 0):,} | {statuses} | "
+                f"{_format_summary_cells(entry.get('latency_ms'))} | "
+                f"{f'{resp:,.0f}' if resp is not None else '–'} |"
+            )
+        lines.append("")
+
+    caches = snapshot.get("caches") or {}
+    if caches:
+        lines.append("## Caches")
+        lines.append("| Cache | Hits | Misses | Hit ratio |")
+        lines.append("|---|---:|---:|---:|")
+        for name, entry in sorted(caches.items()):
+            ratio = entry.get("hit_ratio")
+            lines.append(
+                f"| {name} | {entry.get('hits', 0):,} | {entry.get('misses', 0):,} | "
+                f"{f'{ratio:.1%}' if ratio is not None else '–'} |"
+            )
+        lines.append("")
+
+    hedging = snapshot.get("hedging")
+    if hedging:
+        lines.append("## Request hedging")
+        lines.append(", ".join(f"{k}: {v:,}" for k, v in hedging.items()))
+        lines.append("")
+
+    prefetch = snapshot.get("prefetch")
+    if prefetch:
+        lines.append("## Next-page prefetch")
+        lines.append(", ".join(f"{k}: {v:,}" for k, v in prefetch.items()))
+        lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
@@ -0,0 +1,169 @@
+"""Request hedging for GTA API read paths.
+
+A hedged request fires a duplicate of a slow call once the original has been
+outstanding for longer than the endpoint's rolling p95 latency, returns
+whichever response arrives first and cancels the other. Duplicates are paid
+for from a token budget that accrues a fixed fraction of a token per primary
+request, so hedging can never add more than the configured percentage of
+extra upstream load.
+
+Hedging is opt-in and configured from the environment:
+
+- GTA_HEDGE_ENABLED: "1"/"true" to enable (default off)
+- GTA_HEDGE_MAX_EXTRA_PERCENT: max duplicate load as % of requests (default 5)
+- GTA_HEDGE_QUANTILE: latency quantile used as the hedge delay (default 0.95)
+- GTA_HEDGE_MIN_DELAY_MS: floor for the hedge delay (default 50)
+- GTA_HEDGE_MIN_SAMPLES: samples needed before an endpoint is hedged (default 20)
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+
+DEFAULT_MAX_EXTRA_PERCENT = 5.0
+DEFAULT_QUANTILE = 0.95
+DEFAULT_MIN_DELAY_MS = 50.0
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_WINDOW_SIZE = 200
+
+# Cap on accrued hedge tokens, so a long quiet period cannot be spent as a
+# burst of duplicates against an upstream that has just started to struggle.
+MAX_BUDGET_TOKENS = 10.0
+
+
+class LatencyWindow:
+    """Rolling window of recent latencies (seconds) for one endpoint."""
+
+    def __init__(self, size: int = DEFAULT_WINDOW_SIZE):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the q-quantile of the window, or None if it is empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
+
+
+class RequestHedger:
+    """Budgeted hedging of idempotent async requests.
+
+    One instance is shared for the lifetime of the server process so the
+    latency windows and the hedge budget survive across tool calls.
+    """
+
+    def __init__(
+        self,
+        max_extra_percent: float = DEFAULT_MAX_EXTRA_PERCENT,
+        quantile: float = DEFAULT_QUANTILE,
+        min_delay_ms: float = DEFAULT_MIN_DELAY_MS,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+    ):
+        if not 0.0 < quantile < 1.0:
+            raise ValueError(f"Hedge quantile must be between 0 and 1, got {quantile}")
+        if max_extra_percent < 0:
+            raise ValueError(f"Hedge budget must be non-negative, got {max_extra_percent}")
+        self.max_extra_ratio = max_extra_percent / 100.0
+        self.quantile = quantile
+        self.min_delay = min_delay_ms / 1000.0
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self._windows: Dict[str, LatencyWindow] = {}
+        self._tokens = 0.0
+        self.stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "budget_denied": 0}
+
+    @classmethod
+    def from_env(cls) -> Optional["RequestHedger"]:
+        """Build a hedger from GTA_HEDGE_* variables, or None when disabled."""
+        if os.getenv("GTA_HEDGE_ENABLED", "").strip().lower() not in {"1", "true", "yes", "on"}:
+            return None
+        return cls(
+            max_extra_percent=float(os.getenv("GTA_HEDGE_MAX_EXTRA_PERCENT", str(DEFAULT_MAX_EXTRA_PERCENT))),
+            quantile=float(os.getenv("GTA_HEDGE_QUANTILE", str(DEFAULT_QUANTILE))),
+            min_delay_ms=float(os.getenv("GTA_HEDGE_MIN_DELAY_MS", str(DEFAULT_MIN_DELAY_MS))),
+            min_samples=int(os.getenv("GTA_HEDGE_MIN_SAMPLES", str(DEFAULT_MIN_SAMPLES))),
+        )
+
+    def _window(self, key: str) -> LatencyWindow:
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = LatencyWindow(self.window_size)
+        return window
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging `key`, or None if not enough samples yet."""
+        window = self._window(key)
+        if len(window) < self.min_samples:
+            return None
+        return max(self.min_delay, window.quantile(self.quantile) or 0.0)
+
+    def _take_token(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.stats["budget_denied"] += 1
+        return False
+
+    async def run(self, key: str, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `request`, hedging it with a duplicate if it is slower than the rolling quantile.
+
+        Args:
+            key: Latency bucket, normally the endpoint path.
+            request: Zero-argument factory returning a fresh awaitable per call.
+                Must be idempotent — it may be invoked twice.
+
+        Returns:
+            The result of whichever attempt succeeds first.
+
+        Raises:
+            The first error seen when every attempt fails.
+        """
+        self.stats["requests"] += 1
+        self._tokens = min(MAX_BUDGET_TOKENS, self._tokens + self.max_extra_ratio)
+        delay = self.hedge_delay(key)
+        started = time.monotonic()
+
+        if delay is None:
+            result = await request()
+            self._window(key).record(time.monotonic() - started)
+            return result
+
+        primary = asyncio.ensure_future(request())
+        backup: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._take_token():
+                result = await primary
+                self._window(key).record(time.monotonic() - started)
+                return result
+
+            self.stats["hedged"] += 1
+            backup = asyncio.ensure_future(request())
+            pending = {primary, backup}
+            first_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.stats["hedge_wins"] += 1
+                        self._window(key).record(time.monotonic() - started)
+                        return task.result()
+                    if first_error is None:
+                        first_error = task.exception()
+            raise first_error
+        finally:
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
@@ -0,0 +1,343 @@
+"""Lightweight per-tool latency and payload instrumentation.
+
+Every MCP tool call gets a ToolCall record (held in a context variable) that
+collects stage timings, upstream status codes, bytes sent/received and cache
+hits. Completed calls are folded into in-memory fixed-bucket histograms, which
+back the ``gta_server_stats`` tool and can be dumped periodically to disk.
+
+Dumping is configured from the environment:
+
+- GTA_METRICS_PATH: file to write snapshots to. A ``.prom`` suffix writes
+  Prometheus text exposition format (overwritten each time); anything else
+  appends one JSON snapshot per line (JSONL). Unset = in-memory only.
+- GTA_METRICS_INTERVAL: minimum seconds between dumps (default 60). Dumps
+  happen at the end of a tool call once the interval has elapsed, so no
+  background task is needed.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+SIZE_BUCKETS_BYTES = (1_024, 4_096, 16_384, 65_536, 262_144, 1_048_576, 4_194_304, 16_777_216)
+
+DEFAULT_DUMP_INTERVAL_SECONDS = 60.0
+
+
+class Histogram:
+    """Fixed-bucket histogram with exact count, sum and max."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (capped at the observed max)."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                bound = self.buckets[i] if i < len(self.buckets) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2),
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 2),
+        }
+
+
+@dataclass
+class ToolCall:
+    """Measurements collected during a single tool invocation."""
+    tool: str
+    stages_ms: Dict[str, float] = field(default_factory=dict)
+    upstream_statuses: List[str] = field(default_factory=list)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    bytes_out: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+_current_call: contextvars.ContextVar[Optional[ToolCall]] = contextvars.ContextVar(
+    "gta_mcp_current_call", default=None
+)
+
+
+def current_call() -> Optional[ToolCall]:
+    """Return the ToolCall for the running tool invocation, if any."""
+    return _current_call.get()
+
+
+def detach_call() -> None:
+    """Stop attributing work in the current task to the enclosing tool call.
+
+    Background tasks inherit the context of the tool call that spawned them;
+    call this at the top of such a task so its upstream requests and stages
+    are recorded globally rather than against a call that has already ended.
+    """
+    _current_call.set(None)
+
+
+def _current_tool() -> str:
+    call = _current_call.get()
+    return call.tool if call else "-"
+
+
+class MetricsRegistry:
+    """In-memory histograms and counters keyed by (metric, labels)."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], int] = {}
+        self.dump_path: Optional[Path] = None
+        self.dump_interval = DEFAULT_DUMP_INTERVAL_SECONDS
+        self._last_dump = time.monotonic()
+
+    def configure_from_env(self) -> None:
+        path = os.getenv("GTA_METRICS_PATH")
+        self.dump_path = Path(path).expanduser() if path else None
+        self.dump_interval = float(os.getenv("GTA_METRICS_INTERVAL", str(DEFAULT_DUMP_INTERVAL_SECONDS)))
+
+    def reset(self) -> None:
+        self.started_at = time.time()
+        self.histograms.clear()
+        self.counters.clear()
+
+    # ---- recording -------------------------------------------------------
+
+    def observe(self, metric: str, value: float, buckets: Tuple[float, ...], **labels: str) -> None:
+        key = (metric, tuple(sorted(labels.items())))
+        hist = self.histograms.get(key)
+        if hist is None:
+            hist = self.histograms[key] = Histogram(buckets)
+        hist.observe(value)
+
+    def incr(self, metric: str, amount: int = 1, **labels: str) -> None:
+        key = (metric, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def finish_call(self, call: ToolCall, elapsed_ms: float, outcome: str) -> None:
+        self.incr("tool_calls_total", tool=call.tool, outcome=outcome)
+        self.observe("tool_latency_ms", elapsed_ms, LATENCY_BUCKETS_MS, tool=call.tool)
+        self.observe("tool_response_bytes", call.bytes_out, SIZE_BUCKETS_BYTES, tool=call.tool)
+        if call.bytes_received:
+            self.observe("tool_upstream_bytes", call.bytes_received, SIZE_BUCKETS_BYTES, tool=call.tool)
+        self.maybe_dump()
+
+    # ---- reporting -------------------------------------------------------
+
+    def _labelled(self, source: Dict, metric: str) -> Iterator[Tuple[Dict[str, str], Any]]:
+        for (name, labels), value in source.items():
+            if name == metric:
+                yield dict(labels), value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarise all metrics as a JSON-serialisable dict."""
+        tools: Dict[str, Dict[str, Any]] = {}
+        for labels, n in self._labelled(self.counters, "tool_calls_total"):
+            entry = tools.setdefault(labels["tool"], {"calls": 0, "errors": 0})
+            entry["calls"] += n
+            if labels["outcome"] != "ok":
+                entry["errors"] += n
+        for metric, field_name in (
+            ("tool_latency_ms", "latency_ms"),
+            ("tool_response_bytes", "response_bytes"),
+            ("tool_upstream_bytes", "upstream_bytes"),
+        ):
+            for labels, hist in self._labelled(self.histograms, metric):
+                tools.setdefault(labels["tool"], {"calls": 0, "errors": 0})[field_name] = hist.summary()
+
+        stages = {
+            f"{labels['tool']}/{labels['stage']}": hist.summary()
+            for labels, hist in self._labelled(self.histograms, "stage_latency_ms")
+        }
+
+        upstream: Dict[str, Dict[str, Any]] = {}
+        for labels, n in self._labelled(self.counters, "upstream_requests_total"):
+            entry = upstream.setdefault(labels["endpoint"], {"requests": 0, "statuses": {}})
+            entry["requests"] += n
+            entry["statuses"][labels["status"]] = entry["statuses"].get(labels["status"], 0) + n
+        for metric, field_name in (
+            ("upstream_latency_ms", "latency_ms"),
+            ("upstream_response_bytes", "response_bytes"),
+            ("upstream_request_bytes", "request_bytes"),
+        ):
+            for labels, hist in self._labelled(self.histograms, metric):
+                upstream.setdefault(labels["endpoint"], {"requests": 0, "statuses": {}})[field_name] = hist.summary()
+
+        caches: Dict[str, Dict[str, Any]] = {}
+        for labels, n in self._labelled(self.counters, "cache_requests_total"):
+            entry = caches.setdefault(labels["cache"], {"hits": 0, "misses": 0})
+            entry["hits" if labels["result"] == "hit" else "misses"] += n
+        for entry in caches.values():
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_ratio"] = round(entry["hits"] / lookups, 3) if lookups else None
+
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "tools": tools,
+            "stages": stages,
+            "upstream": upstream,
+            "caches": caches,
+        }
+
+    def prometheus_text(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        def fmt_labels(labels: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+            parts = [f'{k}="{v}"' for k, v in labels]
+            if extra:
+                parts.append(extra)
+            return "{" + ",".join(parts) + "}" if parts else ""
+
+        lines: List[str] = []
+        for name in sorted({name for name, _ in self.counters}):
+            lines.append(f"# TYPE gta_mcp_{name} counter")
+            for (metric, labels), value in sorted(self.counters.items()):
+                if metric == name:
+                    lines.append(f"gta_mcp_{name}{fmt_labels(labels)} {value}")
+        for name in sorted({name for name, _ in self.histograms}):
+            lines.append(f"# TYPE gta_mcp_{name} histogram")
+            for (metric, labels), hist in sorted(self.histograms.items(), key=lambda kv: kv[0]):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, n in zip(list(hist.buckets) + ["+Inf"], hist.counts):
+                    cumulative += n
+                    le = f'le="{bound}"'
+                    lines.append(f"gta_mcp_{name}_bucket{fmt_labels(labels, le)} {cumulative}")
+                lines.append(f"gta_mcp_{name}_sum{fmt_labels(labels)} {hist.total}")
+                lines.append(f"gta_mcp_{name}_count{fmt_labels(labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self) -> None:
+        """Write the current metrics to GTA_METRICS_PATH."""
+        if self.dump_path is None:
+            return
+        self.dump_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.dump_path.suffix == ".prom":
+            tmp = self.dump_path.with_suffix(".prom.tmp")
+            tmp.write_text(self.prometheus_text(), encoding="utf-8")
+            tmp.replace(self.dump_path)
+        else:
+            record = {"timestamp": time.time(), **self.snapshot()}
+            with open(self.dump_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._last_dump = time.monotonic()
+
+    def maybe_dump(self) -> None:
+        if self.dump_path is None or time.monotonic() - self._last_dump < self.dump_interval:
+            return
+        try:
+            self.dump()
+        except OSError:
+            # Metrics must never break a tool call
+            pass
+
+
+registry = MetricsRegistry()
+registry.configure_from_env()
+
+
+# ---- recording helpers used by server and API client ---------------------
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block as a named stage of the current tool call."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        call = _current_call.get()
+        if call is not None:
+            call.stages_ms[name] = call.stages_ms.get(name, 0.0) + elapsed_ms
+        registry.observe("stage_latency_ms", elapsed_ms, LATENCY_BUCKETS_MS, tool=_current_tool(), stage=name)
+
+
+def record_upstream(
+    endpoint: str,
+    status: str,
+    elapsed_ms: float,
+    bytes_sent: int = 0,
+    bytes_received: int = 0,
+) -> None:
+    """Record one upstream HTTP request made on behalf of the current tool call."""
+    registry.incr("upstream_requests_total", endpoint=endpoint, status=status)
+    registry.observe("upstream_latency_ms", elapsed_ms, LATENCY_BUCKETS_MS, endpoint=endpoint)
+    registry.observe("upstream_request_bytes", bytes_sent, SIZE_BUCKETS_BYTES, endpoint=endpoint)
+    registry.observe("upstream_response_bytes", bytes_received, SIZE_BUCKETS_BYTES, endpoint=endpoint)
+    call = _current_call.get()
+    if call is not None:
+        call.upstream_statuses.append(status)
+        call.bytes_sent += bytes_sent
+        call.bytes_received += bytes_received
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Record a cache lookup result for the named cache."""
+    registry.incr("cache_requests_total", cache=cache, result="hit" if hit else "miss")
+    call = _current_call.get()
+    if call is not None:
+        if hit:
+            call.cache_hits += 1
+        else:
+            call.cache_misses += 1
+
+
+def instrument_tool(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Decorate an async MCP tool so each call is timed and measured.
+
+    Apply beneath ``@mcp.tool``; ``functools.wraps`` keeps the signature and
+    docstring FastMCP uses to build the tool schema.
+    """
+    tool_name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        call = ToolCall(tool=tool_name)
+        token = _current_call.set(call)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await fn(*args, **kwargs)
+            if isinstance(result, str):
+                call.bytes_out = len(result.encode("utf-8"))
+            outcome = "ok"
+            return result
+        finally:
+            _current_call.reset(token)
+            registry.finish_call(call, (time.perf_counter() - started) * 1000, outcome)
+
+    return wrapper
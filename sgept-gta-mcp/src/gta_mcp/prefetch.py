@@ -0,0 +1,199 @@
+"""Speculative next-page prefetch for paginated GTA API reads.
+
+When a paginated read (search, ticker, impact chains) returns a full page,
+the next page is almost always requested next. With prefetch enabled the
+client fetches that page in the background into a small response cache, so
+the follow-up call is served locally or joins the request already in flight.
+
+The cache is bounded by a TTL and a global memory cap (measured on response
+body size). Outstanding prefetches are cancelled and the cache is cleared
+once no API request has been made for the idle timeout.
+
+Prefetch is opt-in and configured from the environment:
+
+- GTA_PREFETCH_ENABLED: "1"/"true" to enable (default off)
+- GTA_PREFETCH_TTL_SECONDS: lifetime of a prefetched page (default 60)
+- GTA_PREFETCH_MAX_MB: memory cap for prefetched pages (default 32)
+- GTA_PREFETCH_IDLE_SECONDS: idle time before prefetches are cancelled (default 120)
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_MB = 32.0
+DEFAULT_IDLE_SECONDS = 120.0
+MAX_INFLIGHT = 4
+
+
+@dataclass
+class CacheEntry:
+    """A prefetched response with its body size and expiration time."""
+    value: Any
+    size: int
+    expires_at: float
+
+
+class Prefetcher:
+    """Background next-page fetcher backed by a TTL, size-capped response cache.
+
+    One instance is shared for the lifetime of the server process so pages
+    prefetched during one tool call are available to the next.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = int(DEFAULT_MAX_MB * 1024 * 1024),
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        max_inflight: int = MAX_INFLIGHT,
+    ):
+        self.ttl = ttl_seconds
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds
+        self.max_inflight = max_inflight
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._last_activity = time.monotonic()
+        self._idle_watcher: Optional[asyncio.Task] = None
+        self.stats = {
+            "scheduled": 0, "completed": 0, "failed": 0, "cancelled": 0,
+            "hits": 0, "joined": 0, "evicted": 0, "skipped": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional["Prefetcher"]:
+        """Build a prefetcher from GTA_PREFETCH_* variables, or None when disabled."""
+        if os.getenv("GTA_PREFETCH_ENABLED", "").strip().lower() not in {"1", "true", "yes", "on"}:
+            return None
+        return cls(
+            ttl_seconds=float(os.getenv("GTA_PREFETCH_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+            max_bytes=int(float(os.getenv("GTA_PREFETCH_MAX_MB", str(DEFAULT_MAX_MB))) * 1024 * 1024),
+            idle_seconds=float(os.getenv("GTA_PREFETCH_IDLE_SECONDS", str(DEFAULT_IDLE_SECONDS))),
+        )
+
+    @staticmethod
+    def make_key(path: str, body: Dict[str, Any]) -> str:
+        """Cache key for a request: endpoint path plus canonical JSON body."""
+        return path + "|" + json.dumps(body, sort_keys=True, default=str)
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._bytes
+
+    def touch(self) -> None:
+        """Record API activity, postponing idle cancellation."""
+        self._last_activity = time.monotonic()
+
+    def _evict(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, e in self._cache.items() if e.expires_at <= now]:
+            self._evict(key)
+
+    def _store(self, key: str, value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        self._purge_expired()
+        self._evict(key)
+        while self._cache and self._bytes + size > self.max_bytes:
+            oldest = next(iter(self._cache))
+            self._evict(oldest)
+            self.stats["evicted"] += 1
+        self._cache[key] = CacheEntry(value, size, time.monotonic() + self.ttl)
+        self._bytes += size
+
+    async def lookup(self, key: str) -> Tuple[bool, Any]:
+        """Return (True, value) for a prefetched page, awaiting one still in flight.
+
+        A page is handed out once and then dropped, so repeated calls always
+        reflect fresh upstream data.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._evict(key)
+            if entry.expires_at > time.monotonic():
+                self.stats["hits"] += 1
+                return True, entry.value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            try:
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise  # the caller itself was cancelled
+                return False, None
+            except Exception:
+                return False, None
+            # The task stored its result on completion; hand it out.
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._evict(key)
+                self.stats["joined"] += 1
+                return True, entry.value
+        return False, None
+
+    def schedule(self, key: str, fetch: Callable[[], Awaitable[Tuple[Any, int]]]) -> None:
+        """Fetch `key` in the background unless it is cached, in flight or over budget.
+
+        Args:
+            key: Cache key from make_key().
+            fetch: Zero-argument factory returning (decoded response, body size in bytes).
+        """
+        if key in self._cache or key in self._inflight:
+            return
+        if len(self._inflight) >= self.max_inflight or self._bytes >= self.max_bytes:
+            self.stats["skipped"] += 1
+            return
+
+        async def _run() -> None:
+            try:
+                value, size = await fetch()
+            except Exception:
+                self.stats["failed"] += 1
+                raise
+            else:
+                self.stats["completed"] += 1
+                self._store(key, value, size)
+            finally:
+                self._inflight.pop(key, None)
+
+        task = asyncio.ensure_future(_run())
+        # Failures are counted above; don't let them surface as unretrieved-exception warnings.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        self.stats["scheduled"] += 1
+        self._ensure_idle_watcher()
+
+    def _ensure_idle_watcher(self) -> None:
+        if self._idle_watcher is None or self._idle_watcher.done():
+            self._idle_watcher = asyncio.ensure_future(self._watch_idle())
+
+    async def _watch_idle(self) -> None:
+        while self._inflight or self._cache:
+            remaining = self._last_activity + self.idle_seconds - time.monotonic()
+            if remaining <= 0:
+                self.cancel_all()
+                return
+            await asyncio.sleep(remaining)
+
+    def cancel_all(self) -> None:
+        """Cancel outstanding prefetches and drop every cached page."""
+        for task in list(self._inflight.values()):
+            if task.cancel():
+                self.stats["cancelled"] += 1
+        self._inflight.clear()
+        self._cache.clear()
+        self._bytes = 0
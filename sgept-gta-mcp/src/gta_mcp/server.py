@@ -17,7 +17,19 @@ from .models import (
     SEMANTIC_CANDIDATE_CEILING_DEFAULT,
     _SYNTHETIC_SHOW_KEYS,
 )
-from .api import GTAAPIClient, build_filters, build_count_filters, FACET_DIMENSION_TO_COUNT_BY
+from .api import GTAAPIClient, FACET_DIMENSION_TO_COUNT_BY
+from .hedging import RequestHedger
+from .validation import (
+    COUNT_CONTROL_FIELDS,
+    IMPACT_CHAIN_CONTROL_FIELDS,
+    SEARCH_CONTROL_FIELDS,
+    TICKER_CONTROL_FIELDS,
+    prepare_count_filters,
+    prepare_filters,
+    validate_input,
+)
+from .prefetch import Prefetcher
+from .instrumentation import instrument_tool, registry as metrics_registry, stage
 from mcp.server.fastmcp.exceptions import ToolError
 from .formatters import (
     format_interventions_markdown,
@@ -30,6 +42,7 @@ from .formatters import (
     format_counts_markdown,
     format_counts_json,
     format_facets_section_markdown,
+    format_server_stats_markdown,
     CHARACTER_LIMIT
 )
 from .resources_loader import (
@@ -82,6 +95,14 @@ mcp = FastMCP(
 )
 
 
+# Process-wide hedger (None unless GTA_HEDGE_ENABLED is set). Shared by every
+# client so the rolling latency windows and hedge budget persist across calls.
+_request_hedger = RequestHedger.from_env()
+
+# Process-wide next-page prefetcher (None unless GTA_PREFETCH_ENABLED is set).
+_prefetcher = Prefetcher.from_env()
+
+
 def get_api_client() -> GTAAPIClient:
     """Get initialized GTA API client with API key from environment."""
     api_key = os.getenv("GTA_API_KEY")
@@ -91,7 +112,9 @@ def get_api_client() -> GTAAPIClient:
             "Please set your API key: export GTA_API_KEY='your-key-here'"
         )
     base_url = os.getenv("GTA_BASE_URL")
-    return GTAAPIClient(api_key, base_url=base_url)
+    return GTAAPIClient(
+        api_key, base_url=base_url, hedger=_request_hedger, prefetcher=_prefetcher
+    )
 
 
 # Key profiles for show_keys — controls which fields the API returns per intervention.
@@ -116,6 +139,51 @@ KEY_PROFILES = {
     "full": None  # No show_keys = API returns everything
 }
 
+# Approximate rendered characters per record, by response format and key profile.
+# Used to size auto-detail fetches so we never download rows the formatter would
+# only truncate away. Standard estimates are deliberately conservative because
+# affected jurisdiction/sector lists vary a lot between interventions.
+RECORD_CHARS_ESTIMATE = {
+    ResponseFormat.MARKDOWN: {"overview": 200, "standard": 1200},
+    ResponseFormat.JSON: {"overview": 550, "standard": 2500},
+}
+# Headroom for headers, filter messages, dataset links and facets.
+RESPONSE_OVERHEAD_CHARS = 5000
+# Ceiling on an auto-sized overview page, matching the API's practical maximum.
+OVERVIEW_MAX_LIMIT = 1000
+
+
+def _budget_rows(response_format: ResponseFormat, profile: str) -> int:
+    """Number of records of the given key profile that fit in CHARACTER_LIMIT."""
+    per_record = RECORD_CHARS_ESTIMATE[response_format][profile]
+    return max(1, (CHARACTER_LIMIT - RESPONSE_OVERHEAD_CHARS) // per_record)
+
+
+def _select_auto_detail(
+    response_format: ResponseFormat,
+    requested_limit: int,
+    remaining: int | None,
+) -> tuple[str, int]:
+    """Pick a key profile and fetch limit for a broad search without detail_level.
+
+    Args:
+        response_format: Output format the records will be rendered in.
+        requested_limit: Upper bound on rows the caller is willing to receive.
+        remaining: Matching records at or after the requested offset, or None
+            when the count query was unavailable.
+
+    Returns:
+        Tuple of (profile name, effective limit). Result sets that fit the
+        render budget at standard detail are returned in full at standard
+        detail; anything larger falls back to an overview page sized to the
+        budget.
+    """
+    standard_rows = _budget_rows(response_format, "standard")
+    rows = requested_limit if remaining is None else min(requested_limit, remaining)
+    if rows <= standard_rows:
+        return "standard", min(requested_limit, standard_rows)
+    return "overview", min(requested_limit, _budget_rows(response_format, "overview"))
+
 
 
 
@@ -254,6 +322,7 @@ async def _gta_unified_semantic_search(
 
 
 @mcp.tool(name="gta_search_interventions")
+@instrument_tool
 async def gta_search_interventions(
     implementing_jurisdictions: list[str] | None = None,
     affected_jurisdictions: list[str] | None = None,
@@ -363,17 +432,16 @@ async def gta_search_interventions(
     raw_kwargs = {k: v for k, v in locals().items()}
     if raw_kwargs.get('semantic_query'):
         raw_kwargs['sorting'] = None
-    params = GTASearchInput(**raw_kwargs)
+    with stage("validate"):
+        params = validate_input(GTASearchInput, raw_kwargs)
     try:
         client = get_api_client()
 
         # Build filter dictionary and get informational messages
-        original_params = params.model_dump(exclude={
-            'limit', 'offset', 'sorting', 'response_format',
-            'detail_level', 'show_keys', 'include_facets', 'semantic_query',
-            'include_matched_snippets',
-        })
-        filters, filter_messages = build_filters(original_params)
+        with stage("build_filters"):
+            prepared = prepare_filters(params, SEARCH_CONTROL_FIELDS)
+            original_params = prepared.params
+            filters, filter_messages = prepared.filters, prepared.messages
 
         # ----------------------------------------------------------------
         # Unified semantic search path
@@ -395,15 +463,22 @@ async def gta_search_interventions(
         #
         # Auto-detection logic (when user doesn't set detail_level):
         # - Specific intervention_id lookup → standard keys (detail pass)
-        # - Broad search (no intervention_id) → overview keys + limit=500 (triage pass)
+        # - Broad search (no intervention_id) → sized against the render budget:
+        #   a cheap count query tells us how many rows match; if they fit at
+        #   standard detail we return them all, otherwise an overview page
+        #   holding as many rows as the formatter can actually render
         #
         # This enables the multi-pass workflow automatically:
-        # 1. Any broad search returns a compact overview table (up to 500 results)
+        # 1. A broad search too large for standard detail returns a compact
+        #    overview page (small ones come back at standard detail directly)
         # 2. The LLM triages and identifies relevant interventions
         # 3. The LLM calls again with intervention_id=[...] for full detail
         show_keys = None
         effective_limit = params.limit
         use_overview_format = False
+        total_count = None
+        # The signature default (50) means "not set" — size the page ourselves
+        requested_limit = OVERVIEW_MAX_LIMIT if params.limit == 50 else params.limit
 
         if params.show_keys:
             # Explicit show_keys overrides everything
@@ -412,8 +487,9 @@ async def gta_search_interventions(
             show_keys = KEY_PROFILES.get(params.detail_level)
             if params.detail_level == "overview":
                 use_overview_format = True
-                if params.limit == 50:
-                    effective_limit = 1000
+                effective_limit = min(
+                    requested_limit, _budget_rows(params.response_format, "overview")
+                )
             elif params.detail_level == "standard":
                 pass  # standard keys, user's limit
             # detail_level="full" → show_keys=None (API returns everything)
@@ -421,12 +497,20 @@ async def gta_search_interventions(
             # Fetching specific IDs — use standard detail (this is the detail pass)
             show_keys = KEY_PROFILES["standard"]
         else:
-            # Broad search with no explicit detail_level — auto-select overview
-            # This ensures the LLM always sees the full picture before drilling down
-            show_keys = KEY_PROFILES["overview"]
-            use_overview_format = True
-            if params.limit == 50:
-                effective_limit = 1000
+            # Broad search with no explicit detail_level — size against the budget.
+            # Only pay for the count query when the answer could change the profile.
+            if requested_limit > _budget_rows(params.response_format, "standard"):
+                try:
+                    count_filters = prepare_count_filters(params, SEARCH_CONTROL_FIELDS).filters
+                    total_count = await client.count_total(count_filters)
+                except Exception:
+                    total_count = None  # fall back to a budget-sized overview page
+            remaining = None if total_count is None else max(0, total_count - params.offset)
+            profile, effective_limit = _select_auto_detail(
+                params.response_format, requested_limit, remaining
+            )
+            show_keys = KEY_PROFILES[profile]
+            use_overview_format = profile == "overview"
 
         # Make API request
         results = await client.search_interventions(
@@ -434,7 +518,8 @@ async def gta_search_interventions(
             limit=effective_limit,
             offset=params.offset,
             sorting=params.sorting if params.sorting else "-date_announced",
-            show_keys=show_keys
+            show_keys=show_keys,
+            paginated=True,
         )
 
         # Wrap list response in expected format for formatters
@@ -445,48 +530,48 @@ async def gta_search_interventions(
             "previous": None if params.offset == 0 else f"Use offset={max(0, params.offset - effective_limit)}"
         }
 
+        if total_count is not None:
+            data["total_count"] = total_count
+
         # Fan out to counts endpoint for requested facet dimensions
         if params.include_facets:
-            count_filter_params = params.model_dump(exclude={
-                'limit', 'offset', 'sorting', 'response_format',
-                'detail_level', 'show_keys', 'include_facets', 'semantic_query'
-            })
-            count_filters, _ = build_count_filters(count_filter_params)
+            count_filters = prepare_count_filters(params, SEARCH_CONTROL_FIELDS).filters
             data["facets"] = await client.get_facets(
                 dimension_names=list(params.include_facets),
                 count_filters=count_filters,
             )
 
         # Format response — overview mode uses compact table
-        if use_overview_format and params.response_format == ResponseFormat.MARKDOWN:
-            formatted_response = format_interventions_overview(data)
-            if filter_messages:
-                message_section = "\n".join([f"ℹ️ {msg}" for msg in filter_messages])
-                formatted_response = f"{message_section}\n\n{formatted_response}"
-            # Dataset links: header at TOP (high visibility), full section at bottom
-            links_header = make_dataset_links_header(filters, original_params)
-            if links_header:
-                formatted_response = links_header + "\n\n" + formatted_response
-                formatted_response += "\n\n" + make_dataset_links_section(filters, original_params)
-            return formatted_response
-        elif params.response_format == ResponseFormat.MARKDOWN:
-            formatted_response = format_interventions_markdown(data)
-            if filter_messages:
-                message_section = "\n".join([f"ℹ️ {msg}" for msg in filter_messages])
-                formatted_response = f"{message_section}\n\n{formatted_response}"
-            # Dataset links: header at TOP (high visibility), full section at bottom
-            links_header = make_dataset_links_header(filters, original_params)
-            if links_header:
-                formatted_response = links_header + "\n\n" + formatted_response
-                formatted_response += "\n\n" + make_dataset_links_section(filters, original_params)
-            return formatted_response
-        else:
-            if filter_messages:
-                data["filter_messages"] = filter_messages
-            dataset_urls = build_dataset_urls(filters, original_params)
-            if dataset_urls:
-                data["dataset_urls"] = dataset_urls
-            return format_interventions_json(data)
+        with stage("format"):
+            if use_overview_format and params.response_format == ResponseFormat.MARKDOWN:
+                formatted_response = format_interventions_overview(data)
+                if filter_messages:
+                    message_section = "\n".join([f"ℹ️ {msg}" for msg in filter_messages])
+                    formatted_response = f"{message_section}\n\n{formatted_response}"
+                # Dataset links: header at TOP (high visibility), full section at bottom
+                links_header = make_dataset_links_header(filters, original_params)
+                if links_header:
+                    formatted_response = links_header + "\n\n" + formatted_response
+                    formatted_response += "\n\n" + make_dataset_links_section(filters, original_params)
+                return formatted_response
+            elif params.response_format == ResponseFormat.MARKDOWN:
+                formatted_response = format_interventions_markdown(data)
+                if filter_messages:
+                    message_section = "\n".join([f"ℹ️ {msg}" for msg in filter_messages])
+                    formatted_response = f"{message_section}\n\n{formatted_response}"
+                # Dataset links: header at TOP (high visibility), full section at bottom
+                links_header = make_dataset_links_header(filters, original_params)
+                if links_header:
+                    formatted_response = links_header + "\n\n" + formatted_response
+                    formatted_response += "\n\n" + make_dataset_links_section(filters, original_params)
+                return formatted_response
+            else:
+                if filter_messages:
+                    data["filter_messages"] = filter_messages
+                dataset_urls = build_dataset_urls(filters, original_params)
+                if dataset_urls:
+                    data["dataset_urls"] = dataset_urls
+                return format_interventions_json(data)
             
     except ValueError as e:
         raise ToolError(f"Configuration Error: {str(e)}. Please ensure GTA_API_KEY is set.")
@@ -505,6 +590,7 @@ async def gta_search_interventions(
 
 
 @mcp.tool(name="gta_get_intervention")
+@instrument_tool
 async def gta_get_intervention(
     intervention_id: int | None = None,
     intervention_ids: list[int] | None = None,
@@ -543,12 +629,13 @@ async def gta_get_intervention(
         - "Fetch details for interventions 138295, 138296, 138297" → intervention_ids=[138295, 138296, 138297]
         - "Get title and evaluation for these 5 IDs" → intervention_ids=[...], show_keys=["intervention_id","state_act_title","gta_evaluation"]
     """
-    params = GTAGetInterventionInput(
-        intervention_id=intervention_id,
-        intervention_ids=intervention_ids,
-        show_keys=show_keys,
-        response_format=response_format,
-    )
+    with stage("validate"):
+        params = GTAGetInterventionInput(
+            intervention_id=intervention_id,
+            intervention_ids=intervention_ids,
+            show_keys=show_keys,
+            response_format=response_format,
+        )
     try:
         client = get_api_client()
 
@@ -592,6 +679,7 @@ async def gta_get_intervention(
 
 
 @mcp.tool(name="gta_list_ticker_updates")
+@instrument_tool
 async def gta_list_ticker_updates(
     implementing_jurisdictions: list[str] | None = None,
     intervention_types: list[str] | None = None,
@@ -625,12 +713,15 @@ async def gta_list_ticker_updates(
         - Get updates from the last week
         - Track changes to US trade measures
     """
-    params = GTATickerInput(**{k: v for k, v in locals().items()})
+    with stage("validate"):
+        params = validate_input(GTATickerInput, locals())
     try:
         client = get_api_client()
 
         # Build filter dictionary and get informational messages
-        filters, filter_messages = build_filters(params.model_dump(exclude={'limit', 'offset', 'response_format'}))
+        with stage("build_filters"):
+            prepared = prepare_filters(params, TICKER_CONTROL_FIELDS)
+            filters, filter_messages = prepared.filters, prepared.messages
 
         # Make API request
         results = await client.get_ticker_updates(
@@ -652,15 +743,16 @@ async def gta_list_ticker_updates(
             data = results
 
         # Format response
-        if params.response_format == ResponseFormat.MARKDOWN:
-            formatted_response = format_ticker_markdown(data)
-            # Prepend filter messages if any
-            if filter_messages:
-                message_section = "\n".join([f"ℹ️ {msg}" for msg in filter_messages])
-                formatted_response = f"{message_section}\n\n{formatted_response}"
-            return formatted_response
-        else:
-            return json.dumps(data, indent=2, ensure_ascii=False)
+        with stage("format"):
+            if params.response_format == ResponseFormat.MARKDOWN:
+                formatted_response = format_ticker_markdown(data)
+                # Prepend filter messages if any
+                if filter_messages:
+                    message_section = "\n".join([f"ℹ️ {msg}" for msg in filter_messages])
+                    formatted_response = f"{message_section}\n\n{formatted_response}"
+                return formatted_response
+            else:
+                return json.dumps(data, indent=2, ensure_ascii=False)
             
     except ToolError:
         raise
@@ -673,6 +765,7 @@ async def gta_list_ticker_updates(
 
 
 @mcp.tool(name="gta_get_impact_chains")
+@instrument_tool
 async def gta_get_impact_chains(
     granularity: str,
     implementing_jurisdictions: list[str] | None = None,
@@ -703,14 +796,15 @@ async def gta_get_impact_chains(
         - Get product-level impact chains for US implementing jurisdictions
         - Analyze sector-level impacts on EU countries
     """
-    params = GTAImpactChainInput(**{k: v for k, v in locals().items()})
+    with stage("validate"):
+        params = validate_input(GTAImpactChainInput, locals())
     try:
         client = get_api_client()
 
         # Build filter dictionary and get informational messages
-        filters, filter_messages = build_filters(
-            params.model_dump(exclude={'granularity', 'limit', 'offset', 'response_format'})
-        )
+        with stage("build_filters"):
+            prepared = prepare_filters(params, IMPACT_CHAIN_CONTROL_FIELDS)
+            filters, filter_messages = prepared.filters, prepared.messages
 
         # Make API request
         data = await client.get_impact_chains(
@@ -725,7 +819,8 @@ async def gta_get_impact_chains(
             data["filter_messages"] = filter_messages
 
         # Format response (JSON is most useful for impact chains)
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        with stage("format"):
+            return json.dumps(data, indent=2, ensure_ascii=False)
         
     except ToolError:
         raise
@@ -740,6 +835,7 @@ async def gta_get_impact_chains(
 
 
 @mcp.tool(name="gta_count_interventions")
+@instrument_tool
 async def gta_count_interventions(
     count_by: list[str],
     count_variable: str = "intervention_id",
@@ -813,16 +909,17 @@ async def gta_count_interventions(
         - Subsidies by implementing country:
           count_by=['implementer'], mast_chapters=['L']
     """
-    params = GTACountInput(**{k: v for k, v in locals().items()})
+    with stage("validate"):
+        params = validate_input(GTACountInput, locals())
     try:
         # Get API client
         client = get_api_client()
 
         # Build count-specific filters
-        filter_params = params.model_dump(
-            exclude={'count_by', 'count_variable', 'response_format'}
-        )
-        filters, filter_messages = build_count_filters(filter_params)
+        with stage("build_filters"):
+            prepared = prepare_count_filters(params, COUNT_CONTROL_FIELDS)
+            filter_params = prepared.params
+            filters, filter_messages = prepared.filters, prepared.messages
 
         # Make API request (now uses API key auth via self.headers)
         data = await client.count_interventions(
@@ -832,31 +929,32 @@ async def gta_count_interventions(
         )
 
         # Format response
-        if params.response_format == ResponseFormat.MARKDOWN:
-            formatted_response = format_counts_markdown(
-                data=data,
-                count_by=list(params.count_by),
-                count_variable=params.count_variable,
-                filter_messages=filter_messages,
-            )
-            # Dataset links: header at TOP (high visibility), full section at bottom
-            links_header = make_dataset_links_header(filters, filter_params)
-            if links_header:
-                formatted_response = links_header + "\n\n" + formatted_response
-                formatted_response += "\n\n" + make_dataset_links_section(filters, filter_params)
-            return formatted_response
-        else:
-            result = format_counts_json(
-                data=data,
-                count_by=list(params.count_by),
-                count_variable=params.count_variable,
-            )
-            dataset_urls = build_dataset_urls(filters, filter_params)
-            if dataset_urls:
-                result_dict = json.loads(result)
-                result_dict["dataset_urls"] = dataset_urls
-                result = json.dumps(result_dict, indent=2, ensure_ascii=False)
-            return result
+        with stage("format"):
+            if params.response_format == ResponseFormat.MARKDOWN:
+                formatted_response = format_counts_markdown(
+                    data=data,
+                    count_by=list(params.count_by),
+                    count_variable=params.count_variable,
+                    filter_messages=filter_messages,
+                )
+                # Dataset links: header at TOP (high visibility), full section at bottom
+                links_header = make_dataset_links_header(filters, filter_params)
+                if links_header:
+                    formatted_response = links_header + "\n\n" + formatted_response
+                    formatted_response += "\n\n" + make_dataset_links_section(filters, filter_params)
+                return formatted_response
+            else:
+                result = format_counts_json(
+                    data=data,
+                    count_by=list(params.count_by),
+                    count_variable=params.count_variable,
+                )
+                dataset_urls = build_dataset_urls(filters, filter_params)
+                if dataset_urls:
+                    result_dict = json.loads(result)
+                    result_dict["dataset_urls"] = dataset_urls
+                    result = json.dumps(result_dict, indent=2, ensure_ascii=False)
+                return result
 
     except ValueError as e:
         raise ToolError(f"Configuration Error: {str(e)}. Please ensure GTA_API_KEY is set.")
@@ -878,6 +976,7 @@ async def gta_count_interventions(
 
 
 @mcp.tool(name="gta_lookup_hs_codes")
+@instrument_tool
 async def gta_lookup_hs_codes(search_term: str, max_results: int = 50):
     """Search HS (Harmonized System) product codes by keyword, chapter number, or code prefix.
 
@@ -902,6 +1001,7 @@ async def gta_lookup_hs_codes(search_term: str, max_results: int = 50):
 
 
 @mcp.tool(name="gta_lookup_sectors")
+@instrument_tool
 async def gta_lookup_sectors(search_term: str, max_results: int = 50):
     """Search CPC (Central Product Classification) sector codes by keyword or code prefix.
 
@@ -1419,6 +1519,7 @@ def get_privacy_policy() -> str:
 
 
 @mcp.tool(name="gta_semantic_search")
+@instrument_tool
 async def gta_semantic_search(
     query: str,
     intervention_ids: list[int] | None = None,
@@ -1459,13 +1560,14 @@ async def gta_semantic_search(
         - Top 10 most relevant interventions mentioning solar panels:
             query="solar panel import duties", limit=10
     """
-    params = GTASemanticSearchInput(
-        query=query,
-        intervention_ids=intervention_ids,
-        limit=limit,
-        show_keys=show_keys,
-        response_format=response_format,
-    )
+    with stage("validate"):
+        params = GTASemanticSearchInput(
+            query=query,
+            intervention_ids=intervention_ids,
+            limit=limit,
+            show_keys=show_keys,
+            response_format=response_format,
+        )
     client = get_api_client()
     try:
         data = await client.semantic_search_interventions(
@@ -1522,6 +1624,38 @@ async def gta_semantic_search(
     return "\n".join(lines)
 
 
+@mcp.tool(name="gta_server_stats")
+async def gta_server_stats(response_format: ResponseFormat = ResponseFormat.MARKDOWN, reset: bool = False):
+    """Diagnostic: latency, payload size and cache statistics for this server process.
+
+    Reports, per tool, call and error counts, latency percentiles and response
+    sizes; per stage (validate, build_filters, upstream, json_decode, format)
+    timing; per upstream endpoint status codes, latency and bytes; cache hit
+    ratios; and request-hedging and next-page prefetch counters when enabled.
+
+    Not needed for answering trade-policy questions — use only when asked to
+    diagnose server performance.
+
+    Args:
+        response_format: 'markdown' (default) or 'json'.
+        reset: Clear all collected metrics after reporting them.
+    """
+    try:
+        fmt = ResponseFormat(response_format)
+    except ValueError:
+        raise ToolError(f"Invalid response_format {response_format!r}: use 'markdown' or 'json'.")
+    snapshot = metrics_registry.snapshot()
+    if _request_hedger is not None:
+        snapshot["hedging"] = dict(_request_hedger.stats)
+    if _prefetcher is not None:
+        snapshot["prefetch"] = dict(_prefetcher.stats, cached_bytes=_prefetcher.cached_bytes)
+    if reset:
+        metrics_registry.reset()
+    if fmt == ResponseFormat.JSON:
+        return json.dumps(snapshot, indent=2, ensure_ascii=False)
+    return format_server_stats_markdown(snapshot)
+
+
 def main():
     """Entry point for running the GTA MCP server."""
     # Check for API key
@@ -0,0 +1,141 @@
+"""Compiled request validation and filter preparation for GTA tools.
+
+Each tool used to validate its input model, dump it once or twice with
+ad-hoc exclude sets and then run build_filters()/build_count_filters(), which
+resolves jurisdictions, intervention types and (fuzzy-matched) sector names
+on every call. This module does that work in a single pass:
+
+- input models are validated through their compiled pydantic-core validator
+- the fields that are *not* filters are precomputed per tool as frozensets
+- the remaining filter parameters are dumped once and serialised into a
+  canonical cache key
+- the built filter dict is memoised on that key, so repeat queries (paging,
+  facet fan-out, count sizing) skip the conversion entirely. The one
+  date-dependent value, `in_force_on_date` (today, for `is_in_force`), is
+  filled in on every call rather than cached
+"""
+
+import copy
+import datetime
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .api import build_count_filters, build_filters
+
+
+M = TypeVar("M", bound=BaseModel)
+FilterBuilder = Callable[[Dict[str, Any]], Tuple[Dict[str, Any], List[str]]]
+
+# Input fields that control paging, projection and output rather than filtering.
+SEARCH_CONTROL_FIELDS = frozenset({
+    'limit', 'offset', 'sorting', 'response_format',
+    'detail_level', 'show_keys', 'include_facets', 'semantic_query',
+    'include_matched_snippets',
+})
+TICKER_CONTROL_FIELDS = frozenset({'limit', 'offset', 'response_format'})
+IMPACT_CHAIN_CONTROL_FIELDS = frozenset({'granularity', 'limit', 'offset', 'response_format'})
+COUNT_CONTROL_FIELDS = frozenset({'count_by', 'count_variable', 'response_format'})
+
+FILTER_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class PreparedFilters:
+    """Filter parameters, the API filter dict built from them, and their cache key."""
+    params: Dict[str, Any]
+    filters: Dict[str, Any]
+    messages: List[str]
+    cache_key: str
+
+
+class _FilterCache:
+    """Small LRU of built filter dicts keyed by (builder, canonical params)."""
+
+    def __init__(self, maxsize: int = FILTER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], List[str]]]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str]):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Tuple[str, str], value: Tuple[Dict[str, Any], List[str]]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_filter_cache = _FilterCache()
+
+
+def validate_input(model: Type[M], raw: Dict[str, Any]) -> M:
+    """Validate raw tool arguments against `model` using its compiled validator."""
+    return model.model_validate(raw)
+
+
+def canonical_key(params: Dict[str, Any]) -> str:
+    """Order-independent serialisation of filter params, omitting unset fields."""
+    return json.dumps(
+        {k: v for k, v in params.items() if v is not None},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def prepare_filters(
+    params: BaseModel,
+    control_fields: frozenset,
+    builder: FilterBuilder = build_filters,
+) -> PreparedFilters:
+    """Dump the filter fields of `params` once and build (or reuse) the API filters.
+
+    Args:
+        params: A validated tool input model.
+        control_fields: Fields of the model that are not filters.
+        builder: build_filters or build_count_filters.
+
+    Returns:
+        PreparedFilters. The filter dict (including its nested lists) and the
+        messages are copies, so callers may modify them without affecting the
+        cache.
+
+    Raises:
+        ValueError: If the builder rejects a filter value (not cached).
+    """
+    filter_params = params.model_dump(exclude=control_fields)
+    key = canonical_key(filter_params)
+    cache_key = (builder.__name__, key)
+    cached = _filter_cache.get(cache_key)
+    if cached is None:
+        cached = builder(filter_params)
+        _filter_cache.set(cache_key, cached)
+    filters, messages = cached
+    filters = copy.deepcopy(filters)
+    if 'in_force_on_date' in filters:
+        # The cached entry may have been built on an earlier day
+        filters['in_force_on_date'] = datetime.date.today().isoformat()
+    return PreparedFilters(
+        params=filter_params,
+        filters=filters,
+        messages=list(messages),
+        cache_key=key,
+    )
+
+
+def prepare_count_filters(params: BaseModel, control_fields: frozenset) -> PreparedFilters:
+    """prepare_filters() for the counts endpoint."""
+    return prepare_filters(params, control_fields, builder=build_count_filters)
@@ -0,0 +1,146 @@
+"""Unit tests for token-budgeted auto detail selection in gta_search_interventions.
+
+Covers:
+- budget arithmetic per response format and key profile
+- small result sets come back in full at standard detail
+- large result sets get an overview page sized to the render budget
+- count query failure falls back to a budget-sized overview page
+- count query is skipped when the requested limit already fits at standard
+- explicit detail_level="overview" is capped at the budget
+- GTAAPIClient.count_total sums evaluation buckets
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from gta_mcp.api import GTAAPIClient
+from gta_mcp.models import ResponseFormat
+from gta_mcp.server import (
+    KEY_PROFILES,
+    _budget_rows,
+    _select_auto_detail,
+    gta_search_interventions,
+)
+
+
+def _record(iid: int) -> dict:
+    return {
+        "intervention_id": iid,
+        "state_act_title": f"Measure {iid}",
+        "intervention_type": "Import tariff",
+        "gta_evaluation": "Red",
+        "date_announced": "2024-01-01",
+        "is_in_force": True,
+    }
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    monkeypatch.setenv("GTA_API_KEY", "test-key")
+    client = AsyncMock()
+    client.search_interventions.return_value = [_record(1), _record(2)]
+    with patch("gta_mcp.server.get_api_client", return_value=client):
+        yield client
+
+
+class TestBudgetSelection:
+
+    def test_budget_rows_shrink_with_wider_profiles(self):
+        for fmt in ResponseFormat:
+            assert _budget_rows(fmt, "overview") > _budget_rows(fmt, "standard") >= 1
+
+    def test_small_result_set_uses_standard(self):
+        profile, limit = _select_auto_detail(ResponseFormat.MARKDOWN, 1000, remaining=12)
+        assert profile == "standard"
+        assert limit == _budget_rows(ResponseFormat.MARKDOWN, "standard")
+
+    def test_large_result_set_uses_budgeted_overview(self):
+        profile, limit = _select_auto_detail(ResponseFormat.JSON, 1000, remaining=50000)
+        assert profile == "overview"
+        assert limit == _budget_rows(ResponseFormat.JSON, "overview")
+        assert limit < 1000
+
+    def test_unknown_count_uses_budgeted_overview(self):
+        profile, limit = _select_auto_detail(ResponseFormat.MARKDOWN, 1000, remaining=None)
+        assert profile == "overview"
+        assert limit == _budget_rows(ResponseFormat.MARKDOWN, "overview")
+
+    def test_explicit_small_limit_respected(self):
+        assert _select_auto_detail(ResponseFormat.MARKDOWN, 10, remaining=None) == ("standard", 10)
+
+
+@pytest.mark.asyncio
+class TestSearchAutoDetail:
+
+    async def test_broad_search_small_total_fetches_standard(self, mock_client):
+        mock_client.count_total.return_value = 2
+        result = await gta_search_interventions(response_format="json")
+
+        kwargs = mock_client.search_interventions.await_args.kwargs
+        assert kwargs["show_keys"] == KEY_PROFILES["standard"]
+        assert kwargs["limit"] == _budget_rows(ResponseFormat.JSON, "standard")
+        data = json.loads(result)
+        assert data["total_count"] == 2
+        assert data["next"] is None
+
+    async def test_broad_search_large_total_fetches_budgeted_overview(self, mock_client):
+        mock_client.count_total.return_value = 80000
+        await gta_search_interventions()
+
+        kwargs = mock_client.search_interventions.await_args.kwargs
+        assert kwargs["show_keys"] == KEY_PROFILES["overview"]
+        assert kwargs["limit"] == _budget_rows(ResponseFormat.MARKDOWN, "overview")
+
+    async def test_offset_reduces_remaining(self, mock_client):
+        mock_client.count_total.return_value = 1010
+        await gta_search_interventions(offset=1000)
+
+        kwargs = mock_client.search_interventions.await_args.kwargs
+        assert kwargs["show_keys"] == KEY_PROFILES["standard"]
+
+    async def test_count_failure_falls_back_to_overview(self, mock_client):
+        mock_client.count_total.side_effect = RuntimeError("counts down")
+        result = await gta_search_interventions()
+
+        kwargs = mock_client.search_interventions.await_args.kwargs
+        assert kwargs["show_keys"] == KEY_PROFILES["overview"]
+        assert kwargs["limit"] == _budget_rows(ResponseFormat.MARKDOWN, "overview")
+        assert "Compact overview" in result
+
+    async def test_small_explicit_limit_skips_count(self, mock_client):
+        await gta_search_interventions(limit=10)
+
+        mock_client.count_total.assert_not_awaited()
+        kwargs = mock_client.search_interventions.await_args.kwargs
+        assert kwargs["show_keys"] == KEY_PROFILES["standard"]
+        assert kwargs["limit"] == 10
+
+    async def test_explicit_overview_capped_at_budget(self, mock_client):
+        await gta_search_interventions(detail_level="overview", response_format="json")
+
+        mock_client.count_total.assert_not_awaited()
+        kwargs = mock_client.search_interventions.await_args.kwargs
+        assert kwargs["limit"] == _budget_rows(ResponseFormat.JSON, "overview")
+
+    async def test_id_lookup_unchanged(self, mock_client):
+        await gta_search_interventions(intervention_id=[1, 2])
+
+        mock_client.count_total.assert_not_awaited()
+        kwargs = mock_client.search_interventions.await_args.kwargs
+        assert kwargs["show_keys"] == KEY_PROFILES["standard"]
+        assert kwargs["limit"] == 50
+
+
+@pytest.mark.asyncio
+class TestCountTotal:
+
+    async def test_sums_evaluation_buckets(self, monkeypatch):
+        client = GTAAPIClient("key", base_url="https://api.test")
+        counts = AsyncMock(return_value=[{"gta_evaluation": 1, "value": 7}, {"gta_evaluation": 3, "value": 5}])
+        monkeypatch.setattr(client, "count_interventions", counts)
+
+        assert await client.count_total({"implementer": [840]}) == 12
+        assert counts.await_args.kwargs["count_by"] == ["gta_evaluation"]
+        assert counts.await_args.kwargs["filters"] == {"implementer": [840]}
@@ -0,0 +1,189 @@
+"""Unit tests for request hedging on GTA API read paths.
+
+Covers:
+- rolling quantile over the latency window
+- no hedging until an endpoint has enough samples
+- slow primary is hedged, fast duplicate wins, loser is cancelled
+- hedge budget caps duplicate load
+- failed attempt falls through to the other attempt
+- GTAAPIClient only routes read paths through the hedger
+- env-driven construction
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from gta_mcp.api import GTAAPIClient
+from gta_mcp.hedging import LatencyWindow, RequestHedger
+
+
+def _warm(hedger: RequestHedger, key: str, seconds: float, n: int) -> None:
+    for _ in range(n):
+        hedger._window(key).record(seconds)
+
+
+class TestLatencyWindow:
+
+    def test_empty_quantile_is_none(self):
+        assert LatencyWindow().quantile(0.95) is None
+
+    def test_p95(self):
+        window = LatencyWindow()
+        for ms in range(1, 101):
+            window.record(ms / 1000)
+        assert window.quantile(0.95) == pytest.approx(0.095)
+
+    def test_window_is_bounded(self):
+        window = LatencyWindow(size=3)
+        for v in (10.0, 1.0, 1.0, 1.0):
+            window.record(v)
+        assert len(window) == 3
+        assert window.quantile(0.99) == 1.0
+
+
+@pytest.mark.asyncio
+class TestRequestHedger:
+
+    async def test_cold_endpoint_not_hedged(self):
+        hedger = RequestHedger(max_extra_percent=100, min_samples=5)
+        calls = []
+
+        async def request():
+            calls.append(1)
+            return "ok"
+
+        assert hedger.hedge_delay("/x") is None
+        assert await hedger.run("/x", request) == "ok"
+        assert len(calls) == 1
+        assert len(hedger._window("/x")) == 1
+
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        hedger = RequestHedger(max_extra_percent=100, min_samples=1, min_delay_ms=1)
+        _warm(hedger, "/x", 0.01, 5)
+        attempts = []
+        primary_cancelled = asyncio.Event()
+
+        async def request():
+            attempts.append(len(attempts))
+            if len(attempts) == 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    primary_cancelled.set()
+                    raise
+                return "primary"
+            return "backup"
+
+        assert await hedger.run("/x", request) == "backup"
+        await asyncio.sleep(0)
+        assert primary_cancelled.is_set()
+        assert hedger.stats["hedged"] == 1
+        assert hedger.stats["hedge_wins"] == 1
+
+    async def test_fast_primary_not_hedged(self):
+        hedger = RequestHedger(max_extra_percent=100, min_samples=1, min_delay_ms=1)
+        _warm(hedger, "/x", 1.0, 5)
+        request = AsyncMock(return_value="fast")
+        assert await hedger.run("/x", request) == "fast"
+        assert request.await_count == 1
+        assert hedger.stats["hedged"] == 0
+
+    async def test_budget_limits_extra_load(self):
+        hedger = RequestHedger(max_extra_percent=10)
+        hedger.hedge_delay = lambda key: 0.001
+
+        async def request():
+            await asyncio.sleep(0.005)
+            return "ok"
+
+        for _ in range(30):
+            await hedger.run("/x", request)
+        assert hedger.stats["requests"] == 30
+        assert 0 < hedger.stats["hedged"] <= 3
+        assert hedger.stats["budget_denied"] > 0
+
+    async def test_failed_attempt_falls_through(self):
+        hedger = RequestHedger(max_extra_percent=100, min_samples=1, min_delay_ms=1)
+        _warm(hedger, "/x", 0.001, 5)
+        attempts = []
+
+        async def request():
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.sleep(0.01)
+                raise RuntimeError("worker died")
+            await asyncio.sleep(0.05)
+            return "backup"
+
+        assert await hedger.run("/x", request) == "backup"
+
+    async def test_all_attempts_fail_raises(self):
+        hedger = RequestHedger(max_extra_percent=100, min_samples=1, min_delay_ms=1)
+        _warm(hedger, "/x", 0.001, 5)
+
+        async def request():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError, match="upstream down"):
+            await hedger.run("/x", request)
+
+
+@pytest.mark.asyncio
+class TestClientHedgedPaths:
+
+    async def test_read_paths_use_hedger(self, monkeypatch):
+        hedger = RequestHedger()
+        hedger.run = AsyncMock(return_value=([], 0))
+        client = GTAAPIClient("key", base_url="https://api.test", hedger=hedger)
+
+        await client.search_interventions(filters={})
+        await client.get_interventions_batch([1])
+        await client.semantic_search_interventions(query="q")
+        hedger.run.return_value = ({"results": []}, 0)
+        await client.count_interventions(["implementer"], "intervention_id", {})
+
+        keys = [call.args[0] for call in hedger.run.await_args_list]
+        assert keys == [
+            "/api/v2/gta/data/",
+            "/api/v2/gta/data/",
+            "/api/v1/gta/semantic-search/",
+            "/api/v1/gta/data-counts/",
+        ]
+
+    async def test_other_paths_bypass_hedger(self, monkeypatch):
+        hedger = RequestHedger()
+        hedger.run = AsyncMock()
+        client = GTAAPIClient("key", base_url="https://api.test", hedger=hedger)
+        sent = AsyncMock(return_value=[])
+
+        async def fake_post(endpoint, body, timeout=30.0, hedge=False, paginated=False):
+            assert hedge is False
+            return await sent()
+
+        monkeypatch.setattr(client, "_post", fake_post)
+        await client.get_ticker_updates(filters={})
+        await client.get_impact_chains("product", filters={})
+        assert sent.await_count == 2
+
+
+class TestHedgerFromEnv:
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("GTA_HEDGE_ENABLED", raising=False)
+        assert RequestHedger.from_env() is None
+
+    def test_enabled_with_overrides(self, monkeypatch):
+        monkeypatch.setenv("GTA_HEDGE_ENABLED", "true")
+        monkeypatch.setenv("GTA_HEDGE_MAX_EXTRA_PERCENT", "2")
+        monkeypatch.setenv("GTA_HEDGE_QUANTILE", "0.9")
+        hedger = RequestHedger.from_env()
+        assert hedger is not None
+        assert hedger.max_extra_ratio == pytest.approx(0.02)
+        assert hedger.quantile == 0.9
+
+    def test_invalid_quantile_rejected(self):
+        with pytest.raises(ValueError):
+            RequestHedger(quantile=1.5)
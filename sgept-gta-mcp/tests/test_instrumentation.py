@@ -0,0 +1,226 @@
+"""Unit tests for per-tool latency and payload instrumentation.
+
+Covers:
+- histogram bucketing and quantile estimates
+- instrument_tool records calls, errors, stages and response bytes
+- GTAAPIClient._post records upstream status and byte counts
+- snapshot / Prometheus / JSONL dump output
+- gta_server_stats tool rendering
+"""
+
+import json
+
+import httpx
+import pytest
+
+from gta_mcp.api import GTAAPIClient
+from gta_mcp.formatters import format_server_stats_markdown
+from gta_mcp.instrumentation import (
+    Histogram,
+    MetricsRegistry,
+    current_call,
+    instrument_tool,
+    record_cache,
+    registry,
+    stage,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+class TestHistogram:
+
+    def test_empty(self):
+        hist = Histogram((10, 100))
+        assert hist.quantile(0.5) is None
+        assert hist.summary() == {"count": 0}
+
+    def test_quantiles_use_bucket_bounds(self):
+        hist = Histogram((10, 100, 1000))
+        for v in [1] * 90 + [500] * 10:
+            hist.observe(v)
+        assert hist.quantile(0.5) == 10
+        # Upper bound of the 1000 bucket is clamped to the observed max.
+        assert hist.quantile(0.95) == 500
+        assert hist.summary()["count"] == 100
+
+    def test_overflow_bucket_reports_max(self):
+        hist = Histogram((10,))
+        hist.observe(12345)
+        assert hist.quantile(0.99) == 12345
+
+
+@pytest.mark.asyncio
+class TestInstrumentTool:
+
+    async def test_records_call_stages_and_bytes(self):
+        seen = {}
+
+        @instrument_tool
+        async def fake_tool(x: int = 1):
+            """Docstring kept."""
+            with stage("build_filters"):
+                pass
+            record_cache("response", hit=True)
+            seen["call"] = current_call()
+            return "é" * 10
+
+        assert fake_tool.__doc__ == "Docstring kept."
+        assert await fake_tool() == "é" * 10
+        call = seen["call"]
+        assert call.tool == "fake_tool"
+        assert "build_filters" in call.stages_ms
+        assert call.bytes_out == 20
+        assert call.cache_hits == 1
+
+        snap = registry.snapshot()
+        assert snap["tools"]["fake_tool"]["calls"] == 1
+        assert snap["tools"]["fake_tool"]["errors"] == 0
+        assert "fake_tool/build_filters" in snap["stages"]
+        assert snap["caches"]["response"] == {"hits": 1, "misses": 0, "hit_ratio": 1.0}
+
+    async def test_records_errors(self):
+        @instrument_tool
+        async def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await broken()
+        assert registry.snapshot()["tools"]["broken"]["errors"] == 1
+        assert current_call() is None
+
+
+@pytest.mark.asyncio
+class TestUpstreamRecording:
+
+    async def test_post_records_status_and_bytes(self, monkeypatch):
+        def handler(request):
+            return httpx.Response(200, json=[{"intervention_id": 1}])
+
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            "gta_mcp.api.httpx.AsyncClient",
+            lambda **kw: real_client(transport=transport, **kw),
+        )
+        client = GTAAPIClient("key", base_url="https://api.test")
+
+        @instrument_tool
+        async def tool():
+            return json.dumps(await client.search_interventions(filters={}))
+
+        await tool()
+        snap = registry.snapshot()
+        upstream = snap["upstream"]["/api/v2/gta/data/"]
+        assert upstream["statuses"] == {"200": 1}
+        assert upstream["response_bytes"]["count"] == 1
+        assert upstream["request_bytes"]["max"] > 0
+        assert "tool/upstream" in snap["stages"]
+        assert "tool/json_decode" in snap["stages"]
+        assert snap["tools"]["tool"]["upstream_bytes"]["count"] == 1
+
+    async def test_post_records_error_status(self, monkeypatch):
+        def handler(request):
+            return httpx.Response(503, json={"detail": "busy"})
+
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            "gta_mcp.api.httpx.AsyncClient",
+            lambda **kw: real_client(transport=transport, **kw),
+        )
+        client = GTAAPIClient("key", base_url="https://api.test")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_ticker_updates(filters={})
+        assert registry.snapshot()["upstream"]["/api/v1/gta/ticker/"]["statuses"] == {"503": 1}
+
+
+class TestDump:
+
+    def _populated(self) -> MetricsRegistry:
+        reg = MetricsRegistry()
+        reg.observe("tool_latency_ms", 42, (10, 100), tool="t")
+        reg.incr("tool_calls_total", tool="t", outcome="ok")
+        return reg
+
+    def test_prometheus_text(self):
+        text = self._populated().prometheus_text()
+        assert '# TYPE gta_mcp_tool_calls_total counter' in text
+        assert 'gta_mcp_tool_calls_total{outcome="ok",tool="t"} 1' in text
+        assert 'gta_mcp_tool_latency_ms_bucket{tool="t",le="100"} 1' in text
+        assert 'gta_mcp_tool_latency_ms_bucket{tool="t",le="+Inf"} 1' in text
+        assert 'gta_mcp_tool_latency_ms_count{tool="t"} 1' in text
+
+    def test_jsonl_dump_appends(self, tmp_path):
+        reg = self._populated()
+        reg.dump_path = tmp_path / "metrics.jsonl"
+        reg.dump()
+        reg.dump()
+        lines = reg.dump_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["tools"]["t"]["calls"] == 1
+
+    def test_prom_dump_overwrites(self, tmp_path):
+        reg = self._populated()
+        reg.dump_path = tmp_path / "metrics.prom"
+        reg.dump()
+        reg.dump()
+        assert reg.dump_path.read_text().count("# TYPE gta_mcp_tool_calls_total") == 1
+
+    def test_maybe_dump_respects_interval(self, tmp_path):
+        reg = self._populated()
+        reg.dump_path = tmp_path / "metrics.jsonl"
+        reg.dump_interval = 3600
+        reg.maybe_dump()
+        assert not reg.dump_path.exists()
+        reg.dump_interval = 0
+        reg.maybe_dump()
+        assert reg.dump_path.exists()
+
+
+@pytest.mark.asyncio
+class TestServerStatsTool:
+
+    async def test_markdown_and_json(self):
+        from gta_mcp.server import gta_server_stats
+
+        @instrument_tool
+        async def gta_fake():
+            return "ok"
+
+        await gta_fake()
+        md = await gta_server_stats()
+        assert "## Tools" in md
+        assert "gta_fake" in md
+        data = json.loads(await gta_server_stats(response_format="json"))
+        assert data["tools"]["gta_fake"]["calls"] == 1
+
+    async def test_invalid_format_is_a_tool_error(self):
+        from mcp.server.fastmcp.exceptions import ToolError
+        from gta_mcp.server import gta_server_stats
+
+        with pytest.raises(ToolError, match="use 'markdown' or 'json'"):
+            await gta_server_stats(response_format="xml")
+
+    async def test_reset(self):
+        from gta_mcp.server import gta_server_stats
+
+        @instrument_tool
+        async def gta_fake():
+            return "ok"
+
+        await gta_fake()
+        await gta_server_stats(reset=True)
+        assert registry.snapshot()["tools"] == {}
+
+
+class TestServerStatsFormatter:
+
+    def test_empty_snapshot_renders(self):
+        md = format_server_stats_markdown(MetricsRegistry().snapshot())
+        assert "No tool calls recorded yet" in md
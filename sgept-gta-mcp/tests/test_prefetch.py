@@ -0,0 +1,233 @@
+"""Unit tests for speculative next-page prefetch.
+
+Covers:
+- full page schedules the next page; short page does not
+- next call is served from the prefetched page (or joins the in-flight fetch)
+- prefetched pages are handed out once and expire after the TTL
+- memory cap evicts oldest pages and skips oversized ones
+- idle sessions cancel outstanding prefetches
+- failed prefetch falls back to a normal request
+- only paginated reads participate; disabled by default
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from gta_mcp.api import GTAAPIClient
+from gta_mcp.instrumentation import registry
+from gta_mcp.prefetch import Prefetcher
+
+
+def _client_with_pages(monkeypatch, prefetcher, total=250, delay=0.0, fail_offsets=()):
+    """Client whose transport serves `total` fake records in limit/offset pages."""
+    seen = []
+
+    async def handler(request):
+        body = json.loads(request.content)
+        seen.append(body["offset"])
+        if delay:
+            await asyncio.sleep(delay)
+        if body["offset"] in fail_offsets:
+            return httpx.Response(502, json={"detail": "bad gateway"})
+        start, stop = body["offset"], min(total, body["offset"] + body["limit"])
+        return httpx.Response(200, json=[{"intervention_id": i} for i in range(start, stop)])
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "gta_mcp.api.httpx.AsyncClient",
+        lambda **kw: real_client(transport=transport, **kw),
+    )
+    client = GTAAPIClient("key", base_url="https://api.test", prefetcher=prefetcher)
+    return client, seen
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+class TestPrefetchFlow:
+
+    async def test_full_page_prefetches_next(self, monkeypatch):
+        prefetcher = Prefetcher()
+        client, seen = _client_with_pages(monkeypatch, prefetcher)
+
+        page1 = await client.search_interventions(filters={}, limit=100, offset=0, paginated=True)
+        await _drain()
+        assert len(page1) == 100
+        assert seen == [0, 100]
+
+        page2 = await client.search_interventions(filters={}, limit=100, offset=100, paginated=True)
+        await _drain()
+        assert [r["intervention_id"] for r in page2] == list(range(100, 200))
+        assert prefetcher.stats["hits"] == 1
+        # page 2 was full as well, so page 3 was prefetched
+        assert seen == [0, 100, 200]
+
+        page3 = await client.search_interventions(filters={}, limit=100, offset=200, paginated=True)
+        await _drain()
+        assert len(page3) == 50
+        # short page: nothing more to prefetch
+        assert seen == [0, 100, 200]
+
+    async def test_next_call_joins_inflight_prefetch(self, monkeypatch):
+        prefetcher = Prefetcher()
+        client, seen = _client_with_pages(monkeypatch, prefetcher, delay=0.05)
+
+        await client.get_ticker_updates(filters={}, limit=100, offset=0)
+        page2 = await client.get_ticker_updates(filters={}, limit=100, offset=100)
+        assert len(page2) == 100
+        assert seen.count(100) == 1
+        assert prefetcher.stats["joined"] == 1
+        prefetcher.cancel_all()
+
+    async def test_page_handed_out_once(self, monkeypatch):
+        prefetcher = Prefetcher()
+        client, seen = _client_with_pages(monkeypatch, prefetcher, total=150)
+
+        await client.get_impact_chains("product", filters={}, limit=100, offset=0)
+        await _drain()
+        await client.get_impact_chains("product", filters={}, limit=100, offset=100)
+        await client.get_impact_chains("product", filters={}, limit=100, offset=100)
+        assert seen == [0, 100, 100]
+
+    async def test_expired_page_refetched(self, monkeypatch):
+        prefetcher = Prefetcher(ttl_seconds=0.0)
+        client, seen = _client_with_pages(monkeypatch, prefetcher)
+
+        await client.get_ticker_updates(filters={}, limit=100, offset=0)
+        await _drain()
+        await client.get_ticker_updates(filters={}, limit=100, offset=100)
+        assert prefetcher.stats["hits"] == 0
+        assert seen[:3] == [0, 100, 100]
+        prefetcher.cancel_all()
+
+    async def test_failed_prefetch_falls_back(self, monkeypatch):
+        prefetcher = Prefetcher()
+        client, seen = _client_with_pages(monkeypatch, prefetcher, fail_offsets={100})
+
+        await client.get_ticker_updates(filters={}, limit=100, offset=0)
+        await _drain()
+        assert prefetcher.stats["failed"] == 1
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_ticker_updates(filters={}, limit=100, offset=100)
+        assert seen == [0, 100, 100]
+
+    async def test_unpaginated_reads_bypass_prefetch(self, monkeypatch):
+        prefetcher = Prefetcher()
+        client, seen = _client_with_pages(monkeypatch, prefetcher)
+
+        await client.search_interventions(filters={}, limit=100, offset=0)
+        await _drain()
+        assert seen == [0]
+        assert prefetcher.stats["scheduled"] == 0
+
+    async def test_lookups_recorded_as_cache_metrics(self, monkeypatch):
+        registry.reset()
+        prefetcher = Prefetcher()
+        client, _ = _client_with_pages(monkeypatch, prefetcher)
+
+        await client.get_ticker_updates(filters={}, limit=100, offset=0)
+        await _drain()
+        await client.get_ticker_updates(filters={}, limit=100, offset=100)
+        prefetcher.cancel_all()
+        cache = registry.snapshot()["caches"]["prefetch"]
+        assert cache["hits"] == 1
+        assert cache["misses"] == 1
+        registry.reset()
+
+
+@pytest.mark.asyncio
+class TestPrefetcherLimits:
+
+    async def test_memory_cap_evicts_oldest(self):
+        prefetcher = Prefetcher(max_bytes=100)
+
+        async def page(value, size):
+            return value, size
+
+        prefetcher.schedule("a", lambda: page("A", 60))
+        await _drain()
+        prefetcher.schedule("b", lambda: page("B", 60))
+        await _drain()
+        assert prefetcher.cached_bytes == 60
+        assert prefetcher.stats["evicted"] == 1
+        assert await prefetcher.lookup("a") == (False, None)
+        assert await prefetcher.lookup("b") == (True, "B")
+        assert prefetcher.cached_bytes == 0
+
+    async def test_oversized_page_not_cached(self):
+        prefetcher = Prefetcher(max_bytes=10)
+
+        async def page():
+            return "big", 11
+
+        prefetcher.schedule("a", page)
+        await _drain()
+        assert prefetcher.cached_bytes == 0
+        assert await prefetcher.lookup("a") == (False, None)
+
+    async def test_inflight_limit(self):
+        prefetcher = Prefetcher(max_inflight=1)
+
+        async def slow():
+            await asyncio.sleep(10)
+            return "x", 1
+
+        prefetcher.schedule("a", slow)
+        prefetcher.schedule("b", slow)
+        assert prefetcher.stats["scheduled"] == 1
+        assert prefetcher.stats["skipped"] == 1
+        prefetcher.cancel_all()
+
+    async def test_idle_session_cancels_prefetches(self):
+        prefetcher = Prefetcher(idle_seconds=0.02)
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "x", 1
+
+        prefetcher.schedule("a", slow)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert prefetcher.stats["cancelled"] == 1
+        assert prefetcher.cached_bytes == 0
+
+    async def test_activity_postpones_idle_cancel(self):
+        prefetcher = Prefetcher(idle_seconds=0.05)
+
+        async def page():
+            return "x", 1
+
+        prefetcher.schedule("a", page)
+        for _ in range(4):
+            await asyncio.sleep(0.02)
+            prefetcher.touch()
+        assert await prefetcher.lookup("a") == (True, "x")
+
+
+class TestPrefetcherFromEnv:
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("GTA_PREFETCH_ENABLED", raising=False)
+        assert Prefetcher.from_env() is None
+
+    def test_enabled_with_overrides(self, monkeypatch):
+        monkeypatch.setenv("GTA_PREFETCH_ENABLED", "1")
+        monkeypatch.setenv("GTA_PREFETCH_TTL_SECONDS", "15")
+        monkeypatch.setenv("GTA_PREFETCH_MAX_MB", "2")
+        monkeypatch.setenv("GTA_PREFETCH_IDLE_SECONDS", "30")
+        prefetcher = Prefetcher.from_env()
+        assert prefetcher.ttl == 15
+        assert prefetcher.max_bytes == 2 * 1024 * 1024
+        assert prefetcher.idle_seconds == 30
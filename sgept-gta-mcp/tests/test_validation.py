@@ -0,0 +1,159 @@
+"""Unit tests for compiled request validation and filter preparation.
+
+Covers:
+- validate_input matches model construction, including validators
+- control-field sets strip exactly the non-filter fields
+- canonical cache key is order-independent and ignores unset fields
+- built filters are memoised per builder and handed out as copies
+- builder errors propagate and are not cached
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from gta_mcp import validation
+from gta_mcp.api import build_count_filters, build_filters
+from gta_mcp.models import GTACountInput, GTASearchInput, GTATickerInput
+from gta_mcp.validation import (
+    COUNT_CONTROL_FIELDS,
+    SEARCH_CONTROL_FIELDS,
+    TICKER_CONTROL_FIELDS,
+    canonical_key,
+    prepare_count_filters,
+    prepare_filters,
+    validate_input,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_filter_cache():
+    validation._filter_cache.clear()
+    yield
+    validation._filter_cache.clear()
+
+
+class TestValidateInput:
+
+    def test_matches_model_construction(self):
+        raw = {"implementing_jurisdictions": ["usa"], "limit": 10}
+        assert validate_input(GTASearchInput, raw) == GTASearchInput(**raw)
+
+    def test_validators_still_run(self):
+        with pytest.raises(ValidationError):
+            validate_input(GTASearchInput, {"semantic_query": "steel", "sorting": "-date_announced"})
+        with pytest.raises(ValidationError):
+            validate_input(GTASearchInput, {"unknown_field": 1})
+
+
+class TestControlFields:
+
+    @pytest.mark.parametrize("model, fields", [
+        (GTASearchInput, SEARCH_CONTROL_FIELDS),
+        (GTATickerInput, TICKER_CONTROL_FIELDS),
+        (GTACountInput, COUNT_CONTROL_FIELDS),
+    ])
+    def test_control_fields_exist_on_model(self, model, fields):
+        assert fields <= set(model.model_fields)
+
+    def test_filter_params_match_previous_dump(self):
+        params = GTASearchInput(implementing_jurisdictions=["USA"], limit=10, offset=5)
+        prepared = prepare_filters(params, SEARCH_CONTROL_FIELDS)
+        assert prepared.params == params.model_dump(exclude=set(SEARCH_CONTROL_FIELDS))
+        assert "limit" not in prepared.params
+
+
+class TestCanonicalKey:
+
+    def test_order_independent_and_ignores_unset(self):
+        assert canonical_key({"a": 1, "b": None, "c": [2]}) == canonical_key({"c": [2], "a": 1})
+
+    def test_paging_does_not_change_key(self):
+        page1 = GTASearchInput(implementing_jurisdictions=["USA"], offset=0)
+        page2 = GTASearchInput(implementing_jurisdictions=["USA"], offset=100)
+        assert (
+            prepare_filters(page1, SEARCH_CONTROL_FIELDS).cache_key
+            == prepare_filters(page2, SEARCH_CONTROL_FIELDS).cache_key
+        )
+
+
+class TestFilterMemo:
+
+    def test_matches_build_filters(self):
+        params = GTASearchInput(
+            implementing_jurisdictions=["USA", "CHN"],
+            intervention_types=["Import tariff"],
+            gta_evaluation=["Red"],
+        )
+        prepared = prepare_filters(params, SEARCH_CONTROL_FIELDS)
+        expected = build_filters(params.model_dump(exclude=set(SEARCH_CONTROL_FIELDS)))
+        assert (prepared.filters, prepared.messages) == expected
+
+    def test_repeat_query_skips_builder(self):
+        calls = []
+
+        def counting_builder(p):
+            calls.append(p)
+            return build_filters(p)
+
+        counting_builder.__name__ = "build_filters"
+        params = GTASearchInput(implementing_jurisdictions=["USA"])
+        prepare_filters(params, SEARCH_CONTROL_FIELDS, builder=counting_builder)
+        prepare_filters(params.model_copy(update={"offset": 50}), SEARCH_CONTROL_FIELDS, builder=counting_builder)
+        assert len(calls) == 1
+
+    def test_builders_cached_separately(self):
+        params = GTASearchInput(gta_evaluation=["Red"])
+        search = prepare_filters(params, SEARCH_CONTROL_FIELDS)
+        count = prepare_count_filters(params, SEARCH_CONTROL_FIELDS)
+        assert search.filters["gta_evaluation"] == build_filters(search.params)[0]["gta_evaluation"]
+        assert count.filters == build_count_filters(count.params)[0]
+
+    def test_returns_copies(self):
+        params = GTASearchInput(implementing_jurisdictions=["USA"])
+        first = prepare_filters(params, SEARCH_CONTROL_FIELDS)
+        first.filters["injected"] = True
+        first.messages.append("noise")
+        second = prepare_filters(params, SEARCH_CONTROL_FIELDS)
+        assert "injected" not in second.filters
+        assert "noise" not in second.messages
+
+    def test_nested_lists_are_copied(self):
+        params = GTASearchInput(implementing_jurisdictions=["USA"])
+        first = prepare_filters(params, SEARCH_CONTROL_FIELDS)
+        first.filters["implementer"].append(999)
+        assert 999 not in prepare_filters(params, SEARCH_CONTROL_FIELDS).filters["implementer"]
+
+    def test_in_force_date_not_frozen_by_cache(self, monkeypatch):
+        import datetime
+
+        params = GTASearchInput(is_in_force=True)
+        assert prepare_filters(params, SEARCH_CONTROL_FIELDS).filters["in_force_on_date"] == datetime.date.today().isoformat()
+
+        class Tomorrow(datetime.date):
+            @classmethod
+            def today(cls):
+                return cls(2030, 1, 2)
+
+        monkeypatch.setattr(datetime, "date", Tomorrow)
+        assert prepare_filters(params, SEARCH_CONTROL_FIELDS).filters["in_force_on_date"] == "2030-01-02"
+
+    def test_errors_not_cached(self):
+        params = GTASearchInput(intervention_types=["Definitely not a type"])
+        with pytest.raises(ValueError):
+            prepare_filters(params, SEARCH_CONTROL_FIELDS)
+        assert len(validation._filter_cache) == 0
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(validation._filter_cache, "maxsize", 2)
+        for year in ("2021", "2022", "2023"):
+            prepare_filters(
+                GTASearchInput(date_announced_gte=f"{year}-01-01"), SEARCH_CONTROL_FIELDS
+            )
+        assert len(validation._filter_cache) == 2
+
+    def test_count_input_prepares_count_filters(self):
+        params = GTACountInput(count_by=["date_announced_year"], gta_evaluation=["Red"])
+        prepared = prepare_count_filters(params, COUNT_CONTROL_FIELDS)
+        assert prepared.filters == build_count_filters(
+            params.model_dump(exclude=set(COUNT_CONTROL_FIELDS))
+        )[0]